@@ -1,12 +1,10 @@
-import allure
 from httpx import Response
-from requests import Response as requests_Response
 from clients.additional_filters.additional_filters_schema import CreateAdditionalFiltersRequestSchema, \
     UpdateAdditionalFiltersRequestSchema, DeleteAdditionalFiltersRequestSchema
-from clients.api_client import APIClient
-from clients.api_session import APISession
-from clients.private_http_builder import AuthenticationUserSchema, get_private_http_client, get_private_http_session
-from config import settings
+from clients.api_client import APIClient, AsyncAPIClient
+from clients.private_http_builder import AuthenticationUserSchema, get_private_http_client, \
+    get_private_async_http_client
+from tools.allure.steps import client_step
 from tools.routes import APIRoutes
 from clients.api_coverage import tracker
 
@@ -16,7 +14,7 @@ class AdditionalFiltersClient(APIClient):
     """
     Клиент для работы с /api/additional_filters/
     """
-    @allure.step('Create additional filters')
+    @client_step('Create additional filters')
     @tracker.track_coverage_httpx(f'{APIRoutes.ADDITIONAL_FILTERS}')
     def create_additional_filters_api(self, request: CreateAdditionalFiltersRequestSchema) -> Response:
         """
@@ -29,7 +27,7 @@ class AdditionalFiltersClient(APIClient):
                          json=request.model_dump(by_alias=True))
 
 
-    @allure.step('Update additional filters')
+    @client_step('Update additional filters')
     @tracker.track_coverage_httpx(f'{APIRoutes.ADDITIONAL_FILTERS}')
     def update_additional_filters_api(self, request: UpdateAdditionalFiltersRequestSchema) -> Response:
         """
@@ -42,6 +40,19 @@ class AdditionalFiltersClient(APIClient):
                         json=request.model_dump(by_alias=True))
 
 
+    @client_step('Delete additional filters')
+    @tracker.track_coverage_httpx(f'{APIRoutes.ADDITIONAL_FILTERS}')
+    def delete_additional_filters_api(self, request: DeleteAdditionalFiltersRequestSchema) -> Response:
+        """
+        Метод удаления дополнительных фильтров.
+
+        :param request: Список словарей с value: str, direction: str, logic_group (logicGroup): int, type: str.
+        :return: Ответ от сервера в виде объекта httpx.Response.
+        """
+        return self.delete(url=f'{APIRoutes.ADDITIONAL_FILTERS}',
+                           json=request.model_dump(by_alias=True))
+
+
 def get_additional_filters_client(user: AuthenticationUserSchema) -> AdditionalFiltersClient:
     """
     Функция создаёт экземпляр AdditionalFiltersClient с уже настроенным HTTP-клиентом.
@@ -50,27 +61,19 @@ def get_additional_filters_client(user: AuthenticationUserSchema) -> AdditionalF
     """
     return AdditionalFiltersClient(client=get_private_http_client(user=user))
 
-# ----------------------------------------------------------------------------------------------------------------------
 
-class AdditionalFiltersSession(APISession):
-
-    @allure.step('Delete additional filters')
-    @tracker.track_coverage_requests(f'{APIRoutes.ADDITIONAL_FILTERS}')
-    def delete_additional_filters_api(self, request: DeleteAdditionalFiltersRequestSchema) -> requests_Response:
-        """
-        Метод удаления дополнительных фильтров.
-
-        :param request: Список словарей с value: str, direction: str, logic_group (logicGroup): int, type: str.
-        :return: Объект requests_Response с данными ответа.
-        """
-        return self.delete(url=f'{settings.http_client.client_url}{APIRoutes.ADDITIONAL_FILTERS}',
-                           json=request.model_dump(by_alias=True))
+class AsyncAdditionalFiltersClient(AsyncAPIClient, AdditionalFiltersClient):
+    """
+    Асинхронный клиент для работы с /api/additional_filters/
+    Все методы AdditionalFiltersClient выполняют запросы, поэтому здесь возвращают корутины с httpx.Response.
+    """
 
 
-def get_additional_filters_session(access_token: str) -> AdditionalFiltersSession:
+def get_async_additional_filters_client(user: AuthenticationUserSchema) -> AsyncAdditionalFiltersClient:
     """
-    Функция создаёт экземпляр AdditionalFiltersSession с уже настроенным HTTP-клиентом.
+    Функция создаёт экземпляр AsyncAdditionalFiltersClient с общим для пользователя асинхронным HTTP-клиентом.
+    Должна вызываться внутри запущенного event loop.
 
-    :return: Готовый к использованию AdditionalFiltersSession.
+    :return: Готовый к использованию AsyncAdditionalFiltersClient.
     """
-    return AdditionalFiltersSession(session=get_private_http_session(access_token=access_token))
\ No newline at end of file
+    return AsyncAdditionalFiltersClient(client=get_private_async_http_client(user=user))
\ No newline at end of file
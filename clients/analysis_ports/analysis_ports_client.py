@@ -1,15 +1,13 @@
-import allure
 from httpx import Response
-from requests import Response as requests_Response
 
 from clients.analysis_ports.analysis_ports_schema import CreateAnalysisPortRequestSchema, \
     UpdateAnalysisPortRequestSchema, DeleteAnalysisPortRequestSchema
-from clients.api_client import APIClient
+from clients.api_client import APIClient, AsyncAPIClient
 from clients.api_coverage import tracker
-from clients.api_session import APISession
-from clients.private_http_builder import get_private_http_client, AuthenticationUserSchema, get_private_http_session
-from clients.public_http_builder import get_public_http_client, get_public_http_session
-from config import settings
+from clients.private_http_builder import get_private_http_client, AuthenticationUserSchema, \
+    get_private_async_http_client
+from clients.public_http_builder import get_public_http_client
+from tools.allure.steps import client_step
 from tools.routes import APIRoutes
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -19,7 +17,7 @@ class AnalysisPortsClient(APIClient):
     Клиент для работы с /api/unknown/
     """
 
-    @allure.step('Get analysis ports list')
+    @client_step('Get analysis ports list')
     @tracker.track_coverage_httpx(f'{APIRoutes.ANALYSIS_PORTS}')
     def get_analysis_port_list_api(self) -> Response:
         """
@@ -31,7 +29,7 @@ class AnalysisPortsClient(APIClient):
         return self.get(url=f'{APIRoutes.ANALYSIS_PORTS}')
 
 
-    @allure.step('Create analysis port')
+    @client_step('Create analysis port')
     @tracker.track_coverage_httpx(f'{APIRoutes.ANALYSIS_PORTS}')
     def create_analysis_port_api(self, request: CreateAnalysisPortRequestSchema) -> Response:
         """
@@ -44,7 +42,7 @@ class AnalysisPortsClient(APIClient):
                          json=request.model_dump(by_alias=True))
 
 
-    @allure.step('Update analysis port')
+    @client_step('Update analysis port')
     @tracker.track_coverage_httpx(f'{APIRoutes.ANALYSIS_PORTS}')
     def update_analysis_port_api(self, request: UpdateAnalysisPortRequestSchema) -> Response:
         """
@@ -57,6 +55,19 @@ class AnalysisPortsClient(APIClient):
                         json=request.model_dump(by_alias=True))
 
 
+    @client_step('Delete analysis port')
+    @tracker.track_coverage_httpx(f'{APIRoutes.ANALYSIS_PORTS}')
+    def delete_analysis_port_api(self, request: DeleteAnalysisPortRequestSchema) -> Response:
+        """
+        Метод удаления порта анализа.
+
+        :param request: Словарь DeleteAnalysisPortRequestSchema.model_dump(by_alias=True).
+        :return: Ответ от сервера в виде объекта httpx.Response.
+        """
+        return self.delete(url=f'{APIRoutes.ANALYSIS_PORTS}',
+                           json=request.model_dump(by_alias=True))
+
+
 def get_analysis_ports_client(user: AuthenticationUserSchema) -> AnalysisPortsClient:
     """
     Функция создаёт экземпляр AnalysisPortsClient с уже настроенным HTTP-клиентом.
@@ -74,36 +85,19 @@ def get_unauthorised_analysis_ports_client() -> AnalysisPortsClient:
     """
     return AnalysisPortsClient(client=get_public_http_client())
 
-# ----------------------------------------------------------------------------------------------------------------------
 
-class AnalysisPortsSession(APISession):
-
-    @allure.step('Delete analysis port')
-    @tracker.track_coverage_requests(f'{APIRoutes.ANALYSIS_PORTS}')
-    def delete_analysis_port_api(self, request: DeleteAnalysisPortRequestSchema) -> requests_Response:
-        """
-        Метод удаления порта анализа.
-
-        :param request: Словарь DeleteAnalysisPortRequestSchema.model_dump(by_alias=True).
-        :return: Объект requests_Response с данными ответа.
-        """
-        return self.delete(url=f'{settings.http_client.client_url}{APIRoutes.ANALYSIS_PORTS}',
-                           json=request.model_dump(by_alias=True))
-
-
-def get_analysis_ports_session(access_token: str) -> AnalysisPortsSession:
+class AsyncAnalysisPortsClient(AsyncAPIClient, AnalysisPortsClient):
     """
-    Функция создаёт экземпляр AnalysisPortsSession с уже настроенным HTTP-клиентом.
-
-    :return: Готовый к использованию AnalysisPortsSession.
+    Асинхронный клиент для работы с /api/unknown/
+    Все методы AnalysisPortsClient выполняют запросы, поэтому здесь возвращают корутины с httpx.Response.
     """
-    return AnalysisPortsSession(session=get_private_http_session(access_token=access_token))
 
 
-def get_unauthorised_analysis_ports_session() -> AnalysisPortsSession:
+def get_async_analysis_ports_client(user: AuthenticationUserSchema) -> AsyncAnalysisPortsClient:
     """
-    Функция создаёт экземпляр неавторизованного AnalysisPortsSession с уже настроенным HTTP-клиентом.
+    Функция создаёт экземпляр AsyncAnalysisPortsClient с общим для пользователя асинхронным HTTP-клиентом.
+    Должна вызываться внутри запущенного event loop.
 
-    :return: Готовый к использованию AnalysisPortsSession без авторизации.
+    :return: Готовый к использованию AsyncAnalysisPortsClient.
     """
-    return AnalysisPortsSession(session=get_public_http_session())
\ No newline at end of file
+    return AsyncAnalysisPortsClient(client=get_private_async_http_client(user=user))
\ No newline at end of file
@@ -1,8 +1,14 @@
 import allure
-from typing import Optional, Any
+from typing import Optional, Any, Iterator, AsyncIterator, TypeVar, Callable, Awaitable
 
-from httpx import Client, URL, Response, QueryParams
+from httpx import Client, AsyncClient, URL, Response, QueryParams
 from httpx._types import RequestData, RequestFiles
+from pydantic import BaseModel
+
+from clients.api_coverage import save_stream_coverage
+from tools.json_stream import iter_json_array, aiter_json_array
+
+Model = TypeVar('Model', bound=BaseModel)
 
 
 class APIClient:
@@ -82,12 +88,213 @@ class APIClient:
 
     @allure.step('Make DELETE-request to {url}')
     def delete(self,
-               url: str | URL
+               url: str | URL,
+               json: Optional[Any] = None
                ) -> Response:
         """
         Выполняет DELETE-запрос.
+        httpx.Client.delete не принимает тело запроса, поэтому используется client.request("DELETE", ...).
+
+        :param url: URL-адрес эндпоинта.
+        :param json: Данные для удаления в формате JSON.
+        :return: Объект Response с данными ответа.
+        """
+        return self.client.request(method="DELETE",
+                                   url=url,
+                                   json=json)
+
+    @allure.step('Make streaming GET-request to {url}')
+    def stream(self,
+               url: str | URL,
+               params: Optional[QueryParams] = None
+               ) -> Response:
+        """
+        Выполняет GET-запрос без чтения тела ответа.
+        Тело читается частями (Response.iter_bytes) и должно быть закрыто вызывающим кодом, см. stream_items.
+
+        :param url: URL-адрес эндпоинта.
+        :param params: GET-параметры запроса (например, ?key=value).
+        :return: Объект Response с заголовками ответа и непрочитанным телом.
+        """
+        return self.client.send(self.client.build_request(method="GET", url=url, params=params), stream=True)
+
+    @staticmethod
+    def stream_items(send: Callable[[], Response],
+                     model: type[Model],
+                     key: Optional[str] = None
+                     ) -> Iterator[Model]:
+        """
+        Возвращает элементы JSON-массива из потокового ответа по мере их получения.
+        Тело ответа читается частями через iter_bytes и не собирается в памяти целиком,
+        поэтому первый элемент доступен до окончания передачи, а память не растёт с размером списка.
+        Запрос выполняется при получении первого элемента, ответ закрывается после последнего.
+        Покрытие эндпоинта записывается по завершении чтения тела (см. clients.api_coverage.save_stream_coverage).
+
+        :param send: Метод доменного клиента, выполняющий запрос через stream (например, get_filters_stream_api),
+                     чтобы запрос проходил через шаг Allure и трекер покрытия.
+        :param model: Pydantic-модель одного элемента массива.
+        :param key: Ключ массива внутри JSON-объекта ответа (например, "nodes"), если ответ не является массивом.
+        :return: Итератор провалидированных элементов.
+        :raises httpx.HTTPStatusError: Если сервер вернул статус ошибки.
+        """
+        response = send()
+        try:
+            response.raise_for_status()
+            for item in iter_json_array(response.iter_bytes(), key=key):
+                yield model.model_validate(item)
+        finally:
+            save_stream_coverage(response)
+            response.close()
+
+
+class AsyncAPIClient:
+    def __init__(self, client: AsyncClient):
+        """
+        Базовый асинхронный API клиент, принимающий объект httpx.AsyncClient.
+        Методы повторяют APIClient, но возвращают корутины, что позволяет выполнять запросы конкурентно.
+
+        :param client: экземпляр httpx.AsyncClient для выполнения HTTP-запросов
+        """
+        self.client = client
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Асинхронный доменный клиент наследует методы синхронного (AsyncXxxClient(AsyncAPIClient, XxxClient)).
+        Методы запросов (client_step) работают в обоих клиентах, а вспомогательные методы синхронного клиента
+        обрабатывают httpx.Response и получили бы корутину, поэтому они должны быть переопределены.
+
+        :raises TypeError: Если вспомогательный метод синхронного клиента не переопределён.
+        """
+        super().__init_subclass__(**kwargs)
+
+        inherited = []
+        for name in dir(cls):
+            owner = next(base for base in cls.__mro__ if name in vars(base))
+            member = vars(owner)[name]
+            if not name.startswith('_') and callable(member) and issubclass(owner, APIClient) \
+                    and not issubclass(owner, AsyncAPIClient) and owner is not APIClient \
+                    and not getattr(member, 'client_request', False):
+                inherited.append(f'{owner.__name__}.{name}')
+
+        if inherited:
+            raise TypeError(f'{cls.__name__} must override sync helper methods: {", ".join(inherited)}')
+
+    async def options(self,
+                      url: str | URL,
+                      params: Optional[QueryParams] = None
+                      ) -> Response:
+        """
+        Выполняет асинхронный OPTIONS-запрос.
 
         :param url: URL-адрес эндпоинта.
+        :param params: OPTIONS-параметры запроса (например, ?key=value).
         :return: Объект Response с данными ответа.
         """
-        return self.client.delete(url=url)
\ No newline at end of file
+        with allure.step(f'Make OPTIONS-request to {url}'):
+            return await self.client.options(url=url,
+                                             params=params)
+
+    async def get(self,
+                  url: str | URL,
+                  params: Optional[QueryParams] = None
+                  ) -> Response:
+        """
+        Выполняет асинхронный GET-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param params: GET-параметры запроса (например, ?key=value).
+        :return: Объект Response с данными ответа.
+        """
+        with allure.step(f'Make GET-request to {url}'):
+            return await self.client.get(url=url,
+                                         params=params)
+
+    async def post(self,
+                   url: str | URL,
+                   json: Optional[Any] = None,
+                   data: Optional[RequestData] = None,
+                   files: Optional[RequestFiles] = None
+                   ) -> Response:
+        """
+        Выполняет асинхронный POST-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param json: Данные в формате JSON.
+        :param data: Форматированные данные формы (например, application/x-www-form-urlencoded).
+        :param files: Файлы для загрузки на сервер.
+        :return: Объект Response с данными ответа.
+        """
+        with allure.step(f'Make POST-request to {url}'):
+            return await self.client.post(url=url,
+                                          json=json,
+                                          data=data,
+                                          files=files)
+
+    async def put(self,
+                  url: str | URL,
+                  json: Optional[Any] = None
+                  ) -> Response:
+        """
+        Выполняет асинхронный PUT-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param json: Данные для обновления в формате JSON.
+        :return: Объект Response с данными ответа.
+        """
+        with allure.step(f'Make PUT-request to {url}'):
+            return await self.client.put(url=url,
+                                         json=json)
+
+    async def delete(self,
+                     url: str | URL,
+                     json: Optional[Any] = None
+                     ) -> Response:
+        """
+        Выполняет асинхронный DELETE-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param json: Данные для удаления в формате JSON.
+        :return: Объект Response с данными ответа.
+        """
+        with allure.step(f'Make DELETE-request to {url}'):
+            return await self.client.request(method="DELETE",
+                                             url=url,
+                                             json=json)
+
+    async def stream(self,
+                     url: str | URL,
+                     params: Optional[QueryParams] = None
+                     ) -> Response:
+        """
+        Асинхронный вариант APIClient.stream: тело ответа читается через aiter_bytes.
+
+        :param url: URL-адрес эндпоинта.
+        :param params: GET-параметры запроса (например, ?key=value).
+        :return: Объект Response с заголовками ответа и непрочитанным телом.
+        """
+        with allure.step(f'Make streaming GET-request to {url}'):
+            return await self.client.send(self.client.build_request(method="GET", url=url, params=params),
+                                          stream=True)
+
+    @staticmethod
+    async def stream_items(send: Callable[[], Awaitable[Response]],
+                           model: type[Model],
+                           key: Optional[str] = None
+                           ) -> AsyncIterator[Model]:
+        """
+        Асинхронный вариант APIClient.stream_items: тело ответа читается частями через aiter_bytes.
+
+        :param send: Метод доменного клиента, выполняющий запрос через stream (например, get_filters_stream_api).
+        :param model: Pydantic-модель одного элемента массива.
+        :param key: Ключ массива внутри JSON-объекта ответа (например, "nodes"), если ответ не является массивом.
+        :return: Асинхронный итератор провалидированных элементов.
+        :raises httpx.HTTPStatusError: Если сервер вернул статус ошибки.
+        """
+        response = await send()
+        try:
+            response.raise_for_status()
+            async for item in aiter_json_array(response.aiter_bytes(), key=key):
+                yield model.model_validate(item)
+        finally:
+            save_stream_coverage(response)
+            await response.aclose()
\ No newline at end of file
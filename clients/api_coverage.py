@@ -1,4 +1,96 @@
+import functools
+import inspect
+from contextlib import contextmanager
+from typing import Callable, Awaitable, Iterator
+
+from httpx import Response, ResponseNotRead
 from swagger_coverage_tool import SwaggerCoverageTracker
 
 
-tracker = SwaggerCoverageTracker(service="packet-broker-api-test")
\ No newline at end of file
+# Ключ Response.extensions, под которым потоковый ответ ждёт записи покрытия до чтения тела (см. save_stream_coverage)
+_STREAM_COVERAGE = 'stream_coverage'
+
+
+class APICoverageTracker(SwaggerCoverageTracker):
+    """
+    Трекер покрытия Swagger-документации, поддерживающий методы асинхронных клиентов.
+
+    Методы доменных клиентов возвращают результат self.get()/self.post()/... как есть.
+    Для AsyncAPIClient это корутина, поэтому покрытие фиксируется только после получения ответа.
+    Для потокового ответа (APIClient.stream) - только после чтения тела, см. save_stream_coverage.
+    """
+    enabled: bool = True
+
+    @contextmanager
+    def disabled(self) -> Iterator[None]:
+        """
+        Временно отключает запись покрытия, например, на время нагрузочного прогона,
+        чтобы каждый запрос не создавал отдельный файл в ./coverage-results.
+        """
+        self.enabled = False
+        try:
+            yield
+        finally:
+            self.enabled = True
+
+    def track_coverage_httpx(self, endpoint: str):
+        def wrapper(func: Callable[..., Response | Awaitable[Response]]):
+            signature = inspect.signature(func)
+
+            @functools.wraps(func)
+            def inner(*args, **kwargs):
+                response = func(*args, **kwargs)
+
+                if inspect.isawaitable(response):
+                    return self._track_awaitable_httpx(endpoint=endpoint, response=response)
+
+                self._save_httpx_coverage(endpoint=endpoint, response=response)
+                return response
+
+            inner.__signature__ = signature
+            return inner
+
+        return wrapper
+
+    async def _track_awaitable_httpx(self, endpoint: str, response: Awaitable[Response]) -> Response:
+        result = await response
+        self._save_httpx_coverage(endpoint=endpoint, response=result)
+        return result
+
+    def _save_httpx_coverage(self, endpoint: str, response: Response):
+        if not self.enabled:
+            return
+
+        try:
+            response.content
+        except ResponseNotRead:
+            response.extensions[_STREAM_COVERAGE] = functools.partial(self._save_stream_coverage, endpoint)
+            return
+
+        if coverage := self.build_endpoint_coverage_for_httpx(endpoint, response):
+            self.storage.save(coverage)
+
+    def _save_stream_coverage(self, endpoint: str, response: Response):
+        if not self.enabled:
+            return
+
+        # Тело потокового ответа прочитано частями и в ответе не сохранено, поэтому покрытие строится по ответу
+        # с тем же запросом и статусом, а тело считается покрытым, если сервер его отправил
+        coverage = self.build_endpoint_coverage_for_httpx(endpoint, Response(status_code=response.status_code,
+                                                                             request=response.request))
+        if coverage:
+            self.storage.save(coverage.model_copy(update={'is_response_covered': response.num_bytes_downloaded > 0}))
+
+
+def save_stream_coverage(response: Response):
+    """
+    Функция записывает покрытие потокового ответа по завершении чтения тела (вызывается из APIClient.stream_items).
+    При выполнении запроса тело ещё не прочитано, поэтому track_coverage_httpx откладывает запись до этого момента.
+
+    :param response: Потоковый ответ с прочитанным телом.
+    """
+    if save := response.extensions.pop(_STREAM_COVERAGE, None):
+        save(response)
+
+
+tracker = APICoverageTracker(service="packet-broker-api-test")
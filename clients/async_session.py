@@ -0,0 +1,36 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, TypeVar
+
+from clients.private_http_builder import close_private_async_http_clients
+from clients.public_http_builder import close_public_async_http_client
+
+Result = TypeVar('Result')
+
+
+@asynccontextmanager
+async def async_http_session() -> AsyncIterator[None]:
+    """
+    Асинхронный контекстный менеджер, закрывающий при выходе все асинхронные HTTP-клиенты текущего event loop.
+    Клиенты хранятся для каждого event loop отдельно (см. get_private_async_http_client), поэтому без закрытия
+    каждый asyncio.run оставлял бы открытые соединения пула.
+    """
+    try:
+        yield
+    finally:
+        await close_private_async_http_clients()
+        await close_public_async_http_client()
+
+
+def run_async(coroutine: Awaitable[Result]) -> Result:
+    """
+    Функция выполняет корутину в новом event loop (как asyncio.run) и закрывает созданные в нём асинхронные клиенты.
+
+    :param coroutine: Корутина, использующая асинхронные доменные клиенты.
+    :return: Результат корутины.
+    """
+    async def main() -> Result:
+        async with async_http_session():
+            return await coroutine
+
+    return asyncio.run(main())
\ No newline at end of file
@@ -1,9 +1,9 @@
-import allure
 from httpx import Response
-from clients.api_client import APIClient
+from clients.api_client import APIClient, AsyncAPIClient
 from clients.authentication.authentication_schema import LoginRequestSchema, LoginResponseSchema, \
     RefreshRequestSchema
-from clients.public_http_builder import get_public_http_client
+from clients.public_http_builder import get_public_http_client, get_public_async_http_client
+from tools.allure.steps import client_step
 from tools.routes import APIRoutes
 from clients.api_coverage import tracker
 
@@ -12,7 +12,7 @@ class AuthenticationClient(APIClient):
     """
     Клиент для работы с /api/token/
     """
-    @allure.step('Get access token used by username and password')
+    @client_step('Get access token used by username and password')
     @tracker.track_coverage_httpx(f'{APIRoutes.AUTHENTICATION}/access/')
     def login_api(self, request: LoginRequestSchema) -> Response:
         """
@@ -34,7 +34,7 @@ class AuthenticationClient(APIClient):
         response = self.login_api(request=request)
         return LoginResponseSchema.model_validate_json(response.text)
 
-    @allure.step('Refresh access token used by refresh_token')
+    @client_step('Refresh access token used by refresh_token')
     @tracker.track_coverage_httpx(f'{APIRoutes.AUTHENTICATION}/both/')
     def refresh_api(self, request: RefreshRequestSchema) -> Response:
         """
@@ -47,10 +47,32 @@ class AuthenticationClient(APIClient):
                          json=request.model_dump())
 
 
+class AsyncAuthenticationClient(AsyncAPIClient, AuthenticationClient):
+    """
+    Асинхронный клиент для работы с /api/token/
+    Методы запросов (*_api) возвращают корутины с httpx.Response,
+    login переопределён как корутина, возвращающая LoginResponseSchema.
+    """
+
+    async def login(self, request: LoginRequestSchema) -> LoginResponseSchema:
+        response = await self.login_api(request=request)
+        return LoginResponseSchema.model_validate_json(response.text)
+
+
 def get_authentication_client() -> AuthenticationClient:
     """
     Функция создаёт экземпляр AuthenticationClient с уже настроенным HTTP-клиентом.
 
     :return: Готовый к использованию AuthenticationClient.
     """
-    return AuthenticationClient(client=get_public_http_client())
\ No newline at end of file
+    return AuthenticationClient(client=get_public_http_client())
+
+
+def get_async_authentication_client() -> AsyncAuthenticationClient:
+    """
+    Функция создаёт экземпляр AsyncAuthenticationClient с общим неавторизованным асинхронным HTTP-клиентом.
+    Должна вызываться внутри запущенного event loop.
+
+    :return: Готовый к использованию AsyncAuthenticationClient.
+    """
+    return AsyncAuthenticationClient(client=get_public_async_http_client())
\ No newline at end of file
@@ -0,0 +1,211 @@
+import asyncio
+import base64
+import json
+import threading
+import time
+from http import HTTPStatus
+from typing import AsyncGenerator, Generator
+from weakref import WeakKeyDictionary
+
+from httpx import Auth, Request, Response
+
+from clients.authentication.authentication_client import get_authentication_client, get_async_authentication_client
+from clients.authentication.authentication_schema import LoginRequestSchema, LoginResponseSchema, \
+    RefreshRequestSchema, RefreshResponseSchema
+from config import settings
+from tools.logger import get_logger
+
+
+logger = get_logger('TOKEN_MANAGER')
+
+
+def get_token_expiration(token: str) -> float | None:
+    """
+    Функция извлекает время истечения токена (claim "exp") из payload JWT без проверки подписи.
+
+    :param token: Строковое значение access или refresh токена.
+    :return: Unix-время истечения токена или None, если токен не является JWT с claim "exp".
+    """
+    try:
+        payload = token.split('.')[1]
+        payload += '=' * (-len(payload) % 4)
+        expiration = json.loads(base64.urlsafe_b64decode(payload)).get('exp')
+    except (IndexError, ValueError, AttributeError):
+        return None
+
+    return float(expiration) if isinstance(expiration, (int, float)) else None
+
+
+class TokenManager:
+    def __init__(self, request: LoginRequestSchema, refresh_margin: float):
+        """
+        Менеджер жизненного цикла access/refresh токенов одного пользователя.
+        Выполняет аутентификацию при первом обращении и обновляет токены через /api/token/both/
+        заранее, за refresh_margin секунд до истечения access_token.
+        Синхронные клиенты обращаются к токенам под threading.Lock, асинхронные - через async_* методы
+        под asyncio.Lock своего event loop, не блокируя его сетевыми запросами.
+
+        :param request: Объект LoginRequestSchema с username и паролем пользователя.
+        :param refresh_margin: Запас в секундах до истечения access_token, при котором токены обновляются.
+        """
+        self.request = request
+        self.refresh_margin = refresh_margin
+        self._login_response: LoginResponseSchema | None = None
+        self._expires_at: float | None = None
+        self._lock = threading.Lock()
+        # asyncio.Lock привязан к event loop, поэтому хранится отдельно для каждого event loop (как AsyncClient)
+        self._async_locks: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = WeakKeyDictionary()
+
+    @property
+    def login_response(self) -> LoginResponseSchema:
+        """
+        Ответ на аутентификацию с актуальными access и refresh токенами.
+        """
+        with self._lock:
+            if self._login_response is None:
+                self._login()
+            elif self._is_expiring():
+                self._refresh()
+
+            return self._login_response
+
+    @property
+    def access_token(self) -> str:
+        return self.login_response.access
+
+    def force_refresh(self, rejected_token: str):
+        """
+        Метод принудительно обновляет токены после отказа сервера в авторизации.
+        Если токен уже был обновлён другим запросом, повторное обновление не выполняется.
+
+        :param rejected_token: access_token, который был отклонён сервером.
+        """
+        with self._lock:
+            if self._login_response is None or self._login_response.access == rejected_token:
+                self._refresh()
+
+    async def async_login_response(self) -> LoginResponseSchema:
+        """
+        Асинхронный вариант login_response.
+
+        :return: Ответ на аутентификацию с актуальными access и refresh токенами.
+        """
+        async with self._async_lock():
+            if self._login_response is None:
+                await self._async_login()
+            elif self._is_expiring():
+                await self._async_refresh()
+
+            return self._login_response
+
+    async def async_access_token(self) -> str:
+        return (await self.async_login_response()).access
+
+    async def async_force_refresh(self, rejected_token: str):
+        """
+        Асинхронный вариант force_refresh.
+
+        :param rejected_token: access_token, который был отклонён сервером.
+        """
+        async with self._async_lock():
+            if self._login_response is None or self._login_response.access == rejected_token:
+                await self._async_refresh()
+
+    def _async_lock(self) -> asyncio.Lock:
+        return self._async_locks.setdefault(asyncio.get_running_loop(), asyncio.Lock())
+
+    def _is_expiring(self) -> bool:
+        return self._expires_at is not None and time.time() >= self._expires_at - self.refresh_margin
+
+    def _set_login_response(self, login_response: LoginResponseSchema):
+        self._login_response = login_response
+        self._expires_at = get_token_expiration(login_response.access)
+
+    def _login(self):
+        authentication_client = get_authentication_client()
+        self._set_login_response(authentication_client.login(request=self.request))
+
+        logger.info(f'User "{self.request.username}" logged in.')
+
+    def _refresh(self):
+        if self._login_response is None:
+            self._login()
+            return
+
+        authentication_client = get_authentication_client()
+        request = RefreshRequestSchema(refresh_token=self._login_response.refresh)
+
+        if not self._set_refresh_response(authentication_client.refresh_api(request=request)):
+            self._login()
+
+    async def _async_login(self):
+        authentication_client = get_async_authentication_client()
+        self._set_login_response(await authentication_client.login(request=self.request))
+
+        logger.info(f'User "{self.request.username}" logged in.')
+
+    async def _async_refresh(self):
+        if self._login_response is None:
+            await self._async_login()
+            return
+
+        authentication_client = get_async_authentication_client()
+        request = RefreshRequestSchema(refresh_token=self._login_response.refresh)
+
+        if not self._set_refresh_response(await authentication_client.refresh_api(request=request)):
+            await self._async_login()
+
+    def _set_refresh_response(self, response: Response) -> bool:
+        if response.status_code != HTTPStatus.OK:
+            logger.warning(f'Refresh tokens of user "{self.request.username}" failed '
+                           f'with status code "{response.status_code}", logging in again.')
+            return False
+
+        refresh_response = RefreshResponseSchema.model_validate_json(response.text)
+        self._set_login_response(self._login_response.model_copy(update=refresh_response.model_dump()))
+
+        logger.info(f'Tokens of user "{self.request.username}" were refreshed.')
+        return True
+
+
+class BearerTokenAuth(Auth):
+    def __init__(self, token_manager: TokenManager):
+        """
+        Схема аутентификации httpx, подставляющая актуальный access_token из TokenManager в каждый запрос.
+        При ответе [401]UNAUTHORIZED токены обновляются и запрос повторяется один раз.
+        Для httpx.AsyncClient токены получаются и обновляются асинхронно (async_auth_flow).
+
+        :param token_manager: Менеджер токенов пользователя.
+        """
+        self.token_manager = token_manager
+
+    def auth_flow(self, request: Request) -> Generator[Request, Response, None]:
+        access_token = self.token_manager.access_token
+        request.headers['Authorization'] = f'Bearer {access_token}'
+        response = yield request
+
+        if response.status_code == HTTPStatus.UNAUTHORIZED:
+            self.token_manager.force_refresh(rejected_token=access_token)
+            request.headers['Authorization'] = f'Bearer {self.token_manager.access_token}'
+            yield request
+
+    async def async_auth_flow(self, request: Request) -> AsyncGenerator[Request, Response]:
+        access_token = await self.token_manager.async_access_token()
+        request.headers['Authorization'] = f'Bearer {access_token}'
+        response = yield request
+
+        if response.status_code == HTTPStatus.UNAUTHORIZED:
+            await self.token_manager.async_force_refresh(rejected_token=access_token)
+            request.headers['Authorization'] = f'Bearer {await self.token_manager.async_access_token()}'
+            yield request
+
+
+def get_token_manager(request: LoginRequestSchema) -> TokenManager:
+    """
+    Функция создаёт экземпляр TokenManager с настройками из config.py.
+
+    :param request: Объект LoginRequestSchema с username и паролем пользователя.
+    :return: Готовый к использованию TokenManager.
+    """
+    return TokenManager(request=request,
+                        refresh_margin=settings.http_client.token_refresh_margin)
\ No newline at end of file
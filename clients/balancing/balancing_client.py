@@ -1,12 +1,10 @@
-import allure
 from httpx import Response
-from requests import Response as requests_Response
 from clients.balancing.balancing_schema import GetBalancingListResponseSchema, CreateBalancingRequestSchema, \
     UpdateBalancingRequestSchema, DeleteBalancingRequestSchema
-from clients.api_client import APIClient
-from clients.api_session import APISession
-from clients.private_http_builder import AuthenticationUserSchema, get_private_http_client, get_private_http_session
-from config import settings
+from clients.api_client import APIClient, AsyncAPIClient
+from clients.private_http_builder import AuthenticationUserSchema, get_private_http_client, \
+    get_private_async_http_client
+from tools.allure.steps import client_step
 from tools.routes import APIRoutes
 from clients.api_coverage import tracker
 
@@ -16,7 +14,7 @@ class BalancingClient(APIClient):
     """
     Клиент для работы с /api/balancing/
     """
-    @allure.step('Get balancing list')
+    @client_step('Get balancing list')
     @tracker.track_coverage_httpx(f'{APIRoutes.BALANCING}')
     def get_balancing_list_api(self) -> Response:
         """
@@ -31,7 +29,7 @@ class BalancingClient(APIClient):
         return GetBalancingListResponseSchema.model_validate_json(response.text)
 
 
-    @allure.step('Create balancing group')
+    @client_step('Create balancing group')
     @tracker.track_coverage_httpx(f'{APIRoutes.BALANCING}')
     def create_balancing_api(self, request: CreateBalancingRequestSchema) -> Response:
         """
@@ -44,7 +42,7 @@ class BalancingClient(APIClient):
                          json=request.model_dump(by_alias=True))
 
 
-    @allure.step('Update balancing group')
+    @client_step('Update balancing group')
     @tracker.track_coverage_httpx(f'{APIRoutes.BALANCING}')
     def update_balancing_api(self, request: UpdateBalancingRequestSchema) -> Response:
         """
@@ -57,6 +55,19 @@ class BalancingClient(APIClient):
                         json=request.model_dump(by_alias=True))
 
 
+    @client_step('Delete balancing group')
+    @tracker.track_coverage_httpx(f'{APIRoutes.BALANCING}')
+    def delete_balancing_api(self, request: DeleteBalancingRequestSchema) -> Response:
+        """
+        Метод удаления балансировки.
+
+        :param request: Словарь с logic_group (logicGroup).
+        :return: Ответ от сервера в виде объекта httpx.Response.
+        """
+        return self.delete(url=f'{APIRoutes.BALANCING}',
+                           json=request.model_dump(by_alias=True))
+
+
 def get_balancing_client(user: AuthenticationUserSchema) -> BalancingClient:
     """
     Функция создаёт экземпляр BalancingClient с уже настроенным HTTP-клиентом.
@@ -65,27 +76,24 @@ def get_balancing_client(user: AuthenticationUserSchema) -> BalancingClient:
     """
     return BalancingClient(client=get_private_http_client(user=user))
 
-# ----------------------------------------------------------------------------------------------------------------------
 
-class BalancingSession(APISession):
-
-    @allure.step('Delete balancing group')
-    @tracker.track_coverage_requests(f'{APIRoutes.BALANCING}')
-    def delete_balancing_api(self, request: DeleteBalancingRequestSchema) -> requests_Response:
-        """
-        Метод удаления балансировки.
+class AsyncBalancingClient(AsyncAPIClient, BalancingClient):
+    """
+    Асинхронный клиент для работы с /api/balancing/
+    Методы запросов (*_api) возвращают корутины с httpx.Response,
+    get_balancing_list переопределён как корутина, возвращающая GetBalancingListResponseSchema.
+    """
 
-        :param request: Словарь с logic_group (logicGroup).
-        :return: Объект requests_Response с данными ответа.
-        """
-        return self.delete(url=f'{settings.http_client.client_url}{APIRoutes.BALANCING}',
-                           json=request.model_dump(by_alias=True))
+    async def get_balancing_list(self) -> GetBalancingListResponseSchema:
+        response = await self.get_balancing_list_api()
+        return GetBalancingListResponseSchema.model_validate_json(response.text)
 
 
-def get_balancing_session(access_token: str) -> BalancingSession:
+def get_async_balancing_client(user: AuthenticationUserSchema) -> AsyncBalancingClient:
     """
-    Функция создаёт экземпляр BalancingSession с уже настроенным HTTP-клиентом.
+    Функция создаёт экземпляр AsyncBalancingClient с общим для пользователя асинхронным HTTP-клиентом.
+    Должна вызываться внутри запущенного event loop.
 
-    :return: Готовый к использованию BalancingSession.
+    :return: Готовый к использованию AsyncBalancingClient.
     """
-    return BalancingSession(session=get_private_http_session(access_token=access_token))
\ No newline at end of file
+    return AsyncBalancingClient(client=get_private_async_http_client(user=user))
\ No newline at end of file
@@ -1,11 +1,16 @@
-import allure
+import os
+from typing import Iterable, IO
+
 from httpx import Response
 
-from clients.api_client import APIClient
+from clients.api_client import APIClient, AsyncAPIClient
 from clients.api_coverage import tracker
 from clients.custom_config.custom_config_schema import UploadCustomConfigRequestSchema
-from clients.private_http_builder import get_private_http_client, AuthenticationUserSchema
+from clients.private_http_builder import get_private_http_client, AuthenticationUserSchema, \
+    get_private_async_http_client
 from clients.public_http_builder import get_public_http_client
+from clients.upload_stream import UploadStream, ProgressCallback, iter_file_chunks
+from tools.allure.steps import client_step
 from tools.routes import APIRoutes
 
 
@@ -14,7 +19,7 @@ class CustomConfigClient(APIClient):
     Клиент для работы с /api/custom_config/ (/api/default_config/)
     """
 
-    @allure.step('Download custom config')
+    @client_step('Download custom config')
     @tracker.track_coverage_httpx(f'{APIRoutes.CUSTOM_CONFIG}')
     def download_custom_config_api(self) -> Response:
         """
@@ -26,21 +31,45 @@ class CustomConfigClient(APIClient):
         return self.get(url=f'{APIRoutes.CUSTOM_CONFIG}')
 
 
-    @allure.step('Upload custom config')
+    @client_step('Upload custom config')
     @tracker.track_coverage_httpx(f'{APIRoutes.CUSTOM_CONFIG}')
-    def upload_custom_config_api(self, request: UploadCustomConfigRequestSchema) -> Response:
+    def upload_custom_config_api(self,
+                                 request: UploadCustomConfigRequestSchema,
+                                 on_progress: ProgressCallback | None = None) -> Response:
         """
         Метод загрузки на коммутатор пользовательского конфигурационного файла формате JSON.
         "Загрузить новую конфигурацию"
+        Файл отправляется частями по мере чтения с диска, без разбора и проверки содержимого.
+        Файл открывается при отправке тела запроса, поэтому метод работает и в AsyncCustomConfigClient.
 
         :param request: Словарь с config (путь к файлу).
+        :param on_progress: Функция, получающая UploadProgress по мере отправки файла.
+        :return: Ответ от сервера в виде объекта httpx.Response.
+        """
+        return self.post(url=f'{APIRoutes.CUSTOM_CONFIG}',
+                         files={"config": ("upload", UploadStream(source=lambda: iter_file_chunks(request.config),
+                                                                  size=os.path.getsize(request.config),
+                                                                  on_progress=on_progress))})
+
+
+    @client_step('Upload custom config stream')
+    @tracker.track_coverage_httpx(f'{APIRoutes.CUSTOM_CONFIG}')
+    def upload_custom_config_stream_api(self,
+                                        stream: Iterable[bytes] | IO[bytes],
+                                        on_progress: ProgressCallback | None = None) -> Response:
+        """
+        Метод загрузки на коммутатор конфигурации из открытого файла или генератора частей файла.
+        Если размер заранее неизвестен, тело запроса отправляется с Transfer-Encoding: chunked.
+
+        :param stream: Бинарный файл или итерируемый объект с частями конфигурационного файла.
+        :param on_progress: Функция, получающая UploadProgress по мере отправки файла.
         :return: Ответ от сервера в виде объекта httpx.Response.
         """
         return self.post(url=f'{APIRoutes.CUSTOM_CONFIG}',
-                         files={"config": request.config.read_bytes()})
+                         files={"config": ("upload", UploadStream(source=stream, on_progress=on_progress))})
 
 
-    @allure.step('Saving custom config')
+    @client_step('Saving custom config')
     @tracker.track_coverage_httpx(f'{APIRoutes.CUSTOM_CONFIG}')
     def saving_custom_config_api(self) -> Response:
         """
@@ -52,7 +81,7 @@ class CustomConfigClient(APIClient):
         return self.put(url=f'{APIRoutes.CUSTOM_CONFIG}')
 
 
-    @allure.step('Restore custom config')
+    @client_step('Restore custom config')
     @tracker.track_coverage_httpx(f'{APIRoutes.CUSTOM_CONFIG}')
     def restore_custom_config_api(self) -> Response:
         """
@@ -64,7 +93,7 @@ class CustomConfigClient(APIClient):
         return self.delete(url=f'{APIRoutes.CUSTOM_CONFIG}')
 
 
-    @allure.step('Return default config')
+    @client_step('Return default config')
     @tracker.track_coverage_httpx(f'{APIRoutes.DEFAULT_CONFIG}')
     def return_default_config(self) -> Response:
         """
@@ -78,7 +107,7 @@ class CustomConfigClient(APIClient):
 
 
 
-    @allure.step('Get switch info')
+    @client_step('Get switch info')
     @tracker.track_coverage_httpx(f'{APIRoutes.SWITCH_INFO}')
     def get_switch_info_api(self):
         """
@@ -104,4 +133,22 @@ def get_unauthorised_custom_config_client() -> CustomConfigClient:
 
     :return: Готовый к использованию CustomConfigClient без авторизации.
     """
-    return CustomConfigClient(client=get_public_http_client())
\ No newline at end of file
+    return CustomConfigClient(client=get_public_http_client())
+
+
+class AsyncCustomConfigClient(AsyncAPIClient, CustomConfigClient):
+    """
+    Асинхронный клиент для работы с /api/custom_config/ (/api/default_config/)
+    Все методы CustomConfigClient, включая return_default_config, выполняют запросы и возвращают корутины.
+    Загружаемый файл открывается только при отправке тела запроса (см. upload_custom_config_api).
+    """
+
+
+def get_async_custom_config_client(user: AuthenticationUserSchema) -> AsyncCustomConfigClient:
+    """
+    Функция создаёт экземпляр AsyncCustomConfigClient с общим для пользователя асинхронным HTTP-клиентом.
+    Должна вызываться внутри запущенного event loop.
+
+    :return: Готовый к использованию AsyncCustomConfigClient.
+    """
+    return AsyncCustomConfigClient(client=get_private_async_http_client(user=user))
\ No newline at end of file
@@ -1,14 +1,12 @@
-import allure
 from httpx import Response
-from requests import Response as requests_Response
-from clients.api_client import APIClient
+from clients.api_client import APIClient, AsyncAPIClient
 from clients.api_coverage import tracker
-from clients.api_session import APISession
 from clients.egress_groups.egress_groups_schema import CreateEgressGroupRequestSchema, UpdateEgressGroupRequestSchema, \
     DeleteEgressGroupRequestSchema
-from clients.private_http_builder import get_private_http_client, AuthenticationUserSchema, get_private_http_session
-from clients.public_http_builder import get_public_http_client, get_public_http_session
-from config import settings
+from clients.private_http_builder import get_private_http_client, AuthenticationUserSchema, \
+    get_private_async_http_client
+from clients.public_http_builder import get_public_http_client
+from tools.allure.steps import client_step
 from tools.routes import APIRoutes
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -18,7 +16,7 @@ class EgressGroupsClient(APIClient):
     Клиент для работы с /api/egress_groups/
     """
 
-    @allure.step('Get egress group list')
+    @client_step('Get egress group list')
     @tracker.track_coverage_httpx(f'{APIRoutes.EGRESS_GROUPS}')
     def get_egress_group_list_api(self) -> Response:
         """
@@ -30,7 +28,7 @@ class EgressGroupsClient(APIClient):
         return self.get(url=f'{APIRoutes.EGRESS_GROUPS}')
 
 
-    @allure.step('Create egress group')
+    @client_step('Create egress group')
     @tracker.track_coverage_httpx(f'{APIRoutes.EGRESS_GROUPS}')
     def create_egress_group_api(self, request: CreateEgressGroupRequestSchema) -> Response:
         """
@@ -43,7 +41,7 @@ class EgressGroupsClient(APIClient):
                          json=request.model_dump(by_alias=True))
 
 
-    @allure.step('Update egress group')
+    @client_step('Update egress group')
     @tracker.track_coverage_httpx(f'{APIRoutes.EGRESS_GROUPS}')
     def update_egress_group_api(self, request: UpdateEgressGroupRequestSchema) -> Response:
         """
@@ -56,6 +54,19 @@ class EgressGroupsClient(APIClient):
                         json=request.model_dump(by_alias=True))
 
 
+    @client_step('Delete egress group')
+    @tracker.track_coverage_httpx(f'{APIRoutes.EGRESS_GROUPS}')
+    def delete_egress_group_api(self, request: DeleteEgressGroupRequestSchema) -> Response:
+        """
+        Метод удаления выходной группы.
+
+        :param request: Словарь DeleteEgressGroupRequestSchema.model_dump(by_alias=True).
+        :return: Ответ от сервера в виде объекта httpx.Response.
+        """
+        return self.delete(url=f'{APIRoutes.EGRESS_GROUPS}',
+                           json=request.model_dump(by_alias=True))
+
+
 def get_egress_groups_client(user: AuthenticationUserSchema) -> EgressGroupsClient:
     """
     Функция создаёт экземпляр EgressGroupsClient с уже настроенным HTTP-клиентом.
@@ -72,35 +83,19 @@ def get_unauthorised_egress_groups_client() -> EgressGroupsClient:
     """
     return EgressGroupsClient(client=get_public_http_client())
 
-# ----------------------------------------------------------------------------------------------------------------------
-
-class EgressGroupsSession(APISession):
-
-    @allure.step('Delete egress group')
-    @tracker.track_coverage_requests(f'{APIRoutes.EGRESS_GROUPS}')
-    def delete_egress_group_api(self, request: DeleteEgressGroupRequestSchema) -> requests_Response:
-        """
-        Метод удаления выходной группы.
 
-        :param request: Словарь DeleteEgressGroupRequestSchema.model_dump(by_alias=True).
-        :return: Объект requests_Response с данными ответа.
-        """
-        return self.delete(url=f'{settings.http_client.client_url}{APIRoutes.EGRESS_GROUPS}',
-                           json=request.model_dump(by_alias=True))
-
-
-def get_egress_groups_session(access_token: str) -> EgressGroupsSession:
+class AsyncEgressGroupsClient(AsyncAPIClient, EgressGroupsClient):
     """
-    Функция создаёт экземпляр EgressGroupsSession с уже настроенным HTTP-клиентом.
-
-    :return: Готовый к использованию EgressGroupsSession.
+    Асинхронный клиент для работы с /api/egress_groups/
+    Все методы EgressGroupsClient выполняют запросы, поэтому здесь возвращают корутины с httpx.Response.
     """
-    return EgressGroupsSession(session=get_private_http_session(access_token=access_token))
 
-def get_unauthorised_egress_groups_session() -> EgressGroupsSession:
+
+def get_async_egress_groups_client(user: AuthenticationUserSchema) -> AsyncEgressGroupsClient:
     """
-    Функция создаёт экземпляр неавторизованного EgressGroupsSession с уже настроенным HTTP-клиентом.
+    Функция создаёт экземпляр AsyncEgressGroupsClient с общим для пользователя асинхронным HTTP-клиентом.
+    Должна вызываться внутри запущенного event loop.
 
-    :return: Готовый к использованию EgressGroupsSession без авторизации.
+    :return: Готовый к использованию AsyncEgressGroupsClient.
     """
-    return EgressGroupsSession(session=get_public_http_session())
\ No newline at end of file
+    return AsyncEgressGroupsClient(client=get_private_async_http_client(user=user))
\ No newline at end of file
@@ -1,5 +1,6 @@
 from httpx import Request, Response
 from tools.logger import get_logger
+from tools.timings import RequestTimer, TimedResponseStream, get_timing_recorder
 
 
 logger = get_logger('HTTP_CLIENT')
@@ -20,4 +21,75 @@ def log_response_event_hook(response: Response):
 
     :param response: Объект ответа HTTPX.
     """
-    logger.info(f'Got response {response.status_code} {response.reason_phrase} from "{response.url}"')
\ No newline at end of file
+    logger.info(f'Got response {response.status_code} {response.reason_phrase} from "{response.url}"')
+
+
+def start_timing_event_hook(request: Request):
+    """
+    Запускает замер времени выполнения HTTP-запроса.
+    Фазы соединения (connect, TLS, получение заголовков ответа) фиксируются через trace-расширение httpcore.
+
+    :param request: Объект запроса HTTPX.
+    """
+    timer = RequestTimer(request=request)
+    request.extensions['timer'] = timer
+    request.extensions['trace'] = timer.trace
+
+
+def finish_timing_event_hook(response: Response):
+    """
+    Завершает замер времени выполнения HTTP-запроса.
+    Запись в файл замеров выполняется при закрытии потока ответа, то есть после получения всего тела ответа.
+
+    :param response: Объект ответа HTTPX.
+    """
+    timer: RequestTimer | None = response.request.extensions.get('timer')
+    if timer is None:
+        return
+
+    def record(response_bytes: int):
+        get_timing_recorder().write(timer.build_record(response=response, response_bytes=response_bytes))
+
+    if response.is_closed:      # Тело ответа уже получено целиком (например, ответ эмулятора коммутатора)
+        record(response_bytes=len(response.content))
+        return
+
+    response.stream = TimedResponseStream(stream=response.stream, on_close=record)
+
+
+async def log_async_request_event_hook(request: Request):
+    """
+    Логирует информацию об отправленном HTTP-запросе асинхронного клиента.
+    httpx.AsyncClient принимает только корутины в качестве event hooks.
+
+    :param request: Объект запроса HTTPX.
+    """
+    log_request_event_hook(request=request)
+
+
+async def log_async_response_event_hook(response: Response):
+    """
+    Логирует информацию о полученном HTTP-ответе асинхронного клиента.
+
+    :param response: Объект ответа HTTPX.
+    """
+    log_response_event_hook(response=response)
+
+
+async def start_async_timing_event_hook(request: Request):
+    """
+    Запускает замер времени выполнения HTTP-запроса асинхронного клиента.
+
+    :param request: Объект запроса HTTPX.
+    """
+    start_timing_event_hook(request=request)
+    request.extensions['trace'] = request.extensions['timer'].atrace
+
+
+async def finish_async_timing_event_hook(response: Response):
+    """
+    Завершает замер времени выполнения HTTP-запроса асинхронного клиента.
+
+    :param response: Объект ответа HTTPX.
+    """
+    finish_timing_event_hook(response=response)
\ No newline at end of file
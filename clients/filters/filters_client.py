@@ -1,13 +1,16 @@
-import allure
+import asyncio
+import itertools
+from typing import Iterable, Iterator, AsyncIterator, Awaitable, Callable
+
 from httpx import Response
-from requests import Response as requests_Response
-from clients.api_client import APIClient
+from clients.api_client import APIClient, AsyncAPIClient
 from clients.api_coverage import tracker
-from clients.api_session import APISession
-from clients.filters.filters_schema import DeleteFiltersRequestSchema, CreateFilterSchema
-from clients.private_http_builder import get_private_http_client, AuthenticationUserSchema, get_private_http_session
-from clients.public_http_builder import get_public_http_client, get_public_http_session
-from config import settings
+from clients.filters.filters_schema import DeleteFiltersRequestSchema, CreateFilterSchema, DeleteFilterSchema, \
+    CreateFiltersRequestSchema, FilterBulkResultSchema
+from clients.private_http_builder import get_private_http_client, AuthenticationUserSchema, \
+    get_private_async_http_client
+from clients.public_http_builder import get_public_http_client
+from tools.allure.steps import client_step
 from tools.routes import APIRoutes
 
 
@@ -16,7 +19,7 @@ class FiltersClient(APIClient):
     Клиент для работы с /api/filters/
     """
 
-    @allure.step('Get filters list')
+    @client_step('Get filters list')
     @tracker.track_coverage_httpx(f'{APIRoutes.FILTERS}')
     def get_filters_api(self) -> Response:
         """
@@ -28,7 +31,28 @@ class FiltersClient(APIClient):
         return self.get(url=f'{APIRoutes.FILTERS}')
 
 
-    @allure.step('Create filters')
+    @client_step('Get filters list stream')
+    @tracker.track_coverage_httpx(f'{APIRoutes.FILTERS}')
+    def get_filters_stream_api(self) -> Response:
+        """
+        Метод получения списка сконфигурированных фильтров без чтения тела ответа (см. iter_filters).
+
+        :return: Ответ от сервера в виде объекта httpx.Response с непрочитанным телом.
+        """
+        return self.stream(url=f'{APIRoutes.FILTERS}')
+
+
+    def iter_filters(self) -> Iterator[DeleteFilterSchema]:
+        """
+        Метод потокового получения списка сконфигурированных фильтров (см. APIClient.stream_items).
+        Подходит для таблиц из тысяч фильтров: элементы валидируются по мере получения ответа.
+
+        :return: Итератор сконфигурированных фильтров.
+        """
+        return self.stream_items(send=self.get_filters_stream_api, model=DeleteFilterSchema)
+
+
+    @client_step('Create filters')
     @tracker.track_coverage_httpx(f'{APIRoutes.FILTERS}')
     def create_filters_api(self, request: CreateFilterSchema) -> Response:
         """
@@ -42,7 +66,33 @@ class FiltersClient(APIClient):
                          json=[request.model_dump(by_alias=True)])
 
 
-    @allure.step('Delete all filters group')
+    @client_step('Create filters batch')
+    @tracker.track_coverage_httpx(f'{APIRoutes.FILTERS}')
+    def create_filters_batch_api(self, request: CreateFiltersRequestSchema) -> Response:
+        """
+        Метод добавления нескольких фильтров одним запросом.
+
+        :param request: Список фильтров на основе модели CreateFiltersRequestSchema.
+        :return: Ответ от сервера в виде объекта httpx.Response.
+        """
+        return self.post(url=f'{APIRoutes.FILTERS}',
+                         json=request.model_dump(by_alias=True))
+
+
+    @client_step('Delete filters batch')
+    @tracker.track_coverage_httpx(f'{APIRoutes.FILTERS}')
+    def delete_filters_batch_api(self, request: DeleteFiltersRequestSchema) -> Response:
+        """
+        Метод удаления нескольких фильтров одним запросом.
+
+        :param request: Список фильтров на основе модели DeleteFiltersRequestSchema.
+        :return: Ответ от сервера в виде объекта httpx.Response.
+        """
+        return self.delete(url=f'{APIRoutes.FILTERS}',
+                           json=request.model_dump(by_alias=True))
+
+
+    @client_step('Delete all filters group')
     @tracker.track_coverage_httpx(f'{APIRoutes.ALL_FILTERS}')
     def delete_all_filters_api(self) -> Response:
         """
@@ -53,6 +103,19 @@ class FiltersClient(APIClient):
         return self.delete(url=f'{APIRoutes.ALL_FILTERS}')
 
 
+    @client_step('Delete filters group')
+    @tracker.track_coverage_httpx(f'{APIRoutes.FILTERS}')
+    def delete_filters_api(self, request: DeleteFiltersRequestSchema) -> Response:
+        """
+        Метод удаления фильтров.
+
+        :param request: Список словарей на основе модели DeleteFilterSchema.
+        :return: Ответ от сервера в виде объекта httpx.Response.
+        """
+        return self.delete(url=f'{APIRoutes.FILTERS}',
+                           json=request)
+
+
 def get_filters_client(user: AuthenticationUserSchema) -> FiltersClient:
     """
     Функция создаёт экземпляр FiltersClient с уже настроенным HTTP-клиентом.
@@ -70,36 +133,109 @@ def get_unauthorised_filters_client() -> FiltersClient:
     """
     return FiltersClient(client=get_public_http_client())
 
-# ----------------------------------------------------------------------------------------------------------------------
 
-class FiltersSession(APISession):
+class AsyncFiltersClient(AsyncAPIClient, FiltersClient):
+    """
+    Асинхронный клиент для работы с /api/filters/
+    Методы запросов возвращают корутины, iter_filters - асинхронный итератор фильтров.
+    Пакетные create_filters_bulk и delete_filters_bulk есть только у асинхронного клиента.
+    """
 
-    @allure.step('Delete filters group')
-    @tracker.track_coverage_requests(f'{APIRoutes.FILTERS}')
-    def delete_filters_api(self, request: DeleteFiltersRequestSchema) -> requests_Response:
+    def iter_filters(self) -> AsyncIterator[DeleteFilterSchema]:
         """
-        Метод удаления фильтров.
+        Метод потокового получения списка сконфигурированных фильтров (см. AsyncAPIClient.stream_items).
 
-        :param request: Список словарей на основе модели DeleteFilterSchema.
-        :return: Объект requests.Response с данными ответа.
+        :return: Асинхронный итератор сконфигурированных фильтров.
         """
-        return self.delete(url=f'{settings.http_client.client_url}{APIRoutes.FILTERS}',
-                           json=request)
-
+        return self.stream_items(send=self.get_filters_stream_api, model=DeleteFilterSchema)
 
-def get_filters_session(access_token: str) -> FiltersSession:
-    """
-    Функция создаёт экземпляр FiltersSession с уже настроенным HTTP-клиентом.
+    def create_filters_bulk(self,
+                            filters: Iterable[CreateFilterSchema],
+                            batch_size: int = 100,
+                            concurrency: int = 4
+                            ) -> AsyncIterator[FilterBulkResultSchema]:
+        """
+        Метод пакетного создания фильтров.
+        Фильтры читаются из filters по мере отправки пакетами по batch_size штук, одновременно выполняется
+        не более concurrency запросов, поэтому весь набор фильтров не хранится в памяти.
+
+        :param filters: Последовательность фильтров на основе модели CreateFilterSchema (например, генератор).
+        :param batch_size: Количество фильтров в одном запросе.
+        :param concurrency: Максимальное количество одновременно выполняемых запросов.
+        :return: Асинхронный итератор результатов по каждому фильтру в порядке завершения пакетов.
+        """
+        return _send_in_batches(send=lambda batch: self.create_filters_batch_api(CreateFiltersRequestSchema(batch)),
+                                items=filters,
+                                batch_size=batch_size,
+                                concurrency=concurrency)
+
+    def delete_filters_bulk(self,
+                            filters: Iterable[DeleteFilterSchema],
+                            batch_size: int = 100,
+                            concurrency: int = 4
+                            ) -> AsyncIterator[FilterBulkResultSchema]:
+        """
+        Метод пакетного удаления фильтров. Работает аналогично create_filters_bulk.
 
-    :return: Готовый к использованию FiltersSession.
-    """
-    return FiltersSession(session=get_private_http_session(access_token=access_token))
+        :param filters: Последовательность фильтров на основе модели DeleteFilterSchema (например, генератор).
+        :param batch_size: Количество фильтров в одном запросе.
+        :param concurrency: Максимальное количество одновременно выполняемых запросов.
+        :return: Асинхронный итератор результатов по каждому фильтру в порядке завершения пакетов.
+        """
+        return _send_in_batches(send=lambda batch: self.delete_filters_batch_api(DeleteFiltersRequestSchema(batch)),
+                                items=filters,
+                                batch_size=batch_size,
+                                concurrency=concurrency)
 
 
-def get_unauthorised_filters_session() -> FiltersSession:
+def get_async_filters_client(user: AuthenticationUserSchema) -> AsyncFiltersClient:
     """
-    Функция создаёт экземпляр неавторизованного FiltersSession с уже настроенным HTTP-клиентом.
+    Функция создаёт экземпляр AsyncFiltersClient с общим для пользователя асинхронным HTTP-клиентом.
+    Должна вызываться внутри запущенного event loop.
 
-    :return: Готовый к использованию FiltersSession без авторизации.
+    :return: Готовый к использованию AsyncFiltersClient.
     """
-    return FiltersSession(session=get_public_http_session())
\ No newline at end of file
+    return AsyncFiltersClient(client=get_private_async_http_client(user=user))
+
+
+async def _send_batch(send: Callable[[list], Awaitable[Response]],
+                      batch: list,
+                      start_index: int) -> list[FilterBulkResultSchema]:
+    try:
+        response = await send(batch)
+        status_code, error = response.status_code, response.text if response.is_error else None
+    except Exception as exception:
+        status_code, error = None, f'{type(exception).__name__}: {exception}'
+
+    # Сервер принимает или отклоняет пакет целиком, поэтому результат пакета относится к каждому его фильтру
+    return [FilterBulkResultSchema(index=index, status_code=status_code, error=error)
+            for index in range(start_index, start_index + len(batch))]
+
+
+async def _send_in_batches(send: Callable[[list], Awaitable[Response]],
+                           items: Iterable,
+                           batch_size: int,
+                           concurrency: int) -> AsyncIterator[FilterBulkResultSchema]:
+    iterator = iter(items)
+    pending: set[asyncio.Task] = set()
+    start_index = 0
+
+    try:
+        while batch := list(itertools.islice(iterator, batch_size)):
+            if len(pending) >= concurrency:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    for result in task.result():
+                        yield result
+
+            pending.add(asyncio.create_task(_send_batch(send=send, batch=batch, start_index=start_index)))
+            start_index += len(batch)
+
+        for task in asyncio.as_completed(pending):
+            for result in await task:
+                yield result
+    finally:
+        for task in pending:
+            task.cancel()
+        # Отменённые пакеты дожидаются завершения, чтобы их запросы не выполнялись после закрытия итератора
+        await asyncio.gather(*pending, return_exceptions=True)
\ No newline at end of file
@@ -136,4 +136,21 @@ class DeleteFiltersRequestSchema(RootModel):
     Описание структуры запроса на удаление фильтров.
     List[DeleteFilterSchema]
     """
-    root: List[DeleteFilterSchema]
\ No newline at end of file
+    root: List[DeleteFilterSchema]
+
+
+class FilterBulkResultSchema(BaseModel):
+    """
+    Описание структуры результата обработки одного фильтра при пакетном создании или удалении.
+    Attributes:
+        index: int - Порядковый номер фильтра во входной последовательности
+        status_code: int | None - Статус-код ответа на пакет, в который входил фильтр (None - ответ не получен)
+        error: str | None - Текст ошибки сервера или исключения httpx
+    """
+    index: int
+    status_code: int | None
+    error: str | None = None
+
+    @property
+    def is_success(self) -> bool:
+        return self.error is None
\ No newline at end of file
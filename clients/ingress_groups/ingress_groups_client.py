@@ -1,14 +1,12 @@
-import allure
 from httpx import Response
-from requests import Response as requests_Response
-from clients.api_client import APIClient
+from clients.api_client import APIClient, AsyncAPIClient
 from clients.api_coverage import tracker
-from clients.api_session import APISession
 from clients.ingress_groups.ingress_groups_schema import CreateIngressGroupRequestSchema, \
     UpdateIngressGroupRequestSchema, DeleteIngressGroupRequestSchema
-from clients.private_http_builder import get_private_http_client, AuthenticationUserSchema, get_private_http_session
-from clients.public_http_builder import get_public_http_client, get_public_http_session
-from config import settings
+from clients.private_http_builder import get_private_http_client, AuthenticationUserSchema, \
+    get_private_async_http_client
+from clients.public_http_builder import get_public_http_client
+from tools.allure.steps import client_step
 from tools.routes import APIRoutes
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -17,7 +15,7 @@ class IngressGroupsClient(APIClient):
     """
     Клиент для работы с /api/ingress_groups/
     """
-    @allure.step('Get ingress group list')
+    @client_step('Get ingress group list')
     @tracker.track_coverage_httpx(f'{APIRoutes.INGRESS_GROUPS}')
     def get_ingress_group_list_api(self) -> Response:
         """
@@ -29,7 +27,7 @@ class IngressGroupsClient(APIClient):
         return self.get(url=f'{APIRoutes.INGRESS_GROUPS}')
 
 
-    @allure.step('Create ingress group')
+    @client_step('Create ingress group')
     @tracker.track_coverage_httpx(f'{APIRoutes.INGRESS_GROUPS}')
     def create_ingress_group_api(self, request: CreateIngressGroupRequestSchema) -> Response:
         """
@@ -42,7 +40,7 @@ class IngressGroupsClient(APIClient):
                          json=request.model_dump(by_alias=True))
 
 
-    @allure.step('Update ingress group')
+    @client_step('Update ingress group')
     @tracker.track_coverage_httpx(f'{APIRoutes.INGRESS_GROUPS}')
     def update_ingress_group_api(self, request: UpdateIngressGroupRequestSchema) -> Response:
         """
@@ -55,6 +53,30 @@ class IngressGroupsClient(APIClient):
                         json=request.model_dump(by_alias=True))
 
 
+    @client_step('Delete ingress group')
+    @tracker.track_coverage_httpx(f'{APIRoutes.INGRESS_GROUPS}')
+    def delete_ingress_group_api(self, request: DeleteIngressGroupRequestSchema) -> Response:
+        """
+        Метод удаления входной группы.
+
+        :param request: Словарь DeleteIngressGroupRequestSchema.model_dump(by_alias=True).
+        :return: Ответ от сервера в виде объекта httpx.Response.
+        """
+        return self.delete(url=f'{APIRoutes.INGRESS_GROUPS}',
+                           json=request.model_dump(by_alias=True))
+
+
+    @client_step('Delete nonexistent ingress group')
+    @tracker.track_coverage_httpx(f'{APIRoutes.INGRESS_GROUPS}')
+    def incorrect_delete_ingress_group_api(self) -> Response:
+        """
+        Метод для обработки ошибки [412] с помощью удаления не существующей входной группы.
+
+        :return: Ответ от сервера в виде объекта httpx.Response.
+        """
+        return self.delete(url=f'{APIRoutes.INGRESS_GROUPS}')
+
+
 def get_ingress_group_client(user: AuthenticationUserSchema) -> IngressGroupsClient:
     """
     Функция создаёт экземпляр IngressGroupsClient с уже настроенным HTTP-клиентом.
@@ -72,47 +94,19 @@ def get_unauthorised_ingress_group_client() -> IngressGroupsClient:
     """
     return IngressGroupsClient(client=get_public_http_client())
 
-# ----------------------------------------------------------------------------------------------------------------------
-
-class IngressGroupsSession(APISession):
-
-    @allure.step('Delete ingress group')
-    @tracker.track_coverage_requests(f'{APIRoutes.INGRESS_GROUPS}')
-    def delete_ingress_group_api(self, request: DeleteIngressGroupRequestSchema) -> requests_Response:
-        """
-        Метод удаления входной группы.
-
-        :param request: Словарь DeleteIngressGroupRequestSchema.model_dump(by_alias=True).
-        :return: Объект requests_Response с данными ответа.
-        """
-        return self.delete(url=f'{settings.http_client.client_url}{APIRoutes.INGRESS_GROUPS}',
-                           json=request.model_dump(by_alias=True))
 
-
-    @allure.step('Delete nonexistent ingress group')
-    @tracker.track_coverage_requests(f'{APIRoutes.PORTS}')
-    def incorrect_delete_ingress_group_api(self) -> requests_Response:
-        """
-        Метод для обработки ошибки [412] с помощью удаления не существующей входной группы.
-
-        :return: Объект requests_Response с данными ответа.
-        """
-        return self.delete(url=f'{settings.http_client.client_url}{APIRoutes.INGRESS_GROUPS}')
-
-
-def get_ingress_group_session(access_token: str) -> IngressGroupsSession:
+class AsyncIngressGroupsClient(AsyncAPIClient, IngressGroupsClient):
     """
-    Функция создаёт экземпляр IngressGroupsSession с уже настроенным HTTP-клиентом.
-
-    :return: Готовый к использованию IngressGroupsSession.
+    Асинхронный клиент для работы с /api/ingress_groups/
+    Все методы IngressGroupsClient выполняют запросы, поэтому здесь возвращают корутины с httpx.Response.
     """
-    return IngressGroupsSession(session=get_private_http_session(access_token=access_token))
 
 
-def get_unauthorised_ingress_group_session() -> IngressGroupsSession:
+def get_async_ingress_group_client(user: AuthenticationUserSchema) -> AsyncIngressGroupsClient:
     """
-    Функция создаёт экземпляр неавторизованного IngressGroupsSession с уже настроенным HTTP-клиентом.
+    Функция создаёт экземпляр AsyncIngressGroupsClient с общим для пользователя асинхронным HTTP-клиентом.
+    Должна вызываться внутри запущенного event loop.
 
-    :return: Готовый к использованию IngressGroupsSession без авторизации.
+    :return: Готовый к использованию AsyncIngressGroupsClient.
     """
-    return IngressGroupsSession(session=get_public_http_session())
\ No newline at end of file
+    return AsyncIngressGroupsClient(client=get_private_async_http_client(user=user))
\ No newline at end of file
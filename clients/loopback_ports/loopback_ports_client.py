@@ -1,13 +1,11 @@
-import allure
 from httpx import Response
-from requests import Response as requests_Response
-from clients.api_client import APIClient
+from clients.api_client import APIClient, AsyncAPIClient
 from clients.api_coverage import tracker
-from clients.api_session import APISession
 from clients.loopback_ports.loopback_ports_schema import DeleteLoopbackPortsRequestSchema, CreateLoopbackPortsRequestSchema
-from clients.private_http_builder import get_private_http_client, AuthenticationUserSchema, get_private_http_session
-from clients.public_http_builder import get_public_http_client, get_public_http_session
-from config import settings
+from clients.private_http_builder import get_private_http_client, AuthenticationUserSchema, \
+    get_private_async_http_client
+from clients.public_http_builder import get_public_http_client
+from tools.allure.steps import client_step
 from tools.routes import APIRoutes
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -17,7 +15,7 @@ class LoopbackPortsClient(APIClient):
     Клиент для работы с api/loopback_ports/.
     """
 
-    @allure.step('Get loopback ports speed limit list')
+    @client_step('Get loopback ports speed limit list')
     @tracker.track_coverage_httpx(f'{APIRoutes.LOOPBACK_PORTS}')
     def get_loopback_ports_speed(self) -> Response:
         """
@@ -29,7 +27,7 @@ class LoopbackPortsClient(APIClient):
         return self.get(url=f'{APIRoutes.LOOPBACK_PORTS}')
 
 
-    @allure.step('Create loopback ports speed limit')
+    @client_step('Create loopback ports speed limit')
     @tracker.track_coverage_httpx(f'{APIRoutes.LOOPBACK_PORTS}')
     def create_loopback_ports(self, request: CreateLoopbackPortsRequestSchema) -> Response:
         """
@@ -42,6 +40,19 @@ class LoopbackPortsClient(APIClient):
                          json=request.model_dump(by_alias=True))
 
 
+    @client_step('Delete loopback ports speed limit')
+    @tracker.track_coverage_httpx(f'{APIRoutes.LOOPBACK_PORTS}')
+    def delete_loopback_ports(self, request: DeleteLoopbackPortsRequestSchema) -> Response:
+        """
+        Метод удаления списка сконфигурированных портов.
+
+        :param request: Словарь DeleteLoopbackPortsRequestSchema.model_dump(by_alias=True).
+        :return: Ответ от сервера в виде объекта httpx.Response.
+        """
+        return self.delete(url=f'{APIRoutes.LOOPBACK_PORTS}',
+                           json=request.model_dump(by_alias=True))
+
+
 def get_loopback_ports_client(user: AuthenticationUserSchema) -> LoopbackPortsClient:
     """
     Функция создаёт экземпляр LoopbackPortsClient с уже настроенным HTTP-клиентом.
@@ -59,36 +70,20 @@ def get_unauthorised_loopback_ports_client() -> LoopbackPortsClient:
     """
     return LoopbackPortsClient(client=get_public_http_client())
 
-# ----------------------------------------------------------------------------------------------------------------------
 
-class LoopbackPortsSession(APISession):
-
-    @allure.step('Delete loopback ports speed limit')
-    @tracker.track_coverage_requests(f'{APIRoutes.LOOPBACK_PORTS}')
-    def delete_loopback_ports(self, request: DeleteLoopbackPortsRequestSchema) -> requests_Response:
-        """
-        Метод удаления списка сконфигурированных портов.
-
-        :param request: Словарь DeleteLoopbackPortsRequestSchema.model_dump(by_alias=True).
-        :return: Объект requests_Response с данными ответа.
-        """
-        return self.delete(url=f'{settings.http_client.client_url}{APIRoutes.LOOPBACK_PORTS}',
-                           json=request.model_dump(by_alias=True))
-
-
-def get_loopback_ports_session(access_token: str) -> LoopbackPortsSession:
+class AsyncLoopbackPortsClient(AsyncAPIClient, LoopbackPortsClient):
     """
-    Функция создаёт экземпляр LoopbackPortsSession с уже настроенной HTTP-сессией.
-
-    :return: Готовый к использованию LoopbackPortsSession.
+    Асинхронный клиент для работы с api/loopback_ports/.
+    Все методы LoopbackPortsClient выполняют запросы (в том числе методы без суффикса _api),
+    поэтому здесь возвращают корутины с httpx.Response.
     """
-    return LoopbackPortsSession(session=get_private_http_session(access_token=access_token))
 
 
-def get_unauthorised_loopback_ports_session() -> LoopbackPortsSession:
+def get_async_loopback_ports_client(user: AuthenticationUserSchema) -> AsyncLoopbackPortsClient:
     """
-    Функция создаёт экземпляр неавторизованного LoopbackPortsSession с уже настроенной HTTP-сессией.
+    Функция создаёт экземпляр AsyncLoopbackPortsClient с общим для пользователя асинхронным HTTP-клиентом.
+    Должна вызываться внутри запущенного event loop.
 
-    :return: Готовый к использованию LoopbackPortsSession без авторизации.
+    :return: Готовый к использованию AsyncLoopbackPortsClient.
     """
-    return LoopbackPortsSession(session=get_public_http_session())
\ No newline at end of file
+    return AsyncLoopbackPortsClient(client=get_private_async_http_client(user=user))
\ No newline at end of file
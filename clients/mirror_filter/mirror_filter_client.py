@@ -1,13 +1,11 @@
-import allure
 from httpx import Response
-from requests import Response as requests_Response
-from clients.api_client import APIClient
+from clients.api_client import APIClient, AsyncAPIClient
 from clients.api_coverage import tracker
-from clients.api_session import APISession
 from clients.mirror_filter.mirror_filter_schema import CreateMirrorFilterRequestSchema, DeleteMirrorFilterRequestSchema
-from clients.private_http_builder import get_private_http_client, AuthenticationUserSchema, get_private_http_session
-from clients.public_http_builder import get_public_http_client, get_public_http_session
-from config import settings
+from clients.private_http_builder import get_private_http_client, AuthenticationUserSchema, \
+    get_private_async_http_client
+from clients.public_http_builder import get_public_http_client
+from tools.allure.steps import client_step
 from tools.routes import APIRoutes
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -17,7 +15,7 @@ class MirrorFilterClient(APIClient):
     Клиент для работы с /api/mirror_filter/ и /api/psf_mirror_filter/.
     """
 
-    @allure.step('Get mirror filter list')
+    @client_step('Get mirror filter list')
     @tracker.track_coverage_httpx(f'{APIRoutes.MIRROR_FILTER}')
     def get_mirror_filter_list(self) -> Response:
         """
@@ -29,7 +27,7 @@ class MirrorFilterClient(APIClient):
         return self.get(url=f'{APIRoutes.MIRROR_FILTER}')
 
 
-    @allure.step('Create mirror filter')
+    @client_step('Create mirror filter')
     @tracker.track_coverage_httpx(f'{APIRoutes.MIRROR_FILTER}')
     def create_mirror_filter_api(self, request: CreateMirrorFilterRequestSchema) -> Response:
         """
@@ -44,7 +42,7 @@ class MirrorFilterClient(APIClient):
 
 
 
-    @allure.step('Get PSF mirror filter list')
+    @client_step('Get PSF mirror filter list')
     @tracker.track_coverage_httpx(f'{APIRoutes.PSF_MIRROR_FILTER}')
     def get_psf_mirror_filter_list_api(self) -> Response:
         """
@@ -56,6 +54,17 @@ class MirrorFilterClient(APIClient):
         return self.get(url=f'{APIRoutes.PSF_MIRROR_FILTER}')
 
 
+    @client_step('Delete mirror filters')
+    @tracker.track_coverage_httpx(f'{APIRoutes.MIRROR_FILTER}')
+    def delete_mirror_filters(self, request: DeleteMirrorFilterRequestSchema) -> Response:
+        """
+        Метод удаления фильтров зеркалирования.
+
+        :param request: Словарь DeleteMirrorFilterRequestSchema.model_dump(by_alias=True).
+        :return: Ответ от сервера в виде объекта httpx.Response.
+        """
+        return self.delete(url=f'{APIRoutes.MIRROR_FILTER}',
+                           json=request.model_dump(by_alias=True))
 
 
 def get_mirror_filter_client(user: AuthenticationUserSchema) -> MirrorFilterClient:
@@ -74,30 +83,20 @@ def get_unauthorized_mirror_filter_client() -> MirrorFilterClient:
     """
     return MirrorFilterClient(client=get_public_http_client())
 
-#-----------------------------------------------------------------------------------------------------------------------
-
-class MirrorFilterSession(APISession):
 
-    @allure.step('Delete mirror filters')
-    @tracker.track_coverage_requests(f'{APIRoutes.MIRROR_FILTER}')
-    def delete_mirror_filters(self, request: DeleteMirrorFilterRequestSchema) -> requests_Response:
-
-        return self.delete(url=f'{settings.http_client.client_url}{APIRoutes.MIRROR_FILTER}',
-                           json=request.model_dump(by_alias=True))
-
-
-def get_mirror_filter_session(access_token: str) -> MirrorFilterSession:
+class AsyncMirrorFilterClient(AsyncAPIClient, MirrorFilterClient):
     """
-    Функция создаёт экземпляр MirrorFilterSession с уже настроенным HTTP-клиентом.
-
-    :return: Готовый к использованию MirrorFilterSession.
+    Асинхронный клиент для работы с /api/mirror_filter/ и /api/psf_mirror_filter/.
+    Все методы MirrorFilterClient выполняют запросы (в том числе get_mirror_filter_list и delete_mirror_filters),
+    поэтому здесь возвращают корутины с httpx.Response.
     """
-    return MirrorFilterSession(get_private_http_session(access_token=access_token))
 
-def get_unauthorized_mirror_filter_session() -> MirrorFilterSession:
+
+def get_async_mirror_filter_client(user: AuthenticationUserSchema) -> AsyncMirrorFilterClient:
     """
-    Функция создаёт экземпляр неавторизованного MirrorFilterSession с уже настроенным HTTP-клиентом.
+    Функция создаёт экземпляр AsyncMirrorFilterClient с общим для пользователя асинхронным HTTP-клиентом.
+    Должна вызываться внутри запущенного event loop.
 
-    :return: Готовый к использованию MirrorFilterSession без авторизации.
+    :return: Готовый к использованию AsyncMirrorFilterClient.
     """
-    return MirrorFilterSession(get_public_http_session())
\ No newline at end of file
+    return AsyncMirrorFilterClient(client=get_private_async_http_client(user=user))
\ No newline at end of file
@@ -1,14 +1,12 @@
-import allure
 from httpx import Response
-from requests import Response as requests_Response
-from clients.api_client import APIClient
+from clients.api_client import APIClient, AsyncAPIClient
 from clients.api_coverage import tracker
-from clients.api_session import APISession
 from clients.mirroring.mirroring_schema import CreateMirroringRequestSchema, UpdateMirroringRequestSchema, \
     DeleteMirroringRequestSchema
-from clients.private_http_builder import get_private_http_client, AuthenticationUserSchema, get_private_http_session
-from clients.public_http_builder import get_public_http_client, get_public_http_session
-from config import settings
+from clients.private_http_builder import get_private_http_client, AuthenticationUserSchema, \
+    get_private_async_http_client
+from clients.public_http_builder import get_public_http_client
+from tools.allure.steps import client_step
 from tools.routes import APIRoutes
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -17,7 +15,7 @@ class MirroringClient(APIClient):
     """
     Клиент для работы с /api/mirroring/
     """
-    @allure.step('Get mirroring list')
+    @client_step('Get mirroring list')
     @tracker.track_coverage_httpx(f'{APIRoutes.MIRRORING}')
     def get_mirroring_list_api(self) -> Response:
         """
@@ -29,7 +27,7 @@ class MirroringClient(APIClient):
         return self.get(url=f'{APIRoutes.MIRRORING}')
 
 
-    @allure.step('Create mirroring group')
+    @client_step('Create mirroring group')
     @tracker.track_coverage_httpx(f'{APIRoutes.MIRRORING}')
     def create_mirroring_api(self, request: CreateMirroringRequestSchema) -> Response:
         """
@@ -42,7 +40,7 @@ class MirroringClient(APIClient):
                          json=request.model_dump(by_alias=True))
 
 
-    @allure.step('Update mirroring group')
+    @client_step('Update mirroring group')
     @tracker.track_coverage_httpx(f'{APIRoutes.MIRRORING}')
     def update_mirroring_api(self, request: UpdateMirroringRequestSchema) -> Response:
         """
@@ -55,6 +53,19 @@ class MirroringClient(APIClient):
                         json=request.model_dump(by_alias=True))
 
 
+    @client_step('Delete mirroring group')
+    @tracker.track_coverage_httpx(f'{APIRoutes.MIRRORING}')
+    def delete_mirroring_api(self, request: DeleteMirroringRequestSchema) -> Response:
+        """
+        Метод удаления балансировки.
+
+        :param request: Словарь DeleteMirroringRequestSchema.model_dump(by_alias=True).
+        :return: Ответ от сервера в виде объекта httpx.Response.
+        """
+        return self.delete(url=f'{APIRoutes.MIRRORING}',
+                           json=request.model_dump(by_alias=True))
+
+
 def get_mirroring_client(user: AuthenticationUserSchema) -> MirroringClient:
     """
     Функция создаёт экземпляр MirroringClient с уже настроенным HTTP-клиентом.
@@ -72,36 +83,19 @@ def get_unauthorised_mirroring_client() -> MirroringClient:
     """
     return MirroringClient(client=get_public_http_client())
 
-# ----------------------------------------------------------------------------------------------------------------------
 
-class MirroringSession(APISession):
-
-    @allure.step('Delete mirroring group')
-    @tracker.track_coverage_requests(f'{APIRoutes.MIRRORING}')
-    def delete_mirroring_api(self, request: DeleteMirroringRequestSchema) -> requests_Response:
-        """
-        Метод удаления балансировки.
-
-        :param request: Словарь DeleteMirroringRequestSchema.model_dump(by_alias=True).
-        :return: Объект requests_Response с данными ответа.
-        """
-        return self.delete(url=f'{settings.http_client.client_url}{APIRoutes.MIRRORING}',
-                           json=request.model_dump(by_alias=True))
-
-
-def get_mirroring_session(access_token: str) -> MirroringSession:
+class AsyncMirroringClient(AsyncAPIClient, MirroringClient):
     """
-    Функция создаёт экземпляр MirroringSession с уже настроенным HTTP-клиентом.
-
-    :return: Готовый к использованию MirroringSession.
+    Асинхронный клиент для работы с /api/mirroring/
+    Все методы MirroringClient выполняют запросы, поэтому здесь возвращают корутины с httpx.Response.
     """
-    return MirroringSession(session=get_private_http_session(access_token=access_token))
 
 
-def get_unauthorised_mirroring_session() -> MirroringSession:
+def get_async_mirroring_client(user: AuthenticationUserSchema) -> AsyncMirroringClient:
     """
-    Функция создаёт экземпляр неавторизованного MirroringSession с уже настроенным HTTP-клиентом.
+    Функция создаёт экземпляр AsyncMirroringClient с общим для пользователя асинхронным HTTP-клиентом.
+    Должна вызываться внутри запущенного event loop.
 
-    :return: Готовый к использованию MirroringSession без авторизации.
+    :return: Готовый к использованию AsyncMirroringClient.
     """
-    return MirroringSession(session=get_public_http_session())
\ No newline at end of file
+    return AsyncMirroringClient(client=get_private_async_http_client(user=user))
\ No newline at end of file
@@ -1,10 +1,13 @@
-import allure
+from typing import Iterator, AsyncIterator
+
 from httpx import Response
-from clients.api_client import APIClient
+from clients.api_client import APIClient, AsyncAPIClient
 from clients.api_coverage import tracker
-from clients.nodes.nodes_schema import CreateNodesRequestSchema
-from clients.private_http_builder import get_private_http_client, AuthenticationUserSchema
+from clients.nodes.nodes_schema import CreateNodesRequestSchema, NodeSchema
+from clients.private_http_builder import get_private_http_client, AuthenticationUserSchema, \
+    get_private_async_http_client
 from clients.public_http_builder import get_public_http_client
+from tools.allure.steps import client_step
 from tools.routes import APIRoutes
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -13,7 +16,7 @@ class NodesClient(APIClient):
     """
     Клиент для работы с /api/nodes/
     """
-    @allure.step('Get nodes list')
+    @client_step('Get nodes list')
     @tracker.track_coverage_httpx(f'{APIRoutes.NODES}')
     def get_nodes_list_api(self) -> Response:
         """
@@ -25,7 +28,28 @@ class NodesClient(APIClient):
         return self.get(url=f'{APIRoutes.NODES}')
 
 
-    @allure.step('Create nodes config')
+    @client_step('Get nodes list stream')
+    @tracker.track_coverage_httpx(f'{APIRoutes.NODES}')
+    def get_nodes_list_stream_api(self) -> Response:
+        """
+        Метод получения текущей конфигурации коммутатора на Web без чтения тела ответа (см. iter_nodes).
+
+        :return: Ответ от сервера в виде объекта httpx.Response с непрочитанным телом.
+        """
+        return self.stream(url=f'{APIRoutes.NODES}')
+
+
+    def iter_nodes(self) -> Iterator[NodeSchema]:
+        """
+        Метод потокового получения нод текущей конфигурации коммутатора на Web (см. APIClient.stream_items).
+        Из ответа разбирается только массив "nodes", остальные поля конфигурации пропускаются.
+
+        :return: Итератор нод конфигурации.
+        """
+        return self.stream_items(send=self.get_nodes_list_stream_api, model=NodeSchema, key='nodes')
+
+
+    @client_step('Create nodes config')
     @tracker.track_coverage_httpx(f'{APIRoutes.NODES}')
     def create_nodes_api(self, request: CreateNodesRequestSchema) -> Response:
         """
@@ -38,7 +62,7 @@ class NodesClient(APIClient):
                          json=request.model_dump(by_alias=True))
 
 
-    @allure.step('Create nodes config')
+    @client_step('Create nodes config')
     @tracker.track_coverage_httpx(f'{APIRoutes.NODES}')
     def create_nodes_api_json(self, request_JSON: str) -> Response:
         """
@@ -51,7 +75,7 @@ class NodesClient(APIClient):
                          json=request_JSON)
 
 
-    @allure.step('Apply nodes config')
+    @client_step('Apply nodes config')
     @tracker.track_coverage_httpx(f'{APIRoutes.NODES}')
     def apply_nodes_api(self) -> Response:
         """
@@ -62,7 +86,7 @@ class NodesClient(APIClient):
         return self.options(url=f'{APIRoutes.NODES}')
 
 
-    @allure.step('Delete nodes config')
+    @client_step('Delete nodes config')
     @tracker.track_coverage_httpx(f'{APIRoutes.NODES}')
     def delete_nodes_api(self) -> Response:
         """
@@ -89,4 +113,29 @@ def get_unauthorised_nodes_client() -> NodesClient:
 
     :return: Готовый к использованию NodesClient без авторизации.
     """
-    return NodesClient(client=get_public_http_client())
\ No newline at end of file
+    return NodesClient(client=get_public_http_client())
+
+
+class AsyncNodesClient(AsyncAPIClient, NodesClient):
+    """
+    Асинхронный клиент для работы с /api/nodes/
+    Методы запросов возвращают корутины, iter_nodes - асинхронный итератор нод.
+    """
+
+    def iter_nodes(self) -> AsyncIterator[NodeSchema]:
+        """
+        Метод потокового получения нод текущей конфигурации коммутатора на Web (см. AsyncAPIClient.stream_items).
+
+        :return: Асинхронный итератор нод конфигурации.
+        """
+        return self.stream_items(send=self.get_nodes_list_stream_api, model=NodeSchema, key='nodes')
+
+
+def get_async_nodes_client(user: AuthenticationUserSchema) -> AsyncNodesClient:
+    """
+    Функция создаёт экземпляр AsyncNodesClient с общим для пользователя асинхронным HTTP-клиентом.
+    Должна вызываться внутри запущенного event loop.
+
+    :return: Готовый к использованию AsyncNodesClient.
+    """
+    return AsyncNodesClient(client=get_private_async_http_client(user=user))
\ No newline at end of file
@@ -15,6 +15,22 @@ class PositionSchema(BaseModel):
     y: float
 
 
+class NodeSchema(BaseModel):
+    """
+    Описание структуры pydantic-model произвольной ноды конфигурации при получении с Web.
+    Attributes:
+        id: str
+        type: str
+        data: dict[str, Any]
+        position: PositionSchema
+    """
+
+    id: str
+    type: str
+    data: dict[str, Any]    = Field(default_factory=dict)
+    position: PositionSchema
+
+
 class ViewportSchema(BaseModel):
     """
     Описание структуры pydantic-model области видимости конфигурации на Web.
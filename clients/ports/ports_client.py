@@ -1,14 +1,14 @@
-import allure
+from typing import Iterator, AsyncIterator
+
 from httpx import Response
-from requests import Response as requests_Response
-from clients.api_client import APIClient
+from clients.api_client import APIClient, AsyncAPIClient
 from clients.api_coverage import tracker
-from clients.api_session import APISession
 from clients.ports.ports_schema import CreatePortRequestSchema, DeletePortsRequestSchema, UpdatedPortSchema, \
-    UpdatePortStatusRequestSchema
-from clients.private_http_builder import get_private_http_client, AuthenticationUserSchema, get_private_http_session
-from clients.public_http_builder import get_public_http_client, get_public_http_session
-from config import settings
+    UpdatePortStatusRequestSchema, ConfiguredPortSchema, PortSchema
+from clients.private_http_builder import get_private_http_client, AuthenticationUserSchema, \
+    get_private_async_http_client
+from clients.public_http_builder import get_public_http_client
+from tools.allure.steps import client_step
 from tools.routes import APIRoutes
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -17,7 +17,7 @@ class PortsClient(APIClient):
     """
     Клиент для работы с /api/ports/
     """
-    @allure.step('Get configured ports list')
+    @client_step('Get configured ports list')
     @tracker.track_coverage_httpx(f'{APIRoutes.PORTS}')
     def get_ports_list_api(self) -> Response:
         """
@@ -29,7 +29,27 @@ class PortsClient(APIClient):
         return self.get(url=f'{APIRoutes.PORTS}')
 
 
-    @allure.step('Get possible ports list')
+    @client_step('Get configured ports list stream')
+    @tracker.track_coverage_httpx(f'{APIRoutes.PORTS}')
+    def get_ports_list_stream_api(self) -> Response:
+        """
+        Метод получения списка сконфигурированных портов без чтения тела ответа (см. iter_ports).
+
+        :return: Ответ от сервера в виде объекта httpx.Response с непрочитанным телом.
+        """
+        return self.stream(url=f'{APIRoutes.PORTS}')
+
+
+    def iter_ports(self) -> Iterator[ConfiguredPortSchema]:
+        """
+        Метод потокового получения списка сконфигурированных портов (см. APIClient.stream_items).
+
+        :return: Итератор сконфигурированных портов.
+        """
+        return self.stream_items(send=self.get_ports_list_stream_api, model=ConfiguredPortSchema)
+
+
+    @client_step('Get possible ports list')
     @tracker.track_coverage_httpx(f'{APIRoutes.PORTS}')
     def get_possible_ports_list_api(self) -> Response:
         """
@@ -41,7 +61,7 @@ class PortsClient(APIClient):
         return self.options(url=f'{APIRoutes.PORTS}')
 
 
-    @allure.step('Create configured port')
+    @client_step('Create configured port')
     @tracker.track_coverage_httpx(f'{APIRoutes.PORTS}')
     def create_ports_api(self, request: CreatePortRequestSchema) -> Response:
         """
@@ -54,7 +74,7 @@ class PortsClient(APIClient):
                          json=request.model_dump(by_alias=True))
 
 
-    @allure.step('Update configured ports')
+    @client_step('Update configured ports')
     @tracker.track_coverage_httpx(f'{APIRoutes.PORTS}')
     def update_ports_api(self, request: UpdatedPortSchema) -> Response:
         """
@@ -69,7 +89,7 @@ class PortsClient(APIClient):
 
 
 
-    @allure.step('Update status port')
+    @client_step('Update status port')
     @tracker.track_coverage_httpx(f'{APIRoutes.PORT_STATUS}')
     def update_port_status_api(self, request: UpdatePortStatusRequestSchema) -> Response:
         """
@@ -84,7 +104,7 @@ class PortsClient(APIClient):
 
 
 
-    @allure.step('Get all ports list')
+    @client_step('Get all ports list')
     @tracker.track_coverage_httpx(f'{APIRoutes.PORTS_ALL}')
     def get_all_ports_list_api(self) -> Response:
         """
@@ -95,6 +115,50 @@ class PortsClient(APIClient):
         return self.get(url=f'{APIRoutes.PORTS_ALL}')
 
 
+    @client_step('Get all ports list stream')
+    @tracker.track_coverage_httpx(f'{APIRoutes.PORTS_ALL}')
+    def get_all_ports_list_stream_api(self) -> Response:
+        """
+        Метод получения списка всех доступных портов с информацией о модулях без чтения тела ответа (см. iter_all_ports).
+
+        :return: Ответ от сервера в виде объекта httpx.Response с непрочитанным телом.
+        """
+        return self.stream(url=f'{APIRoutes.PORTS_ALL}')
+
+
+    def iter_all_ports(self) -> Iterator[PortSchema]:
+        """
+        Метод потокового получения списка всех доступных портов (см. APIClient.stream_items).
+
+        :return: Итератор портов с информацией о модулях.
+        """
+        return self.stream_items(send=self.get_all_ports_list_stream_api, model=PortSchema)
+
+
+    @client_step('Delete configured ports')
+    @tracker.track_coverage_httpx(f'{APIRoutes.PORTS}')
+    def delete_ports_api(self, request: DeletePortsRequestSchema) -> Response:
+        """
+        Метод удаления списка сконфигурированных портов.
+
+        :param request: Словарь DeletePortsRequestSchema.model_dump(by_alias=True).
+        :return: Ответ от сервера в виде объекта httpx.Response.
+        """
+        return self.delete(url=f'{APIRoutes.PORTS}',
+                           json=request.model_dump(by_alias=True))
+
+
+    @client_step('Delete nonexistent ports')
+    @tracker.track_coverage_httpx(f'{APIRoutes.PORTS}')
+    def incorrect_delete_ports_api(self) -> Response:
+        """
+        Метод для обработки ошибки [412] с помощью удаления не существующего порта.
+
+        :return: Ответ от сервера в виде объекта httpx.Response.
+        """
+        return self.delete(url=f'{APIRoutes.PORTS}')
+
+
 def get_ports_client(user: AuthenticationUserSchema) -> PortsClient:
     """
     Функция создаёт экземпляр PortsClient с уже настроенным HTTP-клиентом.
@@ -112,47 +176,35 @@ def get_unauthorised_ports_client() -> PortsClient:
     """
     return PortsClient(client=get_public_http_client())
 
-# ----------------------------------------------------------------------------------------------------------------------
 
-class PortsSession(APISession):
+class AsyncPortsClient(AsyncAPIClient, PortsClient):
+    """
+    Асинхронный клиент для работы с /api/ports/
+    Методы запросов возвращают корутины, iter_ports и iter_all_ports - асинхронные итераторы портов.
+    """
 
-    @allure.step('Delete configured ports')
-    @tracker.track_coverage_requests(f'{APIRoutes.PORTS}')
-    def delete_ports_api(self, request: DeletePortsRequestSchema) -> requests_Response:
+    def iter_ports(self) -> AsyncIterator[ConfiguredPortSchema]:
         """
-        Метод удаления списка сконфигурированных портов.
+        Метод потокового получения списка сконфигурированных портов (см. AsyncAPIClient.stream_items).
 
-        :param request: Словарь DeletePortsRequestSchema.model_dump(by_alias=True).
-        :return: Объект requests_Response с данными ответа.
+        :return: Асинхронный итератор сконфигурированных портов.
         """
-        return self.delete(url=f'{settings.http_client.client_url}{APIRoutes.PORTS}',
-                           json=request.model_dump(by_alias=True))
-
+        return self.stream_items(send=self.get_ports_list_stream_api, model=ConfiguredPortSchema)
 
-    @allure.step('Delete nonexistent ports')
-    @tracker.track_coverage_requests(f'{APIRoutes.PORTS}')
-    def incorrect_delete_ports_api(self) -> requests_Response:
+    def iter_all_ports(self) -> AsyncIterator[PortSchema]:
         """
-        Метод для обработки ошибки [412] с помощью удаления не существующего порта.
+        Метод потокового получения списка всех доступных портов (см. AsyncAPIClient.stream_items).
 
-        :return: Объект requests_Response с данными ответа.
+        :return: Асинхронный итератор портов с информацией о модулях.
         """
-        return self.delete(url=f'{settings.http_client.client_url}{APIRoutes.PORTS}')
-
-
-def get_ports_session(access_token: str) -> PortsSession:
-    """
-    Функция создаёт экземпляр PortsSession с уже настроенным HTTP-клиентом.
-
-    :return: Готовый к использованию PortsSession.
-    """
-    return PortsSession(session=get_private_http_session(access_token=access_token))
+        return self.stream_items(send=self.get_all_ports_list_stream_api, model=PortSchema)
 
 
-def get_unauthorised_ports_session() -> PortsSession:
+def get_async_ports_client(user: AuthenticationUserSchema) -> AsyncPortsClient:
     """
-    Функция создаёт экземпляр неавторизованного PortsSession с уже настроенным HTTP-клиентом.
+    Функция создаёт экземпляр AsyncPortsClient с общим для пользователя асинхронным HTTP-клиентом.
+    Должна вызываться внутри запущенного event loop.
 
-    :return: Готовый к использованию PortsSession без авторизации.
+    :return: Готовый к использованию AsyncPortsClient.
     """
-    return PortsSession(session=get_public_http_session())
\ No newline at end of file
+    return AsyncPortsClient(client=get_private_async_http_client(user=user))
\ No newline at end of file
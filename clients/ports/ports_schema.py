@@ -1,8 +1,45 @@
+from enum import Enum
 from typing import List, Any
 from tools.fakers import fake
 from pydantic import BaseModel, Field, RootModel, ConfigDict
 
 
+# Порты коммутатора: разъёмы 1-33, по 4 канала на разъём ("1/0".."33/3")
+POSSIBLE_PORTS = [f'{connector}/{channel}' for connector in range(1, 34) for channel in range(4)]
+
+
+class PortSpeed(str, Enum):
+    """
+    Допустимые значения поля speed сконфигурированного порта.
+    """
+    SPEED_1G = 'BF_SPEED_1G'
+    SPEED_10G = 'BF_SPEED_10G'
+    SPEED_25G = 'BF_SPEED_25G'
+    SPEED_40G = 'BF_SPEED_40G'
+    SPEED_50G = 'BF_SPEED_50G'
+    SPEED_100G = 'BF_SPEED_100G'
+    SPEED_200G = 'BF_SPEED_200G'
+    SPEED_400G = 'BF_SPEED_400G'
+
+
+class PortFec(str, Enum):
+    """
+    Допустимые значения поля fec сконфигурированного порта.
+    """
+    NONE = 'BF_FEC_TYP_NONE'
+    FIRECODE = 'BF_FEC_TYP_FIRECODE'
+    REED_SOLOMON = 'BF_FEC_TYP_REED_SOLOMON'
+
+
+class PortAutoNegotiation(str, Enum):
+    """
+    Допустимые значения поля an сконфигурированного порта.
+    """
+    DEFAULT = 'PM_AN_DEFAULT'
+    FORCE_ENABLE = 'PM_AN_FORCE_ENABLE'
+    FORCE_DISABLE = 'PM_AN_FORCE_DISABLE'
+
+
 class ConfiguredPortSchema(BaseModel):
     """
     Описание структуры pydantic-model порта.
@@ -50,10 +87,10 @@ class UpdatedPortSchema(BaseModel):
     Attributes:
         name: str (генерируется случайным образом на основе случайных цветов)
         port: str
-        speed: str
+        speed: str - значение PortSpeed
         mtu: int
-        an: str
-        fec: str
+        an: str - значение PortAutoNegotiation
+        fec: str - значение PortFec
         dir: str
         speed_limit (speedLimit): int
         loopback: str
@@ -1,12 +1,16 @@
+import asyncio
 from functools import lru_cache
+from weakref import WeakKeyDictionary
 
-from httpx import Client
+from httpx import Client, AsyncClient, Limits
 from pydantic import BaseModel, ConfigDict, Field
-from requests import Session
 
-from clients.authentication.authentication_client import get_authentication_client
 from clients.authentication.authentication_schema import LoginRequestSchema
-from clients.event_hooks import log_request_event_hook, log_response_event_hook
+from clients.authentication.token_manager import TokenManager, BearerTokenAuth, get_token_manager
+from clients.event_hooks import log_request_event_hook, log_response_event_hook, log_async_request_event_hook, \
+    log_async_response_event_hook, start_timing_event_hook, finish_timing_event_hook, start_async_timing_event_hook, \
+    finish_async_timing_event_hook
+from clients.transport import get_http_transport
 from config import settings
 
 
@@ -24,35 +28,76 @@ class AuthenticationUserSchema(BaseModel):
 
 
 @lru_cache(maxsize=None)
-def get_private_http_client(user: AuthenticationUserSchema) -> Client:
+def get_user_token_manager(user: AuthenticationUserSchema) -> TokenManager:
     """
-    Функция создаёт экземпляр httpx.Client с аутентификацией пользователя.
+    Функция возвращает общий на прогон менеджер токенов пользователя.
+    Токены переиспользуются синхронными и асинхронными HTTP-клиентами и обновляются заранее до истечения.
 
     :param user: Объект AuthenticationUserSchema с username и паролем пользователя.
-    :return: Готовый к использованию объект httpx.Client с установленным заголовком Authorization.
+    :return: TokenManager с access и refresh токенами пользователя.
     """
-    authentication_client = get_authentication_client()
     login_request = LoginRequestSchema(username=user.username,
                                        password=user.password)
-    login_response = authentication_client.login(request=login_request)
+    return get_token_manager(request=login_request)
+
 
+@lru_cache(maxsize=None)
+def get_private_http_client(user: AuthenticationUserSchema) -> Client:
+    """
+    Функция создаёт экземпляр httpx.Client с аутентификацией пользователя.
+
+    :param user: Объект AuthenticationUserSchema с username и паролем пользователя.
+    :return: Готовый к использованию объект httpx.Client с актуальным заголовком Authorization.
+    """
     return Client(
-        event_hooks={"request": [log_request_event_hook],
-                     "response": [log_response_event_hook]},
+        event_hooks={"request": [log_request_event_hook, start_timing_event_hook],
+                     "response": [log_response_event_hook, finish_timing_event_hook]},
         base_url=settings.http_client.client_url,
         timeout=settings.http_client.timeout,
-        headers={"Authorization": f"Bearer {login_response.access}"}
+        auth=BearerTokenAuth(token_manager=get_user_token_manager(user=user)),
+        transport=get_http_transport()
     )
 
 
-@lru_cache(maxsize=None)
-def get_private_http_session(access_token: str) -> Session:
+# Пулы соединений httpx.AsyncClient привязаны к event loop, в котором были открыты.
+# Поэтому общий клиент пользователя хранится отдельно для каждого event loop.
+_private_async_http_clients: WeakKeyDictionary[asyncio.AbstractEventLoop, dict[AuthenticationUserSchema, AsyncClient]] \
+    = WeakKeyDictionary()
+
+
+def get_private_async_http_client(user: AuthenticationUserSchema) -> AsyncClient:
+    """
+    Функция возвращает экземпляр httpx.AsyncClient с аутентификацией пользователя.
+    Все асинхронные доменные клиенты одного пользователя используют один общий ограниченный пул соединений.
+    Должна вызываться внутри запущенного event loop (например, из корутины под clients.async_session.run_async).
+
+    :param user: Объект AuthenticationUserSchema с username и паролем пользователя.
+    :return: Готовый к использованию объект httpx.AsyncClient с актуальным заголовком Authorization.
     """
-    Функция создаёт экземпляр requests.Session с аутентификацией пользователя.
+    loop = asyncio.get_running_loop()
+    clients = _private_async_http_clients.setdefault(loop, {})
 
-    :param access_token: Строковое значение access-token.
-    :return: Готовый к использованию объект requests.Session с установленным заголовком Authorization.
+    if user not in clients:
+        clients[user] = AsyncClient(
+            event_hooks={"request": [log_async_request_event_hook, start_async_timing_event_hook],
+                         "response": [log_async_response_event_hook, finish_async_timing_event_hook]},
+            base_url=settings.http_client.client_url,
+            timeout=settings.http_client.timeout,
+            limits=Limits(max_connections=settings.http_client.max_connections,
+                          max_keepalive_connections=settings.http_client.max_keepalive_connections),
+            auth=BearerTokenAuth(token_manager=get_user_token_manager(user=user)),
+            transport=get_http_transport()
+        )
+
+    return clients[user]
+
+
+async def close_private_async_http_clients():
     """
-    session = Session()
-    session.headers = {"Authorization": f"Bearer {access_token}"}
-    return session
\ No newline at end of file
+    Функция закрывает пулы соединений всех асинхронных HTTP-клиентов пользователей текущего event loop.
+    Должна вызываться перед завершением event loop (см. clients.async_session.run_async).
+    """
+    clients = _private_async_http_clients.pop(asyncio.get_running_loop(), {})
+
+    for client in clients.values():
+        await client.aclose()
\ No newline at end of file
@@ -1,14 +1,12 @@
-import allure
 from httpx import Response
-from requests import Response as requests_Response
-from clients.api_client import APIClient
+from clients.api_client import APIClient, AsyncAPIClient
 from clients.api_coverage import tracker
-from clients.api_session import APISession
-from clients.private_http_builder import get_private_http_client, AuthenticationUserSchema, get_private_http_session
+from clients.private_http_builder import get_private_http_client, AuthenticationUserSchema, \
+    get_private_async_http_client
 from clients.psf_format.psf_format_schema import CreatePsfFormatRequestSchema, UpdatePsfFormatRequestSchema, \
     DeletePsfFormatRequestSchema, CreatePsfDmacRequestSchema
-from clients.public_http_builder import get_public_http_client, get_public_http_session
-from config import settings
+from clients.public_http_builder import get_public_http_client
+from tools.allure.steps import client_step
 from tools.routes import APIRoutes
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -18,7 +16,7 @@ class PsfFormatClient(APIClient):
     Клиент для работы с /api/psf_format/ и /api/psf_dmac/.
     """
 
-    @allure.step('Get psf format list')
+    @client_step('Get psf format list')
     @tracker.track_coverage_httpx(f'{APIRoutes.PSF_FORMAT}')
     def get_psf_format_list_api(self) -> Response:
         """
@@ -30,7 +28,7 @@ class PsfFormatClient(APIClient):
         return self.get(url=f'{APIRoutes.PSF_FORMAT}')
 
 
-    @allure.step('Create psf format')
+    @client_step('Create psf format')
     @tracker.track_coverage_httpx(f'{APIRoutes.PSF_FORMAT}')
     def create_psf_format_api(self, request: CreatePsfFormatRequestSchema) -> Response:
         """
@@ -43,7 +41,7 @@ class PsfFormatClient(APIClient):
                          json=request.model_dump())
 
 
-    @allure.step('Update psf format')
+    @client_step('Update psf format')
     @tracker.track_coverage_httpx(f'{APIRoutes.PSF_FORMAT}')
     def update_psf_format_api(self, request: UpdatePsfFormatRequestSchema) -> Response:
         """
@@ -58,7 +56,7 @@ class PsfFormatClient(APIClient):
 
 
 
-    @allure.step('Get psf dmac')
+    @client_step('Get psf dmac')
     @tracker.track_coverage_httpx(f'{APIRoutes.PSF_DMAC}')
     def get_psf_dmac_api(self) -> Response:
         """
@@ -70,7 +68,7 @@ class PsfFormatClient(APIClient):
         return self.get(url=f'{APIRoutes.PSF_DMAC}')
 
 
-    @allure.step('Create psf dmac')
+    @client_step('Create psf dmac')
     @tracker.track_coverage_httpx(f'{APIRoutes.PSF_DMAC}')
     def create_psf_dmac_api(self, request: CreatePsfDmacRequestSchema) -> Response:
         """
@@ -82,6 +80,17 @@ class PsfFormatClient(APIClient):
                          json=request.model_dump())
 
 
+    @client_step('Delete psf format')
+    @tracker.track_coverage_httpx(f'{APIRoutes.PSF_FORMAT}')
+    def delete_psf_format_api(self, request: DeletePsfFormatRequestSchema) -> Response:
+        """
+        Метод удаления правила спецформата.
+
+        :param request: Словарь DeletePsfFormatRequestSchema.model_dump().
+        :return: Ответ от сервера в виде объекта httpx.Response.
+        """
+        return self.delete(url=f'{APIRoutes.PSF_FORMAT}',
+                           json=request.model_dump())
 
 
 def get_psf_format_client(user: AuthenticationUserSchema) -> PsfFormatClient:
@@ -101,36 +110,19 @@ def get_unauthorized_psf_format_client() -> PsfFormatClient:
     """
     return PsfFormatClient(client=get_public_http_client())
 
-# ----------------------------------------------------------------------------------------------------------------------
-
-class PsfFormatSession(APISession):
 
-    @allure.step('Delete psf format')
-    @tracker.track_coverage_requests(f'{APIRoutes.PSF_FORMAT}')
-    def delete_psf_format_api(self, request: DeletePsfFormatRequestSchema) -> requests_Response:
-        """
-        Метод удаления правила спецформата.
-
-        :param request: Словарь DeletePsfFormatRequestSchema.model_dump().
-        :return: Объект requests_Response с данными ответа.
-        """
-        return self.delete(url=f'{settings.http_client.client_url}{APIRoutes.PSF_FORMAT}',
-                           json=request.model_dump())
-
-
-def get_psf_format_session(access_token: str) -> PsfFormatSession:
+class AsyncPsfFormatClient(AsyncAPIClient, PsfFormatClient):
     """
-    Функция создаёт экземпляр PsfFormatSession с уже настроенным HTTP-клиентом.
-
-    :return: Готовый к использованию PsfFormatSession.
+    Асинхронный клиент для работы с /api/psf_format/ и /api/psf_dmac/.
+    Все методы PsfFormatClient выполняют запросы, поэтому здесь возвращают корутины с httpx.Response.
     """
-    return PsfFormatSession(session=get_private_http_session(access_token=access_token))
 
 
-def get_unauthorized_psf_format_session() -> PsfFormatSession:
+def get_async_psf_format_client(user: AuthenticationUserSchema) -> AsyncPsfFormatClient:
     """
-    Функция создаёт экземпляр неавторизованного PsfFormatSession с уже настроенным HTTP-клиентом.
+    Функция создаёт экземпляр AsyncPsfFormatClient с общим для пользователя асинхронным HTTP-клиентом.
+    Должна вызываться внутри запущенного event loop.
 
-    :return: Готовый к использованию PsfFormatSession без авторизации.
+    :return: Готовый к использованию AsyncPsfFormatClient.
     """
-    return PsfFormatSession(session=get_public_http_session())
\ No newline at end of file
+    return AsyncPsfFormatClient(client=get_private_async_http_client(user=user))
\ No newline at end of file
@@ -1,15 +1,12 @@
 import allure
 from httpx import Response
-from requests import Response as requests_Response
 
 from clients.additional_filters.additional_filters_schema import CreateAdditionalFiltersRequestSchema, \
     UpdateAdditionalFiltersRequestSchema, DeleteAdditionalFiltersRequestSchema
 from clients.api_client import APIClient
-from clients.api_session import APISession
 from clients.balancing.balancing_schema import CreateBalancingRequestSchema, UpdateBalancingRequestSchema, \
     DeleteBalancingRequestSchema
-from clients.public_http_builder import get_public_http_client, get_public_http_session
-from config import settings
+from clients.public_http_builder import get_public_http_client
 from tools.routes import APIRoutes
 from clients.api_coverage import tracker
 
@@ -46,6 +43,17 @@ class PublicClient(APIClient):
                         json=request.model_dump(by_alias=True))
 
 
+    @allure.step('Delete additional filters')
+    @tracker.track_coverage_httpx(f'{APIRoutes.ADDITIONAL_FILTERS}')
+    def delete_additional_filters_api(self, request: DeleteAdditionalFiltersRequestSchema) -> Response:
+        """
+        Метод удаления дополнительных фильтров.
+
+        :param request: Список словарей с value: str, direction: str, logic_group (logicGroup): int, type: str.
+        :return: Ответ от сервера.
+        """
+        return self.delete(url=f'{APIRoutes.ADDITIONAL_FILTERS}',
+                           json=request.model_dump())
 
 # ----------------------------------------------------------------------------------------------------------------------
 
@@ -89,42 +97,21 @@ class PublicClient(APIClient):
                         json=request.model_dump(by_alias=True))
 
 
-
-#======================================================================================================================
-
-
-
-class PublicSession(APISession):
-    """
-    Сессия для работы без access_token (валидация ошибки [403]FORBIDDEN)
-    """
-    @allure.step('Delete additional filters')
-    @tracker.track_coverage_requests(f'{APIRoutes.ADDITIONAL_FILTERS}')
-    def delete_additional_filters_api(self, request: DeleteAdditionalFiltersRequestSchema) -> requests_Response:
-        """
-        Метод удаления дополнительных фильтров.
-
-        :param request: Список словарей с value: str, direction: str, logic_group (logicGroup): int, type: str.
-        :return: Объект requests_Response с данными ответа.
-        """
-        return self.delete(url=f'{settings.http_client.client_url}{APIRoutes.ADDITIONAL_FILTERS}',
-                           json=request.model_dump())
-
-#-----------------------------------------------------------------------------------------------------------------------
-
     @allure.step('Delete balancing group')
-    @tracker.track_coverage_requests(f'{APIRoutes.BALANCING}')
-    def delete_balancing_api(self, request: DeleteBalancingRequestSchema) -> requests_Response:
+    @tracker.track_coverage_httpx(f'{APIRoutes.BALANCING}')
+    def delete_balancing_api(self, request: DeleteBalancingRequestSchema) -> Response:
         """
         Метод удаления балансировки.
 
         :param request: Словарь с logic_group (logicGroup).
-        :return: Объект requests_Response с данными ответа.
+        :return: Ответ от сервера.
         """
-        return self.delete(url=f'{settings.http_client.client_url}{APIRoutes.BALANCING}',
+        return self.delete(url=f'{APIRoutes.BALANCING}',
                            json=request.model_dump(by_alias=True))
 
-#-----------------------------------------------------------------------------------------------------------------------
+
+
+#======================================================================================================================
 
 
 
@@ -138,13 +125,4 @@ def get_public_client() -> PublicClient:
 
     :return: Готовый к использованию PublicClient.
     """
-    return PublicClient(client=get_public_http_client())
-
-
-def get_public_session() -> PublicSession:
-    """
-    Функция создаёт экземпляр PublicSession с уже настроенным HTTP-клиентом.
-
-    :return: Готовый к использованию PublicSession.
-    """
-    return PublicSession(session=get_public_http_session())
\ No newline at end of file
+    return PublicClient(client=get_public_http_client())
\ No newline at end of file
@@ -1,7 +1,12 @@
-from httpx import Client
-from requests import Session
+import asyncio
+from weakref import WeakKeyDictionary
 
-from clients.event_hooks import log_request_event_hook, log_response_event_hook
+from httpx import Client, AsyncClient, Limits
+
+from clients.event_hooks import log_request_event_hook, log_response_event_hook, log_async_request_event_hook, \
+    log_async_response_event_hook, start_timing_event_hook, finish_timing_event_hook, start_async_timing_event_hook, \
+    finish_async_timing_event_hook
+from clients.transport import get_http_transport
 from config import settings
 
 
@@ -12,16 +17,47 @@ def get_public_http_client() -> Client:
     :return: Готовый к использованию объект httpx.Client.
     """
     return Client(
-        event_hooks={"request": [log_request_event_hook],
-                     "response": [log_response_event_hook]},
+        event_hooks={"request": [log_request_event_hook, start_timing_event_hook],
+                     "response": [log_response_event_hook, finish_timing_event_hook]},
         base_url=settings.http_client.client_url,
-        timeout=settings.http_client.timeout
+        timeout=settings.http_client.timeout,
+        transport=get_http_transport()
     )
 
-def get_public_http_session() -> Session:
+
+# Пул соединений httpx.AsyncClient привязан к event loop, поэтому клиент хранится отдельно для каждого event loop.
+_public_async_http_clients: WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncClient] = WeakKeyDictionary()
+
+
+def get_public_async_http_client() -> AsyncClient:
     """
-    Функция создаёт экземпляр requests.Session с базовыми настройками.
+    Функция возвращает экземпляр httpx.AsyncClient с базовыми настройками.
+    Все неавторизованные асинхронные клиенты используют один общий ограниченный пул соединений.
+    Должна вызываться внутри запущенного event loop.
 
-    :return: Готовый к использованию объект requests.Session.
+    :return: Готовый к использованию объект httpx.AsyncClient.
     """
-    return Session()
\ No newline at end of file
+    loop = asyncio.get_running_loop()
+
+    if loop not in _public_async_http_clients:
+        _public_async_http_clients[loop] = AsyncClient(
+            event_hooks={"request": [log_async_request_event_hook, start_async_timing_event_hook],
+                         "response": [log_async_response_event_hook, finish_async_timing_event_hook]},
+            base_url=settings.http_client.client_url,
+            timeout=settings.http_client.timeout,
+            limits=Limits(max_connections=settings.http_client.max_connections,
+                          max_keepalive_connections=settings.http_client.max_keepalive_connections),
+            transport=get_http_transport()
+        )
+
+    return _public_async_http_clients[loop]
+
+
+async def close_public_async_http_client():
+    """
+    Функция закрывает пул соединений неавторизованного асинхронного HTTP-клиента текущего event loop.
+    """
+    client = _public_async_http_clients.pop(asyncio.get_running_loop(), None)
+
+    if client is not None:
+        await client.aclose()
\ No newline at end of file
@@ -1,12 +1,14 @@
-import allure
+from typing import Iterator, AsyncIterator
+
 from httpx import Response
-from clients.api_client import APIClient
+from clients.api_client import APIClient, AsyncAPIClient
 from clients.api_coverage import tracker
-from clients.api_session import APISession
-from clients.private_http_builder import get_private_http_client, AuthenticationUserSchema, get_private_http_session
-from clients.public_http_builder import get_public_http_client, get_public_http_session
-from clients.selections.selections_schema import CreateSelectionRequestSchema, DeleteSelectionRequestSchema
-from config import settings
+from clients.private_http_builder import get_private_http_client, AuthenticationUserSchema, \
+    get_private_async_http_client
+from clients.public_http_builder import get_public_http_client
+from clients.selections.selections_schema import CreateSelectionRequestSchema, DeleteSelectionRequestSchema, \
+    GetSelectionSchema
+from tools.allure.steps import client_step
 from tools.routes import APIRoutes
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -15,7 +17,7 @@ class SelectionsClient(APIClient):
     """
     Клиент для работы с /api/selections/
     """
-    @allure.step('Get selections list')
+    @client_step('Get selections list')
     @tracker.track_coverage_httpx(f'{APIRoutes.SELECTIONS}')
     def get_selections_list_api(self) -> Response:
         """
@@ -27,7 +29,27 @@ class SelectionsClient(APIClient):
         return self.get(url=f'{APIRoutes.SELECTIONS}')
 
 
-    @allure.step('Create selection group')
+    @client_step('Get selections list stream')
+    @tracker.track_coverage_httpx(f'{APIRoutes.SELECTIONS}')
+    def get_selections_list_stream_api(self) -> Response:
+        """
+        Метод получения списка групп отбора без чтения тела ответа (см. iter_selections).
+
+        :return: Ответ от сервера в виде объекта httpx.Response с непрочитанным телом.
+        """
+        return self.stream(url=f'{APIRoutes.SELECTIONS}')
+
+
+    def iter_selections(self) -> Iterator[GetSelectionSchema]:
+        """
+        Метод потокового получения списка групп отбора (см. APIClient.stream_items).
+
+        :return: Итератор групп отбора.
+        """
+        return self.stream_items(send=self.get_selections_list_stream_api, model=GetSelectionSchema)
+
+
+    @client_step('Create selection group')
     @tracker.track_coverage_httpx(f'{APIRoutes.SELECTIONS}')
     def create_selection_api(self, request: CreateSelectionRequestSchema) -> Response:
         """
@@ -40,6 +62,19 @@ class SelectionsClient(APIClient):
                          json=request.model_dump(by_alias=True))
 
 
+    @client_step('Delete selection group')
+    @tracker.track_coverage_httpx(f'{APIRoutes.SELECTIONS}')
+    def delete_selection_api(self, request: DeleteSelectionRequestSchema) -> Response:
+        """
+        Метод удаления группы отбора.
+
+        :param request: Словарь DeleteSelectionRequestSchema.model_dump(by_alias=True).
+        :return: Ответ от сервера в виде объекта httpx.Response.
+        """
+        return self.delete(url=f'{APIRoutes.SELECTIONS}',
+                           json=request.model_dump(by_alias=True))
+
+
 def get_selections_client(user: AuthenticationUserSchema) -> SelectionsClient:
     """
     Функция создаёт экземпляр SelectionsClient с уже настроенным HTTP-клиентом.
@@ -57,36 +92,27 @@ def get_unauthorised_selections_client() -> SelectionsClient:
     """
     return SelectionsClient(client=get_public_http_client())
 
-# ----------------------------------------------------------------------------------------------------------------------
 
-class SelectionsSession(APISession):
+class AsyncSelectionsClient(AsyncAPIClient, SelectionsClient):
+    """
+    Асинхронный клиент для работы с /api/selections/
+    Методы запросов возвращают корутины, iter_selections - асинхронный итератор групп отбора.
+    """
 
-    @allure.step('Delete selection group')
-    @tracker.track_coverage_requests(f'{APIRoutes.SELECTIONS}')
-    def delete_selection_api(self, request: DeleteSelectionRequestSchema) -> Response:
+    def iter_selections(self) -> AsyncIterator[GetSelectionSchema]:
         """
-        Метод удаления группы отбора.
+        Метод потокового получения списка групп отбора (см. AsyncAPIClient.stream_items).
 
-        :param request: Словарь DeleteSelectionRequestSchema.model_dump(by_alias=True).
-        :return: Объект requests_Response с данными ответа.
+        :return: Асинхронный итератор групп отбора.
         """
-        return self.delete(url=f'{settings.http_client.client_url}{APIRoutes.SELECTIONS}',
-                           json=request.model_dump(by_alias=True))
-
-
-def get_selections_session(access_token: str) -> SelectionsSession:
-    """
-    Функция создаёт экземпляр SelectionsSession с уже настроенным HTTP-клиентом.
-
-    :return: Готовый к использованию SelectionsSession.
-    """
-    return SelectionsSession(session=get_private_http_session(access_token=access_token))
+        return self.stream_items(send=self.get_selections_list_stream_api, model=GetSelectionSchema)
 
 
-def get_unauthorised_selections_session() -> SelectionsSession:
+def get_async_selections_client(user: AuthenticationUserSchema) -> AsyncSelectionsClient:
     """
-    Функция создаёт экземпляр неавторизованного SelectionsSession с уже настроенным HTTP-клиентом.
+    Функция создаёт экземпляр AsyncSelectionsClient с общим для пользователя асинхронным HTTP-клиентом.
+    Должна вызываться внутри запущенного event loop.
 
-    :return: Готовый к использованию SelectionsSession без авторизации.
+    :return: Готовый к использованию AsyncSelectionsClient.
     """
-    return SelectionsSession(session=get_public_http_session())
\ No newline at end of file
+    return AsyncSelectionsClient(client=get_private_async_http_client(user=user))
\ No newline at end of file
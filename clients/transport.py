@@ -0,0 +1,21 @@
+from httpx import MockTransport
+
+
+# Транспорт для всех HTTP-клиентов прогона (None - обычный сетевой транспорт httpx).
+# Задаётся при запуске (см. fixtures/emulator.py), а не импортом в клиентах, чтобы клиенты не зависели от эмулятора
+_http_transport: MockTransport | None = None
+
+
+def set_http_transport(transport: MockTransport | None):
+    """
+    Функция задаёт транспорт для создаваемых после неё синхронных и асинхронных HTTP-клиентов.
+
+    :param transport: Транспорт, подходящий и для httpx.Client, и для httpx.AsyncClient (например, httpx.MockTransport);
+                      None - сетевой транспорт.
+    """
+    global _http_transport
+    _http_transport = transport
+
+
+def get_http_transport() -> MockTransport | None:
+    return _http_transport
\ No newline at end of file
@@ -0,0 +1,178 @@
+import io
+import os
+import time
+from typing import Callable, Iterable, Iterator, IO
+
+from tools.logger import get_logger
+
+
+logger = get_logger('UPLOAD_STREAM')
+
+
+class UploadProgress:
+    __slots__ = ('total', 'sent', 'started', 'updated')
+
+    def __init__(self, total: int | None):
+        """
+        Состояние потоковой загрузки файла на коммутатор.
+
+        :param total: Размер файла в байтах или None, если он заранее неизвестен (генератор).
+        """
+        self.total = total
+        self.sent = 0
+        self.started = time.perf_counter()
+        self.updated = self.started
+
+    @property
+    def elapsed(self) -> float:
+        return self.updated - self.started
+
+    @property
+    def throughput(self) -> float:
+        """
+        Средняя скорость загрузки в байтах в секунду.
+        """
+        return self.sent / self.elapsed if self.elapsed else 0.0
+
+    def to_metric(self) -> dict:
+        """
+        Метод формирует метрику загрузки для отчёта (например, вложения Allure).
+
+        :return: Словарь с размером, временем и скоростью загрузки.
+        """
+        return {
+            'total_bytes': self.total,
+            'sent_bytes': self.sent,
+            'upload_seconds': round(self.elapsed, 3),
+            'throughput_mib_per_second': round(self.throughput / 1024 / 1024, 3),
+        }
+
+    def __str__(self) -> str:
+        total = f'/{self.total}' if self.total is not None else ''
+        return f'{self.sent}{total} bytes in {self.elapsed:.3f} s ({self.throughput / 1024 / 1024:.2f} MiB/s)'
+
+
+ProgressCallback = Callable[[UploadProgress], None]
+
+
+def iter_file_chunks(path: str | os.PathLike, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """
+    Функция читает файл частями. Файл открывается при получении первой части и закрывается после последней,
+    поэтому генератор можно передать в UploadStream до отправки запроса (в том числе асинхронного).
+
+    :param path: Путь к файлу.
+    :param chunk_size: Размер части в байтах.
+    :return: Итератор частей файла.
+    """
+    with open(path, 'rb') as file:
+        yield from iter(lambda: file.read(chunk_size), b'')
+
+
+class UploadStream(io.RawIOBase):
+    def __init__(self,
+                 source: Iterable[bytes] | Callable[[], Iterable[bytes]] | IO[bytes],
+                 size: int | None = None,
+                 on_progress: ProgressCallback | None = None):
+        """
+        Файл для поля multipart/form-data, который читается частями по мере отправки запроса.
+        Если размер известен, HTTPX указывает Content-Length, иначе тело отправляется с Transfer-Encoding: chunked.
+
+        :param source: Открытый бинарный файл, итерируемый объект с частями файла
+                       или функция, возвращающая такой объект (тогда поток можно перечитать при повторе запроса).
+        :param size: Размер файла в байтах; для файлов на диске определяется автоматически.
+        :param on_progress: Функция, вызываемая после отправки каждой части и по окончании файла.
+        """
+        super().__init__()
+        self.source = source
+        self.on_progress = on_progress
+
+        if size is None and hasattr(source, 'fileno'):
+            size = os.fstat(source.fileno()).st_size
+
+        self.progress = UploadProgress(total=size)
+        self._chunks: Iterator[bytes] | None = None
+        self._buffer: bytes | memoryview = b''
+        self._finished = False
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return self.progress.total is not None
+
+    def tell(self) -> int:
+        return self.progress.sent
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        # HTTPX определяет длину файла через seek(0, SEEK_END) и перематывает его в начало перед отправкой
+        if whence == os.SEEK_END and offset == 0 and self.progress.total is not None:
+            return self.progress.total
+
+        if whence == os.SEEK_SET and offset == self.progress.sent:
+            return offset
+
+        if whence == os.SEEK_SET and offset == 0:
+            self._restart()
+            return 0
+
+        raise io.UnsupportedOperation('UploadStream can only be rewound to the beginning')
+
+    def read(self, size: int = -1) -> bytes | memoryview:
+        """
+        Метод возвращает следующую часть файла.
+        Часть не копируется: возвращается срез текущей части источника, поэтому за один вызов
+        может быть прочитано меньше size байт (как у io.RawIOBase).
+
+        :param size: Максимальный размер части в байтах; -1 - весь оставшийся файл.
+        :return: Часть файла; пустая часть - конец файла.
+        """
+        if self._chunks is None:
+            self._chunks = self._open()
+            self.progress.started = self.progress.updated = time.perf_counter()
+
+        if size < 0:
+            data = b''.join([self._buffer, *self._chunks])
+            self._buffer, self._finished = b'', True
+            self._report(sent=len(data))
+            return data
+
+        while not self._buffer and not self._finished:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._finished = True
+            else:
+                self._buffer = memoryview(chunk)
+
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        self._report(sent=len(data))
+        return data
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def _open(self) -> Iterator[bytes]:
+        if hasattr(self.source, 'read'):
+            return iter(lambda: self.source.read(64 * 1024), b'')
+
+        return iter(self.source() if callable(self.source) else self.source)
+
+    def _restart(self):
+        if hasattr(self.source, 'seek'):
+            self.source.seek(0)
+        elif self._chunks is not None and not callable(self.source):
+            raise io.UnsupportedOperation('Iterable upload source can not be read twice')
+
+        self._chunks, self._buffer, self._finished = None, b'', False
+        self.progress = UploadProgress(total=self.progress.total)
+
+    def _report(self, sent: int):
+        self.progress.sent += sent
+        self.progress.updated = time.perf_counter()
+
+        if self.on_progress is not None and (sent or self._finished):
+            self.on_progress(self.progress)
+
+        if self._finished and not self._buffer and not sent:
+            logger.info(f'Upload finished: {self.progress}')
\ No newline at end of file
@@ -1,11 +1,19 @@
-from typing import Self
+from typing import Self, Literal
+from pathlib import Path
 from pydantic import BaseModel, HttpUrl, DirectoryPath, FilePath, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+LogLevel = Literal['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
+
+
 class HTTPClientConfig(BaseModel):
     url: HttpUrl
     timeout: float
+    max_connections: int            = Field(default=10, description='Размер общего пула соединений на пользователя')
+    max_keepalive_connections: int  = Field(default=10, description='Количество keep-alive соединений в пуле')
+    token_refresh_margin: float     = Field(default=60, description='За сколько секунд до истечения обновлять токены')
+    emulator: bool                  = Field(default=False, description='Направлять запросы во встроенный эмулятор коммутатора')
 
     @property
     def client_url(self):
@@ -22,14 +30,34 @@ class TestDataConfig(BaseModel):
     invalid_custom_config_json_file: FilePath
 
 
+class BenchmarkConfig(BaseModel):
+    filter_table_sizes: list[int]   = Field(default=[100, 1000, 10000], description='Размеры таблицы фильтров')
+    batch_size: int                 = Field(default=100, description='Количество фильтров в одном запросе')
+    concurrency: int                = Field(default=4, description='Количество одновременных запросов')
+    config_filter_counts: list[int] = Field(default=[1000, 10000, 100000],
+                                            description='Размеры таблицы ternary_filters синтетической конфигурации')
+    link_toggles: int               = Field(default=3, description='Количество отключений и включений портов')
+
+
+class TelemetryConfig(BaseModel):
+    interval: float                 = Field(default=1.0, description='Интервал опроса телеметрии в секундах')
+    history: int                    = Field(default=600, description='Количество хранимых замеров телеметрии')
+    link_poll_min: float            = Field(default=0.01, description='Начальный интервал опроса состояния линка')
+    link_poll_max: float            = Field(default=0.5, description='Максимальный интервал опроса состояния линка')
+    link_timeout: float             = Field(default=30.0, description='Время ожидания смены состояния линка')
+
+
 class XdistGroupNamesConfig(BaseModel):
     """
     Добавляем маркировку @pytest.mark.xdist_group(name="__name__") к нашим тестам, чтобы они выполнялись в одном потоке.
 
     Attributes:
         negative_tests: str - Имя потока (xdist_group) при параллельном запуске тестов
+        benchmark_filters: str - Имя потока для тестов, создающих и удаляющих фильтры из BENCHMARK_SOURCE_NETWORK
     """
-    negative_tests: str = Field(description='Поток авто-тестов для проверки негативных сценариев')
+    negative_tests: str     = Field(description='Поток авто-тестов для проверки негативных сценариев')
+    benchmark_filters: str  = Field(default='benchmark_filters',
+                                    description='Поток авто-тестов, очищающих фильтры нагрузочного диапазона')
 
 
 class Settings(BaseSettings):
@@ -43,14 +71,31 @@ class Settings(BaseSettings):
     test_data: TestDataConfig
     user_data: UserDataConfig
     http_client: HTTPClientConfig
+    benchmark: BenchmarkConfig = Field(default_factory=BenchmarkConfig)
+    telemetry: TelemetryConfig = Field(default_factory=TelemetryConfig)
     allure_results_dir: DirectoryPath
+    timing_results_dir: DirectoryPath
+    latency_report_file: Path = Field(default=Path('./latency-report.json'),
+                                      description='JSON-отчёт о задержках запросов по маршрутам')
+    log_level: LogLevel = Field(default='DEBUG', description='Уровень логирования авто-тестов')
+    session_state_dir: DirectoryPath
+    keep_session_config: bool = Field(default=False,
+                                      description='Не возвращать конфигурацию по умолчанию после прогона')
 
     @classmethod
     def initialize(cls) -> Self:
         allure_results_dir = DirectoryPath('./allure-results')
         allure_results_dir.mkdir(exist_ok=True)
 
-        return Settings(allure_results_dir=allure_results_dir)
+        timing_results_dir = DirectoryPath('./timing-results')
+        timing_results_dir.mkdir(exist_ok=True)
+
+        session_state_dir = DirectoryPath('./.session-state')
+        session_state_dir.mkdir(exist_ok=True)
+
+        return Settings(allure_results_dir=allure_results_dir,
+                        timing_results_dir=timing_results_dir,
+                        session_state_dir=session_state_dir)
 
 
 settings = Settings.initialize()    # Инициализируем настройки с созданием папки allure_results при условии ее отсутствия
\ No newline at end of file
@@ -1,7 +1,9 @@
 pytest_plugins = (
+    'fixtures.emulator',
     'fixtures.session_set_up',
     'fixtures.session_tear_down',
     'fixtures.allure',
+    'fixtures.timings',
 
     'fixtures.public',
     'fixtures.authentication',
@@ -1,7 +1,6 @@
 import pytest
 from pydantic import BaseModel, Field
-from clients.additional_filters.additional_filters_client import AdditionalFiltersClient, get_additional_filters_client, \
-    AdditionalFiltersSession, get_additional_filters_session
+from clients.additional_filters.additional_filters_client import AdditionalFiltersClient, get_additional_filters_client
 from clients.additional_filters.additional_filters_schema import CreateAdditionalFiltersRequestSchema, \
     CreateAdditionalFiltersSchema
 from fixtures.authentication import UserFixture
@@ -27,14 +26,9 @@ class AdditionalFilterFixture(BaseModel):
     test_data: DeleteAdditionalFiltersData
 
 
-@pytest.fixture(scope='function')
-def additional_filters_client(function_user: UserFixture) -> AdditionalFiltersClient:
-    return get_additional_filters_client(user=function_user.authentication_user)
-
-
-@pytest.fixture(scope='function')
-def additional_filters_session(function_user: UserFixture) -> AdditionalFiltersSession:
-    return get_additional_filters_session(access_token=function_user.access_token)
+@pytest.fixture(scope='session')
+def additional_filters_client(session_user: UserFixture) -> AdditionalFiltersClient:
+    return get_additional_filters_client(user=session_user.authentication_user)
 
 
 @pytest.fixture(scope='function')
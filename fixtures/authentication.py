@@ -3,7 +3,11 @@ from pydantic import BaseModel
 
 from clients.authentication.authentication_client import AuthenticationClient, get_authentication_client
 from clients.authentication.authentication_schema import LoginRequestSchema, LoginResponseSchema
-from clients.private_http_builder import AuthenticationUserSchema
+from clients.private_http_builder import AuthenticationUserSchema, get_user_token_manager
+from tools.logger import get_logger
+
+
+logger = get_logger('AUTHENTICATION_FIXTURE')
 
 
 class UserFixture(BaseModel):
@@ -37,13 +41,40 @@ class UserFixture(BaseModel):
                                         password=self.password)
 
 
-@pytest.fixture(scope='function')
+@pytest.fixture(scope='session')
 def authentication_client() -> AuthenticationClient:
     return get_authentication_client()
 
 
+@pytest.fixture(scope='session')
+def session_user(worker_id: str) -> UserFixture:
+    """
+    Фикстура пользователя, общая для всех тестов одного воркера pytest-xdist.
+    Аутентификация выполняется один раз на воркер, далее токены берутся из общего TokenManager
+    и обновляются им по мере истечения. На неё опираются все клиентские фикстуры.
+
+    :param worker_id: Идентификатор воркера pytest-xdist ("master" при запуске без распараллеливания).
+    :return: Pydantic-модель с данными запроса и ответа на аутентификацию.
+    """
+    request = LoginRequestSchema()
+    user = AuthenticationUserSchema(username=request.username,
+                                    password=request.password)
+    response = get_user_token_manager(user=user).login_response
+
+    logger.info(f'[{worker_id}] User "{request.username}" was authenticated for the session.')
+    return UserFixture(request=request,
+                       response=response)
+
+
 @pytest.fixture(scope='function')
 def function_user(authentication_client: AuthenticationClient) -> UserFixture:
+    """
+    Фикстура пользователя со свежей аутентификацией для каждого теста.
+    Используется только в тестах, которым действительно нужна новая пара токенов.
+
+    :param authentication_client: Фикстура с подготовленным клиентом для работы с /api/token/.
+    :return: Pydantic-модель с данными запроса и ответа на аутентификацию.
+    """
     request = LoginRequestSchema()
     response = authentication_client.login(request=request)
     return UserFixture(request=request,
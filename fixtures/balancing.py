@@ -1,7 +1,6 @@
 import pytest
 from pydantic import BaseModel
-from clients.balancing.balancing_client import BalancingClient, get_balancing_client, BalancingSession, \
-    get_balancing_session
+from clients.balancing.balancing_client import BalancingClient, get_balancing_client
 from clients.balancing.balancing_schema import CreateBalancingRequestSchema
 from fixtures.authentication import UserFixture
 from tools.logger import get_logger
@@ -14,14 +13,9 @@ class BalancingFixture(BaseModel):
     request: CreateBalancingRequestSchema
 
 
-@pytest.fixture(scope='function')
-def balancing_client(function_user: UserFixture) -> BalancingClient:
-    return get_balancing_client(user=function_user.authentication_user)
-
-
-@pytest.fixture(scope='function')
-def balancing_session(function_user: UserFixture) -> BalancingSession:
-    return get_balancing_session(access_token=function_user.access_token)
+@pytest.fixture(scope='session')
+def balancing_client(session_user: UserFixture) -> BalancingClient:
+    return get_balancing_client(user=session_user.authentication_user)
 
 
 @pytest.fixture(scope='function')
@@ -10,11 +10,11 @@ class CustomConfigFixture(BaseModel):
     request: UploadCustomConfigRequestSchema
 
 
-@pytest.fixture(scope='function')
-def custom_config_client(function_user: UserFixture) -> CustomConfigClient:
-    return get_custom_config_client(user=function_user.authentication_user)
+@pytest.fixture(scope='session')
+def custom_config_client(session_user: UserFixture) -> CustomConfigClient:
+    return get_custom_config_client(user=session_user.authentication_user)
 
-@pytest.fixture(scope='function')
+@pytest.fixture(scope='session')
 def unauthorised_custom_config_client() -> CustomConfigClient:
     return get_unauthorised_custom_config_client()
 
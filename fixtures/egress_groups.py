@@ -4,8 +4,7 @@ from pydantic import BaseModel
 from clients.custom_config.custom_config_client import CustomConfigClient
 from clients.custom_config.custom_config_schema import UploadCustomConfigRequestSchema
 from clients.egress_groups.egress_groups_client import EgressGroupsClient, get_egress_groups_client, \
-    get_unauthorised_egress_groups_client, EgressGroupsSession, get_egress_groups_session, \
-    get_unauthorised_egress_groups_session
+    get_unauthorised_egress_groups_client
 from clients.egress_groups.egress_groups_schema import CreateEgressGroupRequestSchema, DeleteEgressGroupRequestSchema
 from fixtures.authentication import UserFixture
 from tools.logger import get_logger
@@ -18,23 +17,15 @@ class EgressGroupFixture(BaseModel):
     request: CreateEgressGroupRequestSchema
 
 
-@pytest.fixture(scope='function')
-def egress_groups_client(function_user: UserFixture) -> EgressGroupsClient:
-    return get_egress_groups_client(user=function_user.authentication_user)
+@pytest.fixture(scope='session')
+def egress_groups_client(session_user: UserFixture) -> EgressGroupsClient:
+    return get_egress_groups_client(user=session_user.authentication_user)
 
-@pytest.fixture(scope='function')
+@pytest.fixture(scope='session')
 def unauthorised_egress_groups_client() -> EgressGroupsClient:
     return get_unauthorised_egress_groups_client()
 
 
-@pytest.fixture(scope='function')
-def egress_groups_session(function_user: UserFixture) -> EgressGroupsSession:
-    return get_egress_groups_session(access_token=function_user.access_token)
-
-@pytest.fixture(scope='function')
-def unauthorised_egress_groups_session() -> EgressGroupsSession:
-    return get_unauthorised_egress_groups_session()
-
 
 @pytest.fixture(scope='function')
 def function_egress_group(egress_groups_client: EgressGroupsClient) -> EgressGroupFixture:
@@ -50,15 +41,15 @@ def function_egress_group(egress_groups_client: EgressGroupsClient) -> EgressGro
 
 
 @pytest.fixture(scope='function')
-def function_egress_group_tear_down(egress_groups_session: EgressGroupsSession):
+def function_egress_group_tear_down(egress_groups_client: EgressGroupsClient):
     """
     Фикстура для удаления созданной выходной группы по окончании теста.
 
-    :param egress_groups_session: Фикстура с подготовленной сессией для работы с /api/egress_groups/.
+    :param egress_groups_client: Фикстура с подготовленным клиентом для работы с /api/egress_groups/.
     """
     yield
     request = DeleteEgressGroupRequestSchema()
-    egress_groups_session.delete_egress_group_api(request=request)
+    egress_groups_client.delete_egress_group_api(request=request)
 
     logger.info('[Tear-down completed] : Created egress group was deleted.')
 
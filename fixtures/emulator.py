@@ -0,0 +1,15 @@
+import pytest
+
+from clients.transport import set_http_transport
+from config import settings
+from tools.emulator.server import get_emulator_transport
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config: pytest.Config):
+    """
+    Направляет запросы всех HTTP-клиентов во встроенный эмулятор коммутатора, если включён HTTP_CLIENT.EMULATOR.
+    Выполняется в главном процессе и в каждом воркере pytest-xdist до создания клиентов.
+    """
+    if settings.http_client.emulator:
+        set_http_transport(get_emulator_transport())
\ No newline at end of file
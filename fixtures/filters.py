@@ -1,10 +1,11 @@
 import pytest
 from pydantic import BaseModel
-from clients.filters.filters_client import FiltersClient, FiltersSession, get_filters_client, get_filters_session, \
-    get_unauthorised_filters_client, get_unauthorised_filters_session
-from clients.filters.filters_schema import CreateFilterSchema
+from clients.async_session import run_async
+from clients.filters.filters_client import FiltersClient, get_filters_client, get_unauthorised_filters_client, \
+    get_async_filters_client
+from clients.filters.filters_schema import CreateFilterSchema, FilterBulkResultSchema
 from fixtures.authentication import UserFixture
-from tests.filters.filters_data import FILTERS_FOR_DELETE
+from tests.filters.filters_data import FILTERS_FOR_DELETE, is_benchmark_filter
 from tools.logger import get_logger
 
 
@@ -15,25 +16,16 @@ class FiltersFixture(BaseModel):
     request: CreateFilterSchema
 
 
-@pytest.fixture(scope='function')
-def filters_client(function_user: UserFixture) -> FiltersClient:
-    return get_filters_client(user=function_user.authentication_user)
+@pytest.fixture(scope='session')
+def filters_client(session_user: UserFixture) -> FiltersClient:
+    return get_filters_client(user=session_user.authentication_user)
 
 
-@pytest.fixture(scope='function')
+@pytest.fixture(scope='session')
 def unauthorised_filters_client() -> FiltersClient:
     return get_unauthorised_filters_client()
 
 
-@pytest.fixture(scope='function')
-def filters_session(function_user: UserFixture) -> FiltersSession:
-    return get_filters_session(access_token=function_user.access_token)
-
-
-@pytest.fixture(scope='function')
-def unauthorised_filters_session() -> FiltersSession:
-    return get_unauthorised_filters_session()
-
 
 @pytest.fixture(scope='function')
 def function_filters(filters_client: FiltersClient) -> FiltersFixture:
@@ -49,14 +41,36 @@ def function_filters(filters_client: FiltersClient) -> FiltersFixture:
 
 
 @pytest.fixture(scope='function')
-def function_filters_tear_down(filters_session: FiltersSession):
+def function_filters_tear_down(filters_client: FiltersClient):
     """
     Фикстура для удаления созданных фильтров по окончании теста.
 
-    :param filters_session: Фикстура с подготовленной сессией для работы с /api/filters/.
+    :param filters_client: Фикстура с подготовленным клиентом для работы с /api/filters/.
     """
     yield
     request = FILTERS_FOR_DELETE.model_dump(by_alias=True)
-    filters_session.delete_filters_api(request=request)
+    filters_client.delete_filters_api(request=request)
+
+    logger.info('[Tear-down completed] : Created filter was deleted.')
+
+
+@pytest.fixture(scope='function')
+def function_benchmark_filters_tear_down(session_user: UserFixture, filters_client: FiltersClient):
+    """
+    Фикстура для удаления фильтров, оставшихся после нагрузочного теста таблицы фильтров
+    (например, если тест упал до их удаления). Фильтры тестовой конфигурации не затрагиваются.
+    Фильтры удаляются пакетами (AsyncFiltersClient.delete_filters_bulk), так как их могут быть тысячи.
+
+    :param session_user: Фикстура с данными пользователя.
+    :param filters_client: Фикстура с подготовленным клиентом для работы с /api/filters/.
+    """
+    yield
+    filters = [item for item in filters_client.iter_filters() if is_benchmark_filter(item)]
+
+    async def delete_filters() -> list[FilterBulkResultSchema]:
+        async_filters_client = get_async_filters_client(user=session_user.authentication_user)
+        return [result async for result in async_filters_client.delete_filters_bulk(filters=filters)]
 
-    logger.info('[Tear-down completed] : Created filter was deleted.')
\ No newline at end of file
+    failed = sum(not result.is_success for result in run_async(delete_filters())) if filters else 0
+    logger.info(f'[Tear-down completed] : {len(filters) - failed} remaining benchmark filters were deleted, '
+                f'{failed} failed.')
\ No newline at end of file
@@ -4,8 +4,7 @@ from pydantic import BaseModel
 from clients.custom_config.custom_config_client import CustomConfigClient
 from clients.custom_config.custom_config_schema import UploadCustomConfigRequestSchema
 from clients.mirror_filter.mirror_filter_client import MirrorFilterClient, get_mirror_filter_client, \
-    get_unauthorized_mirror_filter_client, MirrorFilterSession, get_mirror_filter_session, \
-    get_unauthorized_mirror_filter_session
+    get_unauthorized_mirror_filter_client
 from clients.mirror_filter.mirror_filter_schema import CreateMirrorFilterRequestSchema, DeleteMirrorFilterRequestSchema
 from fixtures.authentication import UserFixture
 from tools.logger import get_logger
@@ -19,21 +18,14 @@ class MirrorFilterFixture(BaseModel):
 
 
 
-@pytest.fixture(scope='function')
-def mirror_filter_client(function_user: UserFixture) -> MirrorFilterClient:
-    return get_mirror_filter_client(user=function_user.authentication_user)
+@pytest.fixture(scope='session')
+def mirror_filter_client(session_user: UserFixture) -> MirrorFilterClient:
+    return get_mirror_filter_client(user=session_user.authentication_user)
 
-@pytest.fixture(scope='function')
+@pytest.fixture(scope='session')
 def unauthorized_mirror_filter_client() -> MirrorFilterClient:
     return get_unauthorized_mirror_filter_client()
 
-@pytest.fixture(scope='function')
-def mirror_filter_session(function_user: UserFixture) -> MirrorFilterSession:
-    return get_mirror_filter_session(access_token=function_user.access_token)
-
-@pytest.fixture(scope='function')
-def unauthorized_mirror_filter_session() -> MirrorFilterSession:
-    return get_unauthorized_mirror_filter_session()
 
 
 @pytest.fixture(scope='function')
@@ -63,14 +55,14 @@ def function_mirror_filter(mirror_filter_client: MirrorFilterClient) -> MirrorFi
 
 
 @pytest.fixture(scope='function')
-def function_mirror_filter_tear_down(mirror_filter_session: MirrorFilterSession):
+def function_mirror_filter_tear_down(mirror_filter_client: MirrorFilterClient):
     """
     Фикстура для удаления добавленного правила фильтрации зеркалирования по окончании теста.
 
-    :param mirror_filter_session: Фикстура с подготовленным клиентом для работы с /api/mirror_filter/.
+    :param mirror_filter_client: Фикстура с подготовленным клиентом для работы с /api/mirror_filter/.
     """
     yield
     request = DeleteMirrorFilterRequestSchema()
-    mirror_filter_session.delete_mirror_filters(request=request)
+    mirror_filter_client.delete_mirror_filters(request=request)
 
     logger.info('[Tear-down completed] : Created mirror filter was deleted.')
\ No newline at end of file
@@ -10,12 +10,12 @@ from tools.logger import get_logger
 logger = get_logger('NODES_FIXTURE')
 
 
-@pytest.fixture(scope='function')
-def nodes_client(function_user: UserFixture) -> NodesClient:
-    return get_nodes_client(user=function_user.authentication_user)
+@pytest.fixture(scope='session')
+def nodes_client(session_user: UserFixture) -> NodesClient:
+    return get_nodes_client(user=session_user.authentication_user)
 
-@pytest.fixture(scope='function')
-def unauthorised_nodes_client(function_user: UserFixture) -> NodesClient:
+@pytest.fixture(scope='session')
+def unauthorised_nodes_client() -> NodesClient:
     return get_unauthorised_nodes_client()
 
 
@@ -1,11 +1,15 @@
+import json
+
+import allure
 import pytest
 from pydantic import BaseModel
 
-from clients.ports.ports_client import PortsClient, get_ports_client, PortsSession, get_ports_session, \
-    get_unauthorised_ports_client, get_unauthorised_ports_session
+from clients.ports.ports_client import PortsClient, get_ports_client, get_unauthorised_ports_client
 from clients.ports.ports_schema import CreatePortRequestSchema, DeletePortsRequestSchema
 from fixtures.authentication import UserFixture
+from tests.ports.ports_data import PROVISIONING_PORTS
 from tools.logger import get_logger
+from tools.telemetry.port_poller import PortTelemetryPoller
 
 
 logger = get_logger('PORTS_FIXTURE')
@@ -15,23 +19,15 @@ class PortsFixture(BaseModel):
     request: CreatePortRequestSchema
 
 
-@pytest.fixture(scope='function')
-def ports_client(function_user: UserFixture) -> PortsClient:
-    return get_ports_client(user=function_user.authentication_user)
+@pytest.fixture(scope='session')
+def ports_client(session_user: UserFixture) -> PortsClient:
+    return get_ports_client(user=session_user.authentication_user)
 
-@pytest.fixture(scope='function')
-def unauthorised_ports_client(function_user: UserFixture) -> PortsClient:
+@pytest.fixture(scope='session')
+def unauthorised_ports_client() -> PortsClient:
     return get_unauthorised_ports_client()
 
 
-@pytest.fixture(scope='function')
-def ports_session(function_user: UserFixture) -> PortsSession:
-    return get_ports_session(access_token=function_user.access_token)
-
-@pytest.fixture(scope='function')
-def unauthorised_ports_session(function_user: UserFixture) -> PortsSession:
-    return get_unauthorised_ports_session()
-
 
 @pytest.fixture(scope='function')
 def function_ports(ports_client: PortsClient) -> PortsFixture:
@@ -47,14 +43,52 @@ def function_ports(ports_client: PortsClient) -> PortsFixture:
 
 
 @pytest.fixture(scope='function')
-def function_ports_tear_down(ports_session: PortsSession):
+def function_ports_tear_down(ports_client: PortsClient):
     """
     Фикстура для удаления созданных фильтров по окончании теста.
 
-    :param ports_session: Фикстура с подготовленной сессией для работы с /api/ports/.
+    :param ports_client: Фикстура с подготовленным клиентом для работы с /api/ports/.
     """
     yield
     request = DeletePortsRequestSchema()
-    ports_session.delete_ports_api(request=request)
+    ports_client.delete_ports_api(request=request)
+
+    logger.info('[Tear-down completed] : Created port was deleted.')
 
-    logger.info('[Tear-down completed] : Created port was deleted.')
\ No newline at end of file
+
+@pytest.fixture(scope='function')
+def function_provisioned_ports_tear_down(ports_client: PortsClient):
+    """
+    Фикстура для удаления портов, оставшихся после параллельной настройки PROVISIONING_PORTS.
+
+    :param ports_client: Фикстура с подготовленным клиентом для работы с /api/ports/.
+    """
+    yield
+    leftover = [port.port for port in ports_client.iter_ports() if port.port in PROVISIONING_PORTS]
+    if leftover:
+        ports_client.delete_ports_api(request=DeletePortsRequestSchema(leftover))
+
+    logger.info(f'[Tear-down completed] : {len(leftover)} provisioned ports were deleted.')
+
+
+@pytest.fixture(scope='function')
+def function_port_telemetry(ports_client: PortsClient) -> PortTelemetryPoller:
+    """
+    Фикстура для наблюдения за уровнями оптических модулей во время теста.
+    Опрос /api/ports_all/ выполняется в фоновом потоке с интервалом settings.telemetry.interval;
+    по окончании теста статистика линий прикладывается к отчёту Allure.
+
+    :param ports_client: Фикстура с подготовленным клиентом для работы с /api/ports_all/.
+    :return: Запущенный PortTelemetryPoller.
+    """
+    with PortTelemetryPoller(ports_client=ports_client) as poller:
+        yield poller
+
+    summary = {lane: {metric: stats.model_dump() for metric, stats in lane_stats.items()}
+               for lane, lane_stats in poller.summary().items()}
+    allure.attach(json.dumps({'polls': poller.polls,
+                              'errors': poller.errors,
+                              'alerts': [alert.model_dump() for alert in poller.alerts],
+                              'lanes': summary}, indent=2),
+                  name='Port telemetry',
+                  attachment_type=allure.attachment_type.JSON)
\ No newline at end of file
@@ -2,7 +2,7 @@ import pytest
 from pydantic import BaseModel
 
 from clients.psf_format.psf_format_client import PsfFormatClient, get_psf_format_client, \
-    get_unauthorized_psf_format_client, get_psf_format_session, PsfFormatSession, get_unauthorized_psf_format_session
+    get_unauthorized_psf_format_client
 from clients.psf_format.psf_format_schema import CreatePsfFormatRequestSchema, DeletePsfFormatRequestSchema, \
     CreatePsfDmacRequestSchema
 from fixtures.authentication import UserFixture
@@ -21,23 +21,15 @@ class PsfDmacFixture(BaseModel):
     request: CreatePsfDmacRequestSchema
 
 
-@pytest.fixture(scope='function')
-def psf_format_client(function_user: UserFixture) -> PsfFormatClient:
-    return get_psf_format_client(user=function_user.authentication_user)
+@pytest.fixture(scope='session')
+def psf_format_client(session_user: UserFixture) -> PsfFormatClient:
+    return get_psf_format_client(user=session_user.authentication_user)
 
-@pytest.fixture(scope='function')
+@pytest.fixture(scope='session')
 def unauthorised_psf_format_client() -> PsfFormatClient:
     return get_unauthorized_psf_format_client()
 
 
-@pytest.fixture(scope='function')
-def psf_format_session(function_user: UserFixture) -> PsfFormatSession:
-    return get_psf_format_session(access_token=function_user.access_token)
-
-@pytest.fixture(scope='function')
-def unauthorised_psf_format_session() -> PsfFormatSession:
-    return get_unauthorized_psf_format_session()
-
 
 @pytest.fixture(scope='function')
 def function_psf_format(psf_format_client: PsfFormatClient) -> PsfFormatFixture:
@@ -53,28 +45,28 @@ def function_psf_format(psf_format_client: PsfFormatClient) -> PsfFormatFixture:
 
 
 @pytest.fixture(scope='function')
-def function_psf_format_set_up(psf_format_session: PsfFormatSession):
+def function_psf_format_set_up(psf_format_client: PsfFormatClient):
     """
     Фикстура для удаления имеющегося правила спецформата перед запуском теста.
 
-    :param psf_format_session: Фикстура с подготовленным клиентом для работы с /api/psf_format/.
+    :param psf_format_client: Фикстура с подготовленным клиентом для работы с /api/psf_format/.
     """
     request = DeletePsfFormatRequestSchema()
-    psf_format_session.delete_psf_format_api(request=request)
+    psf_format_client.delete_psf_format_api(request=request)
 
     logger.info('[Set-up completed] : Existing psf format was deleted.')
 
 
 @pytest.fixture(scope='function')
-def function_psf_format_tear_down(psf_format_session: PsfFormatSession):
+def function_psf_format_tear_down(psf_format_client: PsfFormatClient):
     """
     Фикстура для удаления созданного правила спецформата по окончании теста.
 
-    :param psf_format_session: Фикстура с подготовленным клиентом для работы с /api/psf_format/.
+    :param psf_format_client: Фикстура с подготовленным клиентом для работы с /api/psf_format/.
     """
     yield
     request = DeletePsfFormatRequestSchema()
-    psf_format_session.delete_psf_format_api(request=request)
+    psf_format_client.delete_psf_format_api(request=request)
 
     logger.info('[Tear-down completed] : Created psf format was deleted.')
 
@@ -1,13 +1,8 @@
 import pytest
 
-from clients.public.public_client import PublicClient, get_public_client, PublicSession, get_public_session
+from clients.public.public_client import PublicClient, get_public_client
 
 
-@pytest.fixture(scope='function')
+@pytest.fixture(scope='session')
 def public_client() -> PublicClient:
     return get_public_client()
-
-
-@pytest.fixture(scope='function')
-def public_session() -> PublicSession:
-    return get_public_session()
\ No newline at end of file
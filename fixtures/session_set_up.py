@@ -1,11 +1,10 @@
 import pytest
 
-from clients.authentication.authentication_client import get_authentication_client
-from clients.authentication.authentication_schema import LoginRequestSchema
 from clients.custom_config.custom_config_client import get_custom_config_client
 from clients.custom_config.custom_config_schema import UploadCustomConfigRequestSchema
 from clients.private_http_builder import AuthenticationUserSchema
 from tools.logger import get_logger
+from tools.session_state import acquire_custom_config
 
 logger = get_logger(name='SESSION_SET-UP')
 
@@ -16,15 +15,13 @@ def session_custom_config():
     Фикстура для загрузки на коммутатор валидной тестовой конфигурации перед прогоном всех тестов.
     Запускается один раз за прогон в самом начале перед запуском первого теста.
     Тестовая конфигурация: "testdata/files/test_conf.json"
+    При запуске через pytest-xdist конфигурацию загружает один воркер, остальные ждут его на файловой блокировке.
+    Если коммутатор уже содержит эту конфигурацию, повторная загрузка пропускается.
     """
-    authentication_client = get_authentication_client()
-    authentication_request = LoginRequestSchema()
-    authentication_client.login(request=authentication_request)
-
     user = AuthenticationUserSchema()
 
     custom_config_client = get_custom_config_client(user=user)
     custom_config_request = UploadCustomConfigRequestSchema()
-    custom_config_client.upload_custom_config_api(request=custom_config_request)
+    uploaded = acquire_custom_config(custom_config_client=custom_config_client, request=custom_config_request)
 
-    logger.info("Test custom config was uploaded on switch")
\ No newline at end of file
+    logger.info(f"Test custom config is on switch ({'uploaded' if uploaded else 'already there'})")
\ No newline at end of file
@@ -1,10 +1,10 @@
 import pytest
 
-from clients.authentication.authentication_client import get_authentication_client
-from clients.authentication.authentication_schema import LoginRequestSchema
 from clients.custom_config.custom_config_client import get_custom_config_client
 from clients.private_http_builder import AuthenticationUserSchema
 from tools.logger import get_logger
+from tools.session_state import release_custom_config, finish_custom_config_session
+from tools.switch_config.reader import close_config_file_readers
 
 logger = get_logger(name='SESSION_TEAR-DOWN')
 
@@ -14,15 +14,27 @@ def session_default_config():
     """
     Фикстура для загрузки на коммутатор конфигурации по умолчанию после прогоном всех тестов.
     Запускается один раз за прогон в самом конце после прохождения последнего теста.
+    При запуске через pytest-xdist конфигурацию по умолчанию возвращает последний завершившийся воркер.
     """
     yield
-    authentication_client = get_authentication_client()
-    authentication_request = LoginRequestSchema()
-    authentication_client.login(request=authentication_request)
-
     user = AuthenticationUserSchema()
 
     custom_config_client = get_custom_config_client(user=user)
-    custom_config_client.return_default_config()
+    if release_custom_config(custom_config_client=custom_config_client):
+        logger.info("Default config was returned on switch")
+
+
+def pytest_sessionfinish(session: pytest.Session):
+    """
+    Возвращает конфигурацию по умолчанию, если этого не сделал ни один воркер pytest-xdist
+    (например, последний воркер упал до завершения сессии).
+    Выполняется только в главном процессе, когда все воркеры уже завершились.
+    Открытые конфигурационные файлы закрываются в каждом процессе.
+    """
+    close_config_file_readers()
+    if hasattr(session.config, 'workerinput'):
+        return
 
-    logger.info("Default config was returned on switch")
\ No newline at end of file
+    custom_config_client = get_custom_config_client(user=AuthenticationUserSchema())
+    if finish_custom_config_session(custom_config_client=custom_config_client):
+        logger.info("Default config was returned on switch after workers exited")
\ No newline at end of file
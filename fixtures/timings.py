@@ -0,0 +1,37 @@
+import pytest
+
+from tools.allure.environment import create_allure_environment_file
+from tools.logger import get_logger
+from tools.timings import get_run_id, read_timing_records, build_latency_report, save_latency_report
+
+logger = get_logger(name='LATENCY_REPORT')
+
+
+def pytest_configure(config: pytest.Config):
+    """
+    Создаёт идентификатор прогона в главном процессе до запуска воркеров pytest-xdist,
+    чтобы все воркеры записывали замеры HTTP-запросов под общим идентификатором.
+    """
+    get_run_id()
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session: pytest.Session):
+    """
+    Формирует отчёт о задержках запросов по маршрутам после завершения прогона.
+    Выполняется только в главном процессе, когда все воркеры pytest-xdist уже записали свои замеры.
+    Отчёт сохраняется в settings.latency_report_file и добавляется в environment.properties Allure-отчёта.
+    """
+    if hasattr(session.config, 'workerinput'):
+        return
+
+    run_id = get_run_id()
+    records = read_timing_records(run_id=run_id)
+    if not records:
+        return
+
+    report = build_latency_report(records=records)
+    save_latency_report(report=report, run_id=run_id)
+    create_allure_environment_file(latency_report=report)
+
+    logger.info(f'Latency report for {len(records)} requests was saved')
\ No newline at end of file
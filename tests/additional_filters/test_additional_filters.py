@@ -1,11 +1,11 @@
 import allure, pytest
 from http import HTTPStatus
-from clients.additional_filters.additional_filters_client import AdditionalFiltersClient, AdditionalFiltersSession
+from clients.additional_filters.additional_filters_client import AdditionalFiltersClient
 from clients.additional_filters.additional_filters_schema import CreateAdditionalFiltersRequestSchema, \
     CreateAdditionalFiltersSchema, UpdateAdditionalFiltersRequestSchema, DeleteAdditionalFiltersSchema, \
     DeleteAdditionalFiltersRequestSchema
 from clients.errors_schema import AuthenticationErrorResponseSchema
-from clients.public.public_client import PublicClient, PublicSession
+from clients.public.public_client import PublicClient
 from config import settings
 from fixtures.additional_filters import AdditionalFilterFixture
 from tests.additional_filters.additional_filters_assertions import \
@@ -16,7 +16,7 @@ from tools.allure.stories import AllureStory
 from tools.allure.tags import AllureTag
 from tools.assertions.base import assert_status_code
 from tools.allure.severity import AllureSeverity
-from tools.assertions.schema import validate_json_schema
+from tools.assertions.schema import validate_response
 from tools.logger import get_logger
 from tools.assertions.errors import assert_error_for_not_authenticated_user
 
@@ -70,12 +70,10 @@ class TestAdditionalFilters:
     def test_create_additional_filters_without_access_token(self, public_client: PublicClient):
         request = CreateAdditionalFiltersRequestSchema([CreateAdditionalFiltersSchema()])
         response = public_client.create_additional_filters_api(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
 
@@ -100,12 +98,10 @@ class TestAdditionalFilters:
     def test_update_additional_filters_without_access_token(self, public_client: PublicClient):
         request = UpdateAdditionalFiltersRequestSchema()
         response = public_client.update_additional_filters_api(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
 
@@ -115,13 +111,13 @@ class TestAdditionalFilters:
     @allure.sub_suite(AllureStory.DELETE_ENTITY)
     @allure.severity(AllureSeverity.BLOCKER)
     def test_delete_additional_filters(self,
-                                        additional_filters_session: AdditionalFiltersSession,
+                                        additional_filters_client: AdditionalFiltersClient,
                                         function_additional_filters_for_delete: AdditionalFilterFixture):
         request = DeleteAdditionalFiltersRequestSchema([DeleteAdditionalFiltersSchema(value=function_additional_filters_for_delete.test_data.ip,
                                                  direction=function_additional_filters_for_delete.test_data.direction,
                                                  logicGroup=int(function_additional_filters_for_delete.test_data.group_id),
                                                  type=function_additional_filters_for_delete.test_data.type)])
-        response = additional_filters_session.delete_additional_filters_api(request=request)
+        response = additional_filters_client.delete_additional_filters_api(request=request)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
 
@@ -132,13 +128,11 @@ class TestAdditionalFilters:
     @allure.story(AllureStory.DELETE_ENTITY)
     @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
     @allure.severity(AllureSeverity.MAJOR)
-    def test_delete_additional_filters_without_access_token(self, public_session: PublicSession,
+    def test_delete_additional_filters_without_access_token(self, public_client: PublicClient,
                                         function_additional_filters_for_delete: AdditionalFilterFixture):
         request = DeleteAdditionalFiltersRequestSchema([DeleteAdditionalFiltersSchema()])
-        response = public_session.delete_additional_filters_api(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response = public_client.delete_additional_filters_api(request=request)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.FORBIDDEN)
-        assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
\ No newline at end of file
+        assert_error_for_not_authenticated_user(response=response_data)
\ No newline at end of file
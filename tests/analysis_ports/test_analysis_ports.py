@@ -2,7 +2,7 @@ import allure, pytest
 
 from http import HTTPStatus
 
-from clients.analysis_ports.analysis_ports_client import AnalysisPortsClient, AnalysisPortsSession
+from clients.analysis_ports.analysis_ports_client import AnalysisPortsClient
 from clients.analysis_ports.analysis_ports_schema import GetAnalysisPortsResponseSchema, \
     CreateAnalysisPortRequestSchema, UpdateAnalysisPortRequestSchema, DeleteAnalysisPortRequestSchema
 from clients.errors_schema import AuthenticationErrorResponseSchema
@@ -17,7 +17,7 @@ from tools.allure.stories import AllureStory
 from tools.allure.tags import AllureTag
 from tools.assertions.base import assert_status_code
 from tools.assertions.errors import assert_error_for_not_authenticated_user
-from tools.assertions.schema import validate_json_schema
+from tools.assertions.schema import validate_response
 from tools.logger import get_logger
 
 
@@ -44,13 +44,11 @@ class TestAnalysisPorts:
                                     function_analysis_port_tear_down):
 
         response = analysis_ports_client.get_analysis_port_list_api()
-        response_data = GetAnalysisPortsResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=GetAnalysisPortsResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.OK)
 
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @allure.title("[403]FORBIDDEN - Get analysis port list by unauthorised user")
@@ -61,13 +59,11 @@ class TestAnalysisPorts:
     def test_get_analysis_port_list_by_unauthorised_user(self,
                                                          unauthorised_analysis_ports_client: AnalysisPortsClient):
         response = unauthorised_analysis_ports_client.get_analysis_port_list_api()
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @allure.title("[200]OK - Create analysis port")
@@ -101,15 +97,13 @@ class TestAnalysisPorts:
                                                        unauthorised_analysis_ports_client: AnalysisPortsClient):
         request = CreateAnalysisPortRequestSchema()
         response = unauthorised_analysis_ports_client.create_analysis_port_api(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
 
         assert_error_for_not_authenticated_user(response=response_data)
 
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @allure.title("[412]PRECONDITION_FAILED - Create already creating analysis port")
@@ -166,15 +160,13 @@ class TestAnalysisPorts:
                                                        unauthorised_analysis_ports_client: AnalysisPortsClient):
         request = UpdateAnalysisPortRequestSchema()
         response = unauthorised_analysis_ports_client.update_analysis_port_api(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
 
         assert_error_for_not_authenticated_user(response=response_data)
 
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @allure.title("[412]PRECONDITION_FAILED - Update nonexistent analysis port ")
@@ -201,16 +193,16 @@ class TestAnalysisPorts:
     @allure.severity(AllureSeverity.BLOCKER)
     def test_delete_analysis_port(self,
                                   function_analysis_port: AnalysisPortsFixture,
-                                  analysis_ports_session: AnalysisPortsSession):
+                                  analysis_ports_client: AnalysisPortsClient):
 
         request = DeleteAnalysisPortRequestSchema()
-        response = analysis_ports_session.delete_analysis_port_api(request=request)
+        response = analysis_ports_client.delete_analysis_port_api(request=request)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.OK)
 
         request_check_deleted = DeleteAnalysisPortRequestSchema()
-        response_check_deleted = analysis_ports_session.delete_analysis_port_api(request=request_check_deleted)
+        response_check_deleted = analysis_ports_client.delete_analysis_port_api(request=request_check_deleted)
 
         assert_status_code(actual=response_check_deleted.status_code,
                            expected=HTTPStatus.PRECONDITION_FAILED)
@@ -223,19 +215,17 @@ class TestAnalysisPorts:
     @allure.story(AllureStory.DELETE_ENTITY)
     @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
     @allure.severity(AllureSeverity.MAJOR)
-    def test_delete_analysis_port_by_unauthorised_user(self, unauthorised_analysis_ports_session: AnalysisPortsSession):
+    def test_delete_analysis_port_by_unauthorised_user(self, unauthorised_analysis_ports_client: AnalysisPortsClient):
 
         request = DeleteAnalysisPortRequestSchema()
-        response = unauthorised_analysis_ports_session.delete_analysis_port_api(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response = unauthorised_analysis_ports_client.delete_analysis_port_api(request=request)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
 
         assert_error_for_not_authenticated_user(response=response_data)
 
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @allure.title("[412]PRECONDITION_FAILED - Delete nonexistent analysis port")
@@ -243,10 +233,10 @@ class TestAnalysisPorts:
     @allure.story(AllureStory.DELETE_ENTITY)
     @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
     @allure.severity(AllureSeverity.MAJOR)
-    def test_delete_nonexistent_analysis_port(self, analysis_ports_session: AnalysisPortsSession):
+    def test_delete_nonexistent_analysis_port(self, analysis_ports_client: AnalysisPortsClient):
 
         request = DeleteAnalysisPortRequestSchema()
-        response = analysis_ports_session.delete_analysis_port_api(request=request)
+        response = analysis_ports_client.delete_analysis_port_api(request=request)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.PRECONDITION_FAILED)
@@ -1,15 +1,17 @@
-import allure, pytest
+import allure, asyncio, pytest
 
 from http import HTTPStatus
 from clients.authentication.authentication_client import AuthenticationClient
+from clients.async_session import run_async
 from clients.authentication.authentication_schema import LoginRequestSchema, InvalidLoginResponseSchema
+from clients.authentication.token_manager import get_token_manager
 from config import settings
 from tests.authentication.authentication_assertions import assert_invalid_log_in_response
 from tools.allure.epics import AllureEpic
 from tools.allure.features import AllureFeature
 from tools.allure.stories import AllureStory
 from tools.allure.tags import AllureTag
-from tools.assertions.base import assert_status_code
+from tools.assertions.base import assert_status_code, assert_equal, assert_is_true
 from tools.allure.severity import AllureSeverity
 
 
@@ -34,4 +36,25 @@ class TestAdditionalFilters:
         response_data = InvalidLoginResponseSchema.model_validate_json(response.text)
 
         assert_status_code(response.status_code, HTTPStatus.FORBIDDEN)
-        assert_invalid_log_in_response(response=response_data)
\ No newline at end of file
+        assert_invalid_log_in_response(response=response_data)
+
+
+
+    @allure.title("Log in and refresh tokens with async client")
+    @allure.tag(AllureTag.CREATE_ENTITY, AllureTag.POSITIVE_TEST)
+    @allure.story(AllureStory.CREATE_ENTITY)
+    @allure.sub_suite(AllureStory.CREATE_ENTITY)
+    @allure.severity(AllureSeverity.MAJOR)
+    def test_async_token_refresh(self):
+        token_manager = get_token_manager(request=LoginRequestSchema())
+
+        async def get_access_tokens() -> tuple[list[str], str]:
+            tokens = await asyncio.gather(*(token_manager.async_access_token() for _ in range(5)))
+            await asyncio.gather(*(token_manager.async_force_refresh(rejected_token=tokens[0]) for _ in range(2)))
+            return tokens, await token_manager.async_access_token()
+
+        tokens, refreshed_token = run_async(get_access_tokens())
+
+        assert_equal(actual=len(set(tokens)), expected=1, name='access tokens of concurrent requests')
+        assert_is_true(actual=refreshed_token != tokens[0], name='access token is refreshed')
+        assert_equal(actual=token_manager.access_token, expected=refreshed_token, name='access token of sync clients')
\ No newline at end of file
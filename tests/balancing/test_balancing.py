@@ -1,12 +1,14 @@
 import allure, pytest
 
 from http import HTTPStatus
-from clients.balancing.balancing_client import BalancingClient, BalancingSession
+from clients.async_session import run_async
+from clients.balancing.balancing_client import BalancingClient, get_async_balancing_client
 from clients.balancing.balancing_schema import GetBalancingListResponseSchema, CreateBalancingRequestSchema, \
     UpdateBalancingRequestSchema, DeleteBalancingRequestSchema
 from clients.errors_schema import AuthenticationErrorResponseSchema
-from clients.public.public_client import PublicClient, PublicSession
+from clients.public.public_client import PublicClient
 from config import settings
+from fixtures.authentication import UserFixture
 from fixtures.balancing import BalancingFixture
 from tests.balancing.balancing_assertions import assert_create_balancing_for_created_balancing_group_response, \
     assert_create_balancing_without_logic_id_response, assert_create_balancing_without_balance_type_response, \
@@ -16,9 +18,9 @@ from tools.allure.epics import AllureEpic
 from tools.allure.features import AllureFeature
 from tools.allure.stories import AllureStory
 from tools.allure.tags import AllureTag
-from tools.assertions.base import assert_status_code
+from tools.assertions.base import assert_status_code, assert_equal
 from tools.allure.severity import AllureSeverity
-from tools.assertions.schema import validate_json_schema
+from tools.assertions.schema import validate_response
 from tools.logger import get_logger
 from tools.assertions.errors import assert_error_for_not_authenticated_user
 
@@ -47,12 +49,26 @@ class TestBalancing:
         logger.info('[Set-up completed] : Balancing group was created.')
 
         response = balancing_client.get_balancing_list_api()
-        response_data = GetBalancingListResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=GetBalancingListResponseSchema)
 
         logger.info(f'Response data: \n{response.json()}')
 
         assert_status_code(response.status_code, HTTPStatus.OK)
-        validate_json_schema(response.json(), response_data.model_json_schema())
+
+
+    @allure.title("[200]OK - Get balancing list with async client")
+    @allure.tag(AllureTag.GET_ENTITIES, AllureTag.POSITIVE_TEST)
+    @allure.story(AllureStory.GET_ENTITIES)
+    @allure.sub_suite(AllureStory.GET_ENTITIES)
+    @allure.severity(AllureSeverity.MAJOR)
+    def test_get_balancing_list_async(self, balancing_client: BalancingClient, session_user: UserFixture):
+        async def get_balancing_list() -> GetBalancingListResponseSchema:
+            async_balancing_client = get_async_balancing_client(user=session_user.authentication_user)
+            return await async_balancing_client.get_balancing_list()
+
+        assert_equal(actual=run_async(get_balancing_list()),
+                     expected=balancing_client.get_balancing_list(),
+                     name='balancing list')
 
 
     @pytest.mark.xdist_group(name=f"{settings.xdist_group_names.negative_tests}")
@@ -63,11 +79,10 @@ class TestBalancing:
     @allure.severity(AllureSeverity.MAJOR)
     def test_get_balancing_list_without_access_token(self, public_client: PublicClient):
         response = public_client.get_balancing_list_api()
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(response.json(), response_data.model_json_schema())
 
 
 
@@ -76,10 +91,10 @@ class TestBalancing:
     @allure.story(AllureStory.CREATE_ENTITY)
     @allure.sub_suite(AllureStory.CREATE_ENTITY)
     @allure.severity(AllureSeverity.BLOCKER)
-    def test_create_balancing(self, balancing_client: BalancingClient, balancing_session: BalancingSession):
+    def test_create_balancing(self, balancing_client: BalancingClient):
         try:
             request_delete = DeleteBalancingRequestSchema(logic_group=1)
-            response_delete = balancing_session.delete_balancing_api(request=request_delete)
+            response_delete = balancing_client.delete_balancing_api(request=request_delete)
 
             logger.info(f'Delete balancing api response status code: "{response_delete.status_code}"')
             logger.info(f'Delete balancing api response body "{response_delete.text}"')
@@ -141,11 +156,10 @@ class TestBalancing:
     def test_create_balancing_without_access_token(self, public_client: PublicClient):
         request = CreateBalancingRequestSchema()
         response = public_client.create_balancing_api(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(response.json(), response_data.model_json_schema())
 
 
 
@@ -199,11 +213,10 @@ class TestBalancing:
     def test_update_balancing_without_access_token(self, public_client: PublicClient):
         request = UpdateBalancingRequestSchema()
         response = public_client.update_balancing_api(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(response.json(), response_data.model_json_schema())
 
 
 
@@ -214,7 +227,6 @@ class TestBalancing:
     @allure.sub_suite(AllureStory.DELETE_ENTITY)
     @allure.severity(AllureSeverity.MAJOR)
     def test_delete_balancing(self,
-                              balancing_session: BalancingSession,
                               balancing_client: BalancingClient,
                               function_balancing: BalancingFixture,
                               function_balancing_after_delete):
@@ -222,7 +234,7 @@ class TestBalancing:
         logger.info('[Set-up completed] : Balancing group was created.')
 
         request_delete = DeleteBalancingRequestSchema()
-        response_delete = balancing_session.delete_balancing_api(request=request_delete)
+        response_delete = balancing_client.delete_balancing_api(request=request_delete)
 
         logger.info(f'Delete balancing api status code "{response_delete.status_code}"')
         logger.info(f'Delete balancing api response body "{response_delete.text}"')
@@ -237,11 +249,11 @@ class TestBalancing:
     @allure.story(AllureStory.DELETE_ENTITY)
     @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
     @allure.severity(AllureSeverity.MAJOR)
-    def test_delete_had_been_deleted_balancing(self, balancing_session: BalancingSession, function_balancing: BalancingFixture, function_balancing_after_delete):
+    def test_delete_had_been_deleted_balancing(self, balancing_client: BalancingClient, function_balancing: BalancingFixture, function_balancing_after_delete):
 
         request = DeleteBalancingRequestSchema(logic_group=function_balancing.request.logic_id)
-        balancing_session.delete_balancing_api(request=request)
-        response = balancing_session.delete_balancing_api(request=request)
+        balancing_client.delete_balancing_api(request=request)
+        response = balancing_client.delete_balancing_api(request=request)
 
         assert_delete_had_been_deleted_balancing(response_str=response.text)
         assert_status_code(response.status_code, HTTPStatus.PRECONDITION_FAILED)
@@ -253,10 +265,10 @@ class TestBalancing:
     @allure.story(AllureStory.DELETE_ENTITY)
     @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
     @allure.severity(AllureSeverity.MAJOR)
-    def test_delete_without_logic_group(self, balancing_session: BalancingSession):
+    def test_delete_without_logic_group(self, balancing_client: BalancingClient):
 
         request = DeleteBalancingRequestSchema(logic_group="")
-        response = balancing_session.delete_balancing_api(request=request)
+        response = balancing_client.delete_balancing_api(request=request)
 
         assert_delete_without_logic_group_response(response_str=response.text)
         assert_status_code(response.status_code, HTTPStatus.PRECONDITION_FAILED)
@@ -268,11 +280,10 @@ class TestBalancing:
     @allure.story(AllureStory.DELETE_ENTITY)
     @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
     @allure.severity(AllureSeverity.MAJOR)
-    def test_delete_balancing_without_access_token(self, public_session: PublicSession):
+    def test_delete_balancing_without_access_token(self, public_client: PublicClient):
         request = DeleteBalancingRequestSchema()
-        response = public_session.delete_balancing_api(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response = public_client.delete_balancing_api(request=request)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.FORBIDDEN)
-        assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(response.json(), response_data.model_json_schema())
\ No newline at end of file
+        assert_error_for_not_authenticated_user(response=response_data)
\ No newline at end of file
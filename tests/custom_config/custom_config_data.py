@@ -0,0 +1,49 @@
+import json
+
+
+def switch_config_source(tables: dict, **sections) -> bytes:
+    return json.dumps({'names': {'ingress': 'Входная группа {1}'}, 'config': tables, **sections},
+                      ensure_ascii=False).encode()
+
+
+def nested_list(depth: int) -> list:
+    return [nested_list(depth - 1)] if depth else ['"]}', 1]
+
+
+# Таблицы, восстановление которых из компактного вида проверяется побайтно
+SWITCH_CONFIG_TABLES = {
+    'bool_data': {'forward_stat': [{'key': {'$COUNTER_INDEX': {'value': 1}},
+                                    'data': {'is_default_entry': False, 'enabled': True, 'count': 1}}]},
+    'bool_key': {'ternary_filters': [{'key': {'ig_md.flag': {'value': True, 'mask': 1}}, 'data': {}},
+                                     {'key': {'ig_md.flag': {'value': 1, 'mask': True}}, 'data': {}}]},
+    'scalar_key': {'decomposition': [{'key': {'$SELECTOR_GROUP_ID': 5, 'port': {'value': 8}}, 'data': {}},
+                                     {'key': {'$SELECTOR_GROUP_ID': {'value': 6, 'extra': 1}}, 'data': {}}]},
+    'fields_order': {'ternary_filters': [{'key': {'a': {'value': 1}, 'b': {'value': 2}},
+                                          'data': {'action_name': 'drop', 'priority': 1}},
+                                         {'key': {'b': {'value': 3}, 'a': {'value': 4}},
+                                          'data': {'priority': 2, 'action_name': 'forward'}}]},
+    'indexed': {'meter_port': {'2': {'cir': 100, 'pir': 200}, '1': {'pir': 300, 'cir': 400}}},
+    'strings': {'names_table': [{'key': {'name': {'value': 'Группа "{1}" [\\]'}}, 'data': {'note': '}]'}}]},
+    'deep_nesting': {'action_selector': [{'key': {}, 'data': {'members': nested_list(depth=40)}}]},
+}
+
+# Пары таблиц, которые не должны считаться равными
+SWITCH_CONFIG_UNEQUAL_TABLES = {
+    'bool_and_int': ([{'key': {'a': {'value': 1}}, 'data': {'enabled': True}}],
+                     [{'key': {'a': {'value': 1}}, 'data': {'enabled': 1}}]),
+    'bool_and_int_key': ([{'key': {'a': {'value': True}}, 'data': {}}],
+                         [{'key': {'a': {'value': 1}}, 'data': {}}]),
+    'int_and_float': ([{'key': {'a': {'value': 1}}, 'data': {}}],
+                      [{'key': {'a': {'value': 1.0}}, 'data': {}}]),
+    'scalar_and_value_key': ([{'key': {'a': 1}, 'data': {}}],
+                             [{'key': {'a': {'value': 1}}, 'data': {}}]),
+}
+
+# Содержимое, которое не является конфигурационным файлом
+INVALID_SWITCH_CONFIGS = {
+    'list': b'[{"config": {}}]',
+    'string': b'"config"',
+    'extra_data': b'{"config": {}} {}',
+    'unterminated': b'{"config": {"forward_stat": [[[[',
+    'missing_value': b'{"config": }',
+}
\ No newline at end of file
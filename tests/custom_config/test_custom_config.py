@@ -1,19 +1,23 @@
-import allure, pytest, time
+import allure, json, pytest
 
 from http import HTTPStatus
-from clients.custom_config.custom_config_client import CustomConfigClient
+from httpx import Response
+from clients.async_session import run_async
+from clients.custom_config.custom_config_client import CustomConfigClient, get_async_custom_config_client
+from clients.upload_stream import UploadProgress
 from clients.custom_config.custom_config_schema import UploadCustomConfigRequestSchema, GetSwitchInfoResponseSchema
 from clients.errors_schema import AuthenticationErrorResponseSchema
 from config import settings
+from fixtures.authentication import UserFixture
 from tests.custom_config.custom_config_assertions import assert_download_custom_config_response,\
     assert_upload_broken_custom_config
 from tools.allure.epics import AllureEpic
 from tools.allure.features import AllureFeature
 from tools.allure.stories import AllureStory
 from tools.allure.tags import AllureTag
-from tools.assertions.base import assert_status_code
+from tools.assertions.base import assert_status_code, assert_equal
 from tools.allure.severity import AllureSeverity
-from tools.assertions.schema import validate_json_schema
+from tools.assertions.schema import validate_response
 from tools.logger import get_logger
 from tools.assertions.errors import assert_error_for_not_authenticated_user
 
@@ -55,13 +59,11 @@ class TestCustomConfig:
     @allure.severity(AllureSeverity.MAJOR)
     def test_download_custom_config_by_unauthorised_user(self, unauthorised_custom_config_client: CustomConfigClient):
         response = unauthorised_custom_config_client.download_custom_config_api()
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @pytest.mark.flaky(reruns=3, reruns_delay=5)
@@ -72,16 +74,44 @@ class TestCustomConfig:
     @allure.severity(AllureSeverity.BLOCKER)
     def test_upload_custom_config(self, custom_config_client: CustomConfigClient):
         request = UploadCustomConfigRequestSchema()
+        progress: list[UploadProgress] = []
 
-        start_upload_time = time.perf_counter()
-        response = custom_config_client.upload_custom_config_api(request=request)
-        end_upload_time = time.perf_counter()
+        response = custom_config_client.upload_custom_config_api(request=request, on_progress=progress.append)
+        metric = progress[-1].to_metric()
 
-        uploading_time = end_upload_time - start_upload_time
-        logger.info(f'Time spent uploading user custom config to the switch: <{uploading_time:.3f} seconds.>')
+        logger.info(f'User custom config upload to the switch: {progress[-1]}')
+        allure.attach(json.dumps(metric, indent=2),
+                      name='Custom config upload',
+                      attachment_type=allure.attachment_type.JSON)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.OK)
+        assert_equal(actual=metric['sent_bytes'],
+                     expected=request.config.stat().st_size,
+                     name='uploaded bytes')
+
+
+    @allure.title("[200]OK - Upload my custom config to the switch with async client")
+    @allure.tag(AllureTag.CREATE_ENTITY, AllureTag.POSITIVE_TEST)
+    @allure.story(AllureStory.CREATE_ENTITY)
+    @allure.sub_suite(AllureStory.CREATE_ENTITY)
+    @allure.severity(AllureSeverity.MAJOR)
+    def test_upload_custom_config_async(self, session_user: UserFixture, function_custom_config_tear_down):
+        request = UploadCustomConfigRequestSchema()
+        progress: list[UploadProgress] = []
+
+        async def upload() -> Response:
+            async_custom_config_client = get_async_custom_config_client(user=session_user.authentication_user)
+            return await async_custom_config_client.upload_custom_config_api(request=request,
+                                                                             on_progress=progress.append)
+
+        response = run_async(upload())
+
+        assert_status_code(actual=response.status_code,
+                           expected=HTTPStatus.OK)
+        assert_equal(actual=progress[-1].sent,
+                     expected=request.config.stat().st_size,
+                     name='uploaded bytes')
 
 
     @pytest.mark.xdist_group(name=f"{settings.xdist_group_names.negative_tests}")
@@ -93,13 +123,11 @@ class TestCustomConfig:
     def test_upload_custom_config_by_unauthorised_user(self, unauthorised_custom_config_client: CustomConfigClient):
         request = UploadCustomConfigRequestSchema()
         response = unauthorised_custom_config_client.upload_custom_config_api(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     # @pytest.mark.skip(reason='Тест ломает коммутатор')
@@ -140,13 +168,11 @@ class TestCustomConfig:
     @allure.severity(AllureSeverity.MAJOR)
     def test_saving_custom_config_by_unauthorised_user(self, unauthorised_custom_config_client: CustomConfigClient):
         response = unauthorised_custom_config_client.saving_custom_config_api()
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
 
@@ -170,13 +196,11 @@ class TestCustomConfig:
     @allure.severity(AllureSeverity.MAJOR)
     def test_restore_custom_config_by_unauthorised_user(self, unauthorised_custom_config_client: CustomConfigClient):
         response = unauthorised_custom_config_client.restore_custom_config_api()
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
 
@@ -203,13 +227,11 @@ class TestCustomConfig:
     @allure.severity(AllureSeverity.MAJOR)
     def test_return_default_config_by_unauthorised_user(self, unauthorised_custom_config_client: CustomConfigClient):
         response = unauthorised_custom_config_client.return_default_config()
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
 
@@ -230,13 +252,11 @@ class TestSwitchInfo:
     @allure.severity(AllureSeverity.MAJOR)
     def test_get_switch_info(self, custom_config_client: CustomConfigClient):
         response = custom_config_client.get_switch_info_api()
-        response_data = GetSwitchInfoResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=GetSwitchInfoResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.OK)
 
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @allure.title("[403]FORBIDDEN - Get switch info by unauthorised user")
@@ -246,10 +266,8 @@ class TestSwitchInfo:
     @allure.severity(AllureSeverity.MINOR)
     def test_get_switch_info_by_unauthorised_user(self, unauthorised_custom_config_client: CustomConfigClient):
         response = unauthorised_custom_config_client.get_switch_info_api()
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
-        assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
\ No newline at end of file
+        assert_error_for_not_authenticated_user(response=response_data)
\ No newline at end of file
@@ -0,0 +1,86 @@
+import json
+import time
+
+import allure, pytest
+
+from http import HTTPStatus
+from clients.custom_config.custom_config_client import CustomConfigClient
+from clients.ports.ports_schema import POSSIBLE_PORTS
+from clients.upload_stream import UploadProgress
+from config import settings
+from tools.allure.epics import AllureEpic
+from tools.allure.features import AllureFeature
+from tools.allure.severity import AllureSeverity
+from tools.allure.stories import AllureStory
+from tools.allure.tags import AllureTag
+from tools.assertions.base import assert_status_code, assert_equal
+from tools.logger import get_logger
+from tools.switch_config.generator import ConfigScaleSchema, iter_generated_config
+from tools.switch_config.model import SwitchConfig
+
+logger = get_logger('CUSTOM_CONFIG_BENCHMARK')
+
+BENCHMARK_GROUPS = 16
+BENCHMARK_MIRROR_SESSIONS = 8
+BENCHMARK_PSF_RULES = 16
+
+
+@pytest.mark.custom_config
+@pytest.mark.benchmark
+@allure.tag(AllureTag.BENCHMARK, AllureTag.CUSTOM_CONFIG)
+@allure.epic(AllureEpic.PACKET_BROKER)
+@allure.feature(AllureFeature.CUSTOM_CONFIG)
+@allure.parent_suite(AllureEpic.PACKET_BROKER)
+@allure.suite(AllureFeature.CUSTOM_CONFIG)
+class TestCustomConfigBenchmark:
+
+
+    @pytest.mark.parametrize('filters_count', settings.benchmark.config_filter_counts)
+    @allure.title("Synthetic custom config upload and download")
+    @allure.story(AllureStory.BENCHMARK)
+    @allure.sub_suite(AllureStory.BENCHMARK)
+    @allure.severity(AllureSeverity.MINOR)
+    def test_synthetic_custom_config_scaling(self,
+                                             filters_count: int,
+                                             custom_config_client: CustomConfigClient,
+                                             function_custom_config_tear_down):
+        scale = ConfigScaleSchema(ports=len(POSSIBLE_PORTS),
+                                  groups=BENCHMARK_GROUPS,
+                                  filters=filters_count,
+                                  mirror_sessions=BENCHMARK_MIRROR_SESSIONS,
+                                  psf_rules=BENCHMARK_PSF_RULES)
+        progress: list[UploadProgress] = []
+
+        with allure.step(f'Upload synthetic config with {filters_count} filters'):
+            started = time.perf_counter()
+            response = custom_config_client.upload_custom_config_stream_api(stream=iter_generated_config(scale=scale),
+                                                                            on_progress=progress.append)
+            upload_seconds = time.perf_counter() - started
+            assert_status_code(actual=response.status_code, expected=HTTPStatus.OK)
+
+        with allure.step('Download applied config'):
+            started = time.perf_counter()
+            response = custom_config_client.download_custom_config_api()
+            download_seconds = time.perf_counter() - started
+            assert_status_code(actual=response.status_code, expected=HTTPStatus.OK)
+
+        # Разбор скачанной конфигурации - отдельный шаг, чтобы он не попадал во время скачивания
+        with allure.step('Check applied config tables'):
+            downloaded = SwitchConfig(response.content)
+            assert_equal(actual=len(downloaded.table('ternary_filters')), expected=filters_count,
+                         name='ternary_filters size')
+            assert_equal(actual=len(downloaded.table('ports')), expected=scale.ports, name='ports size')
+
+        report = {
+            'scale': scale.model_dump(),
+            'config_bytes': progress[-1].sent,
+            'upload_seconds': round(upload_seconds, 3),
+            'upload_throughput_mib_per_second': progress[-1].to_metric()['throughput_mib_per_second'],
+            'download_seconds': round(download_seconds, 3),
+            'download_bytes': len(response.content),
+        }
+
+        logger.info(f'Synthetic custom config benchmark: {report}')
+        allure.attach(json.dumps(report, indent=2),
+                      name=f'Custom config benchmark ({filters_count})',
+                      attachment_type=allure.attachment_type.JSON)
\ No newline at end of file
@@ -0,0 +1,152 @@
+import allure, json, pytest
+
+from pathlib import Path
+
+from tests.custom_config.custom_config_data import SWITCH_CONFIG_TABLES, SWITCH_CONFIG_UNEQUAL_TABLES, \
+    INVALID_SWITCH_CONFIGS, switch_config_source
+from tools.allure.epics import AllureEpic
+from tools.allure.features import AllureFeature
+from tools.allure.severity import AllureSeverity
+from tools.allure.stories import AllureStory
+from tools.allure.tags import AllureTag
+from tools.assertions.base import assert_equal
+from tools.switch_config.model import SwitchConfig, SwitchTable
+from tools.switch_config.reader import ConfigFileReader, MAX_CONFIG_FILE_READERS, get_config_file_reader, \
+    close_config_file_readers
+
+
+@pytest.mark.custom_config
+@pytest.mark.regression
+@allure.tag(AllureTag.REGRESSION, AllureTag.CUSTOM_CONFIG)
+@allure.epic(AllureEpic.PACKET_BROKER)
+@allure.feature(AllureFeature.CUSTOM_CONFIG)
+@allure.parent_suite(AllureEpic.PACKET_BROKER)
+@allure.suite(AllureFeature.CUSTOM_CONFIG)
+class TestSwitchConfig:
+
+
+    @allure.title("Switch config file is restored from compact tables byte by byte")
+    @allure.tag(AllureTag.POSITIVE_TEST)
+    @allure.story(AllureStory.VALIDATE_ENTITY)
+    @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
+    @allure.severity(AllureSeverity.MAJOR)
+    def test_switch_config_round_trip(self):
+        with open('testdata/files/test_conf.json', 'rb') as file:
+            source = file.read()
+
+        config = SwitchConfig(source)
+
+        assert_equal(actual=json.dumps(config.to_json()), expected=json.dumps(json.loads(source)),
+                     name='restored config file')
+
+
+    @pytest.mark.parametrize('tables', SWITCH_CONFIG_TABLES.values(), ids=SWITCH_CONFIG_TABLES.keys())
+    @allure.title("Switch config table is indexed by byte offsets and restored with original types and order")
+    @allure.tag(AllureTag.POSITIVE_TEST)
+    @allure.story(AllureStory.VALIDATE_ENTITY)
+    @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
+    @allure.severity(AllureSeverity.MAJOR)
+    def test_switch_config_table_round_trip(self, tables: dict):
+        source = switch_config_source(tables, zoom=1.5)
+        config = SwitchConfig(source)
+
+        assert_equal(actual=config.table_names, expected=list(tables), name='table names')
+        for name, rows in tables.items():
+            assert_equal(actual=json.loads(config.raw_table(name)), expected=rows, name=f'{name} raw table')
+            assert_equal(actual=json.dumps(config.table(name).to_json()), expected=json.dumps(rows),
+                         name=f'{name} restored table')
+        assert_equal(actual=config.section('zoom'), expected=1.5, name='section after tables')
+        assert_equal(actual=json.dumps(config.to_json(), ensure_ascii=False), expected=source.decode(),
+                     name='restored config file')
+
+
+    @allure.title("Switch config tables with same entries in different fields order are equal")
+    @allure.tag(AllureTag.POSITIVE_TEST)
+    @allure.story(AllureStory.VALIDATE_ENTITY)
+    @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
+    @allure.severity(AllureSeverity.MAJOR)
+    def test_switch_config_tables_equal(self):
+        rows = SWITCH_CONFIG_TABLES['fields_order']['ternary_filters']
+        reordered = [{'data': dict(reversed(row['data'].items())), 'key': dict(reversed(row['key'].items()))}
+                     for row in rows]
+        current = SwitchConfig(switch_config_source({'ternary_filters': rows}))
+        expected = SwitchConfig(switch_config_source({'ternary_filters': reordered}))
+
+        assert_equal(actual=current.table_equals(other=expected, name='ternary_filters'), expected=True,
+                     name='tables equality')
+
+
+    @pytest.mark.parametrize('rows', SWITCH_CONFIG_UNEQUAL_TABLES.values(), ids=SWITCH_CONFIG_UNEQUAL_TABLES.keys())
+    @allure.title("Switch config tables with values of different types are not equal")
+    @allure.tag(AllureTag.NEGATIVE_TEST)
+    @allure.story(AllureStory.VALIDATE_ENTITY)
+    @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
+    @allure.severity(AllureSeverity.MAJOR)
+    def test_switch_config_tables_not_equal(self, rows: tuple[list, list]):
+        current = SwitchConfig(switch_config_source({'ternary_filters': rows[0]}))
+        expected = SwitchConfig(switch_config_source({'ternary_filters': rows[1]}))
+
+        assert_equal(actual=current.table_equals(other=expected, name='ternary_filters'), expected=False,
+                     name='tables equality')
+        assert_equal(actual=SwitchTable(name='ternary_filters', rows=rows[1]) == expected.table('ternary_filters'),
+                     expected=True, name='table equality to itself')
+
+
+    @pytest.mark.parametrize('source', INVALID_SWITCH_CONFIGS.values(), ids=INVALID_SWITCH_CONFIGS.keys())
+    @allure.title("Switch config is not indexed from content that is not a JSON object")
+    @allure.tag(AllureTag.NEGATIVE_TEST)
+    @allure.story(AllureStory.VALIDATE_ENTITY)
+    @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
+    @allure.severity(AllureSeverity.MINOR)
+    def test_switch_config_invalid(self, source: bytes):
+        with pytest.raises(ValueError):
+            SwitchConfig(source)
+
+
+    @allure.title("Config file reader finds table byte offsets after non-ASCII content")
+    @allure.tag(AllureTag.POSITIVE_TEST)
+    @allure.story(AllureStory.VALIDATE_ENTITY)
+    @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
+    @allure.severity(AllureSeverity.MAJOR)
+    def test_config_file_reader_spans(self, tmp_path: Path):
+        tables = {**SWITCH_CONFIG_TABLES['strings'], **SWITCH_CONFIG_TABLES['indexed']}
+        source = switch_config_source(tables)
+        path = tmp_path / 'config.json'
+        path.write_bytes(source)
+
+        with ConfigFileReader(path) as reader:
+            for name, rows in tables.items():
+                start, end = reader.config.table_spans[name]
+                assert_equal(actual=source[start:end], expected=json.dumps(rows, ensure_ascii=False).encode(),
+                             name=f'{name} span')
+                assert_equal(actual=reader.raw_table(name), expected=source[start:end], name=f'{name} raw table')
+            assert_equal(actual=b''.join(reader.iter_chunks(chunk_size=7)), expected=source, name='file chunks')
+
+        assert_equal(actual=reader.closed, expected=True, name='reader closed')
+
+
+    @allure.title("Config file readers evicted from cache or replaced by modified file are closed")
+    @allure.tag(AllureTag.POSITIVE_TEST)
+    @allure.story(AllureStory.VALIDATE_ENTITY)
+    @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
+    @allure.severity(AllureSeverity.MAJOR)
+    def test_config_file_reader_cache_cleanup(self, tmp_path: Path):
+        close_config_file_readers()
+        paths = [tmp_path / f'config_{number}.json' for number in range(MAX_CONFIG_FILE_READERS + 1)]
+        for path in paths:
+            path.write_bytes(switch_config_source({}))
+
+        readers = [get_config_file_reader(path) for path in paths]
+        assert_equal(actual=get_config_file_reader(paths[-1]) is readers[-1], expected=True, name='cached reader')
+        assert_equal(actual=[reader.closed for reader in readers], expected=[True] + [False] * MAX_CONFIG_FILE_READERS,
+                     name='closed readers after eviction')
+
+        paths[-1].write_bytes(switch_config_source(SWITCH_CONFIG_TABLES['indexed']))
+        modified = get_config_file_reader(paths[-1])
+        assert_equal(actual=(modified is readers[-1], readers[-1].closed), expected=(False, True),
+                     name='reader of modified file')
+        assert_equal(actual=modified.config.table_names, expected=['meter_port'], name='modified file tables')
+
+        close_config_file_readers()
+        assert_equal(actual=all(reader.closed for reader in [*readers, modified]), expected=True,
+                     name='closed readers')
\ No newline at end of file
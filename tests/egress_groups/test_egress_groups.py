@@ -2,7 +2,7 @@ import allure, pytest
 
 from http import HTTPStatus
 
-from clients.egress_groups.egress_groups_client import EgressGroupsClient, EgressGroupsSession
+from clients.egress_groups.egress_groups_client import EgressGroupsClient
 from clients.egress_groups.egress_groups_schema import GetEgressGroupsResponseSchema, CreateEgressGroupRequestSchema, \
     UpdateEgressGroupRequestSchema, DeleteEgressGroupRequestSchema
 from clients.errors_schema import AuthenticationErrorResponseSchema
@@ -17,7 +17,7 @@ from tools.allure.stories import AllureStory
 from tools.allure.tags import AllureTag
 from tools.assertions.base import assert_status_code
 from tools.assertions.errors import assert_error_for_not_authenticated_user
-from tools.assertions.schema import validate_json_schema
+from tools.assertions.schema import validate_response
 from tools.logger import get_logger
 
 
@@ -40,12 +40,10 @@ class TestEgressGroups:
     @allure.severity(AllureSeverity.BLOCKER)
     def test_get_egress_group_list(self, egress_groups_client: EgressGroupsClient):
         response = egress_groups_client.get_egress_group_list_api()
-        response_data = GetEgressGroupsResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=GetEgressGroupsResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.OK)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @allure.title("[403]FORBIDDEN - Get egress group list by unauthorised user")
@@ -55,13 +53,11 @@ class TestEgressGroups:
     @allure.severity(AllureSeverity.MAJOR)
     def test_get_egress_group_list_by_unauthorised_user(self, unauthorised_egress_groups_client: EgressGroupsClient):
         response = unauthorised_egress_groups_client.get_egress_group_list_api()
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @allure.title("[200]OK - Create egress group")
@@ -93,13 +89,11 @@ class TestEgressGroups:
     def test_create_egress_group_by_unauthorised_user(self, unauthorised_egress_groups_client: EgressGroupsClient):
         request = CreateEgressGroupRequestSchema()
         response = unauthorised_egress_groups_client.create_egress_group_api(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @allure.title("[412]PRECONDITION_FAILED - Create already creating egress group")
@@ -151,15 +145,13 @@ class TestEgressGroups:
 
         request = UpdateEgressGroupRequestSchema()
         response = unauthorised_egress_groups_client.update_egress_group_api(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
 
         assert_error_for_not_authenticated_user(response=response_data)
 
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @allure.title("[412]PRECONDITION_FAILED - Update nonexistent egress group")
@@ -186,10 +178,10 @@ class TestEgressGroups:
     @allure.severity(AllureSeverity.BLOCKER)
     def test_delete_egress_group(self,
                                  function_egress_group: EgressGroupFixture,
-                                 egress_groups_session: EgressGroupsSession):
+                                 egress_groups_client: EgressGroupsClient):
 
         request = DeleteEgressGroupRequestSchema()
-        response = egress_groups_session.delete_egress_group_api(request=request)
+        response = egress_groups_client.delete_egress_group_api(request=request)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.OK)
@@ -200,19 +192,17 @@ class TestEgressGroups:
     @allure.story(AllureStory.DELETE_ENTITY)
     @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
     @allure.severity(AllureSeverity.MAJOR)
-    def test_delete_egress_group_by_unauthorised_user(self, unauthorised_egress_groups_session: EgressGroupsSession):
+    def test_delete_egress_group_by_unauthorised_user(self, unauthorised_egress_groups_client: EgressGroupsClient):
 
         request = DeleteEgressGroupRequestSchema()
-        response = unauthorised_egress_groups_session.delete_egress_group_api(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response = unauthorised_egress_groups_client.delete_egress_group_api(request=request)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
 
         assert_error_for_not_authenticated_user(response=response_data)
 
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @allure.title("[412]PRECONDITION_FAILED - Delete nonexistent egress group")
@@ -221,11 +211,11 @@ class TestEgressGroups:
     @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
     @allure.severity(AllureSeverity.MAJOR)
     def test_delete_nonexistent_egress_group(self,
-                                             egress_groups_session: EgressGroupsSession):
+                                             egress_groups_client: EgressGroupsClient):
 
         request = DeleteEgressGroupRequestSchema(group_id='egress-9',
                                                  logic_group='selection-9')
-        response = egress_groups_session.delete_egress_group_api(request=request)
+        response = egress_groups_client.delete_egress_group_api(request=request)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.PRECONDITION_FAILED)
@@ -1,5 +1,8 @@
+from ipaddress import IPv4Address, IPv4Network, IPv6Network, ip_address
+from typing import Iterator
+
 from clients.filters.filters_schema import DeleteFilterSchema, PatternObjectSchema, VlansSchema, EtherTypeSchema, \
-    DeleteFiltersRequestSchema
+    DeleteFiltersRequestSchema, CreateFilterSchema
 
 FILTERS_FOR_DELETE = DeleteFiltersRequestSchema([DeleteFilterSchema(
     hdr_ethernet_dst_addr=PatternObjectSchema(
@@ -55,4 +58,65 @@ FILTERS_FOR_DELETE = DeleteFiltersRequestSchema([DeleteFilterSchema(
 Все значения сущностей взяты согласно CreateFilterSchema()
 """
 
-FILTERS_FOR_DELETE_JSON='[{"hdr.ethernet.dst_addr":{"value":"12:13:14:cc:cc:cc","mask":281474976710655},"hdr.ethernet.src_addr":{"value":"00:1a:3f:f1:4c:c6","mask":281474976710655},"ig_md.dst_addr":{"value":"1.1.1.1","mask":"255.255.255.255 /32"},"ig_md.dst_port":{"value":80,"mask":65535},"ig_md.protocol":{"value":6,"mask":255},"ig_md.src_addr":{"value":"2.2.2.2","mask":"255.255.255.255 /32"},"ig_md.src_port":{"value":122,"mask":65535},"logicGroup":1,"filtrationType":"pass","analyzePort":null,"vlans":{"vlan0":{"value":22,"mask":4095},"vlanLast":{"value":14,"mask":4095}},"etherType":{"etherType":{"value":"0x8847","mask":65535}}}]'
\ No newline at end of file
+FILTERS_FOR_DELETE_JSON='[{"hdr.ethernet.dst_addr":{"value":"12:13:14:cc:cc:cc","mask":281474976710655},"hdr.ethernet.src_addr":{"value":"00:1a:3f:f1:4c:c6","mask":281474976710655},"ig_md.dst_addr":{"value":"1.1.1.1","mask":"255.255.255.255 /32"},"ig_md.dst_port":{"value":80,"mask":65535},"ig_md.protocol":{"value":6,"mask":255},"ig_md.src_addr":{"value":"2.2.2.2","mask":"255.255.255.255 /32"},"ig_md.src_port":{"value":122,"mask":65535},"logicGroup":1,"filtrationType":"pass","analyzePort":null,"vlans":{"vlan0":{"value":22,"mask":4095},"vlanLast":{"value":14,"mask":4095}},"etherType":{"etherType":{"value":"0x8847","mask":65535}}}]'
+
+
+"""
+Сети для адресов источника фильтров нагрузочного теста таблицы фильтров (RFC 2544, 198.18.0.0/15 и
+RFC 5180, 2001:2::/48 для IPv6-правил). По ним отличаются созданные тестом фильтры от фильтров тестовой конфигурации.
+"""
+BENCHMARK_SOURCE_NETWORK = IPv4Network('198.18.0.0/15')
+BENCHMARK_IPV6_SOURCE_NETWORK = IPv6Network('2001:2::/48')
+
+
+def is_benchmark_filter(stored_filter: DeleteFilterSchema) -> bool:
+    """
+    Проверяет, создан ли фильтр из списка /api/filters/ нагрузочным тестом таблицы фильтров.
+
+    :param stored_filter: Фильтр из ответа на получение списка фильтров.
+    :return: True, если адрес источника фильтра входит в BENCHMARK_SOURCE_NETWORK или BENCHMARK_IPV6_SOURCE_NETWORK.
+    """
+    ip_src = stored_filter.ig_md_src_addr.value
+    if not ip_src or not isinstance(ip_src, str):
+        return False
+
+    return any(ip_address(ip_src) in network for network in (BENCHMARK_SOURCE_NETWORK, BENCHMARK_IPV6_SOURCE_NETWORK))
+
+
+def generate_benchmark_filters(count: int, start: int = 0) -> Iterator[CreateFilterSchema]:
+    """
+    Генерирует уникальные фильтры для заполнения таблицы фильтров.
+    Фильтры чередуют варианты правил: IPv4-подсеть, IPv6, VLAN, MAC и L4-порты.
+    Адрес источника у каждого фильтра свой (из BENCHMARK_SOURCE_NETWORK, у IPv6-правил - из
+    BENCHMARK_IPV6_SOURCE_NETWORK), поэтому фильтры не совпадают. В IPv6-правилах IPv4-адреса не задаются.
+
+    :param count: Количество фильтров.
+    :param start: Порядковый номер первого фильтра.
+    :return: Итератор фильтров на основе модели CreateFilterSchema.
+    """
+    for index in range(start, start + count):
+        ip_src = str(BENCHMARK_SOURCE_NETWORK[index + 1])
+
+        match index % 5:
+            case 0:
+                yield CreateFilterSchema(new_ip_src=ip_src,
+                                         new_ip_dst=str(IPv4Address('203.0.113.0') + index % 256),
+                                         new_ip_dst_mask=24)
+            case 1:
+                yield CreateFilterSchema(new_ip_src='',
+                                         new_ip_dst='',
+                                         new_ipv6_src=str(BENCHMARK_IPV6_SOURCE_NETWORK[index + 1]),
+                                         new_ipv6_dst=f'2001:db8:1::{index:x}')
+            case 2:
+                yield CreateFilterSchema(new_ip_src=ip_src,
+                                         new_vlan0=index % 4094 + 1,
+                                         new_vlan_last=index * 7 % 4094 + 1)
+            case 3:
+                yield CreateFilterSchema(new_ip_src=ip_src,
+                                         new_mac_src=f'02{index:010X}',
+                                         new_mac_dst=f'06{index:010X}')
+            case 4:
+                yield CreateFilterSchema(new_ip_src=ip_src,
+                                         new_ip_proto='17',
+                                         new_src_port=1024 + index % 64511,
+                                         new_dst_port=index * 13 % 65535 + 1)
\ No newline at end of file
@@ -1,24 +1,88 @@
+import json
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Iterable
+
 import allure, pytest
 
 from http import HTTPStatus
+from httpx import AsyncClient, Request
+from clients.async_session import run_async
+from clients.authentication.token_manager import BearerTokenAuth
 from clients.errors_schema import AuthenticationErrorResponseSchema
-from clients.filters.filters_client import FiltersClient, FiltersSession
-from clients.filters.filters_schema import CreateFilterSchema
+from clients.filters.filters_client import FiltersClient, AsyncFiltersClient
+from clients.filters.filters_schema import CreateFilterSchema, FilterBulkResultSchema, CreateFiltersRequestSchema, \
+    PatternObjectSchema, DeleteFilterSchema
+from clients.private_http_builder import AuthenticationUserSchema, get_user_token_manager
+from clients.transport import get_http_transport
 from config import settings
+from fixtures.authentication import UserFixture
 from fixtures.filters import FiltersFixture
-from tests.filters.filters_data import FILTERS_FOR_DELETE
+from tests.filters.filters_data import FILTERS_FOR_DELETE, BENCHMARK_SOURCE_NETWORK, generate_benchmark_filters, \
+    is_benchmark_filter
 from tools.allure.epics import AllureEpic
 from tools.allure.features import AllureFeature
 from tools.allure.severity import AllureSeverity
 from tools.allure.stories import AllureStory
 from tools.allure.tags import AllureTag
-from tools.assertions.base import assert_status_code
+from tools.assertions.base import assert_status_code, assert_equal
 from tools.assertions.errors import assert_error_for_not_authenticated_user
-from tools.assertions.schema import validate_json_schema
+from tools.assertions.schema import validate_response
 from tools.logger import get_logger
 
 logger = get_logger('FILTERS')
 
+BULK_FILTERS = 7        # Количество фильтров пакетной операции: два полных пакета и один неполный
+BULK_BATCH_SIZE = 3
+
+
+@asynccontextmanager
+async def batch_recording_filters_client(user: AuthenticationUserSchema
+                                         ) -> AsyncIterator[tuple[AsyncFiltersClient, list[int]]]:
+    """
+    Создаёт асинхронный клиент фильтров с отдельным HTTP-клиентом, записывающим размер каждого отправленного пакета.
+
+    :return: Клиент фильтров и список размеров отправленных им пакетов.
+    """
+    batch_sizes = []
+
+    async def record_batch_size(request: Request):
+        batch_sizes.append(len(json.loads(request.content)))
+
+    async with AsyncClient(event_hooks={'request': [record_batch_size]},
+                           base_url=settings.http_client.client_url,
+                           timeout=settings.http_client.timeout,
+                           auth=BearerTokenAuth(token_manager=get_user_token_manager(user=user)),
+                           transport=get_http_transport()) as client:
+        yield AsyncFiltersClient(client=client), batch_sizes
+
+
+async def collect_bulk_results(bulk: AsyncIterator[FilterBulkResultSchema]) -> list[FilterBulkResultSchema]:
+    return sorted([result async for result in bulk], key=lambda result: result.index)
+
+
+async def create_filters_bulk(user: AuthenticationUserSchema,
+                              filters: Iterable[CreateFilterSchema]) -> tuple[list[FilterBulkResultSchema], list[int]]:
+    """
+    Выполняет пакетное создание фильтров.
+
+    :return: Результаты по фильтрам в порядке входной последовательности и размеры отправленных пакетов.
+    """
+    async with batch_recording_filters_client(user=user) as (filters_client, batch_sizes):
+        bulk = filters_client.create_filters_bulk(filters=filters, batch_size=BULK_BATCH_SIZE)
+        return await collect_bulk_results(bulk), batch_sizes
+
+
+async def delete_filters_bulk(user: AuthenticationUserSchema,
+                              filters: Iterable[DeleteFilterSchema]) -> tuple[list[FilterBulkResultSchema], list[int]]:
+    """
+    Выполняет пакетное удаление фильтров.
+
+    :return: Результаты по фильтрам в порядке входной последовательности и размеры отправленных пакетов.
+    """
+    async with batch_recording_filters_client(user=user) as (filters_client, batch_sizes):
+        bulk = filters_client.delete_filters_bulk(filters=filters, batch_size=BULK_BATCH_SIZE)
+        return await collect_bulk_results(bulk), batch_sizes
+
 
 @pytest.mark.filters
 @pytest.mark.regression
@@ -50,13 +114,11 @@ class TestFilters:
     @allure.severity(AllureSeverity.MAJOR)
     def test_get_filters_list_by_unauthorised_user(self, unauthorised_filters_client: FiltersClient):
         response = unauthorised_filters_client.get_filters_api()
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
 
@@ -83,13 +145,11 @@ class TestFilters:
     def test_create_filters_by_unauthorised_user(self, unauthorised_filters_client: FiltersClient):
         request = CreateFilterSchema()
         response = unauthorised_filters_client.create_filters_api(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
 
@@ -98,9 +158,9 @@ class TestFilters:
     @allure.story(AllureStory.DELETE_ENTITY)
     @allure.sub_suite(AllureStory.DELETE_ENTITY)
     @allure.severity(AllureSeverity.BLOCKER)
-    def test_delete_filters(self, filters_session: FiltersSession, function_filters: FiltersFixture):
+    def test_delete_filters(self, filters_client: FiltersClient, function_filters: FiltersFixture):
         request = FILTERS_FOR_DELETE.model_dump(by_alias=True)
-        response = filters_session.delete_filters_api(request=request)
+        response = filters_client.delete_filters_api(request=request)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.OK)
@@ -112,16 +172,14 @@ class TestFilters:
     @allure.story(AllureStory.DELETE_ENTITY)
     @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
     @allure.severity(AllureSeverity.MAJOR)
-    def test_delete_filters_by_unauthorised_user(self, unauthorised_filters_session: FiltersSession):
+    def test_delete_filters_by_unauthorised_user(self, unauthorised_filters_client: FiltersClient):
         request = FILTERS_FOR_DELETE.model_dump(by_alias=True)
-        response = unauthorised_filters_session.delete_filters_api(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response = unauthorised_filters_client.delete_filters_api(request=request)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @pytest.mark.xfail(reason="Найден БАГ: [404]NOT_FOUND - Nothing matches the given URI\n")
@@ -150,4 +208,82 @@ class TestFilters:
         response = unauthorised_filters_client.delete_all_filters_api()
 
         assert_status_code(actual=response.status_code,
-                           expected=HTTPStatus.FORBIDDEN)
\ No newline at end of file
+                           expected=HTTPStatus.FORBIDDEN)
+
+
+@pytest.mark.filters
+@pytest.mark.regression
+@pytest.mark.xdist_group(name=f"{settings.xdist_group_names.benchmark_filters}")
+@allure.tag(AllureTag.REGRESSION, AllureTag.FILTERS)
+@allure.epic(AllureEpic.PACKET_BROKER)
+@allure.feature(AllureFeature.FILTERS)
+@allure.parent_suite(AllureEpic.PACKET_BROKER)
+@allure.suite(AllureFeature.FILTERS)
+class TestFiltersBulk:
+
+
+    @allure.title("[200]OK - Create filters in batches")
+    @allure.tag(AllureTag.CREATE_ENTITY, AllureTag.POSITIVE_TEST)
+    @allure.story(AllureStory.CREATE_ENTITY)
+    @allure.sub_suite(AllureStory.CREATE_ENTITY)
+    @allure.severity(AllureSeverity.MAJOR)
+    def test_create_filters_bulk(self,
+                                 session_user: UserFixture,
+                                 filters_client: FiltersClient,
+                                 function_benchmark_filters_tear_down):
+        results, batch_sizes = run_async(create_filters_bulk(user=session_user.authentication_user,
+                                                             filters=generate_benchmark_filters(BULK_FILTERS)))
+
+        assert_equal(actual=sorted(batch_sizes), expected=[1, BULK_BATCH_SIZE, BULK_BATCH_SIZE], name='batch sizes')
+        assert_equal(actual=[result.index for result in results], expected=list(range(BULK_FILTERS)),
+                     name='result indexes')
+        assert_equal(actual=[result.index for result in results if not result.is_success], expected=[],
+                     name='failed filters')
+        assert_equal(actual=sum(map(is_benchmark_filter, filters_client.iter_filters())), expected=BULK_FILTERS,
+                     name='created filters')
+
+
+    @allure.title("[412]PRECONDITION_FAILED - Delete filters in batches with unknown filter")
+    @allure.tag(AllureTag.DELETE_ENTITY, AllureTag.NEGATIVE_TEST)
+    @allure.story(AllureStory.DELETE_ENTITY)
+    @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
+    @allure.severity(AllureSeverity.MAJOR)
+    def test_delete_filters_bulk_partial_failure(self,
+                                                 session_user: UserFixture,
+                                                 filters_client: FiltersClient,
+                                                 function_benchmark_filters_tear_down):
+        response = filters_client.create_filters_batch_api(
+            request=CreateFiltersRequestSchema(list(generate_benchmark_filters(BULK_FILTERS))))
+        assert_status_code(actual=response.status_code, expected=HTTPStatus.OK)
+
+        # Несуществующий фильтр попадает во второй пакет: коммутатор отклоняет этот пакет целиком
+        stored = [item for item in filters_client.iter_filters() if is_benchmark_filter(item)]
+        unknown = stored[0].model_copy(update={'ig_md_src_addr': PatternObjectSchema(
+            value=str(BENCHMARK_SOURCE_NETWORK[-2]), mask=stored[0].ig_md_src_addr.mask)})
+        filters = stored[:BULK_BATCH_SIZE + 1] + [unknown] + stored[BULK_BATCH_SIZE + 1:]
+
+        results, batch_sizes = run_async(delete_filters_bulk(user=session_user.authentication_user,
+                                                             filters=filters))
+        failed_batch = list(range(BULK_BATCH_SIZE, 2 * BULK_BATCH_SIZE))
+
+        assert_equal(actual=sorted(batch_sizes), expected=[2, BULK_BATCH_SIZE, BULK_BATCH_SIZE], name='batch sizes')
+        assert_equal(actual=[result.index for result in results if not result.is_success], expected=failed_batch,
+                     name='failed filters')
+        assert_equal(actual={results[index].status_code for index in failed_batch},
+                     expected={HTTPStatus.PRECONDITION_FAILED},
+                     name='failed batch status codes')
+        assert_equal(actual=sum(map(is_benchmark_filter, filters_client.iter_filters())), expected=2,
+                     name='filters of failed batch left')
+
+
+    @allure.title("Create filters in batches from empty input")
+    @allure.tag(AllureTag.CREATE_ENTITY, AllureTag.POSITIVE_TEST)
+    @allure.story(AllureStory.CREATE_ENTITY)
+    @allure.sub_suite(AllureStory.CREATE_ENTITY)
+    @allure.severity(AllureSeverity.MINOR)
+    def test_create_filters_bulk_empty(self, session_user: UserFixture):
+        results, batch_sizes = run_async(create_filters_bulk(user=session_user.authentication_user,
+                                                             filters=[]))
+
+        assert_equal(actual=results, expected=[], name='results')
+        assert_equal(actual=batch_sizes, expected=[], name='batch sizes')
\ No newline at end of file
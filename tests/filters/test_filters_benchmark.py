@@ -0,0 +1,119 @@
+import json
+import time
+from typing import Callable, Iterable
+
+import allure, pytest
+
+from http import HTTPStatus
+from httpx import Response
+from clients.async_session import run_async
+from clients.filters.filters_client import FiltersClient, get_async_filters_client
+from clients.filters.filters_schema import CreateFilterSchema, DeleteFilterSchema, FilterBulkResultSchema
+from clients.private_http_builder import AuthenticationUserSchema
+from config import settings
+from fixtures.authentication import UserFixture
+from tests.filters.filters_data import generate_benchmark_filters, is_benchmark_filter
+from tools.allure.epics import AllureEpic
+from tools.allure.features import AllureFeature
+from tools.allure.severity import AllureSeverity
+from tools.allure.stories import AllureStory
+from tools.allure.tags import AllureTag
+from tools.assertions.base import assert_status_code, assert_equal
+from tools.logger import get_logger
+from tools.timings import percentile
+
+logger = get_logger('FILTERS_BENCHMARK')
+
+SINGLE_INSERTS = 20     # Количество одиночных добавлений для замера задержки при заполненной таблице
+LIST_REPEATS = 5        # Количество запросов списка фильтров для замера задержки
+
+
+async def bulk_send(user: AuthenticationUserSchema,
+                    create: Iterable[CreateFilterSchema] | None = None,
+                    delete: Iterable[DeleteFilterSchema] | None = None) -> tuple[list[FilterBulkResultSchema], float]:
+    filters_client = get_async_filters_client(user=user)
+    started = time.perf_counter()
+
+    if create is not None:
+        results = [result async for result in filters_client.create_filters_bulk(
+            filters=create, batch_size=settings.benchmark.batch_size, concurrency=settings.benchmark.concurrency)]
+    else:
+        results = [result async for result in filters_client.delete_filters_bulk(
+            filters=delete, batch_size=settings.benchmark.batch_size, concurrency=settings.benchmark.concurrency)]
+
+    return results, time.perf_counter() - started
+
+
+def measure(call: Callable[[], Response], repeats: int) -> list[float]:
+    latencies = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        response = call()
+        latencies.append((time.perf_counter() - started) * 1000)
+        assert_status_code(actual=response.status_code, expected=HTTPStatus.OK)
+
+    return sorted(latencies)
+
+
+@pytest.mark.filters
+@pytest.mark.benchmark
+@pytest.mark.xdist_group(name=f"{settings.xdist_group_names.benchmark_filters}")
+@allure.tag(AllureTag.BENCHMARK, AllureTag.FILTERS)
+@allure.epic(AllureEpic.PACKET_BROKER)
+@allure.feature(AllureFeature.FILTERS)
+@allure.parent_suite(AllureEpic.PACKET_BROKER)
+@allure.suite(AllureFeature.FILTERS)
+class TestFiltersBenchmark:
+
+
+    @pytest.mark.parametrize('table_size', settings.benchmark.filter_table_sizes)
+    @allure.title("Filter table scaling")
+    @allure.story(AllureStory.BENCHMARK)
+    @allure.sub_suite(AllureStory.BENCHMARK)
+    @allure.severity(AllureSeverity.MINOR)
+    def test_filter_table_scaling(self,
+                                  table_size: int,
+                                  session_user: UserFixture,
+                                  filters_client: FiltersClient,
+                                  function_benchmark_filters_tear_down):
+        user = session_user.authentication_user
+        initial_size = len(filters_client.get_filters_api().json())
+
+        with allure.step(f'Fill filter table with {table_size} filters'):
+            results, fill_seconds = run_async(bulk_send(user=user, create=generate_benchmark_filters(table_size)))
+            assert_equal(actual=sum(not result.is_success for result in results), expected=0, name='failed inserts')
+
+        with allure.step('Measure single insert latency'):
+            extra_filters = iter(generate_benchmark_filters(SINGLE_INSERTS, start=table_size))
+            insert_latencies = measure(call=lambda: filters_client.create_filters_api(request=next(extra_filters)),
+                                       repeats=SINGLE_INSERTS)
+
+        with allure.step('Measure list latency and payload size'):
+            list_latencies = measure(call=filters_client.get_filters_api, repeats=LIST_REPEATS)
+            response = filters_client.get_filters_api()
+            benchmark_filters = [item for item in filters_client.iter_filters() if is_benchmark_filter(item)]
+            assert_equal(actual=len(benchmark_filters), expected=table_size + SINGLE_INSERTS, name='filter table size')
+
+        with allure.step('Delete all benchmark filters'):
+            results, delete_seconds = run_async(bulk_send(user=user, delete=benchmark_filters))
+            assert_equal(actual=sum(not result.is_success for result in results), expected=0, name='failed deletes')
+            assert_equal(actual=len(filters_client.get_filters_api().json()), expected=initial_size,
+                         name='filter table size after delete')
+
+        report = {
+            'table_size': table_size,
+            'fill_seconds': round(fill_seconds, 3),
+            'fill_filters_per_second': round(table_size / fill_seconds, 1),
+            'insert_p50_ms': round(percentile(insert_latencies, 50), 3),
+            'insert_p99_ms': round(percentile(insert_latencies, 99), 3),
+            'list_p50_ms': round(percentile(list_latencies, 50), 3),
+            'list_max_ms': round(list_latencies[-1], 3),
+            'list_payload_bytes': len(response.content),
+            'delete_seconds': round(delete_seconds, 3),
+            'delete_filters_per_second': round(len(benchmark_filters) / delete_seconds, 1),
+        }
+
+        logger.info(f'Filter table benchmark: {report}')
+        allure.attach(json.dumps(report, indent=2),
+                      name=f'Filter table benchmark ({table_size})',
+                      attachment_type=allure.attachment_type.JSON)
\ No newline at end of file
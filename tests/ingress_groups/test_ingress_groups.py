@@ -2,7 +2,7 @@ import allure, pytest
 
 from http import HTTPStatus
 from clients.errors_schema import AuthenticationErrorResponseSchema
-from clients.ingress_groups.ingress_groups_client import IngressGroupsClient, IngressGroupsSession
+from clients.ingress_groups.ingress_groups_client import IngressGroupsClient
 from clients.ingress_groups.ingress_groups_schema import GetIngressGroupsResponseSchema, \
     CreateIngressGroupRequestSchema, UpdateIngressGroupRequestSchema, DeleteIngressGroupRequestSchema
 from fixtures.ingress_groups import IngressGroupFixture
@@ -13,10 +13,11 @@ from tools.allure.features import AllureFeature
 from tools.allure.severity import AllureSeverity
 from tools.allure.stories import AllureStory
 from tools.allure.tags import AllureTag
-from tools.assertions.base import assert_status_code
+from tools.assertions.base import assert_status_code, assert_equal, assert_is_true
 from tools.assertions.errors import assert_error_for_not_authenticated_user
-from tools.assertions.schema import validate_json_schema
+from tools.assertions.schema import validate_response
 from tools.logger import get_logger
+from tools.telemetry.counter_sampler import CounterSampler, ingress_group_counters
 
 
 logger = get_logger('INGRESS_GROUPS')
@@ -42,12 +43,38 @@ class TestIngressGroups:
                                     ingress_groups_client: IngressGroupsClient,
                                     function_ingress_groups_tear_down):
         response = ingress_groups_client.get_ingress_group_list_api()
-        response_data = GetIngressGroupsResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=GetIngressGroupsResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.OK)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
+
+
+    @allure.title("[200]OK - Sample ingress groups packet counters")
+    @allure.tag(AllureTag.GET_ENTITIES, AllureTag.POSITIVE_TEST)
+    @allure.story(AllureStory.GET_ENTITIES)
+    @allure.sub_suite(AllureStory.GET_ENTITIES)
+    @allure.severity(AllureSeverity.MAJOR)
+    def test_sample_ingress_group_counters(self,
+                                           function_ingress_groups_set_up,
+                                           function_ingress_groups: IngressGroupFixture,
+                                           ingress_groups_client: IngressGroupsClient,
+                                           function_ingress_groups_tear_down):
+        sampler = CounterSampler(source=ingress_group_counters(ingress_groups_client=ingress_groups_client))
+        for _ in range(3):
+            sampler.poll_once()
+
+        response = ingress_groups_client.get_ingress_group_list_api()
+        response_data = validate_response(response=response, model=GetIngressGroupsResponseSchema)
+        rates = sampler.summary()
+
+        assert_equal(actual=sampler.groups,
+                     expected=[f'ingress-{group.id}' for group in response_data.root if group.ports],
+                     name='sampled ingress groups')
+        assert_equal(actual=[stats.samples for stats in rates.values()],
+                     expected=[2] * len(rates),
+                     name='rate samples per group')
+        assert_is_true(actual=all(stats.min >= 0 for stats in rates.values()),
+                       name='packet rates are not negative')
 
 
     @allure.title("[403]FORBIDDEN - Get ingress groups list by unauthorised user")
@@ -57,13 +84,11 @@ class TestIngressGroups:
     @allure.severity(AllureSeverity.MAJOR)
     def test_get_ingress_group_list_by_unauthorised_user(self, unauthorised_ingress_groups_client: IngressGroupsClient):
         response = unauthorised_ingress_groups_client.get_ingress_group_list_api()
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @allure.title("[200]OK - Create ingress group")
@@ -90,13 +115,11 @@ class TestIngressGroups:
     def test_create_ingress_group_by_unauthorised_user(self, unauthorised_ingress_groups_client: IngressGroupsClient):
         request = CreateIngressGroupRequestSchema()
         response = unauthorised_ingress_groups_client.create_ingress_group_api(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @allure.title("[412]PRECONDITION_FAILED - Create already creating ingress group")
@@ -142,13 +165,11 @@ class TestIngressGroups:
     def test_update_ingress_group_by_unauthorised_user(self, unauthorised_ingress_groups_client: IngressGroupsClient):
         request = UpdateIngressGroupRequestSchema()
         response = unauthorised_ingress_groups_client.update_ingress_group_api(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @allure.title("[412]PRECONDITION_FAILED - Update nonexistent ingress group")
@@ -175,9 +196,9 @@ class TestIngressGroups:
     def test_delete_ingress_group(self,
                                   function_ingress_groups_set_up,
                                   function_ingress_groups: IngressGroupFixture,
-                                  ingress_groups_session: IngressGroupsSession):
+                                  ingress_groups_client: IngressGroupsClient):
         request = DeleteIngressGroupRequestSchema()
-        response = ingress_groups_session.delete_ingress_group_api(request=request)
+        response = ingress_groups_client.delete_ingress_group_api(request=request)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.OK)
@@ -188,16 +209,14 @@ class TestIngressGroups:
     @allure.story(AllureStory.DELETE_ENTITY)
     @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
     @allure.severity(AllureSeverity.MAJOR)
-    def test_delete_ingress_group_by_unauthorised_user(self, unauthorised_ingress_groups_session: IngressGroupsSession):
+    def test_delete_ingress_group_by_unauthorised_user(self, unauthorised_ingress_groups_client: IngressGroupsClient):
         request = DeleteIngressGroupRequestSchema()
-        response = unauthorised_ingress_groups_session.delete_ingress_group_api(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response = unauthorised_ingress_groups_client.delete_ingress_group_api(request=request)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @allure.title("[412]PRECONDITION_FAILED - Delete nonexistent ingress group")
@@ -207,9 +226,9 @@ class TestIngressGroups:
     @allure.severity(AllureSeverity.BLOCKER)
     def test_delete_nonexistent_ingress_group(self,
                                               function_ingress_groups_set_up,
-                                              ingress_groups_session: IngressGroupsSession):
+                                              ingress_groups_client: IngressGroupsClient):
         request = DeleteIngressGroupRequestSchema()
-        response = ingress_groups_session.delete_ingress_group_api(request=request)
+        response = ingress_groups_client.delete_ingress_group_api(request=request)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.PRECONDITION_FAILED)
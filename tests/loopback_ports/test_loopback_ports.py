@@ -3,7 +3,7 @@ import allure, pytest
 from http import HTTPStatus
 
 from clients.errors_schema import AuthenticationErrorResponseSchema
-from clients.loopback_ports.loopback_ports_client import LoopbackPortsClient, LoopbackPortsSession
+from clients.loopback_ports.loopback_ports_client import LoopbackPortsClient
 from clients.loopback_ports.loopback_ports_schema import GetLoopbackPortsResponseSchema, \
     CreateLoopbackPortsRequestSchema, DeleteLoopbackPortsRequestSchema
 from config import settings
@@ -16,7 +16,7 @@ from tools.allure.stories import AllureStory
 from tools.allure.tags import AllureTag
 from tools.assertions.base import assert_status_code
 from tools.assertions.errors import assert_error_for_not_authenticated_user
-from tools.assertions.schema import validate_json_schema
+from tools.assertions.schema import validate_response
 from tools.logger import get_logger
 
 
@@ -41,13 +41,11 @@ class TestLoopbackPorts:
                                 function_loopback_port_set_up,
                                 loopback_ports_client: LoopbackPortsClient):
         response = loopback_ports_client.get_loopback_ports_speed()
-        response_data = GetLoopbackPortsResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=GetLoopbackPortsResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.OK)
         assert_get_loopback_ports_response(actual_loopback_ports=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @pytest.mark.xdist_group(name=f"{settings.xdist_group_names.negative_tests}")
@@ -58,13 +56,11 @@ class TestLoopbackPorts:
     @allure.severity(AllureSeverity.MAJOR)
     def test_get_loopback_ports_by_unauthorised_user(self, unauthorised_loopback_ports_client: LoopbackPortsClient):
         response = unauthorised_loopback_ports_client.get_loopback_ports_speed()
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @allure.title("[200]OK - Create loopback port speed limits")
@@ -97,13 +93,11 @@ class TestLoopbackPorts:
     def test_create_loopback_port_by_unauthorised_user(self, unauthorised_loopback_ports_client: LoopbackPortsClient):
         request = CreateLoopbackPortsRequestSchema()
         response = unauthorised_loopback_ports_client.create_loopback_ports(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @allure.title("[200]OK - Delete loopback port speed limits")
@@ -113,10 +107,9 @@ class TestLoopbackPorts:
     @allure.severity(AllureSeverity.BLOCKER)
     def test_delete_loopback_port(self,
                                    function_loopback_port,
-                                   loopback_ports_session: LoopbackPortsSession,
                                    loopback_ports_client: LoopbackPortsClient):
         request = DeleteLoopbackPortsRequestSchema()
-        response_delete = loopback_ports_session.delete_loopback_ports(request=request)
+        response_delete = loopback_ports_client.delete_loopback_ports(request=request)
 
         response_get = loopback_ports_client.get_loopback_ports_speed()
         response_get_data = GetLoopbackPortsResponseSchema.model_validate_json(response_get.text)
@@ -132,13 +125,11 @@ class TestLoopbackPorts:
     @allure.story(AllureStory.DELETE_ENTITY)
     @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
     @allure.severity(AllureSeverity.MAJOR)
-    def test_delete_loopback_port_by_unauthorised_user(self, unauthorised_loopback_ports_session: LoopbackPortsSession):
+    def test_delete_loopback_port_by_unauthorised_user(self, unauthorised_loopback_ports_client: LoopbackPortsClient):
         request = DeleteLoopbackPortsRequestSchema()
-        response = unauthorised_loopback_ports_session.delete_loopback_ports(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response = unauthorised_loopback_ports_client.delete_loopback_ports(request=request)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
-        assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
\ No newline at end of file
+        assert_error_for_not_authenticated_user(response=response_data)
\ No newline at end of file
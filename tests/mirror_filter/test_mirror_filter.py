@@ -2,7 +2,7 @@ import allure, pytest
 
 from http import HTTPStatus
 from clients.errors_schema import AuthenticationErrorResponseSchema
-from clients.mirror_filter.mirror_filter_client import MirrorFilterClient, MirrorFilterSession
+from clients.mirror_filter.mirror_filter_client import MirrorFilterClient
 from clients.mirror_filter.mirror_filter_schema import GetMirrorFilterListResponseSchema, \
     CreateMirrorFilterRequestSchema, DeleteMirrorFilterRequestSchema, GetPsfMirrorFilterListResponseSchema
 from tests.mirror_filter.mirror_filter_assertions import assert_create_mirror_filter_response, \
@@ -14,7 +14,7 @@ from tools.allure.stories import AllureStory
 from tools.allure.tags import AllureTag
 from tools.assertions.base import assert_status_code
 from tools.assertions.errors import assert_error_for_not_authenticated_user
-from tools.assertions.schema import validate_json_schema
+from tools.assertions.schema import validate_response
 from tools.logger import get_logger
 
 
@@ -39,13 +39,11 @@ class TestMirrorFilter:
                                     function_mirror_filter_set_up,
                                     mirror_filter_client: MirrorFilterClient):
         response = mirror_filter_client.get_mirror_filter_list()
-        response_data = GetMirrorFilterListResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=GetMirrorFilterListResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.OK)
 
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @allure.title("[403]FORBIDDEN - Get mirror filter list by unauthorised user")
@@ -56,13 +54,11 @@ class TestMirrorFilter:
     def test_get_mirror_filter_list_by_unauthorised_user(self, unauthorized_mirror_filter_client: MirrorFilterClient):
 
         response = unauthorized_mirror_filter_client.get_mirror_filter_list()
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @allure.title("[200]OK - Create mirror filter")
@@ -96,15 +92,13 @@ class TestMirrorFilter:
 
         request = CreateMirrorFilterRequestSchema()
         response = unauthorized_mirror_filter_client.create_mirror_filter_api(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
 
         assert_error_for_not_authenticated_user(response=response_data)
 
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @allure.title("[200]OK - Delete mirror filter")
@@ -114,15 +108,15 @@ class TestMirrorFilter:
     @allure.severity(AllureSeverity.BLOCKER)
     def test_delete_mirror_filter(self,
                                   function_mirror_filter,
-                                  mirror_filter_session: MirrorFilterSession):
+                                  mirror_filter_client: MirrorFilterClient):
 
         request = DeleteMirrorFilterRequestSchema()
-        response = mirror_filter_session.delete_mirror_filters(request=request)
+        response = mirror_filter_client.delete_mirror_filters(request=request)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.OK)
 
-        response_check_delete = mirror_filter_session.delete_mirror_filters(request=request)
+        response_check_delete = mirror_filter_client.delete_mirror_filters(request=request)
 
         assert_delete_nonexistent_mirror_filter_response(response=response_check_delete)
 
@@ -132,19 +126,17 @@ class TestMirrorFilter:
     @allure.story(AllureStory.DELETE_ENTITY)
     @allure.sub_suite(AllureStory.DELETE_ENTITY)
     @allure.severity(AllureSeverity.MAJOR)
-    def test_delete_mirror_filter_by_unauthorised_user(self, unauthorized_mirror_filter_session: MirrorFilterSession):
+    def test_delete_mirror_filter_by_unauthorised_user(self, unauthorized_mirror_filter_client: MirrorFilterClient):
 
         request = DeleteMirrorFilterRequestSchema()
-        response = unauthorized_mirror_filter_session.delete_mirror_filters(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response = unauthorized_mirror_filter_client.delete_mirror_filters(request=request)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
 
         assert_error_for_not_authenticated_user(response=response_data)
 
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @allure.title("[412]PRECONDITION_FAILED - Delete nonexistent mirror filter")
@@ -152,10 +144,10 @@ class TestMirrorFilter:
     @allure.story(AllureStory.DELETE_ENTITY)
     @allure.sub_suite(AllureStory.DELETE_ENTITY)
     @allure.severity(AllureSeverity.MAJOR)
-    def test_delete_nonexistent_mirror_filter(self, mirror_filter_session: MirrorFilterSession):
+    def test_delete_nonexistent_mirror_filter(self, mirror_filter_client: MirrorFilterClient):
 
         request = DeleteMirrorFilterRequestSchema()
-        response = mirror_filter_session.delete_mirror_filters(request=request)
+        response = mirror_filter_client.delete_mirror_filters(request=request)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.PRECONDITION_FAILED)
@@ -182,13 +174,11 @@ class TestPsfMirrorFilter:
                                         function_mirror_filter,
                                         mirror_filter_client: MirrorFilterClient):
         response = mirror_filter_client.get_psf_mirror_filter_list_api()
-        response_data = GetPsfMirrorFilterListResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=GetPsfMirrorFilterListResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.OK)
 
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @allure.title("[403]FORBIDDEN - Get psf mirror filter list by unauthorised user")
@@ -199,10 +189,8 @@ class TestPsfMirrorFilter:
     def test_get_psf_mirror_filter_list_by_unauthorised_user(self, unauthorized_mirror_filter_client: MirrorFilterClient):
 
         response = unauthorized_mirror_filter_client.get_psf_mirror_filter_list_api()
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
-        assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
\ No newline at end of file
+        assert_error_for_not_authenticated_user(response=response_data)
\ No newline at end of file
@@ -3,7 +3,7 @@ import allure, pytest
 from http import HTTPStatus
 
 from clients.errors_schema import AuthenticationErrorResponseSchema
-from clients.mirroring.mirroring_client import MirroringClient, MirroringSession
+from clients.mirroring.mirroring_client import MirroringClient
 from clients.mirroring.mirroring_schema import GetMirroringResponseSchema, UpdateMirroringRequestSchema, \
     DeleteMirroringRequestSchema, CreateMirroringRequestSchema
 from config import settings
@@ -18,7 +18,7 @@ from tools.allure.stories import AllureStory
 from tools.allure.tags import AllureTag
 from tools.assertions.base import assert_status_code
 from tools.assertions.errors import assert_error_for_not_authenticated_user
-from tools.assertions.schema import validate_json_schema
+from tools.assertions.schema import validate_response
 from tools.logger import get_logger
 
 
@@ -47,14 +47,12 @@ class TestMirroring:
         logger.info('[Set-up completed] : Mirroring group was created.')
 
         response = mirroring_client.get_mirroring_list_api()
-        response_data = GetMirroringResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=GetMirroringResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.OK)
         assert_get_mirroring_list_response(response_get_mirroring=response_data.root[0],
                                            request_create_mirroring=function_mirroring.request)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @pytest.mark.xdist_group(name=f"{settings.xdist_group_names.negative_tests}")
@@ -65,13 +63,11 @@ class TestMirroring:
     @allure.severity(AllureSeverity.MAJOR)
     def test_get_mirroring_list_by_unauthorised_user(self,unauthorised_mirroring_client: MirroringClient):
         response = unauthorised_mirroring_client.get_mirroring_list_api()
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
 
@@ -106,13 +102,11 @@ class TestMirroring:
     def test_create_mirroring_list_by_unauthorised_user(self,unauthorised_mirroring_client: MirroringClient):
         request = CreateMirroringRequestSchema()
         response = unauthorised_mirroring_client.create_mirroring_api(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @pytest.mark.flaky(reruns=3, reruns_delay=1)
@@ -170,13 +164,11 @@ class TestMirroring:
     def test_update_mirroring_list_by_unauthorised_user(self,unauthorised_mirroring_client: MirroringClient):
         request = UpdateMirroringRequestSchema()
         response = unauthorised_mirroring_client.update_mirroring_api(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @pytest.mark.flaky(reruns=3, reruns_delay=1)
@@ -186,12 +178,10 @@ class TestMirroring:
     @allure.story(AllureStory.UPDATE_ENTITY)
     @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
     @allure.severity(AllureSeverity.MAJOR)
-    def test_update_nonexistent_mirroring(self,
-                                          mirroring_client: MirroringClient,
-                                          mirroring_session: MirroringSession):
+    def test_update_nonexistent_mirroring(self, mirroring_client: MirroringClient):
         try:
             request_delete = DeleteMirroringRequestSchema()
-            mirroring_session.delete_mirroring_api(request=request_delete)
+            mirroring_client.delete_mirroring_api(request=request_delete)
         finally:
             request = UpdateMirroringRequestSchema()
             response = mirroring_client.update_mirroring_api(request=request)
@@ -210,12 +200,11 @@ class TestMirroring:
     @allure.severity(AllureSeverity.BLOCKER)
     def test_delete_mirroring(self,
                               mirroring_client: MirroringClient,
-                              function_mirroring: MirroringFixture,
-                              mirroring_session: MirroringSession):
+                              function_mirroring: MirroringFixture):
         logger.info('[Set-up completed] : Mirroring group was created.')
 
         request_delete = DeleteMirroringRequestSchema()
-        response_delete = mirroring_session.delete_mirroring_api(request=request_delete)
+        response_delete = mirroring_client.delete_mirroring_api(request=request_delete)
 
         logger.info('Mirroring group was deleted.')
 
@@ -235,16 +224,14 @@ class TestMirroring:
     @allure.story(AllureStory.DELETE_ENTITY)
     @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
     @allure.severity(AllureSeverity.MAJOR)
-    def test_delete_mirroring_list_by_unauthorised_user(self,unauthorised_mirroring_session: MirroringSession):
+    def test_delete_mirroring_list_by_unauthorised_user(self,unauthorised_mirroring_client: MirroringClient):
         request = DeleteMirroringRequestSchema()
-        response = unauthorised_mirroring_session.delete_mirroring_api(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response = unauthorised_mirroring_client.delete_mirroring_api(request=request)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @pytest.mark.xdist_group(name=f"{settings.xdist_group_names.negative_tests}")
@@ -253,13 +240,13 @@ class TestMirroring:
     @allure.story(AllureStory.DELETE_ENTITY)
     @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
     @allure.severity(AllureSeverity.MAJOR)
-    def test_delete_nonexistent_mirroring(self, mirroring_session: MirroringSession):
+    def test_delete_nonexistent_mirroring(self, mirroring_client: MirroringClient):
         try:
             request_delete = DeleteMirroringRequestSchema()
-            mirroring_session.delete_mirroring_api(request=request_delete)
+            mirroring_client.delete_mirroring_api(request=request_delete)
         finally:
             request = DeleteMirroringRequestSchema()
-            response = mirroring_session.delete_mirroring_api(request=request)
+            response = mirroring_client.delete_mirroring_api(request=request)
             response_text = response.text
 
             assert_status_code(actual=response.status_code,
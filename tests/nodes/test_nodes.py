@@ -1,25 +1,42 @@
+import json
+
 import allure, pytest
 
 from http import HTTPStatus
+from clients.async_session import run_async
+from clients.egress_groups.egress_groups_client import get_async_egress_groups_client
 from clients.errors_schema import AuthenticationErrorResponseSchema
-from clients.nodes.nodes_client import NodesClient
+from clients.ingress_groups.ingress_groups_client import get_async_ingress_group_client
+from clients.nodes.nodes_client import NodesClient, get_async_nodes_client
 from clients.nodes.nodes_schema import CreateNodesRequestSchema
+from clients.private_http_builder import AuthenticationUserSchema
+from clients.selections.selections_client import get_async_selections_client
+from fixtures.authentication import UserFixture
 from tests.nodes.nodes_assertions import assert_apply_invalid_nodes_response
-from tests.nodes.nodes_data import NODES_CONFIG_JSON
+from tests.nodes.nodes_data import NODES_CONFIG_JSON, NODES_DEPLOYMENT_REQUEST
 from tools.allure.epics import AllureEpic
 from tools.allure.features import AllureFeature
 from tools.allure.severity import AllureSeverity
 from tools.allure.stories import AllureStory
 from tools.allure.tags import AllureTag
-from tools.assertions.base import assert_status_code
+from tools.assertions.base import assert_status_code, assert_equal, assert_is_true
 from tools.assertions.errors import assert_error_for_not_authenticated_user
-from tools.assertions.schema import validate_json_schema
+from tools.assertions.schema import validate_json_schema, validate_response
 from tools.logger import get_logger
+from tools.nodes_deployment import NodesDeployment, NodesDeploymentSchema
 
 
 logger = get_logger('NODES')
 
 
+async def deploy_nodes(user: AuthenticationUserSchema, request: CreateNodesRequestSchema) -> NodesDeploymentSchema:
+    deployment = NodesDeployment(nodes_client=get_async_nodes_client(user=user),
+                                 ingress_groups_client=get_async_ingress_group_client(user=user),
+                                 selections_client=get_async_selections_client(user=user),
+                                 egress_groups_client=get_async_egress_groups_client(user=user))
+    return await deployment.deploy(request=request)
+
+
 @pytest.mark.nodes
 @pytest.mark.regression
 @allure.tag(AllureTag.REGRESSION, AllureTag.NODES)
@@ -48,13 +65,11 @@ class TestNodes:
     @allure.severity(AllureSeverity.MAJOR)
     def test_get_nodes_list_by_unauthenticated_user(self, unauthorised_nodes_client: NodesClient):
         response = unauthorised_nodes_client.get_nodes_list_api()
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @allure.title("[200]OK - Create nodes config")
@@ -72,7 +87,7 @@ class TestNodes:
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.OK)
         validate_json_schema(instance=request,
-                             schema=CreateNodesRequestSchema.model_json_schema())
+                             schema=CreateNodesRequestSchema)
 
 
     @allure.title("[403]FORBIDDEN - Create nodes config by unauthenticated user")
@@ -83,13 +98,11 @@ class TestNodes:
     def test_create_nodes_by_unauthenticated_user(self, unauthorised_nodes_client: NodesClient):
         request = NODES_CONFIG_JSON
         response = unauthorised_nodes_client.create_nodes_api_json(request_JSON=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @pytest.mark.order(1)
@@ -116,13 +129,11 @@ class TestNodes:
     @allure.severity(AllureSeverity.MAJOR)
     def test_apply_nodes_by_unauthenticated_user(self, unauthorised_nodes_client: NodesClient):
         response = unauthorised_nodes_client.apply_nodes_api()
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @allure.title("[412]PRECONDITION_FAILED - Apply invalid nodes config")
@@ -145,6 +156,25 @@ class TestNodes:
         assert_apply_invalid_nodes_response(response=response)
 
 
+    @allure.title("[200]OK - Deploy nodes config and verify switch groups")
+    @allure.tag(AllureTag.UPDATE_ENTITY, AllureTag.POSITIVE_TEST)
+    @allure.story(AllureStory.UPDATE_ENTITY)
+    @allure.sub_suite(AllureStory.UPDATE_ENTITY)
+    @allure.severity(AllureSeverity.CRITICAL)
+    def test_deploy_nodes(self,
+                          function_node_set_up,
+                          session_user: UserFixture,
+                          function_node_tear_down):
+        result = run_async(deploy_nodes(user=session_user.authentication_user, request=NODES_DEPLOYMENT_REQUEST))
+
+        assert_equal(actual=result.mismatches, expected=[], name='mismatched tables')
+        assert_is_true(actual=result.matched, name='matched')
+
+        allure.attach(json.dumps({**result.model_dump(), 'total_ms': result.total_ms}, indent=2),
+                      name='Nodes deployment timings',
+                      attachment_type=allure.attachment_type.JSON)
+
+
     @allure.title("[200]OK - Delete nodes config")
     @allure.tag(AllureTag.DELETE_ENTITY, AllureTag.POSITIVE_TEST)
     @allure.story(AllureStory.DELETE_ENTITY)
@@ -167,10 +197,8 @@ class TestNodes:
     @allure.severity(AllureSeverity.MAJOR)
     def test_delete_nodes_by_unauthenticated_user(self, unauthorised_nodes_client: NodesClient):
         response = unauthorised_nodes_client.delete_nodes_api()
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
-        assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
\ No newline at end of file
+        assert_error_for_not_authenticated_user(response=response_data)
\ No newline at end of file
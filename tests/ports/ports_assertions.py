@@ -1,10 +1,10 @@
 import allure
 
 from httpx import Response
-from clients.ports.ports_schema import CreatePortRequestSchema, ConfiguredPortSchema, GetPossiblePortsListResponse
+from clients.ports.ports_schema import CreatePortRequestSchema, ConfiguredPortSchema, GetPossiblePortsListResponse, \
+    POSSIBLE_PORTS
 from tools.assertions.base import assert_equal, assert_equal_in_expected_list_no_logs
 from tools.logger import get_logger
-from tests.ports.ports_data import POSSIBLE_PORTS
 
 logger = get_logger("PORTS_ASSERTIONS")
 logger_port_status = get_logger("PORT_STATUS_ASSERTIONS")
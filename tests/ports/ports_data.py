@@ -1,134 +1,63 @@
-POSSIBLE_PORTS = [
-    "1/0",
-    "1/1",
-    "1/2",
-    "1/3",
-    "2/0",
-    "2/1",
-    "2/2",
-    "2/3",
-    "3/0",
-    "3/1",
-    "3/2",
-    "3/3",
-    "4/0",
-    "4/1",
-    "4/2",
-    "4/3",
-    "5/0",
-    "5/1",
-    "5/2",
-    "5/3",
-    "6/0",
-    "6/1",
-    "6/2",
-    "6/3",
-    "7/0",
-    "7/1",
-    "7/2",
-    "7/3",
-    "8/0",
-    "8/1",
-    "8/2",
-    "8/3",
-    "9/0",
-    "9/1",
-    "9/2",
-    "9/3",
-    "10/0",
-    "10/1",
-    "10/2",
-    "10/3",
-    "11/0",
-    "11/1",
-    "11/2",
-    "11/3",
-    "12/0",
-    "12/1",
-    "12/2",
-    "12/3",
-    "13/0",
-    "13/1",
-    "13/2",
-    "13/3",
-    "14/0",
-    "14/1",
-    "14/2",
-    "14/3",
-    "15/0",
-    "15/1",
-    "15/2",
-    "15/3",
-    "16/0",
-    "16/1",
-    "16/2",
-    "16/3",
-    "17/0",
-    "17/1",
-    "17/2",
-    "17/3",
-    "18/0",
-    "18/1",
-    "18/2",
-    "18/3",
-    "19/0",
-    "19/1",
-    "19/2",
-    "19/3",
-    "20/0",
-    "20/1",
-    "20/2",
-    "20/3",
-    "21/0",
-    "21/1",
-    "21/2",
-    "21/3",
-    "22/0",
-    "22/1",
-    "22/2",
-    "22/3",
-    "23/0",
-    "23/1",
-    "23/2",
-    "23/3",
-    "24/0",
-    "24/1",
-    "24/2",
-    "24/3",
-    "25/0",
-    "25/1",
-    "25/2",
-    "25/3",
-    "26/0",
-    "26/1",
-    "26/2",
-    "26/3",
-    "27/0",
-    "27/1",
-    "27/2",
-    "27/3",
-    "28/0",
-    "28/1",
-    "28/2",
-    "28/3",
-    "29/0",
-    "29/1",
-    "29/2",
-    "29/3",
-    "30/0",
-    "30/1",
-    "30/2",
-    "30/3",
-    "31/0",
-    "31/1",
-    "31/2",
-    "31/3",
-    "32/0",
-    "32/1",
-    "32/2",
-    "32/3",
-    "33/0",
-    "33/1",
-    "33/2",
-    "33/3"
-]
\ No newline at end of file
+from clients.ports.ports_schema import PortSpeed, PortFec, PortAutoNegotiation, POSSIBLE_PORTS
+
+
+# Порты для параллельной настройки: без разъёмов 1 и 33, которые используются остальными тестами и конфигурацией сессии
+PROVISIONING_PORTS = [port for port in POSSIBLE_PORTS if port.split('/')[0] not in ('1', '33')]
+
+# Порты для замера времени поднятия линка: канал 0 допускает любую скорость порта
+LINK_PORTS = [f'{connector}/0' for connector in range(2, 10)]
+
+# Допустимые FEC для каждой скорости порта
+LINK_SPEED_FEC = {
+    PortSpeed.SPEED_10G: [PortFec.NONE, PortFec.FIRECODE],
+    PortSpeed.SPEED_25G: [PortFec.NONE, PortFec.FIRECODE, PortFec.REED_SOLOMON],
+    PortSpeed.SPEED_40G: [PortFec.NONE, PortFec.FIRECODE],
+    PortSpeed.SPEED_50G: [PortFec.NONE, PortFec.FIRECODE, PortFec.REED_SOLOMON],
+    PortSpeed.SPEED_100G: [PortFec.NONE, PortFec.REED_SOLOMON],
+}
+
+# Режимы портов (скорость, FEC, автосогласование), для которых замеряется время поднятия линка
+LINK_MODES = [(speed, fec, an) for speed, fecs in LINK_SPEED_FEC.items() for fec in fecs
+              for an in (PortAutoNegotiation.FORCE_ENABLE, PortAutoNegotiation.FORCE_DISABLE)]
+
+# Документы для потокового разбора списка портов: (документ, ключ массива, ожидаемые элементы)
+JSON_ARRAY_STREAMS = {
+    'empty': (b' [ ] ', None, []),
+    'items': (b'[1, "2" ,{"port": "1/0", "lanes": [0, 1]}, [], null]', None,
+              [1, '2', {'port': '1/0', 'lanes': [0, 1]}, [], None]),
+    'non-ascii': ('["порт", "1/0"]'.encode(), None, ['порт', '1/0']),
+    'keyed': (b'{"total": 2, "nodes": [1.5, 2], "extra": {"nodes": []}}', 'nodes', [1.5, 2]),
+}
+
+# Документы с нарушенными разделителями или структурой: (документ, ключ массива)
+INVALID_JSON_ARRAY_STREAMS = {
+    'missing comma': (b'[1 2]', None),
+    'leading comma': (b'[,1]', None),
+    'doubled comma': (b'[1,,2]', None),
+    'trailing comma': (b'[1,]', None),
+    'only comma': (b'[,]', None),
+    'missing object comma': (b'{"total": 2 "nodes": [1]}', 'nodes'),
+    'leading object comma': (b'{,"nodes": [1]}', 'nodes'),
+    'doubled object comma': (b'{"nodes": [1],,"total": 2}', 'nodes'),
+    'trailing object comma': (b'{"nodes": [1],}', 'nodes'),
+    'missing comma after array': (b'{"nodes": [1] "total": 2}', 'nodes'),
+    'unclosed array': (b'[1, 2', None),
+    'extra data': (b'[1] 2', None),
+}
+
+# Размеры частей тела ответа: None - документ целиком, 1 - каждая часть обрывается на любом символе
+JSON_ARRAY_CHUNK_SIZES = [None, 1, 2, 3]
+
+
+def split_chunks(source: bytes, size: int | None) -> list[bytes]:
+    """
+    Функция делит тело ответа на части заданного размера.
+
+    :param source: Тело ответа.
+    :param size: Размер части в байтах. Если не указан, тело возвращается одной частью.
+    :return: Список частей тела ответа.
+    """
+    if size is None:
+        return [source]
+
+    return [source[start:start + size] for start in range(0, len(source), size)]
\ No newline at end of file
@@ -0,0 +1,48 @@
+import allure, json, pytest
+
+from tests.ports.ports_data import JSON_ARRAY_STREAMS, INVALID_JSON_ARRAY_STREAMS, JSON_ARRAY_CHUNK_SIZES, split_chunks
+from tools.allure.epics import AllureEpic
+from tools.allure.features import AllureFeature
+from tools.allure.severity import AllureSeverity
+from tools.allure.stories import AllureStory
+from tools.allure.tags import AllureTag
+from tools.assertions.base import assert_equal
+from tools.json_stream import iter_json_array
+
+
+@pytest.mark.ports_all
+@pytest.mark.regression
+@allure.tag(AllureTag.REGRESSION, AllureTag.PORTS_ALL)
+@allure.epic(AllureEpic.PACKET_BROKER)
+@allure.feature(AllureFeature.PORTS_ALL)
+@allure.parent_suite(AllureEpic.PACKET_BROKER)
+@allure.suite(AllureFeature.PORTS_ALL)
+class TestJSONArrayStream:
+
+
+    @pytest.mark.parametrize('size', JSON_ARRAY_CHUNK_SIZES)
+    @pytest.mark.parametrize('stream', JSON_ARRAY_STREAMS.values(), ids=JSON_ARRAY_STREAMS.keys())
+    @allure.title("JSON array is parsed from a response body split into chunks")
+    @allure.tag(AllureTag.POSITIVE_TEST)
+    @allure.story(AllureStory.VALIDATE_ENTITY)
+    @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
+    @allure.severity(AllureSeverity.MAJOR)
+    def test_json_array_stream(self, stream: tuple[bytes, str | None, list], size: int | None):
+        source, key, expected = stream
+
+        assert_equal(actual=list(iter_json_array(split_chunks(source, size), key=key)), expected=expected,
+                     name='streamed items')
+
+
+    @pytest.mark.parametrize('size', JSON_ARRAY_CHUNK_SIZES)
+    @pytest.mark.parametrize('stream', INVALID_JSON_ARRAY_STREAMS.values(), ids=INVALID_JSON_ARRAY_STREAMS.keys())
+    @allure.title("Malformed JSON array is rejected regardless of chunk boundaries")
+    @allure.tag(AllureTag.NEGATIVE_TEST)
+    @allure.story(AllureStory.VALIDATE_ENTITY)
+    @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
+    @allure.severity(AllureSeverity.MAJOR)
+    def test_json_array_stream_invalid(self, stream: tuple[bytes, str | None], size: int | None):
+        source, key = stream
+
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_json_array(split_chunks(source, size), key=key))
\ No newline at end of file
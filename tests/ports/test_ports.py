@@ -1,13 +1,25 @@
+import asyncio
+import json
+import time
+from typing import Awaitable, Callable
+
 import allure, pytest
 
 from http import HTTPStatus
+from pathlib import Path
+from httpx import Client, MockTransport, Request, Response
+from clients.api_coverage import APICoverageTracker, tracker
+from clients.async_session import run_async
 from clients.errors_schema import AuthenticationErrorResponseSchema
-from clients.ports.ports_client import PortsClient, PortsSession
+from clients.ports.ports_client import PortsClient, get_async_ports_client
 from clients.ports.ports_schema import CreatePortRequestSchema, ConfiguredPortSchema, CreatePortRequest412Schema, \
     UpdatedPortSchema, DeletePortsRequestSchema, GetPossiblePortsListResponse, UpdatePortStatusRequestSchema, \
-    GetAllPortsListResponse
+    GetAllPortsListResponse, PortSchema
+from clients.private_http_builder import AuthenticationUserSchema
 from config import settings
+from fixtures.authentication import UserFixture
 from fixtures.ports import PortsFixture
+from tests.ports.ports_data import PROVISIONING_PORTS
 from tests.ports.ports_assertions import assert_port, assert_create_port_with_incorrect_body, \
     assert_update_nonexistent_port, assert_delete_port_with_incorrect_body, \
     assert_possible_ports_list, assert_invalid_update_port_status_response
@@ -16,14 +28,30 @@ from tools.allure.features import AllureFeature
 from tools.allure.severity import AllureSeverity
 from tools.allure.stories import AllureStory
 from tools.allure.tags import AllureTag
-from tools.assertions.base import assert_status_code
+from tools.assertions.base import assert_status_code, assert_equal, assert_is_true
 from tools.assertions.errors import assert_error_for_not_authenticated_user
-from tools.assertions.schema import validate_json_schema
+from tools.assertions.schema import validate_json_schema, validate_response
 from tools.logger import get_logger
+from tools.port_provisioning import PortProvisioner, PortOperationResultSchema
+from tools.routes import APIRoutes
+from tools.telemetry.port_poller import PortTelemetryPoller, LevelThresholdsSchema
+from tools.timings import percentile
 
 
 logger = get_logger('PORTS')
 
+ASYNC_REQUESTS = 5      # Количество одновременных запросов асинхронного клиента
+
+
+def provision(user: AuthenticationUserSchema,
+              action: Callable[[PortProvisioner], Awaitable[list[PortOperationResultSchema]]]
+              ) -> list[PortOperationResultSchema]:
+    async def run() -> list[PortOperationResultSchema]:
+        return await action(PortProvisioner(ports_client=get_async_ports_client(user=user),
+                                            concurrency=settings.benchmark.concurrency))
+
+    return run_async(run())
+
 
 @pytest.mark.ports
 @pytest.mark.regression
@@ -56,7 +84,37 @@ class TestPorts:
                     expected_port=function_ports.request)
 
         validate_json_schema(instance=created_port,
-                             schema=response_data.model_json_schema())
+                             schema=ConfiguredPortSchema)
+
+
+    @allure.title("[200]OK - Get configured ports list with async client")
+    @allure.tag(AllureTag.GET_ENTITIES, AllureTag.POSITIVE_TEST)
+    @allure.story(AllureStory.GET_ENTITIES)
+    @allure.sub_suite(AllureStory.GET_ENTITIES)
+    @allure.severity(AllureSeverity.MAJOR)
+    def test_get_ports_list_async(self,
+                                  function_ports: PortsFixture,
+                                  session_user: UserFixture,
+                                  ports_client: PortsClient,
+                                  function_ports_tear_down):
+        async def get_ports_lists():
+            async_ports_client = get_async_ports_client(user=session_user.authentication_user)
+            shared_client = get_async_ports_client(user=session_user.authentication_user).client
+            responses = await asyncio.gather(*(async_ports_client.get_ports_list_api()
+                                               for _ in range(ASYNC_REQUESTS)))
+            return async_ports_client.client, shared_client, responses
+
+        http_client, shared_client, responses = run_async(get_ports_lists())
+        expected_ports = ports_client.get_ports_list_api().json()
+
+        assert_equal(actual=[response.status_code for response in responses],
+                     expected=[HTTPStatus.OK] * ASYNC_REQUESTS,
+                     name='status codes')
+        assert_equal(actual=[response.json() for response in responses],
+                     expected=[expected_ports] * ASYNC_REQUESTS,
+                     name='ports lists')
+        assert_is_true(actual=http_client is shared_client, name='async clients share connection pool')
+        assert_is_true(actual=http_client.is_closed, name='async http client is closed after run_async')
 
 
     @pytest.mark.xdist_group(name=f"{settings.xdist_group_names.negative_tests}")
@@ -67,13 +125,11 @@ class TestPorts:
     @allure.severity(AllureSeverity.MAJOR)
     def test_get_ports_list_by_unauthorised_user(self, unauthorised_ports_client: PortsClient):
         response = unauthorised_ports_client.get_ports_list_api()
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
 
@@ -84,13 +140,11 @@ class TestPorts:
     @allure.severity(AllureSeverity.BLOCKER)
     def test_get_possible_ports_list(self, ports_client: PortsClient):
         response = ports_client.get_possible_ports_list_api()
-        response_data = GetPossiblePortsListResponse.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=GetPossiblePortsListResponse)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.OK)
         assert_possible_ports_list(actual_possible_ports_list=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @pytest.mark.xdist_group(name=f"{settings.xdist_group_names.negative_tests}")
@@ -101,15 +155,13 @@ class TestPorts:
     @allure.severity(AllureSeverity.MAJOR)
     def test_get_possible_ports_list_by_unauthorised_user(self, unauthorised_ports_client: PortsClient):
         response = unauthorised_ports_client.get_possible_ports_list_api()
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
 
         assert_error_for_not_authenticated_user(response=response_data)
 
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
 
@@ -145,13 +197,11 @@ class TestPorts:
     def test_create_port_by_unauthorised_user(self, unauthorised_ports_client: PortsClient):
         request = CreatePortRequestSchema()
         response = unauthorised_ports_client.create_ports_api(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @pytest.mark.xdist_group(name=f"{settings.xdist_group_names.negative_tests}")
@@ -196,13 +246,11 @@ class TestPorts:
     def test_update_by_unauthorised_user(self, unauthorised_ports_client: PortsClient):
         request = UpdatedPortSchema()
         response = unauthorised_ports_client.update_ports_api(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @pytest.mark.xdist_group(name=f"{settings.xdist_group_names.negative_tests}")
@@ -228,9 +276,9 @@ class TestPorts:
     @allure.severity(AllureSeverity.BLOCKER)
     def test_delete_port(self,
                          function_ports: PortsFixture,
-                         ports_session: PortsSession):
+                         ports_client: PortsClient):
         request = DeletePortsRequestSchema()
-        response = ports_session.delete_ports_api(request=request)
+        response = ports_client.delete_ports_api(request=request)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.OK)
@@ -242,16 +290,14 @@ class TestPorts:
     @allure.story(AllureStory.DELETE_ENTITY)
     @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
     @allure.severity(AllureSeverity.MAJOR)
-    def test_delete_by_unauthorised_user(self, unauthorised_ports_session: PortsSession):
+    def test_delete_by_unauthorised_user(self, unauthorised_ports_client: PortsClient):
         request = DeletePortsRequestSchema()
-        response = unauthorised_ports_session.delete_ports_api(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response = unauthorised_ports_client.delete_ports_api(request=request)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @pytest.mark.xdist_group(name=f"{settings.xdist_group_names.negative_tests}")
@@ -260,8 +306,8 @@ class TestPorts:
     @allure.story(AllureStory.DELETE_ENTITY)
     @allure.sub_suite(AllureStory.DELETE_ENTITY)
     @allure.severity(AllureSeverity.MAJOR)
-    def test_delete_port_with_incorrect_body(self, ports_session: PortsSession):
-        response = ports_session.incorrect_delete_ports_api()
+    def test_delete_port_with_incorrect_body(self, ports_client: PortsClient):
+        response = ports_client.incorrect_delete_ports_api()
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.PRECONDITION_FAILED)
@@ -269,6 +315,60 @@ class TestPorts:
         assert_delete_port_with_incorrect_body(response=response)
 
 
+    @allure.title("[200]OK - Provision ports in parallel")
+    @allure.tag(AllureTag.CREATE_ENTITY, AllureTag.POSITIVE_TEST)
+    @allure.story(AllureStory.CREATE_ENTITY)
+    @allure.sub_suite(AllureStory.CREATE_ENTITY)
+    @allure.severity(AllureSeverity.MAJOR)
+    def test_provision_ports_in_parallel(self,
+                                         session_user: UserFixture,
+                                         ports_client: PortsClient,
+                                         function_provisioned_ports_tear_down):
+        user = session_user.authentication_user
+        requests = [CreatePortRequestSchema(name=f'provisioning_{port}', port=port, speed='BF_SPEED_10G')
+                    for port in PROVISIONING_PORTS]
+        results = {}
+
+        with allure.step(f'Create {len(requests)} ports'):
+            results['create'] = provision(user=user, action=lambda provisioner: provisioner.create(requests))
+            configured = {port.port: port for port in ports_client.iter_ports() if port.port in PROVISIONING_PORTS}
+            assert_equal(actual=sorted(configured), expected=sorted(PROVISIONING_PORTS), name='created ports')
+            assert_equal(actual=[result.port for result in results['create']],
+                         expected=[request.port for request in requests],
+                         name='results order')
+
+        with allure.step('Disable created ports'):
+            results['status'] = provision(user=user,
+                                          action=lambda provisioner: provisioner.set_status(PROVISIONING_PORTS, False))
+            enabled = [port.port for port in ports_client.iter_ports() if port.port in configured and port.enable]
+            assert_equal(actual=enabled, expected=[], name='enabled ports')
+
+        with allure.step('Delete created ports'):
+            results['delete'] = provision(user=user, action=lambda provisioner: provisioner.delete(PROVISIONING_PORTS))
+            remaining = [port.port for port in ports_client.iter_ports() if port.port in configured]
+            assert_equal(actual=remaining, expected=[], name='remaining ports')
+
+        failed = [result.model_dump(mode='json') for operation in results.values()
+                  for result in operation if not result.is_success]
+        assert_equal(actual=failed, expected=[], name='failed port operations')
+
+        report = {}
+        for operation, operation_results in results.items():
+            durations = sorted(result.duration_ms for result in operation_results)
+            report[operation] = {
+                'ports': len(operation_results),
+                'total_ms': round(max(result.started_ms + result.duration_ms for result in operation_results), 3),
+                'port_p50_ms': round(percentile(durations, 50), 3),
+                'port_max_ms': durations[-1],
+                'per_port_ms': {result.port: result.duration_ms for result in operation_results},
+            }
+
+        logger.info(f'Port provisioning: { {operation: item["total_ms"] for operation, item in report.items()} }')
+        allure.attach(json.dumps(report, indent=2),
+                      name='Port provisioning timings',
+                      attachment_type=allure.attachment_type.JSON)
+
+
 
 
 @pytest.mark.port_status
@@ -301,13 +401,11 @@ class TestPortStatus:
     def test_update_port_status_by_unauthorised_user(self, unauthorised_ports_client: PortsClient):
         request = UpdatePortStatusRequestSchema()
         response = unauthorised_ports_client.update_port_status_api(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @allure.title("[412]PRECONDITION_FAILED - Invalid update port status")
@@ -344,13 +442,149 @@ class TestPortsAll:
     @allure.severity(AllureSeverity.BLOCKER)
     def test_get_all_ports_list(self, ports_client: PortsClient):
         response = ports_client.get_all_ports_list_api()
-        response_data = GetAllPortsListResponse.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=GetAllPortsListResponse)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.OK)
 
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
+
+
+    @allure.title("[200]OK - Stream all ports list")
+    @allure.tag(AllureTag.GET_ENTITIES, AllureTag.POSITIVE_TEST)
+    @allure.story(AllureStory.GET_ENTITIES)
+    @allure.sub_suite(AllureStory.GET_ENTITIES)
+    @allure.severity(AllureSeverity.CRITICAL)
+    def test_stream_all_ports_list(self, ports_client: PortsClient):
+        response = ports_client.get_all_ports_list_api()
+        response_data = validate_response(response=response, model=GetAllPortsListResponse)
+
+        assert_equal(actual=list(ports_client.iter_all_ports()),
+                     expected=response_data.root,
+                     name='streamed ports list')
+
+
+
+    @allure.title("[200]OK - Stream all ports list with async client")
+    @allure.tag(AllureTag.GET_ENTITIES, AllureTag.POSITIVE_TEST)
+    @allure.story(AllureStory.GET_ENTITIES)
+    @allure.sub_suite(AllureStory.GET_ENTITIES)
+    @allure.severity(AllureSeverity.MAJOR)
+    def test_stream_all_ports_list_async(self, ports_client: PortsClient, session_user: UserFixture):
+        response = ports_client.get_all_ports_list_api()
+        response_data = validate_response(response=response, model=GetAllPortsListResponse)
+
+        async def stream_ports() -> list:
+            async_ports_client = get_async_ports_client(user=session_user.authentication_user)
+            return [port async for port in async_ports_client.iter_all_ports()]
+
+        assert_equal(actual=run_async(stream_ports()),
+                     expected=response_data.root,
+                     name='streamed ports list')
+
+
+
+    @allure.title("Coverage of streamed all ports list is recorded after the body is read")
+    @allure.tag(AllureTag.GET_ENTITIES, AllureTag.POSITIVE_TEST)
+    @allure.story(AllureStory.GET_ENTITIES)
+    @allure.sub_suite(AllureStory.GET_ENTITIES)
+    @allure.severity(AllureSeverity.MINOR)
+    def test_stream_all_ports_list_coverage(self, ports_client: PortsClient, tmp_path: Path):
+        response = ports_client.get_all_ports_list_api()
+        response_data = validate_response(response=response, model=GetAllPortsListResponse)
+
+        coverage_tracker = APICoverageTracker(service=tracker.service,
+                                              settings=tracker.settings.model_copy(update={'results_dir': tmp_path}))
+        # Тело передаётся итератором, поэтому httpx не читает его заранее, как у настоящего потокового ответа
+        stream_transport = MockTransport(lambda request: Response(HTTPStatus.OK, content=iter([response.content])))
+        mock_client = Client(transport=stream_transport, base_url='http://switch')
+
+        @coverage_tracker.track_coverage_httpx(f'{APIRoutes.PORTS_ALL}')
+        def get_all_ports_list_stream_api() -> Response:
+            return PortsClient(client=mock_client).stream(url=f'{APIRoutes.PORTS_ALL}')
+
+        ports = PortsClient.stream_items(send=get_all_ports_list_stream_api, model=PortSchema)
+        streamed_ports = [next(ports)]
+        coverage_before_read = coverage_tracker.storage.load().root
+        streamed_ports.extend(ports)
+
+        assert_equal(actual=streamed_ports, expected=response_data.root, name='streamed ports list')
+        assert_equal(actual=coverage_before_read, expected=[], name='coverage before the body is read')
+        assert_equal(actual=[(coverage.name, coverage.method, coverage.status_code, coverage.is_response_covered)
+                             for coverage in coverage_tracker.storage.load().root],
+                     expected=[(f'{APIRoutes.PORTS_ALL}', 'GET', HTTPStatus.OK, True)],
+                     name='coverage after the body is read')
+
+
+
+    @allure.title("[200]OK - Poll all ports telemetry")
+    @allure.tag(AllureTag.GET_ENTITIES, AllureTag.POSITIVE_TEST)
+    @allure.story(AllureStory.GET_ENTITIES)
+    @allure.sub_suite(AllureStory.GET_ENTITIES)
+    @allure.severity(AllureSeverity.MAJOR)
+    def test_poll_all_ports_telemetry(self, ports_client: PortsClient):
+        poller = PortTelemetryPoller(ports_client=ports_client,
+                                     thresholds=LevelThresholdsSchema(bias_max=-1000))
+        alerts = [poller.poll_once() for _ in range(3)]
+        response_data = validate_response(response=ports_client.get_all_ports_list_api(),
+                                          model=GetAllPortsListResponse)
+
+        biased_lanes = [(port.port, lane.lane) for port in response_data.root
+                        for lane, level in zip(port.lanes, port.levels) if level.bias is not None]
+
+        assert_equal(actual=poller.lanes,
+                     expected=[(port.port, lane.lane) for port in response_data.root for lane in port.lanes],
+                     name='polled lanes')
+        assert_equal(actual=[poller.stats(port, lane, 'bias').samples for port, lane in biased_lanes],
+                     expected=[3] * len(biased_lanes),
+                     name='bias samples per lane')
+        assert_equal(actual=[(alert.port, alert.lane) for alert in alerts[0]],
+                     expected=biased_lanes,
+                     name='bias alerts of the first poll')
+        assert_equal(actual=alerts[1:], expected=[[], []], name='repeated alerts')
+
+
+
+    @allure.title("Poll all ports telemetry of a switch without modules")
+    @allure.tag(AllureTag.GET_ENTITIES, AllureTag.POSITIVE_TEST)
+    @allure.story(AllureStory.GET_ENTITIES)
+    @allure.sub_suite(AllureStory.GET_ENTITIES)
+    @allure.severity(AllureSeverity.MINOR)
+    def test_poll_all_ports_telemetry_without_modules(self):
+        def no_modules(request: Request) -> Response:
+            return Response(HTTPStatus.OK, json=[])
+
+        poller = PortTelemetryPoller(ports_client=PortsClient(client=Client(transport=MockTransport(no_modules),
+                                                                            base_url='http://switch')),
+                                     thresholds=LevelThresholdsSchema(bias_max=-1000))
+        with tracker.disabled():
+            alerts = [poller.poll_once() for _ in range(2)]
+
+        assert_equal(actual=(alerts, poller.lanes, poller.summary(), poller.polls),
+                     expected=([[], []], [], {}, 2),
+                     name='telemetry without lanes')
+
+
+
+    @allure.title("[200]OK - Collect all ports telemetry in background during test")
+    @allure.tag(AllureTag.GET_ENTITIES, AllureTag.POSITIVE_TEST)
+    @allure.story(AllureStory.GET_ENTITIES)
+    @allure.sub_suite(AllureStory.GET_ENTITIES)
+    @allure.severity(AllureSeverity.MINOR)
+    def test_collect_all_ports_telemetry(self, ports_client: PortsClient, function_port_telemetry: PortTelemetryPoller):
+        deadline = time.monotonic() + 5 * settings.telemetry.interval
+        while function_port_telemetry.polls < 2 and time.monotonic() < deadline:
+            time.sleep(settings.telemetry.interval / 10)
+
+        response_data = validate_response(response=ports_client.get_all_ports_list_api(),
+                                          model=GetAllPortsListResponse)
+
+        assert_equal(actual=(function_port_telemetry.polls >= 2, function_port_telemetry.errors),
+                     expected=(True, 0),
+                     name='background polls and errors')
+        assert_equal(actual=function_port_telemetry.lanes,
+                     expected=[(port.port, lane.lane) for port in response_data.root for lane in port.lanes],
+                     name='polled lanes')
+
 
 
     @allure.title("[403]FORBIDDEN - Get all ports list by unauthorised user")
@@ -360,10 +594,8 @@ class TestPortsAll:
     @allure.severity(AllureSeverity.MAJOR)
     def test_get_all_ports_list_by_unauthorised_user(self, unauthorised_ports_client: PortsClient):
         response = unauthorised_ports_client.get_all_ports_list_api()
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
-        assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
\ No newline at end of file
+        assert_error_for_not_authenticated_user(response=response_data)
\ No newline at end of file
@@ -0,0 +1,95 @@
+import json
+import time
+
+import allure, pytest
+
+from http import HTTPStatus
+from clients.ports.ports_client import PortsClient
+from clients.ports.ports_schema import CreatePortRequestSchema, PortSpeed, PortFec, PortAutoNegotiation
+from config import settings
+from tests.ports.ports_data import LINK_PORTS, LINK_MODES
+from tools.allure.epics import AllureEpic
+from tools.allure.features import AllureFeature
+from tools.allure.severity import AllureSeverity
+from tools.allure.stories import AllureStory
+from tools.allure.tags import AllureTag
+from tools.assertions.base import assert_status_code, assert_equal
+from tools.logger import get_logger
+from tools.telemetry.link_transitions import LinkTransitionMeter, LinkTransitionSchema
+from tools.timings import percentile
+
+logger = get_logger('PORTS_BENCHMARK')
+
+
+def convergence_distribution(results: list[LinkTransitionSchema]) -> dict:
+    durations = sorted(result.convergence_ms for result in results)
+
+    return {
+        'samples': len(durations),
+        'p50_ms': round(percentile(durations, 50), 3),
+        'p90_ms': round(percentile(durations, 90), 3),
+        'p99_ms': round(percentile(durations, 99), 3),
+        'max_ms': durations[-1],
+        'max_resolution_ms': max(result.resolution_ms for result in results),
+    }
+
+
+@pytest.mark.port_status
+@pytest.mark.benchmark
+@allure.tag(AllureTag.BENCHMARK, AllureTag.PORT_STATUS)
+@allure.epic(AllureEpic.PACKET_BROKER)
+@allure.feature(AllureFeature.PORT_STATUS)
+@allure.parent_suite(AllureEpic.PACKET_BROKER)
+@allure.suite(AllureFeature.PORT_STATUS)
+class TestPortStatusBenchmark:
+
+
+    @pytest.mark.parametrize('speed, fec, an', LINK_MODES, ids=lambda mode: mode.value)
+    @allure.title("Time to link up and down after port status change")
+    @allure.story(AllureStory.BENCHMARK)
+    @allure.sub_suite(AllureStory.BENCHMARK)
+    @allure.severity(AllureSeverity.MINOR)
+    def test_port_link_transitions(self,
+                                   speed: PortSpeed,
+                                   fec: PortFec,
+                                   an: PortAutoNegotiation,
+                                   ports_client: PortsClient,
+                                   function_provisioned_ports_tear_down):
+        meter = LinkTransitionMeter(ports_client=ports_client)
+        link_up, link_down = [], []
+
+        with allure.step(f'Create {len(LINK_PORTS)} ports {speed.value}, {fec.value}, {an.value}'):
+            created_at = {}
+            for port in LINK_PORTS:
+                response = ports_client.create_ports_api(request=CreatePortRequestSchema(name=f'link_{port}',
+                                                                                         port=port,
+                                                                                         speed=speed.value,
+                                                                                         fec=fec.value,
+                                                                                         an=an.value))
+                assert_status_code(actual=response.status_code, expected=HTTPStatus.OK)
+                created_at[port] = time.perf_counter()
+
+            initial = meter.wait(toggled_at=created_at, status=True)
+
+        for cycle in range(1, settings.benchmark.link_toggles + 1):
+            with allure.step(f'Disable and enable ports, cycle {cycle}'):
+                link_down.extend(meter.toggle(ports=LINK_PORTS, status=False))
+                link_up.extend(meter.toggle(ports=LINK_PORTS, status=True))
+
+        pending = [result.model_dump() for result in initial + link_down + link_up if not result.converged]
+        assert_equal(actual=pending, expected=[], name='ports without link state change')
+
+        report = {
+            'speed': speed.value,
+            'fec': fec.value,
+            'an': an.value,
+            'ports': len(LINK_PORTS),
+            'initial_link_up': convergence_distribution(initial),
+            'link_up': convergence_distribution(link_up),
+            'link_down': convergence_distribution(link_down),
+        }
+
+        logger.info(f'Port link benchmark: {report}')
+        allure.attach(json.dumps(report, indent=2),
+                      name=f'Port link transitions ({speed.value}, {fec.value}, {an.value})',
+                      attachment_type=allure.attachment_type.JSON)
\ No newline at end of file
@@ -2,7 +2,7 @@ import allure, pytest
 
 from http import HTTPStatus
 from clients.errors_schema import AuthenticationErrorResponseSchema
-from clients.psf_format.psf_format_client import PsfFormatClient, PsfFormatSession
+from clients.psf_format.psf_format_client import PsfFormatClient
 from clients.psf_format.psf_format_schema import GetPsfFormatResponseSchema, CreatePsfFormatRequestSchema, \
     UpdatePsfFormatRequestSchema, DeletePsfFormatRequestSchema, GetPsfDmacResponseSchema, CreatePsfDmacRequestSchema
 from fixtures.psf_format import PsfDmacFixture
@@ -16,7 +16,7 @@ from tools.allure.stories import AllureStory
 from tools.allure.tags import AllureTag
 from tools.assertions.base import assert_status_code
 from tools.assertions.errors import assert_error_for_not_authenticated_user
-from tools.assertions.schema import validate_json_schema
+from tools.assertions.schema import validate_response
 from tools.logger import get_logger
 
 
@@ -43,13 +43,11 @@ class TestPsfFormat:
                                  function_psf_format_tear_down):
 
         response = psf_format_client.get_psf_format_list_api()
-        response_data = GetPsfFormatResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=GetPsfFormatResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.OK)
 
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @allure.title("[403]FORBIDDEN - Get psf format list by unauthorised user")
@@ -60,13 +58,11 @@ class TestPsfFormat:
     def test_get_psf_format_list_by_unauthorised_user(self, unauthorised_psf_format_client: PsfFormatClient):
 
         response = unauthorised_psf_format_client.get_psf_format_list_api()
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @allure.title("[200]OK - Create psf format")
@@ -99,15 +95,13 @@ class TestPsfFormat:
     def test_create_psf_format_by_unauthorised_user(self, unauthorised_psf_format_client: PsfFormatClient):
         request = CreatePsfFormatRequestSchema()
         response = unauthorised_psf_format_client.create_psf_format_api(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
 
         assert_error_for_not_authenticated_user(response=response_data)
 
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @allure.title("[412]PRECONDITION_FAILED - Create already creating psf format")
@@ -163,15 +157,13 @@ class TestPsfFormat:
     def test_update_psf_format_by_unauthorised_user(self, unauthorised_psf_format_client: PsfFormatClient):
         request = UpdatePsfFormatRequestSchema()
         response = unauthorised_psf_format_client.update_psf_format_api(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
 
         assert_error_for_not_authenticated_user(response=response_data)
 
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @allure.title("[412]PRECONDITION_FAILED - Update nonexistent psf format ")
@@ -198,10 +190,10 @@ class TestPsfFormat:
     @allure.severity(AllureSeverity.BLOCKER)
     def test_delete_psf_format(self,
                                function_psf_format,
-                               psf_format_session: PsfFormatSession):
+                               psf_format_client: PsfFormatClient):
 
         request = DeletePsfFormatRequestSchema()
-        response = psf_format_session.delete_psf_format_api(request=request)
+        response = psf_format_client.delete_psf_format_api(request=request)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.OK)
@@ -212,19 +204,17 @@ class TestPsfFormat:
     @allure.story(AllureStory.DELETE_ENTITY)
     @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
     @allure.severity(AllureSeverity.MAJOR)
-    def test_delete_psf_format_by_unauthorised_user(self, unauthorised_psf_format_session: PsfFormatSession):
+    def test_delete_psf_format_by_unauthorised_user(self, unauthorised_psf_format_client: PsfFormatClient):
 
         request = DeletePsfFormatRequestSchema()
-        response = unauthorised_psf_format_session.delete_psf_format_api(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response = unauthorised_psf_format_client.delete_psf_format_api(request=request)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
 
         assert_error_for_not_authenticated_user(response=response_data)
 
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 #-----------------------------------------------------------------------------------------------------------------------
 
@@ -248,13 +238,11 @@ class TestPsfDmac:
                           function_psf_dmac_tear_down):
 
         response = psf_format_client.get_psf_dmac_api()
-        response_data = GetPsfDmacResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=GetPsfDmacResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.OK)
 
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @allure.title("[403]FORBIDDEN - Get psf dmac by unauthorised user")
@@ -265,13 +253,11 @@ class TestPsfDmac:
     def test_get_psf_dmac_by_unauthorised_user(self, unauthorised_psf_format_client: PsfFormatClient):
 
         response = unauthorised_psf_format_client.get_psf_dmac_api()
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
         assert_error_for_not_authenticated_user(response=response_data)
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @allure.title("[200]OK - Create psf dmac")
@@ -304,12 +290,9 @@ class TestPsfDmac:
     def test_create_psf_dmac_by_unauthorised_user(self, unauthorised_psf_format_client: PsfFormatClient):
         request = CreatePsfDmacRequestSchema()
         response = unauthorised_psf_format_client.create_psf_dmac_api(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
 
-        assert_error_for_not_authenticated_user(response=response_data)
-
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
\ No newline at end of file
+        assert_error_for_not_authenticated_user(response=response_data)
\ No newline at end of file
@@ -2,7 +2,7 @@ import allure, pytest
 
 from http import HTTPStatus
 from clients.errors_schema import AuthenticationErrorResponseSchema
-from clients.selections.selections_client import SelectionsClient, SelectionsSession
+from clients.selections.selections_client import SelectionsClient
 from clients.selections.selections_schema import GetSelectionsResponseSchema, CreateSelectionRequestSchema, \
     DeleteSelectionRequestSchema
 from fixtures.selections import SelectionFixture
@@ -14,9 +14,9 @@ from tools.allure.features import AllureFeature
 from tools.allure.severity import AllureSeverity
 from tools.allure.stories import AllureStory
 from tools.allure.tags import AllureTag
-from tools.assertions.base import assert_status_code
+from tools.assertions.base import assert_status_code, assert_equal
 from tools.assertions.errors import assert_error_for_not_authenticated_user
-from tools.assertions.schema import validate_json_schema
+from tools.assertions.schema import validate_response
 from tools.logger import get_logger
 
 
@@ -43,7 +43,7 @@ class TestSelections:
                                  function_selection_tear_down):
 
         response = selections_client.get_selections_list_api()
-        response_data = GetSelectionsResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=GetSelectionsResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.OK)
@@ -51,8 +51,24 @@ class TestSelections:
         check_get_selections_list_response(actual=response_data,
                                            expected=function_selection.request)
 
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
+
+
+    @allure.title("[200]OK - Stream selections list")
+    @allure.tag(AllureTag.GET_ENTITIES, AllureTag.POSITIVE_TEST)
+    @allure.story(AllureStory.GET_ENTITIES)
+    @allure.sub_suite(AllureStory.GET_ENTITIES)
+    @allure.severity(AllureSeverity.CRITICAL)
+    def test_stream_selections_list(self,
+                                    function_selection: SelectionFixture,
+                                    selections_client: SelectionsClient,
+                                    function_selection_tear_down):
+        response = selections_client.get_selections_list_api()
+        response_data = validate_response(response=response, model=GetSelectionsResponseSchema)
+
+        assert_equal(actual=list(selections_client.iter_selections()),
+                     expected=response_data.root,
+                     name='streamed selections list')
+
 
 
     @allure.title("[403]FORBIDDEN - Get selections list by unauthenticated user")
@@ -63,15 +79,13 @@ class TestSelections:
     def test_get_selections_list_by_unauthenticated_user(self, unauthorised_selections_client: SelectionsClient):
 
         response = unauthorised_selections_client.get_selections_list_api()
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
 
         assert_error_for_not_authenticated_user(response=response_data)
 
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @allure.title("[200]OK - Create selection group")
@@ -105,15 +119,13 @@ class TestSelections:
 
         request = CreateSelectionRequestSchema()
         response = unauthorised_selections_client.create_selection_api(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
 
         assert_error_for_not_authenticated_user(response=response_data)
 
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @allure.title("[412]PRECONDITION_FAILED - Create already creating selection group")
@@ -142,14 +154,13 @@ class TestSelections:
     @allure.severity(AllureSeverity.BLOCKER)
     def test_delete_selection_group(self,
                                     function_selection,
-                                    selections_client: SelectionsClient,
-                                    selections_session: SelectionsSession):
+                                    selections_client: SelectionsClient):
 
         response_get_before = selections_client.get_selections_list_api()
         selections_list_before = GetSelectionsResponseSchema.model_validate_json(response_get_before.text)
 
         request = DeleteSelectionRequestSchema()
-        response = selections_session.delete_selection_api(request=request)
+        response = selections_client.delete_selection_api(request=request)
 
         response_get_after = selections_client.get_selections_list_api()
         selections_list_after = GetSelectionsResponseSchema.model_validate_json(response_get_after.text)
@@ -167,19 +178,17 @@ class TestSelections:
     @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
     @allure.severity(AllureSeverity.MAJOR)
     def test_delete_selection_group_by_unauthenticated_user(self,
-                                                            unauthorised_selections_session: SelectionsSession):
+                                                            unauthorised_selections_client: SelectionsClient):
 
         request = DeleteSelectionRequestSchema()
-        response = unauthorised_selections_session.delete_selection_api(request=request)
-        response_data = AuthenticationErrorResponseSchema.model_validate_json(response.text)
+        response = unauthorised_selections_client.delete_selection_api(request=request)
+        response_data = validate_response(response=response, model=AuthenticationErrorResponseSchema)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.FORBIDDEN)
 
         assert_error_for_not_authenticated_user(response=response_data)
 
-        validate_json_schema(instance=response.json(),
-                             schema=response_data.model_json_schema())
 
 
     @allure.title("[412]PRECONDITION_FAILED - Delete selection group with incorrect body")
@@ -187,10 +196,10 @@ class TestSelections:
     @allure.story(AllureStory.DELETE_ENTITY)
     @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
     @allure.severity(AllureSeverity.MAJOR)
-    def test_delete_selection_group_with_incorrect_body(self, selections_session: SelectionsSession):
+    def test_delete_selection_group_with_incorrect_body(self, selections_client: SelectionsClient):
 
         request = DeleteSelectionRequestSchema(ingress_group="@")
-        response = selections_session.delete_selection_api(request=request)
+        response = selections_client.delete_selection_api(request=request)
 
         assert_status_code(actual=response.status_code,
                            expected=HTTPStatus.PRECONDITION_FAILED)
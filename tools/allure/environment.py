@@ -2,12 +2,18 @@ from config import settings
 import platform, sys
 
 
-def create_allure_environment_file():
+def create_allure_environment_file(latency_report: list[dict] | None = None):
 
     items = [f'{key}={value}' for key, value in settings.model_dump().items()]
     items.append(f'os_info={platform.system()}, {platform.release()}')
     items.append(f'python_version={sys.version}')
 
+    # Задержки запросов по маршрутам: latency.<METHOD><route>=count, p50/p90/p99/max, rps
+    for row in latency_report or []:
+        items.append(f'latency.{row["method"]}{row["route"]}='
+                     f'count={row["count"]}, p50={row["p50_ms"]}ms, p90={row["p90_ms"]}ms, '
+                     f'p99={row["p99_ms"]}ms, max={row["max_ms"]}ms, rps={row["rps"]}')
+
     properties = '\n'.join(items)
 
     # Открываем файл ./allure-results/environment.properties на запись
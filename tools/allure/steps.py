@@ -0,0 +1,38 @@
+import functools
+from typing import Callable
+
+import allure
+from allure_commons.utils import func_parameters, represent
+from httpx import AsyncClient
+
+
+def client_step(title: str) -> Callable:
+    """
+    Шаг Allure для методов доменных клиентов, общих для синхронных и асинхронных клиентов.
+    У асинхронного клиента метод только создаёт корутину, и allure.step закрылся бы до выполнения запроса,
+    поэтому для клиента с httpx.AsyncClient шаг открывается внутри корутины и закрывается после получения ответа.
+
+    :param title: Название шага (как в allure.step, с подстановкой аргументов метода).
+    :return: Декоратор метода доменного клиента.
+    """
+    def decorator(func: Callable) -> Callable:
+        sync_step = allure.step(title)(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not args or not isinstance(getattr(args[0], 'client', None), AsyncClient):
+                return sync_step(*args, **kwargs)
+
+            step_title = title.format(*map(represent, args), **func_parameters(func, *args, **kwargs))
+
+            async def run_in_step():
+                with allure.step(step_title):
+                    return await func(*args, **kwargs)
+
+            return run_in_step()
+
+        # Метод выполняет запрос и у асинхронного клиента возвращает корутину (см. AsyncAPIClient.__init_subclass__)
+        wrapper.client_request = True
+        return wrapper
+
+    return decorator
\ No newline at end of file
@@ -10,4 +10,6 @@ class AllureStory(str, Enum):
     CREATE_ENTITY = "Create entity"
     UPDATE_ENTITY = "Update entity"
     DELETE_ENTITY = "Delete entity"
-    VALIDATE_ENTITY = "Validate entity"
\ No newline at end of file
+    VALIDATE_ENTITY = "Validate entity"
+
+    BENCHMARK = "Benchmark"
\ No newline at end of file
@@ -4,6 +4,7 @@ from enum import Enum
 class AllureTag(str, Enum):
 
     REGRESSION = "REGRESSION"
+    BENCHMARK = "BENCHMARK"
     AUTHENTICATION = "AUTHENTICATION"
     ADDITIONAL_FILTERS = "ADDITIONAL_FILTERS"
     BALANCING = "BALANCING"
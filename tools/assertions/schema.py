@@ -1,23 +1,71 @@
 import allure
-from typing import Any
-from jsonschema import validate
+import json
+from functools import lru_cache
+from typing import Any, TypeVar
+from httpx import Response
+from jsonschema.exceptions import best_match
 from jsonschema.validators import Draft202012Validator
+from pydantic import BaseModel
 from tools.logger import get_logger
 
 
 logger = get_logger('SCHEMA_ASSERTIONS')
 
+Model = TypeVar('Model', bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def get_schema_validator(model: type[BaseModel]) -> Draft202012Validator:
+    """
+    Возвращает скомпилированный валидатор JSON-схемы pydantic-модели.
+    Схема генерируется и проверяется на соответствие мета-схеме один раз на модель, далее валидатор берётся из кэша.
+
+    :param model: Класс pydantic-модели.
+    :return: Объект Draft202012Validator со схемой модели (доступна через validator.schema).
+    """
+    schema = model.model_json_schema()
+    Draft202012Validator.check_schema(schema)
+
+    return Draft202012Validator(schema=schema,
+                                format_checker=Draft202012Validator.FORMAT_CHECKER)
+
 
 @allure.step('Validate JSON schema')
-def validate_json_schema(instance: Any, schema: Any):
+def validate_json_schema(instance: Any, schema: type[BaseModel] | Any):
     """
     Проверяет, соответствует ли JSON-объект (instance) заданной JSON-схеме (schema).
 
     :param instance: JSON-данные, которые нужно проверить.
-    :param schema: Ожидаемая JSON-schema.
+    :param schema: Класс pydantic-модели (валидатор берётся из кэша) или ожидаемая JSON-schema.
     :raises jsonschema.exceptions.ValidationError: Если instance не соответствует schema.
     """
     logger.info('Validate JSON schema')
-    validate(instance=instance,
-             schema=schema,
-             format_checker=Draft202012Validator.FORMAT_CHECKER)
\ No newline at end of file
+
+    if isinstance(schema, type) and issubclass(schema, BaseModel):
+        validator = get_schema_validator(schema)
+    else:
+        Draft202012Validator.check_schema(schema)
+        validator = Draft202012Validator(schema=schema,
+                                         format_checker=Draft202012Validator.FORMAT_CHECKER)
+
+    if error := best_match(validator.iter_errors(instance)):
+        raise error
+
+
+@allure.step('Validate response schema')
+def validate_response(response: Response, model: type[Model]) -> Model:
+    """
+    Разбирает тело ответа один раз, проверяет его на соответствие JSON-схеме модели
+    и валидирует в pydantic-модель на том же разобранном объекте.
+
+    :param response: Ответ сервера.
+    :param model: Класс pydantic-модели ожидаемого ответа.
+    :return: Объект модели с данными ответа.
+    :raises jsonschema.exceptions.ValidationError: Если тело ответа не соответствует JSON-схеме модели.
+    :raises pydantic.ValidationError: Если тело ответа не удалось валидировать в модель.
+    """
+    logger.info(f'Validate response with {model.__name__}')
+    instance = json.loads(response.content)
+    validate_json_schema(instance=instance, schema=model)
+
+    return model.model_validate(instance)
\ No newline at end of file
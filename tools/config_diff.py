@@ -0,0 +1,157 @@
+import hashlib
+import json
+from collections import Counter
+from typing import Any
+
+from httpx import HTTPStatusError
+from pydantic import BaseModel, Field
+
+from clients.custom_config.custom_config_client import CustomConfigClient
+from clients.custom_config.custom_config_schema import UploadCustomConfigRequestSchema
+from tools.logger import get_logger
+from tools.switch_config.model import SwitchConfig, TABLES_SECTION
+from tools.switch_config.reader import get_config_file_reader
+
+
+logger = get_logger('CONFIG_DIFF')
+
+
+class TableDiffSchema(BaseModel):
+    """
+    Различия одной таблицы (или раздела) конфигурации.
+    Записи таблиц-списков сравниваются как мультимножества, записи таблиц-словарей - по ключам.
+    Attributes:
+        table: str - "config.<таблица>" для таблиц коммутатора или имя раздела файла (nodes, edges, ...)
+        added: int - записи, которых нет на коммутаторе
+        removed: int - записи, которых нет в ожидаемой конфигурации
+        changed: int - ключи таблицы-словаря с разными значениями
+        reordered: bool - записи совпадают, но порядок различается
+    """
+    table: str
+    added: int      = Field(default=0)
+    removed: int    = Field(default=0)
+    changed: int    = Field(default=0)
+    reordered: bool = Field(default=False)
+
+
+class ConfigDiffSchema(BaseModel):
+    """
+    Структурные различия текущей конфигурации коммутатора и ожидаемой.
+    Attributes:
+        tables: list[TableDiffSchema] - только различающиеся таблицы
+    """
+    tables: list[TableDiffSchema] = Field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.tables
+
+    def __str__(self) -> str:
+        if self.is_empty:
+            return 'no changes'
+
+        return ', '.join(f'{table.table} (+{table.added} -{table.removed} ~{table.changed}'
+                         f'{" reordered" if table.reordered else ""})' for table in self.tables)
+
+
+def diff_configs(current: SwitchConfig, expected: SwitchConfig) -> ConfigDiffSchema:
+    """
+    Функция вычисляет структурные различия конфигураций по таблицам.
+    Форматирование файла и порядок ключей в объектах на результат не влияют.
+    Побайтно совпадающие таблицы не разбираются.
+
+    :param current: Конфигурация, скачанная с коммутатора.
+    :param expected: Конфигурация, которую требуется загрузить.
+    :return: Различия конфигураций.
+    """
+    diff = ConfigDiffSchema()
+
+    for name in sorted(current.table_spans.keys() | expected.table_spans.keys()):
+        if current.table_equals(other=expected, name=name):
+            continue
+        _append_table_diff(diff=diff, table=f'{TABLES_SECTION}.{name}',
+                           current=current.table(name).to_json() if name in current.table_spans else None,
+                           expected=expected.table(name).to_json() if name in expected.table_spans else None)
+
+    for name in sorted((current.sections.keys() | expected.sections.keys()) - {TABLES_SECTION}):
+        _append_table_diff(diff=diff, table=name,
+                           current=current.section(name) if name in current.sections else None,
+                           expected=expected.section(name) if name in expected.sections else None)
+
+    return diff
+
+
+def config_fingerprint(config: Any) -> str:
+    """
+    Функция вычисляет отпечаток конфигурации, не зависящий от форматирования файла и порядка ключей в объектах.
+
+    :param config: Разобранная конфигурация.
+    :return: SHA-256 канонического JSON-представления конфигурации.
+    """
+    return hashlib.sha256(_canonical(config).encode()).hexdigest()
+
+
+def upload_custom_config_if_changed(custom_config_client: CustomConfigClient,
+                                    request: UploadCustomConfigRequestSchema,
+                                    current: bytes | None = None) -> ConfigDiffSchema:
+    """
+    Функция загружает конфигурацию на коммутатор, только если она отличается от текущей.
+    Текущая конфигурация скачивается через download_custom_config_api, если не передана в current;
+    если скачать или разобрать её не удалось, конфигурация загружается без сравнения.
+
+    :param custom_config_client: Клиент для работы с /api/custom_config/.
+    :param request: Запрос на загрузку конфигурации.
+    :param current: Уже скачанная текущая конфигурация коммутатора (чтобы не скачивать её повторно).
+    :return: Различия, найденные перед загрузкой (пустые, если загрузка пропущена;
+             таблица "*", если конфигурации сравнить не удалось).
+    """
+    expected = get_config_file_reader(request.config).config
+
+    try:
+        if current is None:
+            response = custom_config_client.download_custom_config_api()
+            response.raise_for_status()
+            current = response.content
+        diff = diff_configs(current=SwitchConfig(current), expected=expected)
+    except (ValueError, HTTPStatusError) as error:
+        logger.warning(f'Current custom config could not be compared, uploading "{request.config.name}": {error}')
+        custom_config_client.upload_custom_config_api(request=request).raise_for_status()
+        return ConfigDiffSchema(tables=[TableDiffSchema(table='*')])
+
+    if diff.is_empty:
+        logger.info(f'Custom config "{request.config.name}" is already on switch, upload skipped')
+        return diff
+
+    logger.info(f'Uploading custom config "{request.config.name}": {diff}')
+    custom_config_client.upload_custom_config_api(request=request).raise_for_status()
+    return diff
+
+
+def _append_table_diff(diff: ConfigDiffSchema, table: str, current: Any, expected: Any):
+    if _canonical(current) == _canonical(expected):
+        return
+
+    if isinstance(current, list) and isinstance(expected, list):
+        current_rows = Counter(_canonical(row) for row in current)
+        expected_rows = Counter(_canonical(row) for row in expected)
+        diff.tables.append(TableDiffSchema(table=table,
+                                           added=sum((expected_rows - current_rows).values()),
+                                           removed=sum((current_rows - expected_rows).values()),
+                                           reordered=current_rows == expected_rows))
+
+    elif isinstance(current, dict) and isinstance(expected, dict):
+        diff.tables.append(TableDiffSchema(table=table,
+                                           added=len(expected.keys() - current.keys()),
+                                           removed=len(current.keys() - expected.keys()),
+                                           changed=sum(_canonical(current[key]) != _canonical(expected[key])
+                                                       for key in current.keys() & expected.keys())))
+
+    else:
+        diff.tables.append(TableDiffSchema(table=table,
+                                           added=int(current is None),
+                                           removed=int(expected is None),
+                                           changed=int(current is not None and expected is not None)))
+
+
+def _canonical(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
\ No newline at end of file
@@ -0,0 +1,865 @@
+import json
+import time
+from email import message_from_bytes
+from email.policy import HTTP
+from ipaddress import IPv4Network, IPv6Network
+from typing import Any
+
+from httpx import Request
+
+from tools.emulator.state import EmulatorState, EmulatorError, LOOPBACK_PORTS, POSSIBLE_PORTS, parse_entity_id, \
+    port_sort_key, empty_nodes_graph
+
+
+OK = 'OK'
+INCORRECT_JSON = 'Не удалось прочитать запрос. Неверно сконфигурирован JSON'
+
+MAC_MASK = 0xFFFFFFFFFFFF
+PORT_MASK = 0xFFFF
+PROTOCOL_MASK = 0xFF
+VLAN_MASK = 0xFFF
+
+# Коммутатор хранит ограничение скорости loopback порта во внутренних единицах
+LOOPBACK_SPEED_DIVIDER = 1004
+
+STARTED_AT = time.monotonic()
+
+# Время поднятия линка после включения порта: автосогласование и FEC увеличивают время согласования линии
+LINK_TRAINING_SECONDS = 0.02
+LINK_AN_SECONDS = {'PM_AN_FORCE_ENABLE': 0.05, 'PM_AN_DEFAULT': 0.03}
+LINK_FEC_SECONDS = {'BF_FEC_TYP_FIRECODE': 0.01, 'BF_FEC_TYP_REED_SOLOMON': 0.02}
+
+
+def read_json(request: Request, expected_type: type | tuple[type, ...] = object) -> Any:
+    """
+    Функция читает тело запроса в формате JSON.
+
+    :param request: Входящий запрос.
+    :param expected_type: Ожидаемый тип корневого элемента JSON.
+    :return: Разобранное тело запроса.
+    :raises EmulatorError: Если тело отсутствует, не является JSON или имеет неверный тип.
+    """
+    try:
+        body = json.loads(request.content)
+    except ValueError:
+        raise EmulatorError(INCORRECT_JSON)
+
+    if not isinstance(body, expected_type):
+        raise EmulatorError(INCORRECT_JSON)
+
+    return body
+
+
+def read_json_list(request: Request, item_type: type | tuple[type, ...] = dict) -> list:
+    body = read_json(request, expected_type=list)
+
+    if not all(isinstance(item, item_type) for item in body):
+        raise EmulatorError(INCORRECT_JSON)
+
+    return body
+
+
+def read_file(request: Request, name: str) -> bytes:
+    """
+    Функция извлекает файл из тела запроса multipart/form-data.
+
+    :param request: Входящий запрос.
+    :param name: Имя поля формы с файлом.
+    :return: Содержимое файла.
+    :raises EmulatorError: Если файл в запросе отсутствует.
+    """
+    content_type = request.headers.get('Content-Type', '')
+    message = message_from_bytes(f'Content-Type: {content_type}\r\n\r\n'.encode() + request.content, policy=HTTP)
+
+    if message.is_multipart():
+        for part in message.iter_parts():
+            if part.get_param('name', header='Content-Disposition') == name:
+                return part.get_payload(decode=True)
+
+    raise EmulatorError(INCORRECT_JSON)
+
+
+def ip_mask(prefix_length: int) -> str:
+    return f'{IPv4Network(f"0.0.0.0/{prefix_length}").netmask} /{prefix_length}'
+
+
+def ig_md_address(ipv4: str | None, prefix_length: int, ipv6: str | None) -> dict:
+    # IPv6-правило приходит с пустым IPv4-адресом, а хранится в том же поле ig_md с маской /128
+    if not ipv4 and ipv6:
+        return ternary(ipv6, f'{IPv6Network("::/128").netmask} /128')
+
+    return ternary(ipv4 or None, ip_mask(prefix_length))
+
+
+def mac_address(value: str) -> str:
+    value = value.replace(':', '').lower()
+    return ':'.join(value[index:index + 2] for index in range(0, 12, 2))
+
+
+def ternary(value: Any, mask: Any) -> dict:
+    return {'value': value, 'mask': mask} if value is not None else {'value': 0, 'mask': 0}
+
+
+def to_int(value: Any) -> int | None:
+    try:
+        return int(value, 0) if isinstance(value, str) else value
+    except ValueError:
+        return None
+
+
+def normalize(entity: dict) -> str:
+    return json.dumps(entity, sort_keys=True)
+
+
+#-----------------------------------------------------------------------------------------------------------------------
+def create_additional_filters(state: EmulatorState, request: Request) -> Any:
+    additional_filters = read_json_list(request)
+
+    for additional_filter in additional_filters:
+        if not additional_filter.get('direction'):
+            raise EmulatorError('Не указано направление правила дополнительной фильтрации')
+
+    for additional_filter in additional_filters:
+        state.additional_filters.append({'value': additional_filter.get('ip'),
+                                         'direction': additional_filter['direction'],
+                                         'logicGroup': parse_entity_id(additional_filter.get('groupId')),
+                                         'type': additional_filter.get('type')})
+    return OK
+
+
+def update_additional_filters(state: EmulatorState, request: Request) -> Any:
+    body = read_json(request, expected_type=dict)
+
+    logic_id = parse_entity_id(body.get('logicId'))
+    if logic_id is None:
+        raise EmulatorError('Неправильно задан ID логической группы')
+
+    state.additional_filters_modes[logic_id] = {'filterIPWhiteEnable': bool(body.get('filterIPWhiteEnable')),
+                                                'filterIPBlackEnable': bool(body.get('filterIPBlackEnable'))}
+    return OK
+
+
+def delete_additional_filters(state: EmulatorState, request: Request) -> Any:
+    deleted = {normalize({'value': additional_filter.get('value'),
+                          'direction': additional_filter.get('direction'),
+                          'logicGroup': parse_entity_id(additional_filter.get('logicGroup')),
+                          'type': additional_filter.get('type')})
+               for additional_filter in read_json_list(request)}
+
+    state.additional_filters = [additional_filter for additional_filter in state.additional_filters
+                                if normalize(additional_filter) not in deleted]
+    return OK
+
+
+#-----------------------------------------------------------------------------------------------------------------------
+def get_balancing(state: EmulatorState, request: Request) -> Any:
+    return [{'logicId': logic_id, 'sel': sel} for logic_id, sel in sorted(state.balancing.items())]
+
+
+def _read_balancing(request: Request) -> tuple[int, int]:
+    body = read_json(request, expected_type=dict)
+
+    logic_id = parse_entity_id(body.get('logicId'))
+    if logic_id is None:
+        raise EmulatorError('Неправильно задан ID логической группы')
+
+    balance_type = parse_entity_id(body.get('balanceType'))
+    if balance_type is None:
+        raise EmulatorError('Неправильно указан тип балансировки')
+
+    return logic_id, balance_type
+
+
+def create_balancing(state: EmulatorState, request: Request) -> Any:
+    logic_id, balance_type = _read_balancing(request)
+
+    if logic_id in state.balancing:
+        raise EmulatorError('Балансировка для этой логической группы уже сконфигурирована')
+
+    state.balancing[logic_id] = balance_type
+    return OK
+
+
+def update_balancing(state: EmulatorState, request: Request) -> Any:
+    logic_id, balance_type = _read_balancing(request)
+
+    if logic_id not in state.balancing:
+        raise EmulatorError('В данной логической группе не задана балансировка')
+
+    state.balancing[logic_id] = balance_type
+    return OK
+
+
+def delete_balancing(state: EmulatorState, request: Request) -> Any:
+    logic_id = parse_entity_id(read_json(request, expected_type=dict).get('logicGroup'))
+
+    if logic_id is None:
+        raise EmulatorError('Некорреткный ID логической группы')
+    if logic_id not in state.balancing:
+        raise EmulatorError('В данной логической группе не задана балансировка')
+
+    del state.balancing[logic_id]
+    return OK
+
+
+#-----------------------------------------------------------------------------------------------------------------------
+def download_custom_config(state: EmulatorState, request: Request) -> Any:
+    return state.raw_config
+
+
+def upload_custom_config(state: EmulatorState, request: Request) -> Any:
+    raw_config = read_file(request, name='config')
+
+    try:
+        state.load_config(raw_config)
+    except Exception as error:
+        raise EmulatorError(f'Unexpected error: {type(error)}{error}')
+
+    return OK
+
+
+def save_custom_config(state: EmulatorState, request: Request) -> Any:
+    state.saved_config = state.raw_config
+    return OK
+
+
+def restore_custom_config(state: EmulatorState, request: Request) -> Any:
+    state.load_config(state.saved_config)
+    return OK
+
+
+def return_default_config(state: EmulatorState, request: Request) -> Any:
+    state.reset()
+    return OK
+
+
+def get_switch_info(state: EmulatorState, request: Request) -> Any:
+    uptime = int(time.monotonic() - STARTED_AT)
+
+    return {'sn': 'EMULATOR-0000000001',
+            'uptime': f'{uptime // 86400} days, {time.strftime("%H:%M:%S", time.gmtime(uptime))}',
+            'packetBrokerVersion': 'emulator',
+            'packetBrokerWebServerVersion': 'emulator'}
+
+
+#-----------------------------------------------------------------------------------------------------------------------
+def get_filters(state: EmulatorState, request: Request) -> Any:
+    return list(state.filters.values())
+
+
+def create_filters(state: EmulatorState, request: Request) -> Any:
+    for new_filter in read_json_list(request):
+        ip_dst_mask = new_filter.get('newIpDstMask', 32)
+        ip_src_mask = new_filter.get('newIpSrcMask', 32)
+        mac_dst = new_filter.get('newMacDst')
+        mac_src = new_filter.get('newMacSrc')
+
+        stored_filter = {
+            'hdr.ethernet.dst_addr': ternary(mac_address(mac_dst) if mac_dst else None, MAC_MASK),
+            'hdr.ethernet.src_addr': ternary(mac_address(mac_src) if mac_src else None, MAC_MASK),
+            'ig_md.dst_addr': ig_md_address(new_filter.get('newIpDst'), ip_dst_mask, new_filter.get('newIpv6Dst')),
+            'ig_md.dst_port': ternary(new_filter.get('newDstPort'), PORT_MASK),
+            'ig_md.protocol': ternary(to_int(new_filter.get('newIpProto')), PROTOCOL_MASK),
+            'ig_md.src_addr': ig_md_address(new_filter.get('newIpSrc'), ip_src_mask, new_filter.get('newIpv6Src')),
+            'ig_md.src_port': ternary(new_filter.get('newSrcPort'), PORT_MASK),
+            'logicGroup': new_filter.get('logicGroup'),
+            'filtrationType': new_filter.get('filtrationType'),
+            'analyzePort': None,
+            'vlans': {'vlan0': ternary(new_filter.get('newVlan0'), VLAN_MASK),
+                      'vlanLast': ternary(new_filter.get('newVlanLast'), VLAN_MASK)},
+            'etherType': {'etherType': ternary(new_filter.get('newEtherType'), PORT_MASK)},
+        }
+
+        state.filters.setdefault(normalize(stored_filter), stored_filter)
+
+    return OK
+
+
+def delete_filters(state: EmulatorState, request: Request) -> Any:
+    deleted = {normalize(deleted_filter) for deleted_filter in read_json_list(request)}
+
+    if not deleted <= state.filters.keys():
+        raise EmulatorError('Такого правила фильтрации не существует')
+
+    for key in deleted:
+        del state.filters[key]
+    return OK
+
+
+def delete_all_filters(state: EmulatorState, request: Request) -> Any:
+    state.filters = {}
+    state.additional_filters = []
+    return OK
+
+
+#-----------------------------------------------------------------------------------------------------------------------
+def get_mirroring(state: EmulatorState, request: Request) -> Any:
+    return [state.mirroring[mirror_id] for mirror_id in sorted(state.mirroring)]
+
+
+def _read_mirroring(request: Request) -> dict:
+    body = read_json(request, expected_type=dict)
+
+    mirror_id = parse_entity_id(body.get('id'))
+    ingress_id = parse_entity_id(body.get('ingressGroup'))
+    ports = body.get('ports')
+
+    if mirror_id is None or ingress_id is None or not isinstance(ports, list):
+        raise EmulatorError(INCORRECT_JSON)
+
+    return {'mirrorId': mirror_id, 'ports': ports, 'ingressId': ingress_id, 'priority': body.get('priority', 0)}
+
+
+def create_mirroring(state: EmulatorState, request: Request) -> Any:
+    mirroring = _read_mirroring(request)
+
+    if mirroring['mirrorId'] in state.mirroring:
+        raise EmulatorError('Такая группа зеркалирования уже существует')
+
+    state.mirroring[mirroring['mirrorId']] = mirroring
+    return OK
+
+
+def update_mirroring(state: EmulatorState, request: Request) -> Any:
+    mirroring = _read_mirroring(request)
+
+    if mirroring['mirrorId'] not in state.mirroring:
+        raise EmulatorError('Такой группы зеркалирования не существует')
+
+    state.mirroring[mirroring['mirrorId']] = mirroring
+    return OK
+
+
+def delete_mirroring(state: EmulatorState, request: Request) -> Any:
+    mirror_id = parse_entity_id(read_json(request, expected_type=dict).get('id'))
+
+    if mirror_id not in state.mirroring:
+        raise EmulatorError('Такой группы зеркалирования не существует')
+
+    del state.mirroring[mirror_id]
+    return OK
+
+
+#-----------------------------------------------------------------------------------------------------------------------
+def start_link_training(state: EmulatorState, port: str):
+    """
+    Функция опускает линк порта и назначает время его поднятия по настройкам порта (скорость, AN, FEC).
+    Отключённый порт линк не поднимает.
+
+    :param state: Состояние эмулятора.
+    :param port: Сконфигурированный порт.
+    """
+    data = state.ports[port]
+    data['up'] = False
+    state.link_up_at.pop(port, None)
+
+    if data['enable']:
+        state.link_up_at[port] = time.monotonic() + LINK_TRAINING_SECONDS + \
+                                 LINK_AN_SECONDS.get(data['an'], 0.0) + LINK_FEC_SECONDS.get(data['fec'], 0.0)
+
+
+def refresh_links(state: EmulatorState):
+    now = time.monotonic()
+    for port, data in state.ports.items():
+        data['up'] = data['enable'] and port in state.link_up_at and state.link_up_at[port] <= now
+
+
+def get_ports(state: EmulatorState, request: Request) -> Any:
+    refresh_links(state)
+    return [state.ports[port] for port in sorted(state.ports, key=port_sort_key)]
+
+
+def get_possible_ports(state: EmulatorState, request: Request) -> Any:
+    return POSSIBLE_PORTS
+
+
+def create_port(state: EmulatorState, request: Request) -> Any:
+    body = read_json(request, expected_type=dict)
+
+    required_fields = ('name', 'port', 'speed', 'mtu', 'an', 'fec', 'dir', 'loopback')
+    if any(body.get(field) is None for field in required_fields) or body['port'] not in POSSIBLE_PORTS:
+        raise EmulatorError('Неверно заданы поля JSON. Запрос некорректен')
+    if body['port'] in state.ports:
+        raise EmulatorError('Такой порт уже существует')
+
+    state.ports[body['port']] = {
+        'port': body['port'],
+        'speed': body['speed'],
+        'mtu': body['mtu'],
+        'an': body['an'],
+        'fec': body['fec'],
+        'dir': body['dir'],
+        'up': False,
+        'enable': True,
+        'monitoring': 0,
+        'action': 0,
+        'loopback': body['loopback'],
+        'reservePort': body.get('reservePort'),
+        'macDstEgress': body.get('macDstEgress'),
+        'name': body['name'],
+        'pid': None,
+        'lid': None,
+    }
+    state.port_statuses[body['port']] = True
+    start_link_training(state, body['port'])
+    return OK
+
+
+def update_ports(state: EmulatorState, request: Request) -> Any:
+    updated_ports = read_json_list(request)
+
+    if any(updated_port.get('port') not in state.ports for updated_port in updated_ports):
+        raise EmulatorError('Такого порта не существует')
+
+    for updated_port in updated_ports:
+        port = state.ports[updated_port['port']]
+
+        for field in ('name', 'speed', 'mtu', 'an', 'fec', 'dir', 'loopback', 'macDstEgress'):
+            if field in updated_port:
+                port[field] = updated_port[field]
+
+        port['reservePort'] = updated_port.get('reservePort', updated_port.get('ReservePort'))
+        start_link_training(state, updated_port['port'])
+
+    return OK
+
+
+def delete_ports(state: EmulatorState, request: Request) -> Any:
+    deleted_ports = read_json_list(request, item_type=str)
+
+    if any(port not in state.ports for port in deleted_ports):
+        raise EmulatorError('Такого порта не существует')
+
+    for port in deleted_ports:
+        del state.ports[port]
+        state.port_statuses.pop(port, None)
+        state.link_up_at.pop(port, None)
+
+    return OK
+
+
+def update_port_status(state: EmulatorState, request: Request) -> Any:
+    body = read_json(request, expected_type=dict)
+    port, status = body.get('port'), body.get('status')
+
+    if not isinstance(port, str) or not isinstance(status, bool):
+        raise EmulatorError(INCORRECT_JSON)
+
+    if not status and any(egress_group['ports'] == [port] for egress_group in state.egress_groups.values()):
+        raise EmulatorError('Невозможно отключить единственный порт в выходной группе')
+
+    state.port_statuses[port] = status
+    if port in state.ports and state.ports[port]['enable'] != status:
+        state.ports[port]['enable'] = status
+        start_link_training(state, port)
+
+    return OK
+
+
+def get_all_ports(state: EmulatorState, request: Request) -> Any:
+    all_ports = []
+    refresh_links(state)
+
+    for connector in range(1, 34):
+        lanes, levels = [], []
+
+        for channel in range(4):
+            port = state.ports.get(f'{connector}/{channel}')
+            lanes.append({'lane': channel,
+                          'status': port['up'] if port else None,
+                          'speed': port['speed'] if port else None,
+                          'vendor': 'EMULATOR' if port else None,
+                          'serialNumber': f'EMU{connector:02}{channel}' if port else None})
+            levels.append({'rx_rate': round(-2.0 - 0.1 * channel, 2) if port else None,
+                           'tx_rate': round(-1.5 - 0.1 * channel, 2) if port else None,
+                           'bias': 35.0 if port else None})
+
+        all_ports.append({'port': connector, 'lanes': lanes, 'levels': levels})
+
+    return all_ports
+
+
+#-----------------------------------------------------------------------------------------------------------------------
+def get_loopback_ports(state: EmulatorState, request: Request) -> Any:
+    return [{'port': port, 'speedLimit': speed_limit} for port, speed_limit in state.loopback_ports.items()]
+
+
+def _read_loopback_ports(request: Request) -> list[dict]:
+    loopback_ports = read_json_list(request)
+
+    for loopback_port in loopback_ports:
+        speed_limit = loopback_port.get('speedLimit')
+
+        if loopback_port.get('port') not in LOOPBACK_PORTS or \
+                (speed_limit is not None and not isinstance(speed_limit, (int, float))):
+            raise EmulatorError(INCORRECT_JSON)
+
+    return loopback_ports
+
+
+def create_loopback_ports(state: EmulatorState, request: Request) -> Any:
+    for loopback_port in _read_loopback_ports(request):
+        speed_limit = loopback_port.get('speedLimit')
+        state.loopback_ports[loopback_port['port']] = \
+            round(speed_limit / LOOPBACK_SPEED_DIVIDER, 2) if speed_limit is not None else None
+
+    return OK
+
+
+def delete_loopback_ports(state: EmulatorState, request: Request) -> Any:
+    for loopback_port in _read_loopback_ports(request):
+        state.loopback_ports[loopback_port['port']] = None
+
+    return OK
+
+
+#-----------------------------------------------------------------------------------------------------------------------
+def get_ingress_groups(state: EmulatorState, request: Request) -> Any:
+    return [{'id': group_id, 'ports': ports, 'packetCounter': [0] * len(ports)}
+            for group_id, ports in sorted(state.ingress_groups.items())]
+
+
+def _read_ingress_group(request: Request) -> tuple[int, list[str]]:
+    body = read_json(request, expected_type=dict)
+
+    group_id = parse_entity_id(body.get('groupId'))
+    ports = body.get('ports')
+
+    if group_id is None or not isinstance(ports, list) or not all(isinstance(port, dict) for port in ports):
+        raise EmulatorError(INCORRECT_JSON)
+
+    return group_id, [port.get('port') for port in ports]
+
+
+def create_ingress_group(state: EmulatorState, request: Request) -> Any:
+    group_id, ports = _read_ingress_group(request)
+
+    if group_id in state.ingress_groups:
+        raise EmulatorError('Входная группа с таким ID уже существует')
+
+    state.ingress_groups[group_id] = ports
+    return OK
+
+
+def update_ingress_group(state: EmulatorState, request: Request) -> Any:
+    group_id, ports = _read_ingress_group(request)
+
+    if group_id not in state.ingress_groups:
+        raise EmulatorError('Такой входной группы не существует')
+
+    state.ingress_groups[group_id] = ports
+    return OK
+
+
+def delete_ingress_group(state: EmulatorState, request: Request) -> Any:
+    group_id, ports = _read_ingress_group(request)
+    group_ports = state.ingress_groups.get(group_id, [])
+
+    for port in ports:
+        if port not in group_ports:
+            raise EmulatorError(f'{port} - данный порт не является портом входной группы')
+
+    state.ingress_groups[group_id] = [port for port in group_ports if port not in ports]
+    if not state.ingress_groups[group_id]:
+        del state.ingress_groups[group_id]
+
+    return OK
+
+
+#-----------------------------------------------------------------------------------------------------------------------
+def get_nodes(state: EmulatorState, request: Request) -> Any:
+    return state.nodes_graph
+
+
+def create_nodes(state: EmulatorState, request: Request) -> Any:
+    nodes_graph = read_json(request, expected_type=dict)
+
+    if not isinstance(nodes_graph.get('nodes'), list):
+        raise EmulatorError(INCORRECT_JSON)
+
+    state.nodes_graph = {**empty_nodes_graph(), **nodes_graph}
+    return OK
+
+
+def apply_nodes(state: EmulatorState, request: Request) -> Any:
+    for node in state.nodes_graph.get('nodes', []):
+        if node.get('type') != 'selection':
+            continue
+
+        selection_filter = (node.get('data') or {}).get('filter') or {}
+        if all(selection_filter.get(field) is None for field in ('ipProtocol', 'srcPort', 'dstPort')):
+            raise EmulatorError('Неверная конфигурация. Задайте признак отбора')
+
+    state.apply_nodes()
+    return OK
+
+
+def delete_nodes(state: EmulatorState, request: Request) -> Any:
+    state.nodes_graph = empty_nodes_graph()
+    return OK
+
+
+#-----------------------------------------------------------------------------------------------------------------------
+def get_selections(state: EmulatorState, request: Request) -> Any:
+    return list(state.selections.values())
+
+
+def create_selection(state: EmulatorState, request: Request) -> Any:
+    body = read_json(request, expected_type=dict)
+
+    ingress_id = parse_entity_id(body.get('ingressId'))
+    logic_id = parse_entity_id(body.get('logicId'))
+    selection = body.get('selection') or {}
+
+    if ingress_id is None:
+        raise EmulatorError('Неверно задан идентификатор входной группы')
+    if logic_id is None:
+        raise EmulatorError('Неправильно задан ID логической группы')
+    if logic_id in state.selections:
+        raise EmulatorError('Логическая группа с таким ID уже существует')
+
+    state.selections[logic_id] = {'logicId': logic_id,
+                                  'ingressId': ingress_id,
+                                  'ipProtocol': selection.get('ipProtocol') or 0,
+                                  'srcPort': selection.get('srcPort') or 0,
+                                  'dstPort': selection.get('dstPort') or 0,
+                                  'trafficType': selection.get('trafficType') or 0,
+                                  'matchPriority': body.get('matchPriority') or 0}
+    return OK
+
+
+def delete_selection(state: EmulatorState, request: Request) -> Any:
+    body = read_json(request, expected_type=dict)
+
+    ingress_id = parse_entity_id(body.get('ingressGroup'))
+    selection_filter = body.get('filter') or {}
+
+    if ingress_id is None:
+        raise EmulatorError('Неверно задан идентификатор входной группы')
+
+    expected = {'ingressId': ingress_id,
+                'ipProtocol': selection_filter.get('ipProtocol') or 0,
+                'srcPort': selection_filter.get('srcPort') or 0,
+                'dstPort': selection_filter.get('dstPort') or 0,
+                'trafficType': selection_filter.get('trafficType') or 0,
+                'matchPriority': body.get('matchPriority') or 0}
+
+    for logic_id, selection in state.selections.items():
+        if all(selection[field] == value for field, value in expected.items()):
+            del state.selections[logic_id]
+            return OK
+
+    raise EmulatorError('Такой группы отбора не существует')
+
+
+#-----------------------------------------------------------------------------------------------------------------------
+def get_egress_groups(state: EmulatorState, request: Request) -> Any:
+    return [{'ports': egress_group['ports'], 'logicGroup': egress_group['logicGroup'], 'groupId': group_id}
+            for group_id, egress_group in sorted(state.egress_groups.items())]
+
+
+def _read_egress_group(request: Request) -> tuple[int, dict]:
+    body = read_json(request, expected_type=dict)
+
+    group_id = parse_entity_id(body.get('groupId'))
+    logic_group = parse_entity_id(body.get('logicGroup'))
+    ports = body.get('ports')
+
+    if group_id is None or logic_group is None or not isinstance(ports, list) \
+            or not all(isinstance(port, dict) for port in ports):
+        raise EmulatorError(INCORRECT_JSON)
+
+    return group_id, {'ports': [port.get('port') for port in ports], 'logicGroup': logic_group}
+
+
+def create_egress_group(state: EmulatorState, request: Request) -> Any:
+    group_id, egress_group = _read_egress_group(request)
+
+    if group_id in state.egress_groups:
+        raise EmulatorError('Выходная группа с таким ID уже существует')
+
+    state.egress_groups[group_id] = egress_group
+    return OK
+
+
+def update_egress_group(state: EmulatorState, request: Request) -> Any:
+    group_id, egress_group = _read_egress_group(request)
+
+    if group_id not in state.egress_groups:
+        raise EmulatorError('Такой выходной группы не существует')
+
+    state.egress_groups[group_id] = egress_group
+    return OK
+
+
+def delete_egress_group(state: EmulatorState, request: Request) -> Any:
+    body = read_json(request, expected_type=dict)
+
+    group_id = parse_entity_id(body.get('id'))
+    logic_group = parse_entity_id((body.get('data') or {}).get('logicGroup'))
+    egress_group = state.egress_groups.get(group_id)
+
+    if egress_group is None or egress_group['logicGroup'] != logic_group:
+        raise EmulatorError('Выходная группа для этой логической группы не сконфигурированна')
+
+    del state.egress_groups[group_id]
+    return OK
+
+
+#-----------------------------------------------------------------------------------------------------------------------
+def get_analysis_ports(state: EmulatorState, request: Request) -> Any:
+    return [{'ingressId': ingress_id, 'egressPort': egress_port}
+            for ingress_id, egress_port in state.analysis_ports.items()]
+
+
+def _read_analysis_port(request: Request) -> tuple[int, str]:
+    body = read_json(request, expected_type=dict)
+
+    ingress_id = parse_entity_id(body.get('ingressGroup'))
+    ports = body.get('ports')
+
+    if ingress_id is None or not isinstance(ports, list) or not ports:
+        raise EmulatorError(INCORRECT_JSON)
+
+    return ingress_id, ports[0]
+
+
+def create_analysis_port(state: EmulatorState, request: Request) -> Any:
+    ingress_id, egress_port = _read_analysis_port(request)
+
+    if ingress_id in state.analysis_ports:
+        raise EmulatorError('Порт анализа на эту входную группу уже настроен')
+
+    state.analysis_ports[ingress_id] = egress_port
+    return OK
+
+
+def update_analysis_port(state: EmulatorState, request: Request) -> Any:
+    ingress_id, egress_port = _read_analysis_port(request)
+
+    if ingress_id not in state.analysis_ports:
+        raise EmulatorError('Порт анализа не сконфигурирован')
+
+    state.analysis_ports[ingress_id] = egress_port
+    return OK
+
+
+def delete_analysis_port(state: EmulatorState, request: Request) -> Any:
+    ingress_id = parse_entity_id((read_json(request, expected_type=dict).get('data') or {}).get('ingressGroup'))
+
+    if ingress_id not in state.analysis_ports:
+        raise EmulatorError('Нет такого порта анализа')
+
+    del state.analysis_ports[ingress_id]
+    return OK
+
+
+#-----------------------------------------------------------------------------------------------------------------------
+def get_psf_formats(state: EmulatorState, request: Request) -> Any:
+    return list(state.psf_formats.values())
+
+
+def _read_psf_format(request: Request) -> dict:
+    body = read_json(request, expected_type=dict)
+
+    if not isinstance(body.get('port'), str) or not isinstance(body.get('dmac'), str):
+        raise EmulatorError(INCORRECT_JSON)
+
+    return {'port': body['port'],
+            'dmac': body['dmac'],
+            'lid': to_int(body.get('lid')),
+            'pid': to_int(body.get('pid'))}
+
+
+def create_psf_format(state: EmulatorState, request: Request) -> Any:
+    psf_format = _read_psf_format(request)
+
+    if psf_format['port'] in state.psf_formats:
+        raise EmulatorError('Данный порт уже используется')
+
+    state.psf_formats[psf_format['port']] = psf_format
+    return OK
+
+
+def update_psf_format(state: EmulatorState, request: Request) -> Any:
+    psf_format = _read_psf_format(request)
+
+    if psf_format['port'] not in state.psf_formats:
+        raise EmulatorError('Такого правила не существует')
+
+    state.psf_formats[psf_format['port']] = psf_format
+    return OK
+
+
+def delete_psf_formats(state: EmulatorState, request: Request) -> Any:
+    ports = read_json_list(request, item_type=str)
+
+    if any(port not in state.psf_formats for port in ports):
+        raise EmulatorError('Такого правила не существует')
+
+    for port in ports:
+        del state.psf_formats[port]
+
+    return OK
+
+
+def get_psf_dmac(state: EmulatorState, request: Request) -> Any:
+    return {'dmac': state.psf_dmac}
+
+
+def create_psf_dmac(state: EmulatorState, request: Request) -> Any:
+    dmac = read_json(request, expected_type=dict).get('dmac')
+
+    if not isinstance(dmac, str):
+        raise EmulatorError(INCORRECT_JSON)
+
+    state.psf_dmac = dmac
+    return OK
+
+
+#-----------------------------------------------------------------------------------------------------------------------
+def get_mirror_filters(state: EmulatorState, request: Request) -> Any:
+    return state.mirror_filters
+
+
+def _mirror_filter_key(mirror_filter: dict) -> str:
+    return normalize({'ig_md.dst_addr': mirror_filter['ig_md.dst_addr'],
+                      'ig_md.src_addr': mirror_filter['ig_md.src_addr'],
+                      'ingressGroup': mirror_filter['ingressGroup'],
+                      'dest_num': mirror_filter['dest_num'],
+                      'mirrorGroup': mirror_filter['mirrorGroup'],
+                      'trafficType': mirror_filter['trafficType']})
+
+
+def create_mirror_filters(state: EmulatorState, request: Request) -> Any:
+    mirror_filters = [{'ig_md.dst_addr': ternary(mirror_filter.get('newIpDst'),
+                                                 ip_mask(mirror_filter.get('newIpDstMask', 32))),
+                       'ig_md.src_addr': ternary(mirror_filter.get('newIpSrc'),
+                                                 ip_mask(mirror_filter.get('newIpSrcMask', 32))),
+                       'ingressGroup': mirror_filter.get('ingressGroup'),
+                       'dest_num': mirror_filter.get('destNum'),
+                       'mirrorGroup': mirror_filter.get('mirrorGroup'),
+                       'trafficType': mirror_filter.get('trafficType')}
+                      for mirror_filter in read_json_list(request)]
+
+    existed = set(map(_mirror_filter_key, state.mirror_filters))
+    if any(_mirror_filter_key(mirror_filter) in existed for mirror_filter in mirror_filters):
+        raise EmulatorError('Такое правило фильтрации зеркалирования уже существует')
+
+    state.mirror_filters.extend(mirror_filters)
+    return OK
+
+
+def delete_mirror_filters(state: EmulatorState, request: Request) -> Any:
+    try:
+        deleted = {_mirror_filter_key({**mirror_filter, 'dest_num': mirror_filter.get('destNum')})
+                   for mirror_filter in read_json_list(request)}
+    except KeyError:
+        raise EmulatorError(INCORRECT_JSON)
+
+    if not deleted <= set(map(_mirror_filter_key, state.mirror_filters)):
+        raise EmulatorError('Нет такого правила фильтрации зеркалирования')
+
+    state.mirror_filters = [mirror_filter for mirror_filter in state.mirror_filters
+                            if _mirror_filter_key(mirror_filter) not in deleted]
+    return OK
\ No newline at end of file
@@ -0,0 +1,313 @@
+import base64
+import json
+import secrets
+import threading
+import time
+from functools import lru_cache
+from http import HTTPStatus
+from typing import Any, Callable
+
+from httpx import Request, Response, MockTransport
+from pydantic import BaseModel, ValidationError
+
+from clients.analysis_ports.analysis_ports_schema import GetAnalysisPortsResponseSchema
+from clients.authentication.authentication_schema import LoginResponseSchema, RefreshResponseSchema
+from clients.balancing.balancing_schema import GetBalancingListResponseSchema
+from clients.custom_config.custom_config_schema import GetSwitchInfoResponseSchema
+from clients.egress_groups.egress_groups_schema import GetEgressGroupsResponseSchema
+from clients.ingress_groups.ingress_groups_schema import GetIngressGroupsResponseSchema
+from clients.loopback_ports.loopback_ports_schema import GetLoopbackPortsResponseSchema
+from clients.mirror_filter.mirror_filter_schema import GetMirrorFilterListResponseSchema, \
+    GetPsfMirrorFilterListResponseSchema
+from clients.mirroring.mirroring_schema import GetMirroringResponseSchema
+from clients.ports.ports_schema import GetPortsListResponse, GetPossiblePortsListResponse, GetAllPortsListResponse
+from clients.psf_format.psf_format_schema import GetPsfFormatResponseSchema, GetPsfDmacResponseSchema
+from clients.selections.selections_schema import GetSelectionsResponseSchema
+from config import settings
+from tools.emulator import handlers
+from tools.emulator.state import EmulatorState, EmulatorError
+from tools.logger import get_logger
+from tools.routes import APIRoutes
+
+
+logger = get_logger('EMULATOR')
+
+Handler = Callable[[EmulatorState, Request], Any]
+
+# Схемы ответов из clients/: JSON-ответ эмулятора проверяется той же моделью, что и ответ коммутатора,
+# поэтому расхождение эмулятора с API возвращается как 500, а не проходит в тесты незамеченным
+RESPONSE_SCHEMAS: dict[tuple[str, str], type[BaseModel]] = {
+    ('POST', f'{APIRoutes.AUTHENTICATION}/access/'): LoginResponseSchema,
+    ('POST', f'{APIRoutes.AUTHENTICATION}/both/'): RefreshResponseSchema,
+    ('GET', APIRoutes.BALANCING): GetBalancingListResponseSchema,
+    ('GET', APIRoutes.SWITCH_INFO): GetSwitchInfoResponseSchema,
+    ('GET', APIRoutes.MIRRORING): GetMirroringResponseSchema,
+    ('GET', APIRoutes.PORTS): GetPortsListResponse,
+    ('OPTIONS', APIRoutes.PORTS): GetPossiblePortsListResponse,
+    ('GET', APIRoutes.PORTS_ALL): GetAllPortsListResponse,
+    ('GET', APIRoutes.LOOPBACK_PORTS): GetLoopbackPortsResponseSchema,
+    ('GET', APIRoutes.INGRESS_GROUPS): GetIngressGroupsResponseSchema,
+    ('GET', APIRoutes.SELECTIONS): GetSelectionsResponseSchema,
+    ('GET', APIRoutes.EGRESS_GROUPS): GetEgressGroupsResponseSchema,
+    ('GET', APIRoutes.ANALYSIS_PORTS): GetAnalysisPortsResponseSchema,
+    ('GET', APIRoutes.PSF_FORMAT): GetPsfFormatResponseSchema,
+    ('GET', APIRoutes.PSF_DMAC): GetPsfDmacResponseSchema,
+    ('GET', APIRoutes.MIRROR_FILTER): GetMirrorFilterListResponseSchema,
+    ('GET', APIRoutes.PSF_MIRROR_FILTER): GetPsfMirrorFilterListResponseSchema,
+}
+
+NOT_AUTHENTICATED = 'Учетные данные не были предоставлены.'
+TOKEN_NOT_VALID = 'Данный токен недействителен для любого типа токена'
+
+
+def _encode_segment(data: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b'=').decode()
+
+
+class PacketBrokerEmulator:
+    def __init__(self, access_token_lifetime: float = 300, refresh_token_lifetime: float = 86400):
+        """
+        In-process эмулятор API коммутатора Packet Broker.
+        Реализует все маршруты из tools/routes.py поверх in-memory состояния и подключается к httpx
+        как MockTransport (get_emulator_transport) или запускается как ASGI-приложение.
+        JSON-ответы проверяются схемами клиентов (RESPONSE_SCHEMAS). Тела запросов проверяются обработчиками,
+        так как схемы запросов заполнены значениями по умолчанию из тестовых данных и не задают обязательных полей,
+        а негативные тесты ожидают конкретные сообщения 412 коммутатора.
+
+        :param access_token_lifetime: Время жизни access_token в секундах.
+        :param refresh_token_lifetime: Время жизни refresh_token в секундах.
+        """
+        self.state = EmulatorState()
+        self.access_token_lifetime = access_token_lifetime
+        self.refresh_token_lifetime = refresh_token_lifetime
+        self._tokens: dict[str, tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+        self.routes: dict[tuple[str, str], Handler] = {
+            ('POST', f'{APIRoutes.AUTHENTICATION}/access/'): self._login,
+            ('POST', f'{APIRoutes.AUTHENTICATION}/both/'): self._refresh,
+
+            ('POST', APIRoutes.ADDITIONAL_FILTERS): handlers.create_additional_filters,
+            ('PUT', APIRoutes.ADDITIONAL_FILTERS): handlers.update_additional_filters,
+            ('DELETE', APIRoutes.ADDITIONAL_FILTERS): handlers.delete_additional_filters,
+
+            ('GET', APIRoutes.BALANCING): handlers.get_balancing,
+            ('POST', APIRoutes.BALANCING): handlers.create_balancing,
+            ('PUT', APIRoutes.BALANCING): handlers.update_balancing,
+            ('DELETE', APIRoutes.BALANCING): handlers.delete_balancing,
+
+            ('GET', APIRoutes.CUSTOM_CONFIG): handlers.download_custom_config,
+            ('POST', APIRoutes.CUSTOM_CONFIG): handlers.upload_custom_config,
+            ('PUT', APIRoutes.CUSTOM_CONFIG): handlers.save_custom_config,
+            ('DELETE', APIRoutes.CUSTOM_CONFIG): handlers.restore_custom_config,
+            ('DELETE', APIRoutes.DEFAULT_CONFIG): handlers.return_default_config,
+            ('GET', APIRoutes.SWITCH_INFO): handlers.get_switch_info,
+
+            ('GET', APIRoutes.FILTERS): handlers.get_filters,
+            ('POST', APIRoutes.FILTERS): handlers.create_filters,
+            ('DELETE', APIRoutes.FILTERS): handlers.delete_filters,
+            ('DELETE', APIRoutes.ALL_FILTERS): handlers.delete_all_filters,
+
+            ('GET', APIRoutes.MIRRORING): handlers.get_mirroring,
+            ('POST', APIRoutes.MIRRORING): handlers.create_mirroring,
+            ('PUT', APIRoutes.MIRRORING): handlers.update_mirroring,
+            ('DELETE', APIRoutes.MIRRORING): handlers.delete_mirroring,
+
+            ('GET', APIRoutes.PORTS): handlers.get_ports,
+            ('OPTIONS', APIRoutes.PORTS): handlers.get_possible_ports,
+            ('POST', APIRoutes.PORTS): handlers.create_port,
+            ('PUT', APIRoutes.PORTS): handlers.update_ports,
+            ('DELETE', APIRoutes.PORTS): handlers.delete_ports,
+            ('PUT', APIRoutes.PORT_STATUS): handlers.update_port_status,
+            ('GET', APIRoutes.PORTS_ALL): handlers.get_all_ports,
+
+            ('GET', APIRoutes.LOOPBACK_PORTS): handlers.get_loopback_ports,
+            ('POST', APIRoutes.LOOPBACK_PORTS): handlers.create_loopback_ports,
+            ('DELETE', APIRoutes.LOOPBACK_PORTS): handlers.delete_loopback_ports,
+
+            ('GET', APIRoutes.INGRESS_GROUPS): handlers.get_ingress_groups,
+            ('POST', APIRoutes.INGRESS_GROUPS): handlers.create_ingress_group,
+            ('PUT', APIRoutes.INGRESS_GROUPS): handlers.update_ingress_group,
+            ('DELETE', APIRoutes.INGRESS_GROUPS): handlers.delete_ingress_group,
+
+            ('GET', APIRoutes.NODES): handlers.get_nodes,
+            ('POST', APIRoutes.NODES): handlers.create_nodes,
+            ('OPTIONS', APIRoutes.NODES): handlers.apply_nodes,
+            ('DELETE', APIRoutes.NODES): handlers.delete_nodes,
+
+            ('GET', APIRoutes.SELECTIONS): handlers.get_selections,
+            ('POST', APIRoutes.SELECTIONS): handlers.create_selection,
+            ('DELETE', APIRoutes.SELECTIONS): handlers.delete_selection,
+
+            ('GET', APIRoutes.EGRESS_GROUPS): handlers.get_egress_groups,
+            ('POST', APIRoutes.EGRESS_GROUPS): handlers.create_egress_group,
+            ('PUT', APIRoutes.EGRESS_GROUPS): handlers.update_egress_group,
+            ('DELETE', APIRoutes.EGRESS_GROUPS): handlers.delete_egress_group,
+
+            ('GET', APIRoutes.ANALYSIS_PORTS): handlers.get_analysis_ports,
+            ('POST', APIRoutes.ANALYSIS_PORTS): handlers.create_analysis_port,
+            ('PUT', APIRoutes.ANALYSIS_PORTS): handlers.update_analysis_port,
+            ('DELETE', APIRoutes.ANALYSIS_PORTS): handlers.delete_analysis_port,
+
+            ('GET', APIRoutes.PSF_FORMAT): handlers.get_psf_formats,
+            ('POST', APIRoutes.PSF_FORMAT): handlers.create_psf_format,
+            ('PUT', APIRoutes.PSF_FORMAT): handlers.update_psf_format,
+            ('DELETE', APIRoutes.PSF_FORMAT): handlers.delete_psf_formats,
+            ('GET', APIRoutes.PSF_DMAC): handlers.get_psf_dmac,
+            ('POST', APIRoutes.PSF_DMAC): handlers.create_psf_dmac,
+
+            ('GET', APIRoutes.MIRROR_FILTER): handlers.get_mirror_filters,
+            ('POST', APIRoutes.MIRROR_FILTER): handlers.create_mirror_filters,
+            ('DELETE', APIRoutes.MIRROR_FILTER): handlers.delete_mirror_filters,
+            ('GET', APIRoutes.PSF_MIRROR_FILTER): handlers.get_mirror_filters,
+        }
+        self.public_paths = {f'{APIRoutes.AUTHENTICATION}/access/', f'{APIRoutes.AUTHENTICATION}/both/'}
+
+    def handle(self, request: Request) -> Response:
+        """
+        Метод обрабатывает запрос так же, как это сделал бы коммутатор.
+        Используется как handler для httpx.MockTransport, поэтому подходит и для Client, и для AsyncClient.
+
+        :param request: Входящий запрос httpx.Request.
+        :return: Ответ httpx.Response.
+        """
+        path = request.url.path
+        methods = {method for method, route in self.routes if route == path}
+
+        if not methods:
+            return Response(HTTPStatus.NOT_FOUND, json={'detail': 'Nothing matches the given URI'})
+
+        if path not in self.public_paths:
+            if error_response := self._authenticate(request):
+                return error_response
+
+        if request.method not in methods:
+            return Response(HTTPStatus.METHOD_NOT_ALLOWED,
+                            json={'detail': f'Метод "{request.method}" не разрешен.'})
+
+        handler = self.routes[(request.method, path)]
+
+        with self._lock:
+            try:
+                result = handler(self.state, request)
+            except EmulatorError as error:
+                return Response(error.status_code, json=error.message)
+            except Exception:
+                logger.exception(f'Unhandled error on "{request.method} {path}"')
+                return Response(HTTPStatus.INTERNAL_SERVER_ERROR, json='Внутренняя ошибка')
+
+        if isinstance(result, Response):
+            return result
+        if isinstance(result, bytes):
+            return Response(HTTPStatus.OK, content=result, headers={'Content-Type': 'application/octet-stream'})
+
+        if schema := RESPONSE_SCHEMAS.get((request.method, path)):
+            try:
+                schema.model_validate(result)
+            except ValidationError:
+                logger.exception(f'Emulator response on "{request.method} {path}" does not match {schema.__name__}')
+                return Response(HTTPStatus.INTERNAL_SERVER_ERROR, json='Ответ не соответствует схеме')
+
+        return Response(HTTPStatus.OK, json=result)
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable):
+        """
+        ASGI-интерфейс эмулятора для запуска под ASGI-сервером (например, uvicorn).
+        """
+        if scope['type'] != 'http':
+            return
+
+        body, more_body = b'', True
+        while more_body:
+            message = await receive()
+            body += message.get('body', b'')
+            more_body = message.get('more_body', False)
+
+        query_string = scope.get('query_string', b'').decode()
+        request = Request(method=scope['method'],
+                          url=f'http://emulator{scope["path"]}' + (f'?{query_string}' if query_string else ''),
+                          headers=[(key.decode('latin-1'), value.decode('latin-1')) for key, value in scope['headers']],
+                          content=body)
+        response = self.handle(request)
+
+        await send({'type': 'http.response.start',
+                    'status': response.status_code,
+                    'headers': [(key.encode('latin-1'), value.encode('latin-1'))
+                                for key, value in response.headers.items()]})
+        await send({'type': 'http.response.body', 'body': response.content})
+
+    def _issue_token(self, token_type: str, lifetime: float) -> str:
+        expires_at = time.time() + lifetime
+        payload = {'token_type': token_type, 'exp': int(expires_at), 'jti': secrets.token_hex(16), 'user_id': 1}
+        token = '.'.join([_encode_segment({'alg': 'HS256', 'typ': 'JWT'}),
+                          _encode_segment(payload),
+                          secrets.token_urlsafe(32)])
+
+        self._tokens[token] = (token_type, expires_at)
+        return token
+
+    def _is_valid_token(self, token: str, token_type: str) -> bool:
+        issued_type, expires_at = self._tokens.get(token, (None, 0))
+        return issued_type == token_type and time.time() < expires_at
+
+    def _issue_tokens(self) -> dict:
+        return {'access': self._issue_token(token_type='access', lifetime=self.access_token_lifetime),
+                'refresh': self._issue_token(token_type='refresh', lifetime=self.refresh_token_lifetime)}
+
+    def _authenticate(self, request: Request) -> Response | None:
+        authorization = request.headers.get('Authorization')
+
+        if not authorization:
+            return Response(HTTPStatus.FORBIDDEN, json={'detail': NOT_AUTHENTICATED})
+
+        scheme, _, token = authorization.partition(' ')
+        with self._lock:
+            is_valid = scheme == 'Bearer' and self._is_valid_token(token=token, token_type='access')
+
+        if not is_valid:
+            return Response(HTTPStatus.UNAUTHORIZED, json={'detail': TOKEN_NOT_VALID, 'code': 'token_not_valid'})
+
+        return None
+
+    def _login(self, state: EmulatorState, request: Request) -> Any:
+        body = handlers.read_json(request, expected_type=dict)
+
+        if body.get('username') != settings.user_data.username or body.get('password') != settings.user_data.password:
+            return Response(HTTPStatus.FORBIDDEN, json={'detail': 'user not found'})
+
+        return {**self._issue_tokens(),
+                'user': {'id': 1,
+                         'username': body['username'],
+                         'is_active': True,
+                         'is_staff': True,
+                         'is_specformat': False}}
+
+    def _refresh(self, state: EmulatorState, request: Request) -> Any:
+        refresh_token = handlers.read_json(request, expected_type=dict).get('refresh_token')
+
+        if not self._is_valid_token(token=refresh_token, token_type='refresh'):
+            return Response(HTTPStatus.FORBIDDEN, json={'detail': TOKEN_NOT_VALID})
+
+        del self._tokens[refresh_token]
+        return self._issue_tokens()
+
+
+@lru_cache(maxsize=None)
+def get_emulator() -> PacketBrokerEmulator:
+    """
+    Функция возвращает общий на процесс экземпляр эмулятора коммутатора.
+    Каждый воркер pytest-xdist работает в отдельном процессе и получает собственное состояние.
+
+    :return: Экземпляр PacketBrokerEmulator.
+    """
+    return PacketBrokerEmulator()
+
+
+@lru_cache(maxsize=None)
+def get_emulator_transport() -> MockTransport:
+    """
+    Функция создаёт транспорт httpx, направляющий запросы в эмулятор коммутатора без обращения к сети.
+
+    :return: Объект httpx.MockTransport, подходящий для httpx.Client и httpx.AsyncClient.
+    """
+    return MockTransport(get_emulator().handle)
\ No newline at end of file
@@ -0,0 +1,185 @@
+import json
+from typing import Any
+
+from clients.ports.ports_schema import POSSIBLE_PORTS
+
+
+LOOPBACK_PORTS = ['L1', 'L2']
+
+
+class EmulatorError(Exception):
+    def __init__(self, message: str, status_code: int = 412):
+        """
+        Ошибка обработки запроса эмулятором. Превращается в ответ сервера с текстом ошибки в виде JSON-строки,
+        как это делает реальный коммутатор: [412]PRECONDITION_FAILED - "Такого порта не существует".
+
+        :param message: Текст ошибки.
+        :param status_code: HTTP-статус ответа.
+        """
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+
+
+def parse_entity_id(value: Any) -> int | None:
+    """
+    Функция извлекает числовой идентификатор сущности из значения вида 1, "1", "ingress-1" или ["ingress-1"].
+
+    :param value: Идентификатор сущности из тела запроса.
+    :return: Числовой идентификатор или None, если значение некорректно.
+    """
+    if isinstance(value, list):
+        return parse_entity_id(value[0]) if value else None
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        number = value.rsplit('-', maxsplit=1)[-1]
+        return int(number) if number.isdigit() else None
+
+    return None
+
+
+def port_sort_key(port: str) -> tuple:
+    return tuple(int(part) if part.isdigit() else 0 for part in port.split('/'))
+
+
+def empty_nodes_graph() -> dict:
+    return {'nodes': [], 'edges': [], 'position': [0, 0], 'zoom': 1, 'viewport': {'x': 0, 'y': 0, 'zoom': 1}}
+
+
+class EmulatorState:
+    """
+    In-memory состояние эмулятора коммутатора: порты, группы, фильтры, PSF, зеркалирование и конфигурация на Web.
+    Заполняется из загруженного конфигурационного файла так же, как это делает коммутатор.
+    """
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """
+        Метод возвращает состояние к конфигурации по умолчанию (пустой коммутатор).
+        """
+        self.raw_config: bytes = json.dumps({'config': {}, 'nodes': [], 'edges': []}).encode()
+        self.saved_config: bytes = self.raw_config
+        self.nodes_graph: dict = empty_nodes_graph()
+
+        self.ports: dict[str, dict] = {}
+        self.port_statuses: dict[str, bool] = {}
+        self.link_up_at: dict[str, float] = {}     # time.monotonic(), когда включённый порт поднимет линк
+        self.loopback_ports: dict[str, float | None] = {port: None for port in LOOPBACK_PORTS}
+
+        self.ingress_groups: dict[int, list[str]] = {}
+        self.selections: dict[int, dict] = {}
+        self.balancing: dict[int, int] = {}
+        self.egress_groups: dict[int, dict] = {}
+        self.analysis_ports: dict[int, str] = {}
+        self.mirroring: dict[int, dict] = {}
+
+        self.filters: dict[str, dict] = {}        # Ключ - нормализованное правило фильтрации
+        self.additional_filters: list[dict] = []
+        self.additional_filters_modes: dict[int, dict] = {}
+        self.mirror_filters: list[dict] = []
+
+        self.psf_formats: dict[str, dict] = {}
+        self.psf_dmac: str = ''
+
+    def load_config(self, raw_config: bytes):
+        """
+        Метод применяет конфигурационный файл коммутатора.
+        При ошибке разбора файла текущее состояние не изменяется.
+
+        :param raw_config: Содержимое конфигурационного файла.
+        :raises ValueError: Если файл содержит некорректные значения.
+        """
+        config = json.loads(raw_config)
+        tables = config.get('config') or {}
+        names = config.get('names') or {}
+        actions = config.get('actions') or {}
+
+        attributes = {entry['key']['ig_intr_md.ingress_port']['value']: entry['data']
+                      for entry in tables.get('set_attributes', [])}
+
+        ports = {}
+        for entry in tables.get('ports', []):
+            data = entry['data']
+            dev_port = entry['key']['$DEV_PORT']['value']
+            port = data['$PORT_NAME']
+            int(data['$RX_MTU'])
+
+            ports[port] = {
+                'port': port,
+                'speed': data['$SPEED'],
+                'mtu': int(data['$TX_MTU']),
+                'an': data['$AUTO_NEGOTIATION'],
+                'fec': data['$FEC'],
+                'dir': data['$PORT_DIR'],
+                'up': data.get('$PORT_UP', False),
+                'enable': data['$PORT_ENABLE'],
+                'monitoring': 0,
+                'action': actions.get(port, 0),
+                'loopback': data['$LOOPBACK_MODE'],
+                'reservePort': None,
+                'macDstEgress': None,
+                'name': names.get(port),
+                'pid': attributes.get(dev_port, {}).get('pid'),
+                'lid': attributes.get(dev_port, {}).get('lid'),
+            }
+
+        nodes_graph = {key: config[key] for key in empty_nodes_graph() if key in config}
+
+        self.reset()
+        self.raw_config = raw_config
+        self.saved_config = raw_config
+        self.ports = ports
+        self.port_statuses = {port: data['enable'] for port, data in ports.items()}
+        self.link_up_at = {port: 0.0 for port, data in ports.items() if data['up']}
+        self.psf_dmac = (config.get('psf_dmac') or {}).get('dmac', '')
+        self.nodes_graph = {**empty_nodes_graph(), **nodes_graph}
+        self.apply_nodes()
+
+    def apply_nodes(self):
+        """
+        Метод применяет конфигурацию на Web (граф nodes) к группам коммутатора.
+        """
+        self.ingress_groups = {}
+        self.selections = {}
+        self.balancing = {}
+        self.egress_groups = {}
+        self.analysis_ports = {}
+        self.mirroring = {}
+
+        for node in self.nodes_graph.get('nodes', []):
+            node_id = parse_entity_id(node.get('id'))
+            data = node.get('data') or {}
+            ports = [item['port'] if isinstance(item, dict) else item for item in data.get('ports', [])]
+
+            match node.get('type'):
+                case 'ingress':
+                    self.ingress_groups[node_id] = ports
+                case 'selection':
+                    selection_filter = data.get('filter') or {}
+                    self.selections[node_id] = {
+                        'logicId': node_id,
+                        'ingressId': parse_entity_id(data.get('ingressGroup')) or 0,
+                        'ipProtocol': selection_filter.get('ipProtocol') or 0,
+                        'srcPort': selection_filter.get('srcPort') or 0,
+                        'dstPort': selection_filter.get('dstPort') or 0,
+                        'trafficType': selection_filter.get('trafficType') or 0,
+                        'matchPriority': data.get('matchPriority') or 0,
+                    }
+                case 'balancing':
+                    if data.get('balancingType') is not None:
+                        self.balancing[parse_entity_id(data.get('logicGroup'))] = data['balancingType']
+                case 'egress':
+                    self.egress_groups[node_id] = {'ports': ports,
+                                                   'logicGroup': parse_entity_id(data.get('logicGroup'))}
+                case 'unknown':
+                    if ports:
+                        self.analysis_ports[parse_entity_id(data.get('ingressGroup'))] = ports[0]
+                case 'mirror':
+                    self.mirroring[node_id] = {'mirrorId': node_id,
+                                               'ports': ports,
+                                               'ingressId': parse_entity_id(data.get('ingressGroup')),
+                                               'priority': data.get('priority', 0)}
\ No newline at end of file
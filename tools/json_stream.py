@@ -0,0 +1,212 @@
+import codecs
+import json
+import re
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator
+
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_OBJECT_KEY = re.compile(r'"(?:[^"\\]|\\.)*"[ \t\n\r]*:[ \t\n\r]*')
+_DELIMITERS = frozenset(' \t\n\r,]}')
+
+# Обработанная часть буфера отбрасывается, когда её размер превышает порог, чтобы не копировать буфер на каждом элементе
+_COMPACT_THRESHOLD = 64 * 1024
+
+
+class JSONArrayStreamParser:
+    def __init__(self, key: str | None = None):
+        """
+        Инкрементальный разбор JSON-массива, получаемого частями.
+        Элементы массива возвращаются по мере получения, весь документ в памяти не собирается.
+
+        :param key: Ключ массива внутри JSON-объекта верхнего уровня (например, "nodes").
+                    Если не указан, массивом должен быть сам документ.
+        """
+        self.key = key
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._position = 0
+        self._state = 'start'
+        self._key_found = False
+        self._retry_pending = 0
+        # Что допустимо следующим внутри контейнера: 'first' - элемент или закрывающая скобка,
+        # 'value' - только элемент (после запятой), 'separator' - запятая или закрывающая скобка
+        self._expecting = 'first'
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """
+        Метод добавляет очередную часть тела ответа.
+
+        :param chunk: Часть тела ответа в байтах (может обрываться посреди элемента или символа UTF-8).
+        :return: Список элементов массива, полностью полученных к этому моменту.
+        """
+        self._buffer += self._text_decoder.decode(chunk)
+        return self._parse(final=False)
+
+    def close(self) -> list[Any]:
+        """
+        Метод завершает разбор после получения всего тела ответа.
+
+        :return: Список оставшихся элементов массива.
+        :raises json.JSONDecodeError: Если документ оборван, не является ожидаемым JSON-массивом
+                                      или после него есть данные, кроме пробельных символов.
+        :raises ValueError: Если в JSON-объекте верхнего уровня нет ключа key.
+        """
+        self._buffer += self._text_decoder.decode(b'', final=True)
+        items = self._parse(final=True)
+
+        if self._state != 'end':
+            raise json.JSONDecodeError('Unexpected end of JSON array stream', self._buffer, len(self._buffer))
+
+        return items
+
+    def _parse(self, final: bool) -> list[Any]:
+        items = []
+
+        while True:
+            self._position = _WHITESPACE.match(self._buffer, self._position).end()
+            if self._position == len(self._buffer):
+                break
+
+            char = self._buffer[self._position]
+
+            if self._state == 'end':
+                raise json.JSONDecodeError('Extra data', self._buffer, self._position)
+
+            if self._state == 'start':
+                self._expect('[' if self.key is None else '{')
+                self._state = 'items' if self.key is None else 'keys'
+                self._expecting = 'first'
+
+            elif self._state == 'keys':
+                if self._expecting == 'separator' or char in ',}':
+                    if self._separate(char, closing='}', expecting='Expecting object key'):
+                        if not self._key_found:
+                            raise ValueError(f'Key "{self.key}" was not found in JSON object')
+                        self._state = 'end'
+                    continue
+
+                # Ключ и значение разбираются вместе, чтобы не хранить незавершённый ключ между частями
+                key_start = self._position
+                value_start = self._decode_key(final=final)
+                if value_start is None:
+                    break
+
+                key, _ = self._decoder.raw_decode(self._buffer, key_start)
+                self._position = value_start
+
+                if key == self.key and not self._key_found:
+                    self._expect('[')
+                    self._key_found = True
+                    self._state = 'items'
+                    self._expecting = 'first'
+                elif self._decode_value(final=final) is None:
+                    self._position = key_start
+                    break
+                else:
+                    self._expecting = 'separator'
+
+            elif self._state == 'items':
+                if self._expecting == 'separator' or char in ',]':
+                    if self._separate(char, closing=']', expecting='Expecting value'):
+                        # Остальные поля объекта пропускаются, но читаются до конца, чтобы проверить документ целиком
+                        self._state = 'end' if self.key is None else 'keys'
+                        self._expecting = 'separator'
+                    continue
+
+                item = self._decode_value(final=final)
+                if item is None:
+                    break
+
+                items.append(item[0])
+                self._expecting = 'separator'
+
+        if self._position > _COMPACT_THRESHOLD:
+            self._buffer = self._buffer[self._position:]
+            self._position = 0
+
+        return items
+
+    def _expect(self, char: str):
+        if self._buffer[self._position] != char:
+            raise json.JSONDecodeError(f'Expecting "{char}"', self._buffer, self._position)
+
+        self._position += 1
+
+    def _separate(self, char: str, closing: str, expecting: str) -> bool:
+        # Возвращает True, если контейнер закрыт, и False после запятой между элементами
+        if char == closing and self._expecting != 'value':
+            self._position += 1
+            return True
+
+        if char == ',' and self._expecting == 'separator':
+            self._position += 1
+            self._expecting = 'value'
+            return False
+
+        message = "Expecting ',' delimiter" if self._expecting == 'separator' else expecting
+        raise json.JSONDecodeError(message, self._buffer, self._position)
+
+    def _decode_key(self, final: bool) -> int | None:
+        match = _OBJECT_KEY.match(self._buffer, self._position)
+
+        if match is None or match.end() == len(self._buffer):
+            if final:
+                raise json.JSONDecodeError('Expecting object key', self._buffer, self._position)
+            return None
+
+        return match.end()
+
+    def _decode_value(self, final: bool) -> tuple[Any] | None:
+        # Повторная попытка разбора незавершённого элемента откладывается до удвоения буфера,
+        # поэтому элементы крупнее одной части разбираются за амортизированное линейное время
+        if not final and len(self._buffer) - self._position < self._retry_pending:
+            return None
+
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._position)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            self._retry_pending = 2 * (len(self._buffer) - self._position)
+            return None
+
+        # Число или литерал, за которым ещё не получен разделитель, может продолжиться в следующей части ("2." -> "2.5")
+        if not final and (end == len(self._buffer) or self._buffer[end] not in _DELIMITERS):
+            return None
+
+        self._position = end
+        self._retry_pending = 0
+        return (value, )
+
+
+def iter_json_array(chunks: Iterable[bytes], key: str | None = None) -> Iterator[Any]:
+    """
+    Функция разбирает JSON-массив из последовательности частей тела ответа.
+
+    :param chunks: Части тела ответа, например Response.iter_bytes().
+    :param key: Ключ массива внутри JSON-объекта верхнего уровня (см. JSONArrayStreamParser).
+    :return: Итератор элементов массива.
+    """
+    parser = JSONArrayStreamParser(key=key)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+
+    yield from parser.close()
+
+
+async def aiter_json_array(chunks: AsyncIterable[bytes], key: str | None = None) -> AsyncIterator[Any]:
+    """
+    Асинхронный вариант iter_json_array.
+
+    :param chunks: Части тела ответа, например Response.aiter_bytes().
+    :param key: Ключ массива внутри JSON-объекта верхнего уровня (см. JSONArrayStreamParser).
+    :return: Асинхронный итератор элементов массива.
+    """
+    parser = JSONArrayStreamParser(key=key)
+    async for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+
+    for item in parser.close():
+        yield item
\ No newline at end of file
@@ -0,0 +1,61 @@
+import argparse
+from pathlib import Path
+
+from clients.async_session import run_async
+from clients.private_http_builder import AuthenticationUserSchema
+from clients.transport import set_http_transport
+from config import settings
+from tools.emulator.server import get_emulator_transport
+from tools.load.runner import LoadProfile, LoadRunner, LoadReportSchema
+from tools.load.scenarios import get_default_operations
+from tools.logger import get_logger
+
+
+logger = get_logger('LOAD_RUNNER')
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='python -m tools.load',
+                                     description='Нагрузочный прогон Web API коммутатора через доменные клиенты')
+    parser.add_argument('--rps', type=float, required=True, help='Интенсивность операций в секунду')
+    parser.add_argument('--ramp-to', type=float, default=None,
+                        help='Интенсивность в конце прогона (линейное нарастание от --rps)')
+    parser.add_argument('--duration', type=float, default=60, help='Длительность прогона в секундах')
+    parser.add_argument('--max-in-flight', type=int, default=100,
+                        help='Максимум одновременно выполняемых операций, сверх него операции отбрасываются')
+    parser.add_argument('--write-ratio', type=float, default=0.2, help='Доля операций записи в смеси')
+    parser.add_argument('--seed', type=int, default=0, help='Зерно выбора операций из смеси')
+    parser.add_argument('--report', type=Path, default=Path('./load-report.json'), help='Путь к JSON-отчёту')
+    return parser.parse_args()
+
+
+async def run(args: argparse.Namespace) -> LoadReportSchema:
+    profile = LoadProfile(start_rps=args.rps,
+                          end_rps=args.ramp_to or args.rps,
+                          duration=args.duration,
+                          max_in_flight=args.max_in_flight,
+                          seed=args.seed)
+    operations = get_default_operations(user=AuthenticationUserSchema(), write_ratio=args.write_ratio)
+
+    return await LoadRunner(operations=operations, profile=profile).run()
+
+
+def print_report(report: LoadReportSchema):
+    header = f'{"operation":<30}{"sent":>8}{"dropped":>9}{"errors":>8}{"rps":>10}{"p50":>10}{"p90":>10}{"p99":>10}'
+    rows = [f'{row.name:<30}{row.sent:>8}{row.dropped:>9}{row.errors:>8}{row.achieved_rps:>10}'
+            f'{row.p50_ms!s:>10}{row.p90_ms!s:>10}{row.p99_ms!s:>10}'
+            for row in [*report.operations, report.total]]
+
+    print('\n'.join([header, *rows]))
+
+
+if __name__ == '__main__':
+    arguments = parse_args()
+    if settings.http_client.emulator:
+        set_http_transport(get_emulator_transport())
+
+    load_report = run_async(run(arguments))
+
+    print_report(load_report)
+    arguments.report.write_text(load_report.model_dump_json(indent=2), encoding='utf-8')
+    logger.info(f'Load report was saved to "{arguments.report}"')
\ No newline at end of file
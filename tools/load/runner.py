@@ -0,0 +1,245 @@
+import asyncio
+import math
+import random
+import time
+from typing import Awaitable, Callable
+
+from httpx import Response
+from pydantic import BaseModel, Field
+
+from clients.api_coverage import tracker
+from tools.logger import get_logger
+from tools.timings import percentile
+
+
+logger = get_logger('LOAD_RUNNER')
+
+# Границы корзин гистограммы задержек в миллисекундах (последняя корзина - всё, что больше 5000 мс)
+HISTOGRAM_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, math.inf)
+
+
+class LoadOperation:
+    def __init__(self,
+                 name: str,
+                 call: Callable[[], Awaitable[Response]],
+                 weight: float = 1,
+                 expected_status_codes: tuple[int, ...] = (200,)):
+        """
+        Операция нагрузочного прогона: один или несколько запросов через асинхронные доменные клиенты.
+
+        :param name: Название операции в отчёте.
+        :param call: Функция без аргументов, возвращающая корутину с итоговым ответом сервера.
+        :param weight: Относительный вес операции в смеси (вероятность выбора пропорциональна весу).
+        :param expected_status_codes: Статус-коды ответа, считающиеся успешными.
+        """
+        self.name = name
+        self.call = call
+        self.weight = weight
+        self.expected_status_codes = expected_status_codes
+
+
+class LoadProfile(BaseModel):
+    """
+    Профиль нагрузки: постоянная (start_rps == end_rps) или линейно нарастающая интенсивность запросов.
+    Attributes:
+        start_rps: float
+        end_rps: float
+        duration: float
+        max_in_flight: int
+        seed: int
+    """
+    start_rps: float    = Field(gt=0, description='Интенсивность в начале прогона, операций в секунду')
+    end_rps: float      = Field(gt=0, description='Интенсивность в конце прогона, операций в секунду')
+    duration: float     = Field(gt=0, description='Длительность прогона в секундах')
+    max_in_flight: int  = Field(default=100, gt=0, description='Максимум одновременно выполняемых операций')
+    seed: int           = Field(default=0, description='Зерно выбора операций из смеси')
+
+    def rate_at(self, elapsed: float) -> float:
+        return self.start_rps + (self.end_rps - self.start_rps) * min(elapsed / self.duration, 1)
+
+
+class OperationReportSchema(BaseModel):
+    """
+    Результаты одной операции (или интервала прогона) в отчёте нагрузочного прогона.
+    Attributes:
+        name: str
+        target_rps: float | None
+        sent: int
+        dropped: int
+        succeeded: int
+        errors: int
+        error_rate: float
+        achieved_rps: float
+        p50_ms / p90_ms / p99_ms / max_ms: float | None
+        histogram: dict[str, int]
+        error_types: dict[str, int]
+    """
+    name: str
+    target_rps: float | None = None
+    sent: int = 0
+    dropped: int = 0
+    succeeded: int = 0
+    errors: int = 0
+    error_rate: float = 0
+    achieved_rps: float = 0
+    p50_ms: float | None = None
+    p90_ms: float | None = None
+    p99_ms: float | None = None
+    max_ms: float | None = None
+    histogram: dict[str, int] = Field(default_factory=dict)
+    error_types: dict[str, int] = Field(default_factory=dict)
+
+
+class LoadReportSchema(BaseModel):
+    """
+    Отчёт нагрузочного прогона.
+    Attributes:
+        profile: LoadProfile
+        elapsed: float
+        total: OperationReportSchema - итог по всем операциям
+        operations: list[OperationReportSchema] - итог по каждой операции
+        timeline: list[OperationReportSchema] - итог по каждой секунде прогона
+    """
+    profile: LoadProfile
+    elapsed: float
+    total: OperationReportSchema
+    operations: list[OperationReportSchema]
+    timeline: list[OperationReportSchema]
+
+
+class _Sample:
+    __slots__ = ('operation', 'started', 'latency_ms', 'error')
+
+    def __init__(self, operation: str, started: float, latency_ms: float | None, error: str | None):
+        self.operation = operation
+        self.started = started
+        self.latency_ms = latency_ms
+        self.error = error
+
+
+class LoadRunner:
+    def __init__(self, operations: list[LoadOperation], profile: LoadProfile):
+        """
+        Генератор нагрузки с открытой моделью поступления запросов.
+        Операции запускаются по расписанию профиля независимо от времени ответа сервера,
+        поэтому деградация сервера видна как рост задержек, ошибок и отброшенных операций, а не как падение интенсивности.
+
+        :param operations: Смесь операций (см. tools/load/scenarios.py).
+        :param profile: Профиль нагрузки.
+        """
+        self.operations = operations
+        self.profile = profile
+        self._samples: list[_Sample] = []
+        self._in_flight: set[asyncio.Task] = set()
+
+    async def run(self) -> LoadReportSchema:
+        """
+        Метод выполняет нагрузочный прогон. Должен вызываться внутри event loop (например, через clients.async_session.run_async).
+        Запись покрытия Swagger-документации на время прогона отключается.
+
+        :return: Отчёт нагрузочного прогона.
+        """
+        rng = random.Random(self.profile.seed)
+        weights = [operation.weight for operation in self.operations]
+        started = time.perf_counter()
+        scheduled = 0.0
+
+        logger.info(f'Load run started: {self.profile.start_rps} -> {self.profile.end_rps} rps '
+                    f'for {self.profile.duration} s')
+
+        with tracker.disabled():
+            while scheduled < self.profile.duration:
+                delay = started + scheduled - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                operation = rng.choices(self.operations, weights=weights)[0]
+
+                if len(self._in_flight) >= self.profile.max_in_flight:
+                    self._samples.append(_Sample(operation=operation.name, started=scheduled,
+                                                 latency_ms=None, error='dropped'))
+                else:
+                    task = asyncio.create_task(self._execute(operation=operation, scheduled=scheduled))
+                    self._in_flight.add(task)
+                    task.add_done_callback(self._in_flight.discard)
+
+                scheduled += 1 / self.profile.rate_at(scheduled)
+
+            await asyncio.gather(*self._in_flight)
+
+        report = self._build_report(elapsed=time.perf_counter() - started)
+        logger.info(f'Load run finished: {report.total.succeeded} operations succeeded, '
+                    f'{report.total.achieved_rps} rps, error rate {report.total.error_rate}, '
+                    f'p99 {report.total.p99_ms} ms')
+        return report
+
+    async def _execute(self, operation: LoadOperation, scheduled: float):
+        error = None
+        started = time.perf_counter()
+
+        try:
+            response = await operation.call()
+            if response.status_code not in operation.expected_status_codes:
+                error = f'HTTP {response.status_code}'
+        except Exception as exception:
+            # Кроме сетевых ошибок httpx сюда попадают ошибки разбора ответа внутри операции (JSON, ValidationError):
+            # они считаются ошибкой операции, а не прерывают прогон
+            error = type(exception).__name__
+
+        latency_ms = (time.perf_counter() - started) * 1000
+        self._samples.append(_Sample(operation=operation.name, started=scheduled, latency_ms=latency_ms, error=error))
+
+    def _build_report(self, elapsed: float) -> LoadReportSchema:
+        by_operation: dict[str, list[_Sample]] = {operation.name: [] for operation in self.operations}
+        by_second: dict[int, list[_Sample]] = {second: [] for second in range(math.ceil(self.profile.duration))}
+
+        for sample in self._samples:
+            by_operation[sample.operation].append(sample)
+            by_second[int(sample.started)].append(sample)
+
+        return LoadReportSchema(
+            profile=self.profile,
+            elapsed=round(elapsed, 3),
+            total=_summarize(name='total', samples=self._samples, elapsed=elapsed),
+            operations=[_summarize(name=name, samples=samples, elapsed=elapsed)
+                        for name, samples in by_operation.items()],
+            timeline=[_summarize(name=f'{second}s', samples=samples, elapsed=1,
+                                 target_rps=round(self.profile.rate_at(second), 3))
+                      for second, samples in by_second.items()],
+        )
+
+
+def _summarize(name: str, samples: list[_Sample], elapsed: float, target_rps: float | None = None) \
+        -> OperationReportSchema:
+    completed = [sample for sample in samples if sample.latency_ms is not None]
+    errors = [sample for sample in completed if sample.error is not None]
+    latencies = sorted(sample.latency_ms for sample in completed)
+
+    histogram = {_bucket_name(bound): 0 for bound in HISTOGRAM_BOUNDS_MS}
+    for latency in latencies:
+        histogram[_bucket_name(next(bound for bound in HISTOGRAM_BOUNDS_MS if latency <= bound))] += 1
+
+    error_types: dict[str, int] = {}
+    for sample in errors:
+        error_types[sample.error] = error_types.get(sample.error, 0) + 1
+
+    return OperationReportSchema(
+        name=name,
+        target_rps=target_rps,
+        sent=len(completed),
+        dropped=len(samples) - len(completed),
+        succeeded=len(completed) - len(errors),
+        errors=len(errors),
+        error_rate=round(len(errors) / len(completed), 4) if completed else 0,
+        achieved_rps=round((len(completed) - len(errors)) / elapsed, 3) if elapsed else 0,
+        p50_ms=round(percentile(latencies, 50), 3) if latencies else None,
+        p90_ms=round(percentile(latencies, 90), 3) if latencies else None,
+        p99_ms=round(percentile(latencies, 99), 3) if latencies else None,
+        max_ms=round(latencies[-1], 3) if latencies else None,
+        histogram=histogram,
+        error_types=error_types,
+    )
+
+
+def _bucket_name(bound: float) -> str:
+    return f'<={bound}ms' if bound != math.inf else f'>{HISTOGRAM_BOUNDS_MS[-2]}ms'
\ No newline at end of file
@@ -0,0 +1,80 @@
+import itertools
+
+from httpx import Response
+
+from clients.custom_config.custom_config_client import get_async_custom_config_client
+from clients.filters.filters_client import get_async_filters_client
+from clients.nodes.nodes_client import get_async_nodes_client
+from clients.ports.ports_client import get_async_ports_client
+from clients.ports.ports_schema import UpdatePortStatusRequestSchema
+from clients.private_http_builder import AuthenticationUserSchema
+from clients.selections.selections_client import get_async_selections_client
+from clients.selections.selections_schema import CreateSelectionRequestSchema, DeleteSelectionRequestSchema
+from tools.load.runner import LoadOperation
+
+
+# Диапазон идентификаторов групп отбора, создаваемых нагрузкой, чтобы не пересекаться с тестовой конфигурацией
+LOAD_SELECTION_IDS = range(1000, 2000)
+
+
+def get_default_operations(user: AuthenticationUserSchema, write_ratio: float = 0.2) -> list[LoadOperation]:
+    """
+    Функция собирает смесь операций оператора Web-интерфейса на основе асинхронных доменных клиентов.
+    Операции чтения повторяют загрузку страниц, операции записи не оставляют после себя изменений на коммутаторе.
+    Должна вызываться внутри запущенного event loop.
+
+    :param user: Пользователь, от имени которого выполняется нагрузка.
+    :param write_ratio: Доля операций записи в смеси (от 0 до 1).
+    :return: Список операций для LoadRunner.
+    """
+    ports_client = get_async_ports_client(user=user)
+    filters_client = get_async_filters_client(user=user)
+    selections_client = get_async_selections_client(user=user)
+    nodes_client = get_async_nodes_client(user=user)
+    custom_config_client = get_async_custom_config_client(user=user)
+
+    selection_ids = itertools.cycle(LOAD_SELECTION_IDS)
+
+    async def create_and_delete_selection() -> Response:
+        selection_id = next(selection_ids)
+        create_request = CreateSelectionRequestSchema(ingress_id=f'ingress-{selection_id}',
+                                                      logic_id=f'selection-{selection_id}')
+        response = await selections_client.create_selection_api(request=create_request)
+        if response.is_error:
+            return response
+
+        delete_request = DeleteSelectionRequestSchema(ingress_group=f'ingress-{selection_id}')
+        return await selections_client.delete_selection_api(request=delete_request)
+
+    async def rewrite_port_status() -> Response:
+        # Состояние записывается тем же, что и было, поэтому линк порта не переобучается и состояние не меняется
+        response = await ports_client.get_ports_list_api()
+        if response.is_error or not response.json():
+            return response
+
+        port = response.json()[0]
+        request = UpdatePortStatusRequestSchema(port=port['port'], status=port['enable'])
+        return await ports_client.update_port_status_api(request=request)
+
+    read_operations = [
+        LoadOperation(name='get ports', call=ports_client.get_ports_list_api, weight=3),
+        LoadOperation(name='get all ports', call=ports_client.get_all_ports_list_api, weight=2),
+        LoadOperation(name='get filters', call=filters_client.get_filters_api, weight=2),
+        LoadOperation(name='get selections', call=selections_client.get_selections_list_api, weight=2),
+        LoadOperation(name='get nodes', call=nodes_client.get_nodes_list_api, weight=1),
+        LoadOperation(name='get switch info', call=custom_config_client.get_switch_info_api, weight=1),
+    ]
+    write_operations = [
+        LoadOperation(name='create and delete selection', call=create_and_delete_selection, weight=1),
+        LoadOperation(name='rewrite port status', call=rewrite_port_status, weight=1),
+    ]
+
+    read_weight = sum(operation.weight for operation in read_operations)
+    write_weight = sum(operation.weight for operation in write_operations)
+
+    for operation in read_operations:
+        operation.weight *= (1 - write_ratio) / read_weight
+    for operation in write_operations:
+        operation.weight *= write_ratio / write_weight
+
+    return [operation for operation in read_operations + write_operations if operation.weight > 0]
\ No newline at end of file
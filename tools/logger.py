@@ -1,17 +1,47 @@
+import atexit
 import logging
+import queue
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 
+from config import settings
 
-def get_logger(name: str) -> logging.Logger:
 
-    logger = logging.getLogger(name=name)
-    logger.setLevel(logging.DEBUG)
+@lru_cache(maxsize=None)
+def get_queue_handler() -> QueueHandler:
+    """
+    Функция возвращает общий на процесс QueueHandler.
+    Записи логов складываются в очередь, а форматирование и вывод в терминал выполняет QueueListener
+    в фоновом потоке, не задерживая тесты на операциях ввода-вывода.
 
-    handler = logging.StreamHandler()
-    handler.setLevel(logging.DEBUG)
+    :return: Объект QueueHandler, связанный с запущенным QueueListener.
+    """
+    log_queue = queue.SimpleQueue()
 
+    handler = logging.StreamHandler()
     formatter = logging.Formatter('%(asctime)s | %(name)s | %(levelname)s | %(message)s')
     handler.setFormatter(fmt=formatter)
 
-    logger.addHandler(hdlr=handler)
+    listener = QueueListener(log_queue, handler)
+    listener.start()
+    atexit.register(listener.stop)      # Дописываем оставшиеся в очереди записи при завершении процесса
+
+    return QueueHandler(log_queue)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Функция возвращает логгер с указанным именем.
+    Повторный вызов с тем же именем не добавляет новых обработчиков, поэтому каждая запись выводится один раз.
+
+    :param name: Имя логгера.
+    :return: Объект logging.Logger с уровнем логирования из настроек (settings.log_level).
+    """
+    logger = logging.getLogger(name=name)
+    logger.setLevel(settings.log_level)
+
+    queue_handler = get_queue_handler()
+    if queue_handler not in logger.handlers:
+        logger.addHandler(hdlr=queue_handler)
 
     return logger
\ No newline at end of file
@@ -0,0 +1,206 @@
+import asyncio
+import time
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from clients.egress_groups.egress_groups_client import AsyncEgressGroupsClient
+from clients.ingress_groups.ingress_groups_client import AsyncIngressGroupsClient
+from clients.nodes.nodes_client import AsyncNodesClient
+from clients.nodes.nodes_schema import CreateNodesRequestSchema
+from clients.selections.selections_client import AsyncSelectionsClient
+from tools.logger import get_logger
+
+
+logger = get_logger('NODES_DEPLOYMENT')
+
+# Поля группы отбора (/api/selections/), которые задаются нодой selection
+SELECTION_FIELDS = ('ingressId', 'ipProtocol', 'srcPort', 'dstPort', 'trafficType', 'matchPriority')
+
+
+class NodesTablesSchema(BaseModel):
+    """
+    Группы коммутатора, которые создаются применением конфигурации на Web.
+    Порты групп хранятся отсортированными: порядок портов в ответе коммутатора не проверяется.
+    Attributes:
+        ingress_groups: dict[int, list[str]] - id входной группы -> порты
+        selections: dict[int, dict[str, int]] - logicId группы отбора -> SELECTION_FIELDS
+        egress_groups: dict[int, dict[str, Any]] - groupId выходной группы -> ports и logicGroup
+    """
+    ingress_groups: dict[int, list[str]]        = Field(default_factory=dict)
+    selections: dict[int, dict[str, int]]       = Field(default_factory=dict)
+    egress_groups: dict[int, dict[str, Any]]    = Field(default_factory=dict)
+
+    def mismatches(self, other: 'NodesTablesSchema') -> list[str]:
+        return [table for table in type(self).model_fields if getattr(self, table) != getattr(other, table)]
+
+
+class NodesDeploymentSchema(BaseModel):
+    """
+    Результат сохранения, применения и проверки конфигурации на Web.
+    Attributes:
+        save_ms: float - сохранение графа в базу данных (POST /api/nodes/)
+        apply_ms: float - применение графа на коммутаторе (OPTIONS /api/nodes/)
+        verify_ms: float - время до совпадения групп коммутатора с графом (или до истечения ожидания)
+        polls: int - количество опросов групп
+        matched: bool - группы коммутатора совпали с графом
+        mismatches: list[str] - таблицы, не совпавшие при последнем опросе
+    """
+    save_ms: float
+    apply_ms: float
+    verify_ms: float
+    polls: int
+    matched: bool
+    mismatches: list[str]   = Field(default_factory=list)
+
+    @property
+    def total_ms(self) -> float:
+        return round(self.save_ms + self.apply_ms + self.verify_ms, 3)
+
+
+def node_entity_id(value: Any) -> int | None:
+    """
+    Функция извлекает числовой идентификатор из ссылки на ноду: "selection-1", ["selection-1"] или 1.
+
+    :param value: Ссылка на ноду из данных другой ноды.
+    :return: Числовой идентификатор или None, если ссылка не задана.
+    """
+    if isinstance(value, list):
+        return node_entity_id(value[0]) if value else None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.rsplit('-', maxsplit=1)[-1].isdigit():
+        return int(value.rsplit('-', maxsplit=1)[-1])
+
+    return None
+
+
+def node_ports(data: dict) -> list[str]:
+    return sorted(item['port'] if isinstance(item, dict) else item for item in data.get('ports') or [])
+
+
+def expected_tables(request: CreateNodesRequestSchema) -> NodesTablesSchema:
+    """
+    Функция вычисляет группы коммутатора, которые должны получиться после применения графа.
+
+    :param request: Граф конфигурации на Web.
+    :return: Ожидаемые входные группы, группы отбора и выходные группы.
+    """
+    tables = NodesTablesSchema()
+
+    for node in request.model_dump(by_alias=True)['nodes']:
+        node_id, data = node_entity_id(node['id']), node.get('data') or {}
+
+        match node['type']:
+            case 'ingress':
+                tables.ingress_groups[node_id] = node_ports(data)
+            case 'selection':
+                selection_filter = data.get('filter') or {}
+                tables.selections[node_id] = {'ingressId': node_entity_id(data.get('ingressGroup')) or 0,
+                                              'ipProtocol': selection_filter.get('ipProtocol') or 0,
+                                              'srcPort': selection_filter.get('srcPort') or 0,
+                                              'dstPort': selection_filter.get('dstPort') or 0,
+                                              'trafficType': selection_filter.get('trafficType') or 0,
+                                              'matchPriority': data.get('matchPriority') or 0}
+            case 'egress':
+                tables.egress_groups[node_id] = {'ports': node_ports(data),
+                                                 'logicGroup': node_entity_id(data.get('logicGroup'))}
+
+    return tables
+
+
+class NodesDeployment:
+    def __init__(self,
+                 nodes_client: AsyncNodesClient,
+                 ingress_groups_client: AsyncIngressGroupsClient,
+                 selections_client: AsyncSelectionsClient,
+                 egress_groups_client: AsyncEgressGroupsClient,
+                 poll_min: float = 0.01,
+                 poll_max: float = 0.5,
+                 timeout: float = 30.0):
+        """
+        Развёртывание конфигурации на Web: сохранение графа, применение и ожидание, пока входные группы,
+        группы отбора и выходные группы коммутатора совпадут с графом. Время каждого этапа замеряется отдельно,
+        чтобы отличать медленное сохранение в базу данных от медленного программирования коммутатора.
+        Три таблицы групп на каждом опросе запрашиваются одновременно; интервал опроса растёт от poll_min
+        в 2 раза после каждого несовпадения до poll_max.
+
+        :param nodes_client: Асинхронный клиент для работы с /api/nodes/.
+        :param ingress_groups_client: Асинхронный клиент для работы с /api/ingress_groups/.
+        :param selections_client: Асинхронный клиент для работы с /api/selections/.
+        :param egress_groups_client: Асинхронный клиент для работы с /api/egress_groups/.
+        :param poll_min: Начальный интервал опроса групп в секундах.
+        :param poll_max: Максимальный интервал опроса групп в секундах.
+        :param timeout: Время ожидания совпадения групп в секундах.
+        """
+        self.nodes_client = nodes_client
+        self.ingress_groups_client = ingress_groups_client
+        self.selections_client = selections_client
+        self.egress_groups_client = egress_groups_client
+        self.poll_min = poll_min
+        self.poll_max = poll_max
+        self.timeout = timeout
+
+    async def deploy(self, request: CreateNodesRequestSchema) -> NodesDeploymentSchema:
+        """
+        Метод сохраняет и применяет граф, затем ожидает совпадения групп коммутатора с графом.
+
+        :param request: Граф конфигурации на Web.
+        :return: Время этапов и результат проверки групп.
+        :raises HTTPError: Если коммутатор вернул ошибку на сохранение, применение или чтение групп.
+        """
+        expected = expected_tables(request)
+
+        started = time.perf_counter()
+        response = await self.nodes_client.create_nodes_api(request=request)
+        response.raise_for_status()
+        saved = time.perf_counter()
+
+        response = await self.nodes_client.apply_nodes_api()
+        response.raise_for_status()
+        applied = time.perf_counter()
+
+        deadline = applied + self.timeout
+        interval, polls = self.poll_min, 0
+        while True:
+            mismatches = expected.mismatches(await self.read_tables())
+            polls += 1
+            if not mismatches or time.perf_counter() >= deadline:
+                break
+
+            await asyncio.sleep(min(interval, max(0.0, deadline - time.perf_counter())))
+            interval = min(interval * 2, self.poll_max)
+
+        result = NodesDeploymentSchema(save_ms=round((saved - started) * 1000, 3),
+                                       apply_ms=round((applied - saved) * 1000, 3),
+                                       verify_ms=round((time.perf_counter() - applied) * 1000, 3),
+                                       polls=polls,
+                                       matched=not mismatches,
+                                       mismatches=mismatches)
+
+        if mismatches:
+            logger.warning(f'Nodes config was not applied in {self.timeout} s, mismatched tables: {mismatches}')
+        logger.info(f'Nodes deployment: save {result.save_ms} ms, apply {result.apply_ms} ms, '
+                    f'verify {result.verify_ms} ms ({polls} polls)')
+        return result
+
+    async def read_tables(self) -> NodesTablesSchema:
+        """
+        Метод одновременно запрашивает входные группы, группы отбора и выходные группы коммутатора.
+
+        :return: Текущие группы коммутатора.
+        :raises HTTPError: Если коммутатор вернул ошибку.
+        """
+        responses = await asyncio.gather(self.ingress_groups_client.get_ingress_group_list_api(),
+                                         self.selections_client.get_selections_list_api(),
+                                         self.egress_groups_client.get_egress_group_list_api())
+        for response in responses:
+            response.raise_for_status()
+
+        ingress_groups, selections, egress_groups = (response.json() for response in responses)
+        return NodesTablesSchema(
+            ingress_groups={group['id']: sorted(group['ports']) for group in ingress_groups},
+            selections={selection['logicId']: {field: selection[field] for field in SELECTION_FIELDS}
+                        for selection in selections},
+            egress_groups={group['groupId']: {'ports': sorted(group['ports']), 'logicGroup': group['logicGroup']}
+                           for group in egress_groups})
\ No newline at end of file
@@ -0,0 +1,160 @@
+import asyncio
+import time
+from enum import Enum
+from typing import Awaitable, Callable, Iterable
+
+from httpx import Response
+from pydantic import BaseModel, Field
+
+from clients.ports.ports_client import AsyncPortsClient
+from clients.ports.ports_schema import CreatePortRequestSchema, UpdatedPortSchema, UpdatePortStatusRequestSchema, \
+    DeletePortsRequestSchema
+from tools.logger import get_logger
+
+
+logger = get_logger('PORT_PROVISIONING')
+
+
+class PortOperation(str, Enum):
+    CREATE = 'create'
+    UPDATE = 'update'
+    STATUS = 'status'
+    DELETE = 'delete'
+
+
+class PortOperationResultSchema(BaseModel):
+    """
+    Результат операции над одним портом при параллельной настройке портов.
+    Attributes:
+        port: str
+        operation: PortOperation
+        status_code: int | None - статус-код ответа (None - ответ не получен)
+        error: str | None - текст ошибки сервера или исключения, возникшего при выполнении запроса
+        started_ms: float - начало запроса от начала всей операции
+        duration_ms: float - время выполнения запроса
+    """
+    port: str
+    operation: PortOperation
+    status_code: int | None
+    error: str | None   = Field(default=None)
+    started_ms: float
+    duration_ms: float
+
+    @property
+    def is_success(self) -> bool:
+        return self.error is None
+
+
+def port_connector(port: str) -> int:
+    return int(port.split('/')[0])
+
+
+def port_channel(port: str) -> int:
+    return int(port.split('/')[1])
+
+
+class PortProvisioner:
+    def __init__(self, ports_client: AsyncPortsClient, concurrency: int = 8):
+        """
+        Параллельная настройка произвольного набора портов из POSSIBLE_PORTS.
+        Порты одного разъёма (например, "5/0".."5/3") делят линии модуля, поэтому настраиваются последовательно:
+        создание и включение - от канала 0 к каналу 3, удаление и отключение - в обратном порядке.
+        Разные разъёмы настраиваются одновременно, всего выполняется не более concurrency запросов.
+
+        :param ports_client: Асинхронный клиент для работы с /api/ports/ и /api/port_status/.
+        :param concurrency: Максимальное количество одновременно выполняемых запросов.
+        """
+        self.ports_client = ports_client
+        self.concurrency = concurrency
+
+    async def create(self, requests: Iterable[CreatePortRequestSchema]) -> list[PortOperationResultSchema]:
+        """
+        Метод конфигурирует порты.
+
+        :param requests: Запросы на создание портов.
+        :return: Результаты по каждому порту в порядке запросов.
+        """
+        return await self._run(operation=PortOperation.CREATE,
+                               calls={request.port: lambda request=request: self.ports_client.create_ports_api(request)
+                                      for request in requests})
+
+    async def update(self, requests: Iterable[UpdatedPortSchema]) -> list[PortOperationResultSchema]:
+        """
+        Метод изменяет настройки портов (по одному порту в запросе).
+
+        :param requests: Запросы на изменение портов.
+        :return: Результаты по каждому порту в порядке запросов.
+        """
+        return await self._run(operation=PortOperation.UPDATE,
+                               calls={request.port: lambda request=request: self.ports_client.update_ports_api(request)
+                                      for request in requests})
+
+    async def set_status(self, ports: Iterable[str], status: bool) -> list[PortOperationResultSchema]:
+        """
+        Метод включает или отключает порты через /api/port_status/.
+
+        :param ports: Порты (например, ["2/0", "2/1"]).
+        :param status: True - включить, False - отключить.
+        :return: Результаты по каждому порту в порядке запросов.
+        """
+        return await self._run(operation=PortOperation.STATUS,
+                               calls={port: lambda port=port: self.ports_client.update_port_status_api(
+                                   UpdatePortStatusRequestSchema(port=port, status=status)) for port in ports},
+                               reverse=not status)
+
+    async def delete(self, ports: Iterable[str]) -> list[PortOperationResultSchema]:
+        """
+        Метод удаляет сконфигурированные порты (по одному порту в запросе, чтобы получить время каждого порта).
+
+        :param ports: Порты (например, ["2/0", "2/1"]).
+        :return: Результаты по каждому порту в порядке запросов.
+        """
+        return await self._run(operation=PortOperation.DELETE,
+                               calls={port: lambda port=port: self.ports_client.delete_ports_api(
+                                   DeletePortsRequestSchema([port])) for port in ports},
+                               reverse=True)
+
+    async def _run(self,
+                   operation: PortOperation,
+                   calls: dict[str, Callable[[], Awaitable[Response]]],
+                   reverse: bool = False) -> list[PortOperationResultSchema]:
+        connectors: dict[int, list[str]] = {}
+        for port in calls:
+            connectors.setdefault(port_connector(port), []).append(port)
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        results: dict[str, PortOperationResultSchema] = {}
+        started = time.perf_counter()
+
+        async def run_connector(ports: list[str]):
+            for port in sorted(ports, key=port_channel, reverse=reverse):
+                async with semaphore:
+                    results[port] = await self._call(operation=operation, port=port, call=calls[port],
+                                                     started=started)
+
+        await asyncio.gather(*(run_connector(ports) for ports in connectors.values()))
+
+        failed = sum(not result.is_success for result in results.values())
+        logger.info(f'Port {operation.value}: {len(results)} ports on {len(connectors)} connectors '
+                    f'in {(time.perf_counter() - started) * 1000:.1f} ms, {failed} failed')
+        return [results[port] for port in calls]
+
+    @staticmethod
+    async def _call(operation: PortOperation,
+                    port: str,
+                    call: Callable[[], Awaitable[Response]],
+                    started: float) -> PortOperationResultSchema:
+        request_started = time.perf_counter()
+        try:
+            response = await call()
+            status_code, error = response.status_code, response.text if response.is_error else None
+        except Exception as exception:
+            status_code, error = None, f'{type(exception).__name__}: {exception}'
+
+        finished = time.perf_counter()
+        return PortOperationResultSchema(port=port,
+                                         operation=operation,
+                                         status_code=status_code,
+                                         error=error,
+                                         started_ms=round((request_started - started) * 1000, 3),
+                                         duration_ms=round((finished - request_started) * 1000, 3))
\ No newline at end of file
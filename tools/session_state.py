@@ -0,0 +1,230 @@
+import ctypes
+import hashlib
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from httpx import HTTPError
+
+from clients.custom_config.custom_config_client import CustomConfigClient
+from clients.custom_config.custom_config_schema import UploadCustomConfigRequestSchema
+from config import settings
+from tools.config_diff import config_fingerprint, upload_custom_config_if_changed
+from tools.logger import get_logger
+from tools.timings import get_run_id, get_worker_id
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
+
+logger = get_logger('SESSION_STATE')
+
+LOCK_FILE = 'session.lock'
+CONFIG_MARKER_FILE = 'custom-config.json'
+
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+STILL_ACTIVE = 259
+
+
+@contextmanager
+def session_lock() -> Iterator[None]:
+    """
+    Межпроцессная блокировка подготовки коммутатора к прогону.
+    Воркеры pytest-xdist ждут, пока конфигурацию загружает или возвращает другой воркер.
+    """
+    with open(settings.session_state_dir.joinpath(LOCK_FILE), 'a+b') as file:
+        if os.name == 'nt':
+            file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)     # LK_LOCK сам повторяет попытки 10 секунд
+                    break
+                except OSError:
+                    continue
+        else:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+
+        try:
+            yield
+        finally:
+            if os.name == 'nt':
+                file.seek(0)
+                msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+
+def acquire_custom_config(custom_config_client: CustomConfigClient, request: UploadCustomConfigRequestSchema) -> bool:
+    """
+    Функция регистрирует воркер в прогоне и загружает тестовую конфигурацию, если коммутатор её ещё не содержит.
+    Конфигурацию проверяет первый воркер прогона: скачивает её с коммутатора один раз и сравнивает отпечаток
+    с маркером прошлой загрузки (хеш файла и отпечаток конфигурации коммутатора), а при несовпадении - по таблицам.
+    Хеш подготовленной конфигурации записывается в состояние прогона, поэтому остальные воркеры
+    ничего не скачивают.
+
+    :param custom_config_client: Клиент для работы с /api/custom_config/.
+    :param request: Запрос на загрузку тестовой конфигурации.
+    :return: True, если конфигурация была загружена.
+    """
+    with open(request.config, 'rb') as file:
+        config_hash = hashlib.file_digest(file, 'sha256').hexdigest()
+
+    expected_marker = {'switch': settings.http_client.client_url, 'configHash': config_hash}
+
+    with session_lock():
+        run_state = _read_run_state()
+        run_state['workers'][get_worker_id()] = os.getpid()
+        _write_json(_run_state_path(), run_state)
+
+        if run_state.get('configHash') == config_hash:
+            logger.info(f'Custom config "{request.config.name}" was prepared by another worker, upload skipped')
+            return False
+
+        current = _download_custom_config(custom_config_client)
+        fingerprint = _fingerprint(current) if current is not None else None
+        marker = _read_json(settings.session_state_dir.joinpath(CONFIG_MARKER_FILE))
+
+        if fingerprint and marker == {**expected_marker, 'switchFingerprint': fingerprint}:
+            logger.info(f'Custom config "{request.config.name}" is already on switch (marker matched), upload skipped')
+            uploaded = False
+        else:
+            diff = upload_custom_config_if_changed(custom_config_client=custom_config_client,
+                                                   request=request,
+                                                   current=current)
+            # После загрузки отпечаток считается по файлу, а не по повторно скачанной конфигурации.
+            # Если коммутатор хранит конфигурацию иначе, следующий прогон не найдёт различий и обновит маркер
+            uploaded = not diff.is_empty
+            if uploaded or not fingerprint:
+                fingerprint = _fingerprint(request.config.read_bytes())
+            _write_json(settings.session_state_dir.joinpath(CONFIG_MARKER_FILE),
+                        {**expected_marker, 'switchFingerprint': fingerprint})
+
+        run_state['configHash'] = config_hash
+        _write_json(_run_state_path(), run_state)
+        return uploaded
+
+
+def release_custom_config(custom_config_client: CustomConfigClient) -> bool:
+    """
+    Функция снимает регистрацию воркера в прогоне.
+    Последний завершившийся воркер возвращает конфигурацию по умолчанию (если не задан settings.keep_session_config),
+    поэтому остальные воркеры не теряют тестовую конфигурацию посреди своих тестов.
+    Воркеры, процессы которых уже завершились (например, упали), считаются снявшими регистрацию.
+
+    :param custom_config_client: Клиент для работы с /api/custom_config/.
+    :return: True, если была возвращена конфигурация по умолчанию.
+    """
+    with session_lock():
+        run_state = _read_run_state()
+        run_state['workers'].pop(get_worker_id(), None)
+
+        if _alive_workers(run_state):
+            _write_json(_run_state_path(), run_state)
+            return False
+
+        return _return_default_config(custom_config_client)
+
+
+def finish_custom_config_session(custom_config_client: CustomConfigClient) -> bool:
+    """
+    Функция возвращает конфигурацию по умолчанию, если её не вернул ни один воркер прогона
+    (например, последний воркер упал и не выполнил завершение сессии).
+    Вызывается в главном процессе pytest после завершения всех воркеров.
+
+    :param custom_config_client: Клиент для работы с /api/custom_config/.
+    :return: True, если была возвращена конфигурация по умолчанию.
+    """
+    with session_lock():
+        if not _run_state_path().exists():
+            return False
+
+        if workers := _alive_workers(_read_run_state()):
+            logger.warning(f'Workers {sorted(workers)} are still running, default config was not returned')
+            return False
+
+        return _return_default_config(custom_config_client)
+
+
+def _return_default_config(custom_config_client: CustomConfigClient) -> bool:
+    _run_state_path().unlink(missing_ok=True)
+    if settings.keep_session_config:
+        return False
+
+    settings.session_state_dir.joinpath(CONFIG_MARKER_FILE).unlink(missing_ok=True)
+    custom_config_client.return_default_config()
+    return True
+
+
+def _download_custom_config(custom_config_client: CustomConfigClient) -> bytes | None:
+    try:
+        response = custom_config_client.download_custom_config_api()
+        response.raise_for_status()
+        return response.content
+    except HTTPError as error:
+        logger.warning(f'Current custom config could not be downloaded: {error}')
+        return None
+
+
+def _fingerprint(content: bytes) -> str | None:
+    try:
+        return config_fingerprint(json.loads(content))
+    except ValueError as error:
+        logger.warning(f'Custom config could not be parsed: {error}')
+        return None
+
+
+def _run_state_path() -> Path:
+    return settings.session_state_dir.joinpath(f'{get_run_id()}.json')
+
+
+def _read_run_state() -> dict:
+    run_state = _read_json(_run_state_path())
+    return run_state if isinstance(run_state, dict) else {'workers': {}}
+
+
+def _alive_workers(run_state: dict) -> dict[str, int]:
+    workers = run_state['workers']
+    alive = {worker: pid for worker, pid in workers.items() if _is_process_alive(pid)}
+
+    if stale := workers.keys() - alive.keys():
+        logger.warning(f'Workers {sorted(stale)} exited without releasing custom config')
+
+    run_state['workers'] = alive
+    return alive
+
+
+def _is_process_alive(pid: int) -> bool:
+    if os.name == 'nt':
+        # os.kill на Windows завершает процесс, поэтому состояние проверяется через WinAPI
+        handle = ctypes.windll.kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return False
+
+        exit_code = ctypes.c_ulong()
+        ctypes.windll.kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code))
+        ctypes.windll.kernel32.CloseHandle(handle)
+        return exit_code.value == STILL_ACTIVE
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+
+    return True
+
+
+def _read_json(path: Path) -> dict | list | None:
+    try:
+        return json.loads(path.read_text(encoding='utf-8'))
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def _write_json(path: Path, content: dict | list):
+    path.write_text(json.dumps(content, indent=2), encoding='utf-8')
\ No newline at end of file
@@ -0,0 +1,34 @@
+import argparse
+import sys
+from pathlib import Path
+
+from tools.switch_config.generator import ConfigScaleSchema, iter_generated_config, write_generated_config
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='python -m tools.switch_config',
+                                     description='Генерация синтетической конфигурации коммутатора заданного размера')
+    parser.add_argument('--ports', type=int, default=16, help='Количество портов из POSSIBLE_PORTS')
+    parser.add_argument('--groups', type=int, default=4, help='Количество пар входных и выходных групп')
+    parser.add_argument('--filters', type=int, default=1000, help='Количество записей таблицы ternary_filters')
+    parser.add_argument('--mirror-sessions', type=int, default=2, help='Количество сессий зеркалирования')
+    parser.add_argument('--psf-rules', type=int, default=2, help='Количество правил спецформата')
+    parser.add_argument('--seed', type=int, default=0, help='Зерно генератора')
+    parser.add_argument('--output', type=Path, default=None, help='Путь к файлу (по умолчанию - stdout)')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    arguments = parse_args()
+    config_scale = ConfigScaleSchema(ports=arguments.ports,
+                                     groups=arguments.groups,
+                                     filters=arguments.filters,
+                                     mirror_sessions=arguments.mirror_sessions,
+                                     psf_rules=arguments.psf_rules,
+                                     seed=arguments.seed)
+
+    if arguments.output is not None:
+        write_generated_config(path=arguments.output, scale=config_scale)
+    else:
+        for chunk in iter_generated_config(scale=config_scale):
+            sys.stdout.buffer.write(chunk)
\ No newline at end of file
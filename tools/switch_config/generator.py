@@ -0,0 +1,376 @@
+import json
+import random
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Self
+
+from pydantic import BaseModel, Field, model_validator
+
+from clients.ports.ports_schema import POSSIBLE_PORTS
+from tools.logger import get_logger
+from tools.switch_config.reader import UPLOAD_CHUNK_SIZE
+
+
+logger = get_logger('CONFIG_GENERATOR')
+
+FIRST_MIRROR_SESSION_ID = 501
+METER_PORTS = 128
+FILTER_ACTIONS = ('SwitchIngress.pass', 'SwitchIngress.miss')
+IP_PROTOCOLS = (0, 6, 17)
+
+# Поля записей, одинаковые во всех строках таблицы (см. testdata/files/test_conf.json)
+ENTRY_DATA = {'is_default_entry': False}
+COUNTERS = {'$COUNTER_SPEC_BYTES': 0, '$COUNTER_SPEC_PKTS': 0}
+ANY = {'value': 0, 'mask': 0}
+PORT_DATA = {
+    '$AUTO_NEGOTIATION': 'PM_AN_DEFAULT', '$CUT_THROUGH_EN': False, '$FEC': 'BF_FEC_TYP_NONE',
+    '$IS_INTERNAL': False, '$IS_VALID': True, '$LOOPBACK_MODE': 'BF_LPBK_NONE',
+    '$MEDIA_TYPE': 'BF_MEDIA_TYPE_UNKNOWN', '$N_LANES': 1, '$PLL_OVRCLK': 0.0, '$PORT_DIR': 'PM_PORT_DIR_DEFAULT',
+    '$PORT_ENABLE': True, '$PORT_UP': True, '$RX_MTU': 10240, '$RX_PAUSE_FRAME_EN': False, '$RX_PFC_EN_MAP': 0,
+    '$RX_PRSR_PRI_THRESH': 0, '$SDS_TX_ATTN': 2, '$SDS_TX_POST': 201326592, '$SDS_TX_POST2': 0,
+    '$SDS_TX_PRE': 67108864, '$SDS_TX_PRE2': 0, '$SPEED': 'BF_SPEED_10G', '$TIMESTAMP_1588_DELTA_RX': 0,
+    '$TIMESTAMP_1588_DELTA_TX': 0, '$TIMESTAMP_1588_ID': 0, '$TIMESTAMP_1588_VALID': False,
+    '$TIMESTAMP_1588_VALUE': 0, '$TX_MTU': 10240, '$TX_PAUSE_FRAME_EN': False, '$TX_PFC_EN_MAP': 0,
+    'action_name': None, **ENTRY_DATA,
+}
+METER_DATA = {
+    '$METER_SPEC_CBS_KBITS': 4380866642, '$METER_SPEC_CIR_KBPS': 4372480132,
+    '$METER_SPEC_PBS_KBITS': 4380866642, '$METER_SPEC_PIR_KBPS': 4372480132,
+    'action_name': None, **ENTRY_DATA,
+}
+MIRROR_CFG_DATA = {
+    '$copy_to_cpu': False, '$direction': 'INGRESS', '$egress_port_queue': 0, '$icos_for_copy_to_cpu': 0,
+    '$ingress_cos': 0, '$level1_mcast_hash': 0, '$level2_mcast_hash': 0, '$max_pkt_len': 16384,
+    '$mcast_grp_a_valid': True, '$mcast_grp_b': 0, '$mcast_grp_b_valid': False, '$mcast_l1_xid': 0,
+    '$mcast_l2_xid': 0, '$packet_color': 'GREEN', '$session_enable': True, '$ucast_egress_port': 0,
+    '$ucast_egress_port_valid': False,
+}
+EMPTY_TABLES = ('black_dst_filters', 'black_src_filters', 'forward_stat', 'meter_byte_count', 'mirror_d',
+                'mirror_fwd', 'mod_dst_mac', 'ping_d16', 'white_dst_filters', 'white_src_filters')
+
+
+class ConfigScaleSchema(BaseModel):
+    """
+    Размер синтетической конфигурации коммутатора.
+    Attributes:
+        ports: int
+        groups: int
+        filters: int
+        mirror_sessions: int
+        psf_rules: int
+        seed: int
+    """
+    ports: int              = Field(default=16, ge=2, le=len(POSSIBLE_PORTS), description='Порты из POSSIBLE_PORTS')
+    groups: int             = Field(default=4, ge=1, description='Пары входных и выходных групп')
+    filters: int            = Field(default=1000, ge=0, description='Записи таблицы ternary_filters')
+    mirror_sessions: int    = Field(default=2, ge=0, description='Сессии зеркалирования')
+    psf_rules: int          = Field(default=2, ge=0, description='Правила спецформата (PSF)')
+    seed: int               = Field(default=0, description='Зерно генератора')
+
+    @model_validator(mode='after')
+    def check_ports(self) -> Self:
+        if self.ports < 2 * self.groups:
+            raise ValueError(f'{self.ports} ports are not enough for {self.groups} ingress and egress groups')
+        if self.psf_rules > self.ports:
+            raise ValueError(f'{self.psf_rules} PSF rules require at least as many ports, got {self.ports}')
+        return self
+
+
+def get_dev_port(port: str) -> int:
+    """
+    Функция возвращает номер порта Tofino ($DEV_PORT) для порта коммутатора.
+    Нумерация совпадает с тестовой конфигурацией: "33/0" -> 64, "33/2" -> 66;
+    порты 1-16 и 17-32 относятся к конвейерам 0 и 1.
+
+    :param port: Порт коммутатора (например, "12/3").
+    :return: Номер порта Tofino.
+    """
+    connector, channel = (int(part) for part in port.split('/'))
+    if connector == 33:
+        return 64 + channel
+
+    pipe, index = divmod(connector - 1, 16)
+    return pipe * 128 + index * 4 + channel
+
+
+class _ConfigLayout:
+    def __init__(self, scale: ConfigScaleSchema):
+        """
+        Распределение портов конфигурации по группам, сессиям зеркалирования и правилам спецформата.
+        Вычисляется целиком до генерации таблиц; случайные записи ternary_filters создаются по мере записи файла.
+
+        :param scale: Размер конфигурации.
+        """
+        self.scale = scale
+        self.rng = random.Random(scale.seed)
+
+        ports = sorted(self.rng.sample(POSSIBLE_PORTS, scale.ports), key=POSSIBLE_PORTS.index)
+        self.ports = ports
+        self.ingress_ports = {group: ports[(group - 1) * 2::scale.groups * 2] for group in self.group_ids}
+        self.egress_ports = {group: ports[(group - 1) * 2 + 1::scale.groups * 2] for group in self.group_ids}
+
+        self.mirror_sessions = [(session, (session - 1) % scale.groups + 1, self.rng.choice(ports))
+                                for session in range(1, scale.mirror_sessions + 1)]
+        # dMAC спецформата один на коммутатор (/api/psf_dmac/), поэтому он общий для всех правил
+        self.psf_dmac = self.rng.getrandbits(48) if scale.psf_rules else None
+        self.psf_rules = [(port, self.rng.randint(1, 4095), self.rng.randint(1, 4095))
+                          for port in self.rng.sample(ports, scale.psf_rules)]
+
+    @property
+    def group_ids(self) -> range:
+        return range(1, self.scale.groups + 1)
+
+
+def iter_generated_config(scale: ConfigScaleSchema, chunk_size: int = UPLOAD_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Функция генерирует валидную конфигурацию коммутатора заданного размера и отдаёт её частями,
+    не собирая файл в памяти. Результат зависит только от scale: одно и то же зерно даёт побайтно одинаковый файл.
+    Части можно сразу передавать в upload_custom_config_stream_api или записывать в файл.
+
+    :param scale: Размер конфигурации.
+    :param chunk_size: Примерный размер части в байтах.
+    :return: Итератор частей JSON-файла конфигурации.
+    """
+    layout = _ConfigLayout(scale=scale)
+    tables = {
+        'action_selector': _action_selector(layout),
+        'decomposition': _decomposition(layout),
+        'form_d16': _form_d16(layout),
+        'forward': _forward(layout),
+        'hash_sel': _hash_sel(layout),
+        'input_groups': _input_groups(layout),
+        'meter_port': _meter_port(),
+        'mgids': _mgids(layout),
+        'mirror': _mirror(layout),
+        'mirror_cfg': _mirror_cfg(layout),
+        'nodes': _multicast_nodes(layout),
+        'ports': _ports(layout),
+        'set_attributes': _set_attributes(layout),
+        'ternary_filters': _ternary_filters(layout),
+        'unknown_ports': _unknown_ports(layout),
+        **{name: [] for name in EMPTY_TABLES},
+    }
+    nodes, edges = _nodes_graph(layout)
+
+    sections = {
+        'config': dict(sorted(tables.items())),
+        'names': {},
+        'actions': {port: 0 for port in layout.ports},
+        'nodes': nodes,
+        'edges': edges,
+        'position': [0, 0],
+        'viewport': {'x': 0, 'y': 0, 'zoom': 1},
+        'zoom': 1,
+        'psf_dmac': {} if layout.psf_dmac is None else {'dmac': f'{layout.psf_dmac:012x}'},
+    }
+
+    buffer, size = [], 0
+    for fragment in _json_object(sections.items()):
+        buffer.append(fragment)
+        size += len(fragment)
+        if size >= chunk_size:
+            yield ''.join(buffer).encode()
+            buffer, size = [], 0
+
+    if buffer:
+        yield ''.join(buffer).encode()
+
+
+def write_generated_config(path: Path, scale: ConfigScaleSchema) -> int:
+    """
+    Функция записывает синтетическую конфигурацию в файл.
+
+    :param path: Путь к файлу конфигурации.
+    :param scale: Размер конфигурации.
+    :return: Размер файла в байтах.
+    """
+    size = 0
+    with open(path, 'wb') as file:
+        for chunk in iter_generated_config(scale=scale):
+            size += file.write(chunk)
+
+    logger.info(f'Generated config "{path}" ({scale}): {size} bytes')
+    return size
+
+
+def _json_object(items: Iterable[tuple[str, Any]]) -> Iterator[str]:
+    yield '{'
+    for position, (key, value) in enumerate(items):
+        yield f'{", " if position else ""}{json.dumps(key)}: '
+        yield from _json_value(value)
+    yield '}'
+
+
+def _json_value(value: Any) -> Iterator[str]:
+    if isinstance(value, Iterator):          # Генераторы записей таблиц пишутся построчно
+        yield '['
+        for position, row in enumerate(value):
+            yield f'{", " if position else ""}{json.dumps(row)}'
+        yield ']'
+    elif isinstance(value, dict) and any(isinstance(item, Iterator) for item in value.values()):
+        yield from _json_object(value.items())
+    else:
+        yield json.dumps(value)
+
+
+def _key(**fields: Any) -> dict:
+    return {field.replace('__', '.'): value if isinstance(value, dict) else {'value': value}
+            for field, value in fields.items()}
+
+
+def _row(key: dict, **data: Any) -> dict:
+    return {'key': key, 'data': {**data, **ENTRY_DATA}}
+
+
+def _ports(layout: _ConfigLayout) -> Iterator[dict]:
+    for port in layout.ports:
+        connector, channel = (int(part) for part in port.split('/'))
+        yield {'key': {'$DEV_PORT': {'value': get_dev_port(port)}},
+               'data': {**PORT_DATA, '$CHNL_ID': channel, '$CONN_ID': connector, '$PORT_NAME': port}}
+
+
+def _input_groups(layout: _ConfigLayout) -> Iterator[dict]:
+    for group in layout.group_ids:
+        for port in layout.ingress_ports[group]:
+            yield _row(_key(ig_intr_md__ingress_port=get_dev_port(port)),
+                       **COUNTERS, grid=group, action_name='SwitchIngress.add_input_grid')
+
+
+def _decomposition(layout: _ConfigLayout) -> Iterator[dict]:
+    for group in layout.group_ids:
+        yield _row(_key(**{'$MATCH_PRIORITY': 0}, ig_md__dst_port=ANY, ig_md__input_grid=group,
+                        ig_md__ipv4_isvalid=ANY, ig_md__ipv6_isvalid=ANY, ig_md__protocol=ANY, ig_md__src_port=ANY),
+                   **COUNTERS, grid=group, action_name='SwitchIngress.add_logic_grid')
+
+
+def _hash_sel(layout: _ConfigLayout) -> Iterator[dict]:
+    for group in layout.group_ids:
+        yield _row(_key(ig_md__logic_grid=group),
+                   filter_ip_black_en=0, filter_ip_white_en=0, sel=0, action_name='SwitchIngress.act_sel')
+
+
+def _forward(layout: _ConfigLayout) -> Iterator[dict]:
+    for group in layout.group_ids:
+        yield _row(_key(ig_md__logic_grid=group), **COUNTERS, **{'$SELECTOR_GROUP_ID': group}, action_name=None)
+
+
+def _action_selector(layout: _ConfigLayout) -> Iterator[dict]:
+    for group in layout.group_ids:
+        members = [get_dev_port(port) for port in layout.egress_ports[group]]
+        yield _row(_key(**{'$SELECTOR_GROUP_ID': group}),
+                   **{'$ACTION_MEMBER_ID': members, '$ACTION_MEMBER_STATUS': [True] * len(members),
+                      '$MAX_GROUP_SIZE': len(members)}, action_name=None)
+
+
+def _unknown_ports(layout: _ConfigLayout) -> Iterator[dict]:
+    for group in layout.group_ids:
+        yield _row(_key(ig_md__input_grid=group), **COUNTERS,
+                   port=get_dev_port(layout.egress_ports[group][0]), action_name='SwitchIngress.fwd_unknown')
+
+
+def _ternary_filters(layout: _ConfigLayout) -> Iterator[dict]:
+    rng = layout.rng
+    for index in range(layout.scale.filters):
+        prefix = rng.choice((8, 16, 24, 32))
+        dst_mask = (0xFFFFFFFF << (32 - prefix)) & 0xFFFFFFFF
+        protocol = rng.choice(IP_PROTOCOLS)
+
+        # Адрес источника уникален для каждой записи, поэтому правила не повторяются при любом зерне
+        yield _row(_key(**{'$MATCH_PRIORITY': 2},
+                        hdr__ethernet__dst_addr=ANY, hdr__ethernet__ether_type=ANY, hdr__ethernet__src_addr=ANY,
+                        **{'hdr.vlan_tag$0.$valid': ANY, 'hdr.vlan_tag$0.vid': ANY},
+                        ig_md__dst_addr={'value': rng.getrandbits(32) & dst_mask, 'mask': dst_mask},
+                        ig_md__dst_port=ANY, ig_md__ipv6_isvalid=ANY,
+                        ig_md__logic_grid=index % layout.scale.groups + 1,
+                        ig_md__protocol={'value': protocol, 'mask': 0xFF if protocol else 0},
+                        ig_md__src_addr={'value': (10 << 24) + index + 1, 'mask': 0xFFFFFFFF},
+                        ig_md__src_port=ANY, ig_md__tls=ANY,
+                        **{'ig_md.vlan_last.$valid': ANY, 'ig_md.vlan_last.vid': ANY}),
+                   action_name=rng.choice(FILTER_ACTIONS))
+
+
+def _mirror(layout: _ConfigLayout) -> Iterator[dict]:
+    for session, group, _ in layout.mirror_sessions:
+        yield _row(_key(**{'$MATCH_PRIORITY': session - 1}, ig_md__dst_addr=ANY, ig_md__dst_port=ANY,
+                        ig_md__input_grid=group, ig_md__ipv4_isvalid=ANY, ig_md__ipv6_isvalid=ANY,
+                        ig_md__protocol=ANY, ig_md__sflow_cnt=ANY, ig_md__src_addr=ANY, ig_md__src_port=ANY),
+                   dest_num=4, mir_ses=FIRST_MIRROR_SESSION_ID + session - 1, action_name='SwitchIngress.set_mirror')
+
+
+def _mirror_cfg(layout: _ConfigLayout) -> Iterator[dict]:
+    for session, _, _ in layout.mirror_sessions:
+        yield _row(_key(**{'$sid': FIRST_MIRROR_SESSION_ID + session - 1}),
+                   **MIRROR_CFG_DATA, **{'$mcast_grp_a': session, '$mcast_rid': session}, action_name='$normal')
+
+
+def _mgids(layout: _ConfigLayout) -> Iterator[dict]:
+    for session, _, _ in layout.mirror_sessions:
+        yield _row(_key(**{'$MGID': session}),
+                   **{'$MULTICAST_ECMP_ID': [], '$MULTICAST_ECMP_L1_XID': [], '$MULTICAST_ECMP_L1_XID_VALID': [],
+                      '$MULTICAST_NODE_ID': [session], '$MULTICAST_NODE_L1_XID': [0],
+                      '$MULTICAST_NODE_L1_XID_VALID': [False]}, action_name=None)
+
+
+def _multicast_nodes(layout: _ConfigLayout) -> Iterator[dict]:
+    for session, _, port in layout.mirror_sessions:
+        yield _row(_key(**{'$MULTICAST_NODE_ID': session}),
+                   **{'$DEV_PORT': [get_dev_port(port)], '$MULTICAST_LAG_ID': [], '$MULTICAST_RID': session},
+                   action_name=None)
+
+
+def _form_d16(layout: _ConfigLayout) -> Iterator[dict]:
+    for port, _, _ in layout.psf_rules:
+        yield _row(_key(ig_intr_md__ingress_port=get_dev_port(port)),
+                   dmac=layout.psf_dmac, action_name='SwitchIngress.hit_psf_format')
+
+
+def _set_attributes(layout: _ConfigLayout) -> Iterator[dict]:
+    for port, lid, pid in layout.psf_rules:
+        yield _row(_key(ig_intr_md__ingress_port=get_dev_port(port)), lid=lid, pid=pid,
+                   action_name='SwitchIngress.write_to_reg')
+
+
+def _meter_port() -> dict:
+    return {str(index): METER_DATA for index in range(METER_PORTS)}
+
+
+def _nodes_graph(layout: _ConfigLayout) -> tuple[list[dict], list[dict]]:
+    nodes, edges = [], []
+
+    def add_node(node_id: str, node_type: str, column: int, row: float, **data: Any):
+        nodes.append({'id': node_id, 'type': node_type, 'data': data,
+                      'position': {'x': column * 300.0, 'y': row * 400.0}})
+
+    def add_edge(source: str, target: str, target_handle: str = 'b'):
+        edges.append({'id': f'vueflow__edge-{source}a-{target}{target_handle}', 'type': 'button',
+                      'source': source, 'target': target, 'sourceHandle': 'a', 'targetHandle': target_handle,
+                      'data': {}, 'label': ''})
+
+    def ports(names: list[str]) -> list[dict]:
+        return [{'port': port, 'state': True} for port in names]
+
+    for group in layout.group_ids:
+        ingress, selection = f'ingress-{group}', f'selection-{group}'
+        add_node(ingress, 'ingress', 0, group,
+                 ports=ports(layout.ingress_ports[group]), logicGroup=[selection], counter=0)
+        add_node(selection, 'selection', 1, group, ingressGroup=ingress,
+                 filter={'ipProtocol': 0, 'srcPort': None, 'dstPort': None, 'trafficType': 0},
+                 matchPriority=0, counter=0)
+        add_node(f'balancing-{group}', 'balancing', 2, group, logicGroup=selection, balancingType=0)
+        add_node(f'filtration-{group}', 'filtration', 3, group, logicGroup=selection, counter=0)
+        add_node(f'egress-{group}', 'egress', 4, group,
+                 ports=ports(layout.egress_ports[group]), logicGroup=selection, counter=0)
+        add_node(f'unknown-{group}', 'unknown', 1, group - 0.5,
+                 ports=ports(layout.egress_ports[group][:1]), ingressGroup=ingress, counter=0)
+
+        add_edge(ingress, selection)
+        add_edge(selection, f'balancing-{group}')
+        add_edge(f'balancing-{group}', f'filtration-{group}')
+        add_edge(f'filtration-{group}', f'egress-{group}', target_handle='a')
+        add_edge(ingress, f'unknown-{group}', target_handle='a')
+
+    for session, group, port in layout.mirror_sessions:
+        add_node(f'mirroring-{session}', 'mirror', 1, group + 0.5,
+                 ports=ports([port]), ingressGroup=f'ingress-{group}', priority=session - 1)
+        add_edge(f'ingress-{group}', f'mirroring-{session}')
+
+    return nodes, edges
\ No newline at end of file
@@ -0,0 +1,381 @@
+import json
+import re
+import sys
+from array import array
+from typing import Any, Iterator
+
+
+# Разбор конфигурационного файла выполняется над байтами (bytes или mmap) без декодирования в строку
+_WHITESPACE = re.compile(rb'[ \t\n\r]*+')
+_STRING = rb'"[^"\\]*+(?:\\.[^"\\]*+)*+"'
+_KEY = re.compile(rb'(' + _STRING + rb')[ \t\n\r]*+:[ \t\n\r]*+')
+_SCALAR = re.compile(rb'[^ \t\n\r,:{}\[\]"]++|' + _STRING)
+_PLAIN = re.compile(rb'(?:[^"{}\[\]]++|' + _STRING + rb')*+')
+
+# Глубина вложенности скобок, до которой значение пропускается одним регулярным выражением
+_MAX_NESTING = 16
+
+# Раздел конфигурационного файла с таблицами Tofino
+TABLES_SECTION = 'config'
+
+Spans = dict[str, tuple[int, int]]
+
+
+def _nested_value(depth: int) -> re.Pattern:
+    # В re нет рекурсии, поэтому шаблон уровня n содержит шаблон уровня n - 1.
+    # Строки пропускаются целиком, чтобы скобки внутри строк не учитывались
+    inner = _PLAIN.pattern
+    for _ in range(depth):
+        inner = rb'(?:[^"{}\[\]]++|' + _STRING + rb'|[{\[]' + inner + rb'[}\]])*+'
+
+    return re.compile(rb'[{\[]' + inner + rb'[}\]]')
+
+
+_NESTED_VALUE = _nested_value(_MAX_NESTING)
+
+
+def index_config(source: bytes) -> tuple[Spans, Spans]:
+    """
+    Функция находит границы разделов конфигурационного файла и таблиц Tofino в разделе "config".
+    Файл просматривается на уровне байтов: учитываются только строки, экранирование и вложенность скобок,
+    значения не разбираются и объекты не создаются. Корректность значений проверяется при их разборе.
+
+    :param source: Содержимое конфигурационного файла (bytes или mmap).
+    :return: Пара словарей "имя -> (начало, конец) в байтах": разделы файла и таблицы раздела "config".
+    :raises ValueError: Если файл не является JSON-объектом.
+    """
+    sections, tables, end = _index_object(source=source, start=_WHITESPACE.match(source).end(),
+                                          expand=TABLES_SECTION)
+
+    if _WHITESPACE.match(source, end).end() != len(source):
+        raise ValueError(f'Extra data after JSON object at {end}')
+
+    return sections, tables
+
+
+def _index_object(source: bytes, start: int, expand: str | None = None) -> tuple[Spans, Spans, int]:
+    if source[start:start + 1] != b'{':
+        raise ValueError(f'Expecting JSON object at {start}')
+
+    spans, expanded = {}, {}
+    position = _WHITESPACE.match(source, start + 1).end()
+
+    while source[position:position + 1] != b'}':
+        key_match = _KEY.match(source, position)
+        if key_match is None:
+            raise ValueError(f'Expecting object key at {position}')
+
+        key, value_start = json.loads(key_match.group(1)), key_match.end()
+        if key == expand and source[value_start:value_start + 1] == b'{':
+            expanded, _, value_end = _index_object(source=source, start=value_start)
+        else:
+            value_end = _skip_value(source=source, start=value_start)
+
+        spans[key] = (value_start, value_end)
+        position = _WHITESPACE.match(source, value_end).end()
+        if source[position:position + 1] == b',':
+            position = _WHITESPACE.match(source, position + 1).end()
+        elif source[position:position + 1] != b'}':
+            raise ValueError(f'Expecting "," or "}}" at {position}')
+
+    return spans, expanded, position + 1
+
+
+def _skip_value(source: bytes, start: int) -> int:
+    nested = source[start:start + 1] in (b'{', b'[')
+    if match := (_NESTED_VALUE if nested else _SCALAR).match(source, start):
+        return match.end()
+    if not nested:
+        raise ValueError(f'Expecting JSON value at {start}')
+
+    # Вложенность больше _MAX_NESTING (или скобки не закрыты): скобки считаются по одной
+    depth, position = 0, start
+    while True:
+        position = _PLAIN.match(source, position).end()
+        bracket = source[position:position + 1]
+        if not bracket:
+            raise ValueError(f'Unterminated JSON value at {start}')
+
+        position += 1
+        depth += 1 if bracket in (b'{', b'[') else -1
+        if depth == 0:
+            return position
+
+
+def _compact_ints(values: list) -> array | tuple:
+    # bool - подкласс int, но в array('Q') true превратился бы в 1, поэтому массив только для целых чисел
+    if not all(type(value) is int for value in values):
+        return tuple(values)
+
+    try:
+        return array('Q', values)
+    except OverflowError:     # Отрицательные и 128-битные значения хранятся как есть
+        return tuple(values)
+
+
+def _field_order(fields: dict[str, int], item: dict) -> tuple[int, ...] | None:
+    # Порядок полей записи хранится, только если он отличается от порядка полей таблицы
+    positions = [fields[field] for field in item]
+    return None if all(left < right for left, right in zip(positions, positions[1:])) else tuple(positions)
+
+
+def _canonical_json(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class TableEntry:
+    __slots__ = ('table', 'index', 'key_present', 'mask_present', 'raw_present', 'values', 'masks', 'data_present',
+                 'data', 'key_order', 'data_order')
+
+    def __init__(self, table: 'SwitchTable', index: str | None, key: dict, data: dict):
+        """
+        Компактная запись таблицы Tofino.
+        Вместо словарей {"value": .., "mask": ..} хранятся битовые маски присутствия полей и массивы значений,
+        имена полей хранятся один раз на таблицу. Поле ключа в другом виде (например, число без "value")
+        хранится как есть и отмечается в raw_present.
+
+        :param table: Таблица, к которой относится запись.
+        :param index: Индекс записи для таблиц-словарей (например, meter_port), иначе None.
+        :param key: Ключ записи из конфигурационного файла.
+        :param data: Данные записи из конфигурационного файла.
+        """
+        self.table = table
+        self.index = index
+
+        self.key_present = 0
+        self.mask_present = 0
+        self.raw_present = 0
+        values, masks = [], []
+        for bit, field in enumerate(table.key_fields):
+            if field not in key:
+                continue
+            self.key_present |= 1 << bit
+            item = key[field]
+            if not isinstance(item, dict) or list(item) not in (['value'], ['value', 'mask']):
+                self.raw_present |= 1 << bit
+                values.append(_intern(item))
+                continue
+
+            values.append(item['value'])
+            if 'mask' in item:
+                self.mask_present |= 1 << bit
+                masks.append(item['mask'])
+
+        self.values = _compact_ints(values)
+        self.masks = _compact_ints(masks)
+
+        self.data_present = 0
+        items = []
+        for bit, field in enumerate(table.data_fields):
+            if field in data:
+                self.data_present |= 1 << bit
+                items.append(_intern(data[field]))
+
+        self.data = tuple(items)
+        self.key_order = _field_order(fields=table.key_bits, item=key)
+        self.data_order = _field_order(fields=table.data_bits, item=data)
+
+    def get_key(self, field: str) -> tuple[Any, Any] | None:
+        """
+        Метод возвращает поле ключа записи.
+
+        :param field: Имя поля ключа (например, "ig_md.src_addr").
+        :return: Пара (value, mask); mask равен None, если поле без маски. Поле ключа не в виде {"value": ..}
+            возвращается как (значение из файла, None). None, если поля нет в записи.
+        """
+        for name, value, mask, _ in self._iter_key():
+            if name == field:
+                return value, mask
+
+        return None
+
+    def get_data(self, field: str, default: Any = None) -> Any:
+        """
+        Метод возвращает поле данных записи.
+
+        :param field: Имя поля данных (например, "action_name").
+        :param default: Значение, если поля нет в записи.
+        :return: Значение поля данных.
+        """
+        return next((value for name, value in self._iter_data() if name == field), default)
+
+    def to_json(self) -> tuple[str | None, dict]:
+        """
+        Метод восстанавливает запись в виде конфигурационного файла с исходным порядком полей.
+
+        :return: Пара (индекс, запись): запись {"key": .., "data": ..} для таблиц-списков, данные - для таблиц-словарей.
+        """
+        key = {name: value if raw else {'value': value} if mask is None else {'value': value, 'mask': mask}
+               for name, value, mask, raw in self._iter_key()}
+        data = dict(self._iter_data())
+
+        if self.key_order:
+            key = {field: key[field] for field in (self.table.key_fields[bit] for bit in self.key_order)}
+        if self.data_order:
+            data = {field: data[field] for field in (self.table.data_fields[bit] for bit in self.data_order)}
+
+        return self.index, data if self.table.indexed else {'key': key, 'data': data}
+
+    def _iter_key(self) -> Iterator[tuple[str, Any, Any, bool]]:
+        value_position = mask_position = 0
+        for bit, field in enumerate(self.table.key_fields):
+            if not self.key_present >> bit & 1:
+                continue
+
+            mask = None
+            if self.mask_present >> bit & 1:
+                mask = self.masks[mask_position]
+                mask_position += 1
+
+            yield field, self.values[value_position], mask, bool(self.raw_present >> bit & 1)
+            value_position += 1
+
+    def _iter_data(self) -> Iterator[tuple[str, Any]]:
+        position = 0
+        for bit, field in enumerate(self.table.data_fields):
+            if self.data_present >> bit & 1:
+                yield field, self.data[position]
+                position += 1
+
+    def _state(self) -> tuple:
+        return (self.index, self.key_present, self.mask_present, self.raw_present, self.values, self.masks,
+                self.data_present, self.data)
+
+
+class SwitchTable:
+    __slots__ = ('name', 'indexed', 'key_fields', 'data_fields', 'key_bits', 'data_bits', 'entries')
+
+    def __init__(self, name: str, rows: list | dict):
+        """
+        Компактная таблица Tofino из раздела "config" конфигурационного файла.
+
+        :param name: Имя таблицы (например, "ternary_filters").
+        :param rows: Записи таблицы: список {"key": .., "data": ..} или словарь "индекс -> данные" (meter_port).
+        """
+        self.name = name
+        self.indexed = isinstance(rows, dict)
+
+        items = list(rows.items()) if self.indexed else [(None, row) for row in rows]
+        keys = [{} if self.indexed else row['key'] for _, row in items]
+        datas = [row if self.indexed else row['data'] for _, row in items]
+
+        # Порядок полей - порядок первого появления; записи с другим порядком хранят его в key_order и data_order
+        self.key_fields = tuple(sys.intern(field) for field in dict.fromkeys(field for key in keys for field in key))
+        self.data_fields = tuple(sys.intern(field)
+                                 for field in dict.fromkeys(field for data in datas for field in data))
+        self.key_bits = {field: bit for bit, field in enumerate(self.key_fields)}
+        self.data_bits = {field: bit for bit, field in enumerate(self.data_fields)}
+        self.entries = [TableEntry(table=self, index=index, key=key, data=data)
+                        for (index, _), key, data in zip(items, keys, datas)]
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[TableEntry]:
+        return iter(self.entries)
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Таблицы равны, если равны их записи в конфигурационном файле без учёта порядка полей.
+        Значения сравниваются с учётом типа: true не равно 1, 1 не равно 1.0.
+        """
+        if not isinstance(other, SwitchTable):
+            return NotImplemented
+
+        # Несовпадение компактных записей при одинаковых полях достаточно для неравенства таблиц,
+        # совпадение - нет: в компактном виде true и 1 равны
+        layout = (self.indexed, self.key_fields, self.data_fields)
+        if layout == (other.indexed, other.key_fields, other.data_fields) and \
+                [entry._state() for entry in self] != [entry._state() for entry in other]:
+            return False
+
+        return _canonical_json(self.to_json()) == _canonical_json(other.to_json())
+
+    def to_json(self) -> list | dict:
+        """
+        Метод восстанавливает таблицу в виде конфигурационного файла.
+
+        :return: Список записей или словарь "индекс -> данные" для таблиц-словарей.
+        """
+        rows = [entry.to_json() for entry in self.entries]
+        return dict(rows) if self.indexed else [row for _, row in rows]
+
+
+class SwitchConfig:
+    __slots__ = ('source', 'sections', 'table_spans', '_tables', '_parsed_sections')
+
+    def __init__(self, source: bytes):
+        """
+        Конфигурация коммутатора с ленивым разбором по таблицам.
+        При создании находятся только границы разделов и таблиц; таблица разбирается в компактный вид SwitchTable
+        при первом обращении. Неразобранные таблицы сравниваются побайтно.
+
+        :param source: Содержимое конфигурационного файла (bytes или mmap).
+        """
+        self.source = source
+        self.sections, self.table_spans = index_config(source)
+
+        self._tables: dict[str, SwitchTable] = {}
+        self._parsed_sections: dict[str, Any] = {}
+
+    @property
+    def table_names(self) -> list[str]:
+        return list(self.table_spans)
+
+    def raw_table(self, name: str) -> bytes:
+        start, end = self.table_spans[name]
+        return bytes(self.source[start:end])
+
+    def table(self, name: str) -> SwitchTable:
+        """
+        Метод возвращает таблицу Tofino, разбирая её при первом обращении.
+
+        :param name: Имя таблицы (например, "forward_stat").
+        :return: Компактная таблица.
+        :raises KeyError: Если таблицы нет в конфигурации.
+        """
+        if name not in self._tables:
+            self._tables[name] = SwitchTable(name=name, rows=json.loads(self.raw_table(name)))
+
+        return self._tables[name]
+
+    def section(self, name: str) -> Any:
+        """
+        Метод возвращает раздел конфигурационного файла вне таблиц ("names", "actions", "nodes", "edges", ...).
+
+        :param name: Имя раздела.
+        :return: Разобранное значение раздела.
+        :raises KeyError: Если раздела нет в конфигурации.
+        """
+        if name not in self._parsed_sections:
+            start, end = self.sections[name]
+            self._parsed_sections[name] = json.loads(bytes(self.source[start:end]))
+
+        return self._parsed_sections[name]
+
+    def table_equals(self, other: 'SwitchConfig', name: str) -> bool:
+        """
+        Метод сравнивает одноимённые таблицы двух конфигураций.
+        Побайтно совпадающие таблицы не разбираются.
+
+        :param other: Другая конфигурация.
+        :param name: Имя таблицы.
+        :return: True, если таблицы совпадают (или отсутствуют в обеих конфигурациях).
+        """
+        if name not in self.table_spans or name not in other.table_spans:
+            return name not in self.table_spans and name not in other.table_spans
+
+        return self.raw_table(name) == other.raw_table(name) or self.table(name) == other.table(name)
+
+    def to_json(self) -> dict:
+        """
+        Метод восстанавливает конфигурационный файл целиком.
+
+        :return: Конфигурация в виде словаря (см. testdata/files/test_conf.json).
+        """
+        return {name: {table: self.table(table).to_json() for table in self.table_spans}
+                if name == TABLES_SECTION else self.section(name) for name in self.sections}
\ No newline at end of file
@@ -0,0 +1,155 @@
+import mmap
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterator
+
+from tools.logger import get_logger
+from tools.switch_config.model import SwitchConfig, SwitchTable
+
+
+logger = get_logger('CONFIG_READER')
+
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Количество открытых ConfigFileReader, которые get_config_file_reader держит на процесс
+MAX_CONFIG_FILE_READERS = 8
+
+
+class ConfigFileReader:
+    def __init__(self, path: Path):
+        """
+        Чтение конфигурационного файла коммутатора через mmap.
+        Границы разделов и таблиц находятся при первом обращении к config, дальше таблицы читаются из отображения
+        по одной, а сам файл не загружается в память процесса целиком.
+
+        :param path: Путь к конфигурационному файлу (например, settings.test_data.custom_config_json_file).
+        :raises ValueError: Если файл пустой.
+        """
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        self._config: SwitchConfig | None = None
+
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self.close()
+            raise
+
+    @property
+    def config(self) -> SwitchConfig:
+        """
+        Конфигурация с границами разделов и таблиц (см. SwitchConfig).
+
+        :raises ValueError: Если файл не является JSON-объектом.
+        """
+        if self._config is None:
+            self._config = SwitchConfig(self._mmap)
+            logger.debug(f'Config file "{self.path}" was indexed: {len(self._config.table_names)} tables, '
+                         f'{self.size} bytes')
+
+        return self._config
+
+    @property
+    def size(self) -> int:
+        return len(self._mmap)
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def table(self, name: str) -> SwitchTable:
+        """
+        Метод возвращает таблицу Tofino (см. SwitchConfig.table).
+
+        :param name: Имя таблицы (например, "ports", "mirror_cfg", "meter_port").
+        :return: Компактная таблица.
+        """
+        return self.config.table(name)
+
+    def raw_table(self, name: str) -> bytes:
+        """
+        Метод возвращает таблицу Tofino в исходном виде, без разбора.
+
+        :param name: Имя таблицы.
+        :return: JSON-значение таблицы из файла.
+        """
+        return self.config.raw_table(name)
+
+    def iter_chunks(self, chunk_size: int = UPLOAD_CHUNK_SIZE) -> Iterator[memoryview]:
+        """
+        Метод отдаёт содержимое файла частями без копирования, например для потоковой загрузки на коммутатор.
+        Каждая часть - memoryview над отображением файла; до закрытия ConfigFileReader части нужно освободить.
+
+        :param chunk_size: Размер части в байтах.
+        :return: Итератор частей файла.
+        """
+        with memoryview(self._mmap) as view:
+            for start in range(0, len(view), chunk_size):
+                yield view[start:start + chunk_size]
+
+    def close(self):
+        """
+        Метод закрывает отображение и файл.
+
+        :raises BufferError: Если части файла из iter_chunks ещё не освобождены.
+        """
+        if hasattr(self, '_mmap'):
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> 'ConfigFileReader':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+_readers: OrderedDict[tuple[Path, int, int], ConfigFileReader] = OrderedDict()
+_readers_lock = threading.Lock()
+
+
+def get_config_file_reader(path: Path) -> ConfigFileReader:
+    """
+    Функция возвращает общий на процесс ConfigFileReader для файла.
+    Фикстуры, загружающие одну и ту же конфигурацию, используют один индекс;
+    при изменении файла (время изменения или размер) он индексируется заново.
+    Открытыми остаются не более MAX_CONFIG_FILE_READERS файлов: давно не использованные и устаревшие
+    ConfigFileReader закрываются.
+
+    :param path: Путь к конфигурационному файлу.
+    :return: Открытый ConfigFileReader (закрывать не нужно, см. close_config_file_readers).
+    """
+    path = Path(path).resolve()
+    stat = path.stat()
+    key = (path, stat.st_mtime_ns, stat.st_size)
+
+    with _readers_lock:
+        if key in _readers:
+            _readers.move_to_end(key)
+            return _readers[key]
+
+        for stale in [cached for cached in _readers if cached[0] == path]:
+            _close_reader(_readers.pop(stale))
+
+        reader = _readers[key] = ConfigFileReader(path=path)
+        while len(_readers) > MAX_CONFIG_FILE_READERS:
+            _close_reader(_readers.popitem(last=False)[1])
+
+        return reader
+
+
+def close_config_file_readers():
+    """
+    Функция закрывает все ConfigFileReader, открытые через get_config_file_reader.
+    """
+    with _readers_lock:
+        while _readers:
+            _close_reader(_readers.popitem()[1])
+
+
+def _close_reader(reader: ConfigFileReader):
+    try:
+        reader.close()
+    except BufferError as error:
+        logger.warning(f'Config file "{reader.path}" is still in use and was not closed: {error}')
\ No newline at end of file
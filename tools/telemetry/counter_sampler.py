@@ -0,0 +1,209 @@
+import time
+from typing import Callable, Sequence
+
+from clients.ingress_groups.ingress_groups_client import IngressGroupsClient
+from clients.nodes.nodes_client import NodesClient
+from config import settings
+from tools.logger import get_logger
+from tools.telemetry.periodic import PeriodicPoller
+from tools.telemetry.ring_buffer import RingBuffer, WindowStatsSchema
+
+
+logger = get_logger('COUNTER_SAMPLER')
+
+# (группа, счётчик): ("ingress-1", "33/0") для счётчиков портов входной группы, ("selection-1", "counter") для нод
+CounterKey = tuple[str, str]
+CounterSource = Callable[[], dict[CounterKey, int]]
+
+
+def ingress_group_counters(ingress_groups_client: IngressGroupsClient) -> CounterSource:
+    """
+    Функция возвращает источник счётчиков пакетов портов входных групп (IngressGroupSchema.packet_counter).
+
+    :param ingress_groups_client: Клиент для работы с /api/ingress_groups/.
+    :return: Функция, возвращающая счётчики "(ingress-<id>, порт) -> пакеты".
+    """
+    def read() -> dict[CounterKey, int]:
+        response = ingress_groups_client.get_ingress_group_list_api()
+        response.raise_for_status()
+
+        return {(f'ingress-{group["id"]}', port): counter
+                for group in response.json() for port, counter in zip(group['ports'], group['packetCounter'])}
+
+    return read
+
+
+def node_counters(nodes_client: NodesClient) -> CounterSource:
+    """
+    Функция возвращает источник счётчиков нод конфигурации на Web (поле counter данных ноды).
+
+    :param nodes_client: Клиент для работы с /api/nodes/.
+    :return: Функция, возвращающая счётчики "(id ноды, "counter") -> пакеты".
+    """
+    def read() -> dict[CounterKey, int]:
+        response = nodes_client.get_nodes_list_api()
+        response.raise_for_status()
+
+        return {(node['id'], 'counter'): node['data']['counter']
+                for node in response.json().get('nodes', []) if 'counter' in (node.get('data') or {})}
+
+    return read
+
+
+def counter_deltas(previous: Sequence[int | None],
+                   current: Sequence[int | None],
+                   bits: int = 64) -> tuple[list[int | None], int, int]:
+    """
+    Функция вычисляет приращения счётчиков между двумя замерами за один проход по всем счётчикам.
+    Уменьшение счётчика считается переполнением, если он был в верхней половине диапазона и приращение
+    через переполнение меньше половины диапазона; иначе - сбросом счётчика (приращение считается от нуля).
+
+    :param previous: Предыдущие значения счётчиков (None - счётчика не было).
+    :param current: Текущие значения счётчиков.
+    :param bits: Разрядность счётчиков.
+    :return: Приращения (None, если значения нет в одном из замеров), количество переполнений и сбросов.
+    """
+    modulus, half = 1 << bits, 1 << (bits - 1)
+    deltas, wraps, resets = [], 0, 0
+
+    for old, new in zip(previous, current):
+        if old is None or new is None:
+            deltas.append(None)
+        elif new >= old:
+            deltas.append(new - old)
+        elif old >= half and modulus - old + new < half:
+            deltas.append(modulus - old + new)
+            wraps += 1
+        else:
+            deltas.append(new)
+            resets += 1
+
+    return deltas, wraps, resets
+
+
+class CounterSampler(PeriodicPoller):
+    def __init__(self,
+                 source: CounterSource,
+                 interval: float = settings.telemetry.interval,
+                 history: int = settings.telemetry.history,
+                 counter_bits: int = 64):
+        """
+        Периодический опрос счётчиков пакетов и расчёт скорости (пакетов в секунду) по счётчикам и по группам.
+        Скорость группы - сумма скоростей её счётчиков; переполнение считается по каждому счётчику отдельно.
+        Хранятся только последние history скоростей (см. RingBuffer).
+
+        :param source: Источник счётчиков (ingress_group_counters, node_counters или своя функция).
+        :param interval: Интервал опроса в секундах.
+        :param history: Количество хранимых замеров скорости.
+        :param counter_bits: Разрядность счётчиков коммутатора.
+        """
+        super().__init__(name='Counter sampler', interval=interval)
+        self.source = source
+        self.history = history
+        self.counter_bits = counter_bits
+
+        self.wraps = 0
+        self.resets = 0
+
+        self._keys: list[CounterKey] = []
+        self._groups: dict[str, int] = {}
+        self._group_columns: list[int] = []
+        self._previous: list[int | None] = []
+        self._previous_time: float | None = None
+        self._rates = RingBuffer(channels=1, capacity=history)
+        self._group_rates = RingBuffer(channels=1, capacity=history)
+
+    @property
+    def groups(self) -> list[str]:
+        return list(self._groups)
+
+    def poll_once(self) -> dict[str, float | None]:
+        """
+        Метод выполняет один замер счётчиков.
+
+        :return: Скорости групп по сравнению с предыдущим замером (пустой словарь для первого замера).
+        :raises HTTPError: Если коммутатор вернул ошибку.
+        """
+        counters = self.source()
+        now = time.monotonic()
+        keys = list(counters)
+
+        with self._lock:
+            if keys != self._keys:
+                self._reset_keys(keys)
+
+            current = [counters[key] for key in keys]
+            group_rates = {}
+
+            if keys and self._previous_time is not None and now > self._previous_time:
+                deltas, wraps, resets = counter_deltas(previous=self._previous, current=current, bits=self.counter_bits)
+                elapsed = now - self._previous_time
+                rates = [None if delta is None else delta / elapsed for delta in deltas]
+
+                sums: list[float | None] = [None] * len(self._groups)
+                for column, rate in zip(self._group_columns, rates):
+                    if rate is not None:
+                        sums[column] = (sums[column] or 0.0) + rate
+
+                self._rates.append(rates)
+                self._group_rates.append(sums)
+                self.wraps += wraps
+                self.resets += resets
+                group_rates = dict(zip(self._groups, sums))
+
+                if wraps or resets:
+                    logger.info(f'Counter sample {self.polls + 1}: {wraps} wraparounds, {resets} resets')
+
+            self._previous, self._previous_time = current, now
+            self.polls += 1
+
+        return group_rates
+
+    def group_rate(self, group: str, window: int | None = None) -> WindowStatsSchema:
+        """
+        Метод возвращает статистику скорости группы за окно последних замеров.
+
+        :param group: Группа (например, "ingress-1").
+        :param window: Количество последних замеров; None - вся хранимая история.
+        :return: min/max/mean скорости в пакетах в секунду.
+        :raises KeyError: Если группы нет в замерах.
+        """
+        with self._lock:
+            return self._group_rates.stats(channel=self._groups[group], window=window)
+
+    def counter_rate(self, group: str, counter: str, window: int | None = None) -> WindowStatsSchema:
+        """
+        Метод возвращает статистику скорости одного счётчика за окно последних замеров.
+
+        :param group: Группа (например, "ingress-1").
+        :param counter: Счётчик группы (например, порт "33/0").
+        :param window: Количество последних замеров; None - вся хранимая история.
+        :return: min/max/mean скорости в пакетах в секунду.
+        :raises ValueError: Если счётчика нет в замерах.
+        """
+        with self._lock:
+            return self._rates.stats(channel=self._keys.index((group, counter)), window=window)
+
+    def summary(self, window: int | None = None) -> dict[str, WindowStatsSchema]:
+        """
+        Метод возвращает статистику скорости всех групп.
+
+        :param window: Количество последних замеров; None - вся хранимая история.
+        :return: Словарь "группа -> статистика скорости".
+        """
+        with self._lock:
+            return {group: self._group_rates.stats(channel=column, window=window)
+                    for group, column in self._groups.items()}
+
+    def _reset_keys(self, keys: list[CounterKey]):
+        if self._keys:
+            logger.warning(f'Sampled counters changed ({len(self._keys)} -> {len(keys)}), rate history was reset')
+
+        previous = dict(zip(self._keys, self._previous))
+        self._previous = [previous.get(key) for key in keys]
+        self._keys = keys
+
+        self._groups = {group: column for column, group in enumerate(dict.fromkeys(group for group, _ in keys))}
+        self._group_columns = [self._groups[group] for group, _ in keys]
+        self._rates = RingBuffer(channels=max(len(keys), 1), capacity=self.history)
+        self._group_rates = RingBuffer(channels=max(len(self._groups), 1), capacity=self.history)
\ No newline at end of file
@@ -0,0 +1,157 @@
+import time
+from typing import Callable, Iterable
+
+from pydantic import BaseModel, Field
+
+from clients.ports.ports_client import PortsClient
+from clients.ports.ports_schema import UpdatePortStatusRequestSchema
+from config import settings
+from tools.logger import get_logger
+
+
+logger = get_logger('LINK_TRANSITIONS')
+
+# Источник состояния линков: "порт -> линк поднят" (None - состояние неизвестно)
+LinkStateSource = Callable[[], dict[str, bool | None]]
+
+
+def configured_port_links(ports_client: PortsClient) -> LinkStateSource:
+    """
+    Функция возвращает источник состояния линков по полю up сконфигурированных портов (/api/ports/).
+
+    :param ports_client: Клиент для работы с /api/ports/.
+    :return: Функция, возвращающая "порт ("2/0") -> up".
+    """
+    def read() -> dict[str, bool | None]:
+        response = ports_client.get_ports_list_api()
+        response.raise_for_status()
+
+        return {port['port']: port['up'] for port in response.json()}
+
+    return read
+
+
+def lane_links(ports_client: PortsClient) -> LinkStateSource:
+    """
+    Функция возвращает источник состояния линков по полю status линий модулей (/api/ports_all/).
+
+    :param ports_client: Клиент для работы с /api/ports_all/.
+    :return: Функция, возвращающая "порт ("2/0") -> status линии".
+    """
+    def read() -> dict[str, bool | None]:
+        response = ports_client.get_all_ports_list_api()
+        response.raise_for_status()
+
+        return {f'{item["port"]}/{lane["lane"]}': lane['status'] for item in response.json() for lane in item['lanes']}
+
+    return read
+
+
+class LinkTransitionSchema(BaseModel):
+    """
+    Результат ожидания смены состояния линка одного порта.
+    Attributes:
+        port: str
+        status: bool - ожидаемое состояние линка
+        converged: bool - состояние достигнуто до истечения времени ожидания
+        convergence_ms: float | None - время от ответа на /api/port_status/ до опроса, увидевшего новое состояние
+        resolution_ms: float | None - погрешность: состояние изменилось не раньше начала предыдущего опроса
+        polls: int - количество опросов до смены состояния
+    """
+    port: str
+    status: bool
+    converged: bool
+    convergence_ms: float | None    = Field(default=None)
+    resolution_ms: float | None     = Field(default=None)
+    polls: int
+
+
+class LinkTransitionMeter:
+    def __init__(self,
+                 ports_client: PortsClient,
+                 source: LinkStateSource | None = None,
+                 poll_min: float = settings.telemetry.link_poll_min,
+                 poll_max: float = settings.telemetry.link_poll_max,
+                 timeout: float = settings.telemetry.link_timeout,
+                 backoff: float = 2.0):
+        """
+        Замер времени поднятия и опускания линка портов после изменения состояния через /api/port_status/.
+        Состояние опрашивается с адаптивным интервалом: от poll_min, с ростом в backoff раз после каждого опроса
+        без изменений до poll_max; если опрос увидел смену состояния хотя бы одного порта, интервал сбрасывается
+        до poll_min, так как остальные порты обычно меняют состояние в то же время.
+
+        :param ports_client: Клиент для работы с /api/port_status/ и источником состояния.
+        :param source: Источник состояния линков; None - поле up из /api/ports/.
+        :param poll_min: Начальный интервал опроса в секундах.
+        :param poll_max: Максимальный интервал опроса в секундах.
+        :param timeout: Время ожидания смены состояния всех портов в секундах.
+        :param backoff: Множитель интервала опроса.
+        """
+        self.ports_client = ports_client
+        self.source = source or configured_port_links(ports_client)
+        self.poll_min = poll_min
+        self.poll_max = poll_max
+        self.timeout = timeout
+        self.backoff = backoff
+
+    def toggle(self, ports: Iterable[str], status: bool) -> list[LinkTransitionSchema]:
+        """
+        Метод изменяет состояние портов и ожидает, пока линки всех портов перейдут в это состояние.
+
+        :param ports: Порты (например, ["2/0", "3/0"]).
+        :param status: True - включить порты и ждать поднятия линка, False - отключить и ждать опускания.
+        :return: Результаты по каждому порту в порядке ports.
+        :raises HTTPError: Если коммутатор вернул ошибку на изменение состояния порта.
+        """
+        toggled_at = {}
+        for port in ports:
+            response = self.ports_client.update_port_status_api(UpdatePortStatusRequestSchema(port=port,
+                                                                                              status=status))
+            response.raise_for_status()
+            toggled_at[port] = time.perf_counter()
+
+        return self.wait(toggled_at=toggled_at, status=status)
+
+    def wait(self, toggled_at: dict[str, float], status: bool) -> list[LinkTransitionSchema]:
+        """
+        Метод ожидает, пока линки портов перейдут в заданное состояние.
+
+        :param toggled_at: Порт -> time.perf_counter() момента, от которого считается время смены состояния.
+        :param status: Ожидаемое состояние линков.
+        :return: Результаты по каждому порту в порядке toggled_at.
+        """
+        results: dict[str, LinkTransitionSchema] = {}
+        deadline = time.perf_counter() + self.timeout
+        previous_poll = min(toggled_at.values(), default=0.0)
+        interval, polls = self.poll_min, 0
+
+        while toggled_at and time.perf_counter() < deadline:
+            poll_started = time.perf_counter()
+            states = self.source()
+            observed = time.perf_counter()
+            polls += 1
+
+            converged = [port for port in toggled_at if port not in results and states.get(port) is status]
+            for port in converged:
+                results[port] = LinkTransitionSchema(
+                    port=port,
+                    status=status,
+                    converged=True,
+                    convergence_ms=round((observed - toggled_at[port]) * 1000, 3),
+                    resolution_ms=round((observed - max(previous_poll, toggled_at[port])) * 1000, 3),
+                    polls=polls)
+
+            if len(results) == len(toggled_at):
+                break
+
+            previous_poll = poll_started
+            interval = self.poll_min if converged else min(interval * self.backoff, self.poll_max)
+            time.sleep(max(0.0, min(interval, deadline - time.perf_counter())))
+
+        pending = [port for port in toggled_at if port not in results]
+        if pending:
+            logger.warning(f'Link of {len(pending)} ports did not go {"up" if status else "down"} '
+                           f'in {self.timeout} s: {pending}')
+
+        return [results.get(port) or LinkTransitionSchema(port=port, status=status, converged=False, polls=polls)
+                for port in toggled_at]
\ No newline at end of file
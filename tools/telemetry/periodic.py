@@ -0,0 +1,69 @@
+import threading
+import time
+from typing import Self
+
+from httpx import HTTPError
+
+from tools.logger import get_logger
+
+
+logger = get_logger('TELEMETRY')
+
+
+class PeriodicPoller:
+    def __init__(self, name: str, interval: float):
+        """
+        Базовый класс периодического опроса коммутатора в фоновом потоке.
+        Наследники реализуют poll_once(); ошибки опроса записываются в лог и в счётчик errors, опрос продолжается.
+
+        :param name: Имя потока и опроса в логах.
+        :param interval: Интервал опроса в секундах.
+        """
+        self.name = name
+        self.interval = interval
+        self.polls = 0
+        self.errors = 0
+
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def poll_once(self):
+        raise NotImplementedError
+
+    def start(self) -> Self:
+        """
+        Метод запускает опрос в фоновом потоке с интервалом self.interval.
+        """
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        logger.info(f'{self.name} stopped: {self.polls} polls, {self.errors} errors')
+
+    def __enter__(self) -> Self:
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def _run(self):
+        next_poll = time.monotonic()
+        while not self._stopped.is_set():
+            try:
+                self.poll_once()
+            except (HTTPError, ValueError, KeyError) as error:
+                self.errors += 1
+                logger.warning(f'{self.name} poll failed: {error!r}')
+
+            # Расписание не сдвигается на время опроса; пропущенные из-за медленного ответа опросы не догоняются
+            next_poll += self.interval
+            next_poll = max(next_poll, time.monotonic())
+            self._stopped.wait(next_poll - time.monotonic())
\ No newline at end of file
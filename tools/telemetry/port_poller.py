@@ -0,0 +1,210 @@
+import time
+
+from pydantic import BaseModel, Field
+
+from clients.ports.ports_client import PortsClient
+from clients.ports.ports_schema import LaneSchema
+from config import settings
+from tools.logger import get_logger
+from tools.telemetry.periodic import PeriodicPoller
+from tools.telemetry.ring_buffer import RingBuffer, WindowStatsSchema
+
+
+logger = get_logger('PORT_TELEMETRY')
+
+# Поля LevelSchema, которые сохраняются в кольцевые буферы
+LEVEL_METRICS = ('rx_rate', 'tx_rate', 'bias')
+
+LaneKey = tuple[int, int]
+
+
+class LevelThresholdsSchema(BaseModel):
+    """
+    Допустимые значения уровней линий порта. None - граница не проверяется.
+    Attributes:
+        rx_rate_min / rx_rate_max: float | None - мощность приёма
+        tx_rate_min / tx_rate_max: float | None - мощность передачи
+        bias_min / bias_max: float | None - ток смещения лазера
+    """
+    rx_rate_min: float | None   = Field(default=None)
+    rx_rate_max: float | None   = Field(default=None)
+    tx_rate_min: float | None   = Field(default=None)
+    tx_rate_max: float | None   = Field(default=None)
+    bias_min: float | None      = Field(default=None)
+    bias_max: float | None      = Field(default=None)
+
+    def limits(self, metric: str) -> tuple[float | None, float | None]:
+        return getattr(self, f'{metric}_min'), getattr(self, f'{metric}_max')
+
+
+class TelemetryAlertSchema(BaseModel):
+    """
+    Выход уровня линии порта за допустимые границы.
+    Alert создаётся при выходе значения за границу; пока значение остаётся вне границ, повторно не создаётся.
+    Attributes:
+        port: int
+        lane: int
+        metric: str - rx_rate, tx_rate или bias
+        value: float
+        limit: float - нарушенная граница
+        timestamp: float - время опроса (time.time())
+    """
+    port: int
+    lane: int
+    metric: str
+    value: float
+    limit: float
+    timestamp: float
+
+
+class PortTelemetryPoller(PeriodicPoller):
+    def __init__(self,
+                 ports_client: PortsClient,
+                 interval: float = settings.telemetry.interval,
+                 history: int = settings.telemetry.history,
+                 thresholds: LevelThresholdsSchema | None = None):
+        """
+        Периодический опрос /api/ports_all/ для наблюдения за оптическими модулями во время длительных прогонов.
+        Уровни линий (rx_rate, tx_rate, bias) записываются в кольцевые буферы без создания pydantic-моделей;
+        LaneSchema создаётся заново только для линий, у которых изменились поля модуля (vendor, serialNumber, ...).
+
+        :param ports_client: Клиент для работы с /api/ports_all/.
+        :param interval: Интервал опроса в секундах.
+        :param history: Количество хранимых замеров на линию.
+        :param thresholds: Допустимые значения уровней; None - без проверки.
+        """
+        super().__init__(name='Port telemetry', interval=interval)
+        self.ports_client = ports_client
+        self.history = history
+        self.thresholds = thresholds or LevelThresholdsSchema()
+
+        self.alerts: list[TelemetryAlertSchema] = []
+
+        self._columns: dict[LaneKey, int] = {}
+        self._raw_lanes: dict[LaneKey, dict] = {}
+        self._lanes: dict[LaneKey, LaneSchema] = {}
+        self._levels = {metric: RingBuffer(channels=1, capacity=history) for metric in LEVEL_METRICS}
+        self._timestamps = RingBuffer(channels=1, capacity=history)
+        self._violations: set[tuple[LaneKey, str]] = set()
+
+    @property
+    def lanes(self) -> list[LaneKey]:
+        return list(self._columns)
+
+    def poll_once(self) -> list[TelemetryAlertSchema]:
+        """
+        Метод выполняет один опрос /api/ports_all/.
+
+        :return: Новые alert'ы этого опроса.
+        :raises HTTPError: Если коммутатор вернул ошибку.
+        """
+        response = self.ports_client.get_all_ports_list_api()
+        response.raise_for_status()
+        timestamp = time.time()
+
+        rows = {metric: [] for metric in LEVEL_METRICS}
+        keys, reparsed = [], 0
+        for item in response.json():
+            for lane, level in zip(item['lanes'], item['levels']):
+                key = (item['port'], lane['lane'])
+                keys.append(key)
+
+                if self._raw_lanes.get(key) != lane:
+                    self._raw_lanes[key] = lane
+                    self._lanes[key] = LaneSchema.model_validate(lane)
+                    reparsed += 1
+
+                for metric in LEVEL_METRICS:
+                    rows[metric].append(level.get(metric))
+
+        with self._lock:
+            if keys != list(self._columns):
+                self._reset_columns(keys)
+
+            # Без линий (нет модулей) в буфер с одним каналом записывается пропуск, чтобы опросы оставались выровнены
+            for metric, values in rows.items():
+                self._levels[metric].append(values or [None])
+            self._timestamps.append([timestamp])
+            self.polls += 1
+
+            alerts = self._check_thresholds(rows=rows, timestamp=timestamp)
+            self.alerts.extend(alerts)
+
+        if reparsed:
+            logger.debug(f'Port telemetry poll {self.polls}: {reparsed} lanes changed')
+        for alert in alerts:
+            logger.warning(f'Port {alert.port} lane {alert.lane}: {alert.metric}={alert.value} '
+                           f'is out of limit {alert.limit}')
+
+        return alerts
+
+    def stats(self, port: int, lane: int, metric: str, window: int | None = None) -> WindowStatsSchema:
+        """
+        Метод возвращает статистику уровня линии за окно последних опросов.
+
+        :param port: Номер порта (поле port ответа /api/ports_all/).
+        :param lane: Номер линии.
+        :param metric: rx_rate, tx_rate или bias.
+        :param window: Количество последних опросов; None - вся хранимая история.
+        :return: min/max/mean уровня.
+        :raises KeyError: Если линия ещё не опрашивалась.
+        """
+        with self._lock:
+            return self._levels[metric].stats(channel=self._columns[(port, lane)], window=window)
+
+    def summary(self, window: int | None = None) -> dict[str, dict[str, WindowStatsSchema]]:
+        """
+        Метод возвращает статистику всех линий, у которых есть значения уровней.
+
+        :param window: Количество последних опросов; None - вся хранимая история.
+        :return: Словарь "порт/линия -> метрика -> статистика".
+        """
+        summary = {}
+        with self._lock:
+            for (port, lane), column in self._columns.items():
+                lane_stats = {metric: self._levels[metric].stats(channel=column, window=window)
+                              for metric in LEVEL_METRICS}
+                if any(item.samples for item in lane_stats.values()):
+                    summary[f'{port}/{lane}'] = lane_stats
+
+        return summary
+
+    def lane_info(self, port: int, lane: int) -> LaneSchema | None:
+        """
+        Метод возвращает последние полученные данные модуля линии.
+
+        :param port: Номер порта.
+        :param lane: Номер линии.
+        :return: LaneSchema или None, если линия ещё не опрашивалась.
+        """
+        return self._lanes.get((port, lane))
+
+    def _reset_columns(self, keys: list[LaneKey]):
+        if self._columns:
+            logger.warning(f'Port telemetry lanes changed ({len(self._columns)} -> {len(keys)}), history was reset')
+
+        self._columns = {key: column for column, key in enumerate(keys)}
+        self._levels = {metric: RingBuffer(channels=max(len(keys), 1), capacity=self.history)
+                        for metric in LEVEL_METRICS}
+        self._timestamps = RingBuffer(channels=1, capacity=self.history)
+        self._violations.clear()
+
+    def _check_thresholds(self, rows: dict[str, list], timestamp: float) -> list[TelemetryAlertSchema]:
+        alerts = []
+        for metric, values in rows.items():
+            low, high = self.thresholds.limits(metric)
+            if low is None and high is None:
+                continue
+
+            for key, value in zip(self._columns, values):
+                limit = low if value is not None and low is not None and value < low else \
+                        high if value is not None and high is not None and value > high else None
+
+                if limit is None:
+                    self._violations.discard((key, metric))
+                elif (key, metric) not in self._violations:
+                    self._violations.add((key, metric))
+                    alerts.append(TelemetryAlertSchema(port=key[0], lane=key[1], metric=metric, value=value,
+                                                       limit=limit, timestamp=timestamp))
+
+        return alerts
\ No newline at end of file
@@ -0,0 +1,115 @@
+import math
+from array import array
+from typing import Sequence
+
+from pydantic import BaseModel
+
+
+class WindowStatsSchema(BaseModel):
+    """
+    Статистика одного канала кольцевого буфера за окно последних замеров.
+    Пропущенные значения (None в ответе коммутатора) в статистику не входят.
+    Attributes:
+        samples: int - количество замеров со значением
+        min: float | None
+        max: float | None
+        mean: float | None
+        last: float | None - последнее значение канала
+    """
+    samples: int
+    min: float | None = None
+    max: float | None = None
+    mean: float | None = None
+    last: float | None = None
+
+
+class RingBuffer:
+    def __init__(self, channels: int, capacity: int):
+        """
+        Кольцевой буфер замеров фиксированного размера для нескольких каналов (линий порта, групп и т.п.).
+        Замеры хранятся в одном массиве array('d') построчно: строка - один опрос, столбец - канал.
+        Строка записывается одним присваиванием среза, столбец читается срезом с шагом, без циклов по Python-объектам.
+        Пропущенное значение хранится как NaN.
+
+        :param channels: Количество каналов.
+        :param capacity: Количество хранимых замеров; более старые замеры перезаписываются.
+        """
+        if channels < 1 or capacity < 1:
+            raise ValueError(f'Ring buffer requires at least one channel and one sample, got {channels}x{capacity}')
+
+        self.channels = channels
+        self.capacity = capacity
+        self.appended = 0
+        self._data = array('d', [math.nan]) * (channels * capacity)
+
+    def __len__(self) -> int:
+        return min(self.appended, self.capacity)
+
+    def append(self, values: Sequence[float | None]):
+        """
+        Метод добавляет замер всех каналов.
+
+        :param values: Значения каналов по порядку; None - значение отсутствует.
+        :raises ValueError: Если количество значений не совпадает с количеством каналов.
+        """
+        if len(values) != self.channels:
+            raise ValueError(f'Expected {self.channels} values, got {len(values)}')
+
+        row = values if isinstance(values, array) else array('d', (math.nan if value is None else value
+                                                                    for value in values))
+        start = self.appended % self.capacity * self.channels
+        self._data[start:start + self.channels] = row
+        self.appended += 1
+
+    def row(self, age: int = 0) -> array:
+        """
+        Метод возвращает замер всех каналов.
+
+        :param age: 0 - последний замер, 1 - предыдущий и т.д.
+        :return: Значения каналов (NaN - значение отсутствует).
+        :raises IndexError: Если замер уже перезаписан или ещё не сделан.
+        """
+        if not 0 <= age < len(self):
+            raise IndexError(f'Sample {age} is not in the buffer ({len(self)} samples)')
+
+        start = (self.appended - 1 - age) % self.capacity * self.channels
+        return self._data[start:start + self.channels]
+
+    def column(self, channel: int, window: int | None = None) -> array:
+        """
+        Метод возвращает значения канала в порядке замеров (от старых к новым).
+
+        :param channel: Номер канала.
+        :param window: Количество последних замеров; None - все хранимые замеры.
+        :return: Значения канала (NaN - значение отсутствует).
+        """
+        size = len(self) if window is None else max(0, min(window, len(self)))
+        values = self._data[channel::self.channels]
+
+        if self.appended > self.capacity:           # Буфер заполнен: самый старый замер - следующий за последним
+            split = self.appended % self.capacity
+            values = values[split:] + values[:split]
+        else:
+            values = values[:self.appended]
+
+        return values[len(values) - size:]
+
+    def stats(self, channel: int, window: int | None = None) -> WindowStatsSchema:
+        """
+        Метод вычисляет min/max/mean канала за окно последних замеров.
+
+        :param channel: Номер канала.
+        :param window: Количество последних замеров; None - все хранимые замеры.
+        :return: Статистика канала.
+        """
+        values = [value for value in self.column(channel=channel, window=window) if not math.isnan(value)]
+        last = self.row()[channel] if len(self) else math.nan
+
+        if not values:
+            return WindowStatsSchema(samples=0, last=None if math.isnan(last) else last)
+
+        return WindowStatsSchema(samples=len(values),
+                                 min=min(values),
+                                 max=max(values),
+                                 mean=math.fsum(values) / len(values),
+                                 last=None if math.isnan(last) else last)
\ No newline at end of file
@@ -0,0 +1,257 @@
+import atexit
+import json
+import os
+import threading
+import time
+import uuid
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Iterator, AsyncIterator, Iterable
+
+from httpx import Request, Response, SyncByteStream, AsyncByteStream
+
+from config import settings
+from tools.routes import APIRoutes
+
+
+RUN_ID_ENV = 'TIMINGS_RUN_ID'
+
+# Маршруты отсортированы по убыванию длины, чтобы '/api/ports_all/' не совпадал с '/api/ports/' и т.п.
+_ROUTE_TEMPLATES = sorted((route.value for route in APIRoutes), key=len, reverse=True)
+
+
+def get_run_id() -> str:
+    """
+    Функция возвращает идентификатор текущего прогона.
+    Идентификатор создаётся в главном процессе pytest и передаётся воркерам pytest-xdist через переменную окружения,
+    поэтому файлы замеров всех воркеров одного прогона имеют общий префикс.
+
+    :return: Строка вида "20260101-120000-1a2b3c4d".
+    """
+    return os.environ.setdefault(RUN_ID_ENV, f'{datetime.now():%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:8]}')
+
+
+def get_worker_id() -> str:
+    return os.environ.get('PYTEST_XDIST_WORKER', 'master')
+
+
+def get_route_template(path: str) -> str | None:
+    """
+    Функция определяет маршрут из APIRoutes, к которому относится путь запроса.
+
+    :param path: Путь запроса, например "/api/token/access/".
+    :return: Значение маршрута APIRoutes (например, "/api/token") или None, если маршрут неизвестен.
+    """
+    return next((route for route in _ROUTE_TEMPLATES if path.startswith(route)), None)
+
+
+class RequestTimer:
+    def __init__(self, request: Request):
+        """
+        Замер времени выполнения одного HTTP-запроса.
+        Фазы соединения фиксируются через trace-расширение httpcore, окончание - при закрытии потока ответа.
+
+        :param request: Объект запроса HTTPX.
+        """
+        self.request = request
+        self.started_at = time.time()
+        self.started = time.perf_counter()
+        self.events: dict[str, float] = {}
+
+    def trace(self, event_name: str, info: dict[str, Any]):
+        self.events[event_name] = time.perf_counter()
+
+    async def atrace(self, event_name: str, info: dict[str, Any]):
+        self.trace(event_name=event_name, info=info)
+
+    def _phase(self, name: str) -> float | None:
+        started = self.events.get(f'connection.{name}.started')
+        completed = self.events.get(f'connection.{name}.complete')
+
+        return _to_ms(completed - started) if started and completed else None
+
+    def _time_to_first_byte(self) -> float | None:
+        received = self.events.get('http11.receive_response_headers.complete') \
+                   or self.events.get('http2.receive_response_headers.complete')
+
+        return _to_ms(received - self.started) if received else None
+
+    def build_record(self, response: Response, response_bytes: int) -> dict:
+        """
+        Метод формирует запись замера для JSONL-файла.
+
+        :param response: Полученный ответ HTTPX.
+        :param response_bytes: Размер тела ответа в байтах (как получено по сети).
+        :return: Словарь с данными замера.
+        """
+        return {
+            'run_id': get_run_id(),
+            'worker': get_worker_id(),
+            'timestamp': self.started_at,
+            'method': self.request.method,
+            'route': get_route_template(self.request.url.path),
+            'path': self.request.url.path,
+            'status_code': response.status_code,
+            'request_bytes': int(self.request.headers.get('Content-Length', 0)),
+            'response_bytes': response_bytes,
+            'connection_reused': 'connection.connect_tcp.started' not in self.events,
+            'connect_ms': self._phase('connect_tcp'),           # Включает разрешение имени (DNS)
+            'tls_ms': self._phase('start_tls'),
+            'ttfb_ms': self._time_to_first_byte(),
+            'total_ms': _to_ms(time.perf_counter() - self.started),
+        }
+
+
+class TimedResponseStream(SyncByteStream, AsyncByteStream):
+    def __init__(self, stream: SyncByteStream | AsyncByteStream, on_close: Callable[[int], None]):
+        """
+        Обёртка потока ответа, подсчитывающая полученные байты и сообщающая о его закрытии.
+        Тело ответа при этом не читается заранее, поэтому потоковые ответы остаются потоковыми.
+
+        :param stream: Исходный поток ответа.
+        :param on_close: Функция, вызываемая один раз при закрытии потока с размером тела в байтах.
+        """
+        self.stream = stream
+        self.on_close = on_close
+        self.size = 0
+        self._closed = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self.stream:
+            self.size += len(chunk)
+            yield chunk
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self.stream:
+            self.size += len(chunk)
+            yield chunk
+
+    def close(self):
+        self.stream.close()
+        self._finish()
+
+    async def aclose(self):
+        await self.stream.aclose()
+        self._finish()
+
+    def _finish(self):
+        if not self._closed:
+            self._closed = True
+            self.on_close(self.size)
+
+
+class TimingRecorder:
+    def __init__(self, path: Path):
+        """
+        Запись замеров HTTP-запросов в JSONL-файл (одна строка - один запрос).
+        Файл открывается на дозапись, у каждого воркера pytest-xdist свой файл.
+
+        :param path: Путь к JSONL-файлу.
+        """
+        self.path = path
+        self._file = open(path, 'a', encoding='utf-8')
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def write(self, record: dict):
+        line = json.dumps(record, ensure_ascii=False)
+
+        with self._lock:
+            if self._file.closed:     # Запросы, завершившиеся после остановки процесса, не записываются
+                return
+            self._file.write(f'{line}\n')
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+@lru_cache(maxsize=None)
+def get_timing_recorder() -> TimingRecorder:
+    """
+    Функция возвращает общий на процесс TimingRecorder.
+    Файл замеров: ./timing-results/<run_id>-<worker>.jsonl
+
+    :return: Объект TimingRecorder текущего воркера.
+    """
+    path = settings.timing_results_dir.joinpath(f'{get_run_id()}-{get_worker_id()}.jsonl')
+    return TimingRecorder(path=path)
+
+
+def read_timing_records(run_id: str) -> list[dict]:
+    """
+    Функция читает замеры HTTP-запросов всех воркеров указанного прогона.
+
+    :param run_id: Идентификатор прогона.
+    :return: Список записей замеров.
+    """
+    records = []
+    for path in sorted(settings.timing_results_dir.glob(f'{run_id}-*.jsonl')):
+        with open(path, encoding='utf-8') as file:
+            records.extend(json.loads(line) for line in file if line.strip())
+
+    return records
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """
+    Функция вычисляет перцентиль с линейной интерполяцией между соседними значениями.
+
+    :param sorted_values: Отсортированный по возрастанию непустой список значений.
+    :param q: Перцентиль от 0 до 100.
+    :return: Значение перцентиля.
+    """
+    position = (len(sorted_values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def build_latency_report(records: Iterable[dict]) -> list[dict]:
+    """
+    Функция агрегирует замеры HTTP-запросов по маршруту APIRoutes и HTTP-методу.
+    Пропускная способность считается как число запросов на интервал от начала первого до окончания последнего запроса.
+
+    :param records: Записи замеров (см. RequestTimer.build_record).
+    :return: Список строк отчёта с count, p50/p90/p99/max (мс) и rps, отсортированный по маршруту и методу.
+    """
+    groups: dict[tuple[str, str], list[dict]] = {}
+    for record in records:
+        groups.setdefault((record['route'] or record['path'], record['method']), []).append(record)
+
+    report = []
+    for (route, method), group in sorted(groups.items()):
+        latencies = sorted(record['total_ms'] for record in group)
+        started = min(record['timestamp'] for record in group)
+        finished = max(record['timestamp'] + record['total_ms'] / 1000 for record in group)
+
+        report.append({
+            'route': route,
+            'method': method,
+            'count': len(group),
+            'p50_ms': round(percentile(latencies, 50), 3),
+            'p90_ms': round(percentile(latencies, 90), 3),
+            'p99_ms': round(percentile(latencies, 99), 3),
+            'max_ms': latencies[-1],
+            'rps': round(len(group) / (finished - started), 3) if finished > started else None,
+        })
+
+    return report
+
+
+def save_latency_report(report: list[dict], run_id: str):
+    """
+    Функция сохраняет отчёт о задержках в JSON-файл settings.latency_report_file.
+
+    :param report: Строки отчёта (см. build_latency_report).
+    :param run_id: Идентификатор прогона.
+    """
+    content = {'runId': run_id, 'createdAt': datetime.now().isoformat(), 'endpoints': report}
+    settings.latency_report_file.write_text(json.dumps(content, ensure_ascii=False, indent=2), encoding='utf-8')
+
+
+def _to_ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
\ No newline at end of file